@@ -0,0 +1,67 @@
+"""
+Benchmark de índices con disposición amigable con la caché
+
+Compara BinarySearch contra EytzingerSearch y StaticBTreeSearch con tamaños que
+sobrepasan las cachés L1, L2, L3 y llegan a memoria principal. Para cada tamaño se
+mide la búsqueda individual (search) y por lotes (search_many), además del tiempo
+de construcción de cada índice.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_cache_layout [tamaño_máximo]
+
+Con claves de 64 bits, 4 KB (512 elementos) caben en L1, 256 KB (32768) en L2 y
+unos pocos MB (10^5 a 10^6) en L3; 10^7 y 10^8 elementos ya viven en memoria.
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from search_algorithms.algorithms import BinarySearch, EytzingerSearch, StaticBTreeSearch
+
+
+def time_queries(algorithm, data, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        algorithm.search(data, target)
+    return (time.perf_counter() - start_time) / len(targets)
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    sizes = [size for size in [512, 32_768, 1_000_000, 10_000_000, 100_000_000] if size <= max_size]
+    queries = 50_000
+
+    print("\n" + "=" * 60)
+    print("ÍNDICES CON DISPOSICIÓN AMIGABLE CON LA CACHÉ")
+    print("=" * 60)
+
+    for size in sizes:
+        data = array('q', range(0, size * 2, 2))
+        targets = [random.randrange(0, size * 2) for _ in range(queries)]
+
+        print(f"\nArreglo de {size} elementos ({size * 8 // 1024} KB):")
+        print("-" * 40)
+
+        for algorithm in [BinarySearch(), EytzingerSearch(), StaticBTreeSearch()]:
+            start_time = time.perf_counter()
+            if hasattr(algorithm, "build"):
+                algorithm.build(data)
+            build_time = time.perf_counter() - start_time
+
+            per_query = time_queries(algorithm, data, targets)
+            iterations = algorithm.iterations
+
+            start_time = time.perf_counter()
+            algorithm.search_many(data, targets)
+            batch_time = (time.perf_counter() - start_time) / queries
+
+            print(f"  {algorithm.name:<22} construcción: {build_time:8.3f} s   "
+                  f"search: {per_query * 1e9:8.0f} ns   "
+                  f"search_many: {batch_time * 1e9:6.0f} ns   "
+                  f"iteraciones: {iterations}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark de la caché de resultados
+
+Simula tráfico sesgado (distribución Zipf sobre los objetivos) contra un arreglo
+fijo y compara BinarySearch e InterpolationSearch con y sin CachedSearch, para las
+políticas LRU y LFU. Reporta el tiempo por consulta, las iteraciones promedio y
+la tasa de aciertos.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_cached
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, CachedSearch, InterpolationSearch
+
+
+def zipf_targets(values, count, rng, exponent=1.1):
+    weights = [1 / (rank + 1) ** exponent for rank in range(len(values))]
+    popular = values[:]
+    rng.shuffle(popular)
+    return rng.choices(popular, weights=weights, k=count)
+
+
+def main():
+    size = 1_000_000
+    queries = 100_000
+    rng = random.Random(42)
+    data = sorted(rng.sample(range(size * 10), size))
+    targets = zipf_targets(data[::10], queries, rng)
+
+    print("\n" + "=" * 60)
+    print(f"CACHÉ DE RESULTADOS ({queries} consultas Zipf sobre {size} elementos)")
+    print("=" * 60)
+
+    for make in [BinarySearch, InterpolationSearch]:
+        print(f"\n{make().name}:")
+        print("-" * 40)
+        for label, algorithm in [("sin caché", make()),
+                                 ("LRU 1024", CachedSearch(make(), 1024, 'lru')),
+                                 ("LFU 1024", CachedSearch(make(), 1024, 'lfu'))]:
+            iterations = 0
+            start_time = time.perf_counter()
+            for target in targets:
+                algorithm.search(data, target)
+                iterations += algorithm.iterations
+            elapsed = (time.perf_counter() - start_time) / queries
+
+            hit_rate = f"   aciertos: {algorithm.stats['hit_rate']:6.1%}" if isinstance(algorithm, CachedSearch) else ""
+            print(f"  {label:<10} {elapsed * 1e9:8.0f} ns/consulta   "
+                  f"iteraciones promedio: {iterations / queries:6.2f}{hit_rate}")
+
+
+if __name__ == "__main__":
+    main()
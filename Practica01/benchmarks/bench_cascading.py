@@ -0,0 +1,61 @@
+"""
+Benchmark de la cascada fraccional
+
+Compara FractionalCascading con una búsqueda binaria independiente por arreglo al
+buscar el mismo objetivo en k arreglos ordenados. Reporta el tiempo por consulta y
+las comparaciones promedio de cada enfoque.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_cascading
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, FractionalCascading
+
+
+def main():
+    size = 20_000
+    queries = 2_000
+    rng = random.Random(42)
+
+    print("\n" + "=" * 60)
+    print(f"CASCADA FRACCIONAL (arreglos de {size} elementos)")
+    print("=" * 60)
+
+    for k in [4, 16, 64]:
+        arrays = [sorted(rng.randint(0, size * 10) for _ in range(size)) for _ in range(k)]
+        targets = [rng.randint(0, size * 10) for _ in range(queries)]
+
+        start_time = time.perf_counter()
+        cascade = FractionalCascading(arrays)
+        build_time = time.perf_counter() - start_time
+
+        binary = BinarySearch()
+        iterations = 0
+        start_time = time.perf_counter()
+        for target in targets:
+            for arr in arrays:
+                binary.lower_bound(arr, target)
+                iterations += binary.iterations
+        binary_time = (time.perf_counter() - start_time) / queries
+        binary_iterations = iterations / queries
+
+        iterations = 0
+        start_time = time.perf_counter()
+        for target in targets:
+            cascade.lower_bounds(target)
+            iterations += cascade.iterations
+        cascade_time = (time.perf_counter() - start_time) / queries
+
+        print(f"\n{k} arreglos (construcción de la cascada: {build_time:.3f} s):")
+        print("-" * 40)
+        print(f"  {'k búsquedas binarias':<22} {binary_time * 1e6:10.1f} µs/consulta   "
+              f"comparaciones: {binary_iterations:8.1f}")
+        print(f"  {cascade.name:<22} {cascade_time * 1e6:10.1f} µs/consulta   "
+              f"comparaciones: {iterations / queries:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark del filtro de Bloom para consultas ausentes
+
+Mide el tiempo por consulta de BinarySearch y LinearSearch con y sin
+FilteredSearch para flujos de consultas con distintas proporciones de objetivos
+que no están en el arreglo, y reporta la tasa de aciertos del filtro, los falsos
+positivos, la memoria y el tiempo de construcción.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_filtered [tamaño]
+"""
+
+import random
+import sys
+import time
+
+from search_algorithms.algorithms import BinarySearch, FilteredSearch, LinearSearch
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    data = list(range(0, size * 2, 2))
+
+    print("\n" + "=" * 60)
+    print(f"FILTRO DE BLOOM PARA CONSULTAS AUSENTES (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for false_positive_rate in [0.01, 0.001]:
+        filtered = FilteredSearch(BinarySearch(), false_positive_rate)
+        start_time = time.perf_counter()
+        filtered.search(data, 0)
+        build = time.perf_counter() - start_time
+        print(f"\nTasa de falsos positivos {false_positive_rate}: construcción {build * 1e3:.1f} ms, "
+              f"{filtered.stats['memory_bytes'] / 1024:.1f} KiB, {filtered.stats['num_hashes']} funciones hash")
+
+    for missing in [0.0, 0.5, 0.9]:
+        queries = 20_000
+        # Los impares no están en el arreglo
+        targets = [rng.randrange(size) * 2 + (rng.random() < missing) for _ in range(queries)]
+
+        print(f"\n{missing:.0%} de consultas ausentes:")
+        print("-" * 40)
+        for algorithm, sample in [(BinarySearch(), targets), (LinearSearch(), targets[:50])]:
+            filtered = FilteredSearch(algorithm)
+            filtered.search(data, 0)
+            filtered.reset_stats()
+            for label, search in [(algorithm.name, algorithm.search), (filtered.name, filtered.search)]:
+                start_time = time.perf_counter()
+                for target in sample:
+                    search(data, target)
+                elapsed = (time.perf_counter() - start_time) / len(sample)
+                print(f"  {label:<26} {elapsed * 1e6:12.2f} µs/consulta")
+            stats = filtered.stats
+            print(f"  {'':<26} filtro: {stats['hit_rate']:.1%} descartadas, "
+                  f"{stats['false_positives']} falsos positivos")
+
+
+if __name__ == "__main__":
+    main()
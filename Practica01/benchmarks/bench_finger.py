@@ -0,0 +1,56 @@
+"""
+Benchmark de la búsqueda por dedo (finger search)
+
+Simula un flujo de consultas en el que cada objetivo está cerca del anterior (una
+caminata aleatoria sobre las claves) y compara ExponentialSearch.search, que
+siempre parte del índice 0, con FingerSearchCursor, que parte del resultado
+anterior. Reporta el tiempo por consulta y las iteraciones promedio para varias
+distancias típicas entre objetivos consecutivos.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_finger
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch
+
+
+def main():
+    size = 1_000_000
+    queries = 50_000
+    rng = random.Random(42)
+    data = list(range(0, size * 2, 2))
+
+    print("\n" + "=" * 60)
+    print(f"BÚSQUEDA POR DEDO (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for distance in [10, 1_000, 100_000]:
+        targets = []
+        target = size
+        for _ in range(queries):
+            target = min(max(target + rng.randint(-distance, distance), 0), size * 2 - 1)
+            targets.append(target)
+
+        print(f"\nDistancia entre consultas de hasta {distance} claves:")
+        print("-" * 40)
+        exponential = ExponentialSearch()
+        cursor = exponential.cursor(data)
+        for label, algorithm, search in [("Binary Search", BinarySearch(), None),
+                                         ("Exponential Search", exponential, None),
+                                         ("FingerSearchCursor", cursor, cursor.search)]:
+            search = search or (lambda target, algorithm=algorithm: algorithm.search(data, target))
+            iterations = 0
+            start_time = time.perf_counter()
+            for target in targets:
+                search(target)
+                iterations += algorithm.iterations
+            elapsed = (time.perf_counter() - start_time) / queries
+            print(f"  {label:<22} {elapsed * 1e6:8.2f} µs/consulta   "
+                  f"iteraciones promedio: {iterations / queries:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark del índice hash para arreglos desordenados
+
+Compara LinearSearch con HashIndexSearch sobre arreglos desordenados con y sin
+duplicados. Para cada índice reporta el tiempo de construcción, la memoria por
+elemento y el número de consultas a partir del cual la construcción se amortiza.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_hash_index [tamaño]
+"""
+
+import random
+import sys
+import time
+
+from search_algorithms.algorithms import HashIndexSearch, LinearSearch
+
+
+def per_query(algorithm, data, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        algorithm.search(data, target)
+    return (time.perf_counter() - start_time) / len(targets)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    queries = 20_000
+    rng = random.Random(42)
+
+    datasets = {
+        "sin duplicados": rng.sample(range(size * 10), size),
+        "con duplicados": [rng.randrange(size // 10) for _ in range(size)],
+    }
+
+    print("\n" + "=" * 60)
+    print(f"ÍNDICE HASH (arreglo desordenado de {size} elementos)")
+    print("=" * 60)
+
+    for name, data in datasets.items():
+        targets = [rng.choice(data) for _ in range(queries)]
+        linear_time = per_query(LinearSearch(), data, targets[:50])
+
+        print(f"\nDatos {name}:")
+        print("-" * 40)
+        print(f"  {'Linear Search':<32} {linear_time * 1e6:12.2f} µs/consulta")
+        for all_positions in [False, True]:
+            algorithm = HashIndexSearch(all_positions=all_positions)
+            start_time = time.perf_counter()
+            algorithm.search(data, targets[0])
+            build = time.perf_counter() - start_time
+            query_time = per_query(algorithm, data, targets)
+            label = "Hash Index (todas las posiciones)" if all_positions else "Hash Index (primera posición)"
+            print(f"  {label:<32} {query_time * 1e6:12.2f} µs/consulta   "
+                  f"construcción: {build * 1e3:8.1f} ms   "
+                  f"memoria: {algorithm.memory_bytes / size:6.1f} bytes/elemento   "
+                  f"se amortiza en {build / max(linear_time - query_time, 1e-12):.0f} consultas")
+
+
+if __name__ == "__main__":
+    main()
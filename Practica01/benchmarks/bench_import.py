@@ -0,0 +1,93 @@
+"""
+Benchmark del tiempo de importación
+
+Ejecuta cada forma común de usar el paquete en un intérprete nuevo con
+python -X importtime y muestra el tiempo de importación y del proceso, ambos
+descontando el arranque de un intérprete vacío, y los módulos más costosos. Con
+--limit sale con código 1 si alguno de los casos que no necesitan NumPy supera el
+límite, para usarlo como verificación contra regresiones.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_import [--repeat N] [--top N] [--limit MS]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+# (nombre, código, si --limit se aplica); los dos últimos casos importan NumPy a propósito
+CASES = [
+    ("paquete", "import search_algorithms", True),
+    ("un algoritmo", "from search_algorithms import BinarySearch; BinarySearch().search([1, 2, 3], 2)", True),
+    ("fábrica", "from search_algorithms.algorithms import SearchAlgorithmFactory as F; F.get_algorithm('binary')", True),
+    ("logger nulo", "from search_algorithms import get_null_logger; get_null_logger('cli')", True),
+    ("search_many", "from search_algorithms import BinarySearch; BinarySearch().search_many([1, 2, 3], [2])", False),
+    ("todo", "from search_algorithms import *", False),
+]
+
+
+def parse_importtime(stderr):
+    """Devuelve (módulo, profundidad, propio µs, acumulado µs) por cada línea de -X importtime"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, raw_name = line[len("import time:"):].split("|")
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        rows.append((raw_name.strip(), depth, int(own), int(cumulative)))
+    return rows
+
+
+def run(code):
+    """Ejecuta el código en un intérprete nuevo: (importaciones de primer nivel µs, proceso s, filas)"""
+    start_time = time.perf_counter()
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True).stderr
+    elapsed = time.perf_counter() - start_time
+    rows = parse_importtime(stderr)
+    return sum(cumulative for _, depth, _, cumulative in rows if depth == 0), elapsed, rows
+
+
+def measure(code, repeat, baseline):
+    """Mejor de repeat ejecuciones, descontando las importaciones del arranque del intérprete"""
+    best = None
+    for _ in range(repeat):
+        imports, elapsed, rows = run(code)
+        if best is None or imports < best[0]:
+            best = (imports, elapsed, rows)
+    startup = {name for name, _, _, _ in baseline[2]}
+    rows = [row for row in best[2] if row[0] not in startup]
+    return max(best[0] - baseline[0], 0), best[1] - baseline[1], rows
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_import",
+                                     description="Mide el tiempo de importación del paquete")
+    parser.add_argument("--repeat", type=int, default=5, help="Ejecuciones por caso; se toma la mejor")
+    parser.add_argument("--top", type=int, default=5, help="Módulos más costosos a mostrar por caso")
+    parser.add_argument("--limit", type=float, help="Límite en ms para la importación de los casos sin NumPy")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("TIEMPO DE IMPORTACIÓN (python -X importtime)")
+    print("=" * 60)
+
+    baseline = min((run("pass") for _ in range(args.repeat)), key=lambda result: result[0])
+    exceeded = []
+    for label, code, guarded in CASES:
+        package, elapsed, rows = measure(code, args.repeat, baseline)
+        print(f"\n{label}: {code}")
+        print(f"  importación: {package / 1000:8.1f} ms   proceso: {elapsed * 1000:+8.1f} ms sobre un intérprete vacío")
+        for name, _, own, _ in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+            print(f"    {own / 1000:8.1f} ms  {name}")
+        if guarded and args.limit is not None and package / 1000 > args.limit:
+            exceeded.append(label)
+
+    if exceeded:
+        print(f"\nSuperan el límite de {args.limit} ms: {', '.join(exceeded)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark de la búsqueda por interpolación con distribuciones adversas
+
+Compara InterpolationSearch, GuardedInterpolationSearch y BinarySearch sobre claves
+con distribución uniforme, exponencial, agrupada, Zipf y en potencias de dos. Reporta las iteraciones
+promedio y máximas de cada algoritmo y verifica que la variante acotada nunca
+supere 2 * log2(n) + 2 iteraciones.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_interpolation
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, InterpolationSearch, GuardedInterpolationSearch
+
+
+def distributions(size, rng):
+    return {
+        "uniforme": [rng.randint(0, size * 10) for _ in range(size)],
+        "exponencial": [int(rng.expovariate(1e-4)) for _ in range(size)],
+        "agrupada": [c * 10**9 + rng.randint(0, 1000) for c in range(100) for _ in range(size // 100)],
+        "zipf": [int(rng.paretovariate(1.0) * 1000) for _ in range(size)],
+        "potencias": [2 ** (i // (size // 60)) + i for i in range(size)],
+    }
+
+
+def main():
+    size = 200_000
+    queries = 2_000
+    rng = random.Random(42)
+    bound = 2 * size.bit_length() + 2
+
+    print("\n" + "=" * 60)
+    print(f"INTERPOLACIÓN CON DISTRIBUCIONES ADVERSAS (arreglo de {size} elementos)")
+    print(f"Cota de la variante acotada: {bound} iteraciones")
+    print("=" * 60)
+
+    for name, values in distributions(size, rng).items():
+        data = sorted(values)
+        targets = [rng.choice(data) for _ in range(queries)] + \
+                  [rng.randint(data[0], data[-1]) for _ in range(queries)]
+
+        print(f"\nDistribución {name}:")
+        print("-" * 40)
+
+        for algorithm in [BinarySearch(), InterpolationSearch(), GuardedInterpolationSearch()]:
+            # La búsqueda por interpolación puede ser lineal con distribuciones sesgadas
+            sample = targets[::20] if type(algorithm) is InterpolationSearch else targets
+            total = worst = 0
+            start_time = time.perf_counter()
+            for target in sample:
+                algorithm.search(data, target)
+                total += algorithm.iterations
+                worst = max(worst, algorithm.iterations)
+            elapsed = time.perf_counter() - start_time
+
+            status = ""
+            if isinstance(algorithm, GuardedInterpolationSearch):
+                status = "  cota respetada" if worst <= bound else "  COTA EXCEDIDA"
+            print(f"  {algorithm.name:<30} {elapsed / len(sample) * 1e6:10.1f} µs/consulta   "
+                  f"iteraciones promedio: {total / len(sample):8.1f}   máximo: {worst:6d}{status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark del índice aprendido
+
+Compara LearnedIndexSearch con BinarySearch e InterpolationSearch sobre claves con
+distribución uniforme y sesgada. Reporta el tiempo por consulta, las iteraciones
+promedio y el error máximo de los modelos del índice.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_learned
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, InterpolationSearch, LearnedIndexSearch
+
+
+def distributions(size, rng):
+    return {
+        "uniforme": [rng.randint(0, size * 10) for _ in range(size)],
+        "exponencial": [int(rng.expovariate(1e-4)) for _ in range(size)],
+        "lognormal": [rng.lognormvariate(0, 3) for _ in range(size)],
+        "agrupada": [c * 10**9 + rng.randint(0, 1000) for c in range(100) for _ in range(size // 100)],
+    }
+
+
+def main():
+    size = 1_000_000
+    queries = 20_000
+    rng = random.Random(42)
+
+    print("\n" + "=" * 60)
+    print(f"ÍNDICE APRENDIDO (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for name, values in distributions(size, rng).items():
+        data = sorted(values)
+        targets = [rng.choice(data) for _ in range(queries)]
+
+        learned = LearnedIndexSearch()
+        start_time = time.perf_counter()
+        learned.build(data)
+        build_time = time.perf_counter() - start_time
+
+        print(f"\nDistribución {name} (construcción del índice: {build_time:.3f} s, "
+              f"error máximo: {learned.max_error}):")
+        print("-" * 40)
+
+        for algorithm in [BinarySearch(), InterpolationSearch(), learned]:
+            # La búsqueda por interpolación puede ser lineal con distribuciones sesgadas
+            sample = targets[:50] if isinstance(algorithm, InterpolationSearch) else targets
+            iterations = 0
+            start_time = time.perf_counter()
+            for target in sample:
+                algorithm.search(data, target)
+                iterations += algorithm.iterations
+            elapsed = time.perf_counter() - start_time
+
+            print(f"  {algorithm.name:<22} {elapsed / len(sample) * 1e9:10.0f} ns/consulta   "
+                  f"iteraciones promedio: {iterations / len(sample):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark del recorrido lineal vectorizado
+
+Compara LinearSearch sobre una lista, array.array, memoryview y numpy.ndarray con
+el mismo contenido. Para cada tipo mide el costo por elemento de buscar la primera
+aparición (objetivo ausente, recorrido completo), todas las apariciones y el
+conteo. El ciclo de Python por elemento (un iterable genérico) se reporta como
+referencia.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_linear [tamaño]
+"""
+
+import random
+import sys
+import time
+from array import array
+
+from search_algorithms.algorithms import LinearSearch
+from search_algorithms.algorithms.vectorized import load_numpy
+
+
+class Iterable:
+    """Secuencia sin index(), que obliga al ciclo de Python"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+def per_element(function, size, repetitions=3):
+    best = float("inf")
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start_time)
+    return best / size * 1e9
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    rng = random.Random(42)
+    values = [rng.randrange(0, 1000) for _ in range(size)]
+    typed = array('q', values)
+
+    containers = [("list", values), ("array.array", typed), ("memoryview", memoryview(typed))]
+    np = load_numpy()
+    if np is not None:
+        containers.append(("numpy.ndarray", np.frombuffer(typed, dtype=np.int64)))
+
+    print("\n" + "=" * 60)
+    print(f"RECORRIDO LINEAL VECTORIZADO ({size} elementos, ns por elemento)")
+    print("=" * 60)
+    print(f"\n{'arreglo':<16}{'primera (ausente)':>20}{'todas':>12}{'conteo':>12}")
+    print("-" * 60)
+
+    search = LinearSearch()
+    generic = Iterable(values)
+    print(f"{'ciclo de Python':<16}{per_element(lambda: search.search(generic, -1), size, 1):20.2f}")
+    for name, arr in containers:
+        first = per_element(lambda: search.search(arr, -1), size)
+        every = per_element(lambda: search.search_all(arr, 7), size)
+        count = per_element(lambda: search.count(arr, 7), size)
+        print(f"{name:<16}{first:20.2f}{every:12.2f}{count:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
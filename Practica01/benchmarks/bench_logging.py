@@ -0,0 +1,51 @@
+"""
+Benchmark de la ruta sin seguimiento
+
+Compara la ruta con seguimiento de search() (la que construye un mensaje por
+iteración aunque el logger esté desactivado) contra la ruta sin seguimiento que
+elige la fábrica cuando no hay logger, sobre arreglos de 10^6 elementos.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_logging
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import SearchAlgorithmFactory as SearchFactory
+
+
+def time_queries(search, arr, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        search(arr, target)
+    return time.perf_counter() - start_time
+
+
+def main():
+    algorithms = ["binary", "exponential", "interpolation", "linear"]
+    size = 1_000_000
+    data = list(range(size))
+
+    print("\n" + "=" * 60)
+    print(f"RUTA SIN SEGUIMIENTO (arreglo de {size} elementos)")
+    print("=" * 60 + "\n")
+
+    for algo in algorithms:
+        search_algorithm = SearchFactory.get_algorithm(algo)
+        # La búsqueda lineal recorre el arreglo completo, así que usamos menos consultas
+        queries = 20 if algo == "linear" else 20_000
+        targets = [random.randrange(size) for _ in range(queries)]
+
+        traced_time = time_queries(
+            lambda arr, target: type(search_algorithm).search(search_algorithm, arr, target),
+            data, targets)
+        untraced_time = time_queries(search_algorithm.search, data, targets)
+
+        print(f"  {algo:<14} con seguimiento: {traced_time / queries * 1e6:10.2f} µs/consulta   "
+              f"sin seguimiento: {untraced_time / queries * 1e6:10.2f} µs/consulta   "
+              f"aceleración: {traced_time / untraced_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark de todos los algoritmos por tamaño, posición y distribución
+
+Mide cada algoritmo de la factoría con el motor de search_algorithms.utils.benchmark
+(calibración, calentamiento, recolector de basura desactivado) y reporta la
+mediana, su intervalo de confianza del 95% y el percentil 95 por búsqueda. Con
+--save la corrida se guarda en un ResultStore para compararla después con
+python -m benchmarks.compare.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_matrix [--save directorio] [distribución ...]
+"""
+
+import argparse
+
+from search_algorithms.algorithms import SearchAlgorithmFactory
+from search_algorithms.utils.benchmark import DISTRIBUTIONS, format_results, run_benchmark_matrix
+from search_algorithms.utils.results_store import ResultStore
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_matrix")
+    parser.add_argument("distributions", nargs="*", help=f"Distribuciones a medir (por defecto {', '.join(DISTRIBUTIONS)})")
+    parser.add_argument("--save", metavar="DIRECTORIO", help="Guarda la corrida en este directorio")
+    args = parser.parse_args()
+    distributions = args.distributions or list(DISTRIBUTIONS)
+    sizes = [1_000, 100_000]
+    positions = ['start', 'middle', 'end', 'missing']
+
+    print("\n" + "=" * 60)
+    print(f"MATRIZ DE BENCHMARKS (tamaños {sizes})")
+    print("=" * 60)
+
+    all_rows = []
+    for distribution in distributions:
+        print(f"\nDistribución {distribution}:")
+        print("-" * 40)
+        rows = run_benchmark_matrix(SearchAlgorithmFactory.get_all_algorithms(), sizes=sizes,
+                                    positions=positions, distributions=[distribution], repeat=20)
+        print(format_results(rows))
+        all_rows.extend(rows)
+
+    if args.save:
+        run_id = ResultStore(args.save).save(all_rows, {'source': 'bench_matrix', 'sizes': sizes})
+        print(f"\nCorrida guardada en {args.save}: {run_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark de la búsqueda por lotes ordenados (merge join)
+
+Compara m llamadas independientes a BinarySearch.search con
+ExponentialSearch.merge_search, que recorre el arreglo una sola vez, para
+distintos tamaños de lote. Reporta el tiempo por consulta y las comparaciones
+promedio; la cota de merge_search es O(log(n/m)) por consulta.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_merge
+"""
+
+import random
+import time
+
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch
+
+
+def main():
+    size = 1_000_000
+    rng = random.Random(42)
+    data = sorted(rng.sample(range(size * 10), size))
+
+    print("\n" + "=" * 60)
+    print(f"BÚSQUEDA POR LOTES ORDENADOS (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for batch in [100, 10_000, 200_000]:
+        targets = [rng.choice(data) for _ in range(batch)]
+
+        binary = BinarySearch()
+        iterations = 0
+        start_time = time.perf_counter()
+        for target in targets:
+            binary.search(data, target)
+            iterations += binary.iterations
+        binary_time = (time.perf_counter() - start_time) / batch
+
+        exponential = ExponentialSearch()
+        start_time = time.perf_counter()
+        exponential.merge_search(data, targets)
+        merge_time = (time.perf_counter() - start_time) / batch
+
+        print(f"\nLote de {batch} objetivos:")
+        print("-" * 40)
+        print(f"  {'BinarySearch.search':<28} {binary_time * 1e6:8.2f} µs/consulta   "
+              f"comparaciones: {iterations / batch:6.1f}")
+        print(f"  {'merge_search':<28} {merge_time * 1e6:8.2f} µs/consulta   "
+              f"comparaciones: {exponential.iterations / batch:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark de búsqueda sobre un archivo mapeado en memoria
+
+Escribe un archivo de claves de 64 bits con write_sorted_array y compara el costo de
+abrirlo con MappedSortedArray contra el de construir una List[int] a partir de él.
+Después mide search y search_many de los algoritmos sobre el archivo mapeado.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_mmap [tamaño]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch, InterpolationSearch
+from search_algorithms.utils import MappedSortedArray, write_sorted_array
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    queries = 20_000
+    rng = random.Random(42)
+
+    print("\n" + "=" * 60)
+    print(f"ARREGLO MAPEADO EN MEMORIA ({size} elementos, {size * 8 // 2**20} MB)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "keys.bin")
+
+        start_time = time.perf_counter()
+        write_sorted_array(path, range(0, size * 3, 3))
+        print(f"\nEscritura del archivo: {time.perf_counter() - start_time:.3f} s")
+
+        start_time = time.perf_counter()
+        with open(path, "rb") as file:
+            file.seek(16)
+            values = array('q')
+            values.frombytes(file.read())
+            as_list = values.tolist()
+        print(f"Carga como List[int]: {time.perf_counter() - start_time:.3f} s")
+        del values, as_list
+
+        start_time = time.perf_counter()
+        mapped = MappedSortedArray(path)
+        print(f"Apertura con MappedSortedArray: {(time.perf_counter() - start_time) * 1e3:.3f} ms")
+
+        targets = [rng.randrange(0, size * 3) for _ in range(queries)]
+        print("-" * 40)
+        with mapped:
+            for algorithm in [BinarySearch(), ExponentialSearch(), InterpolationSearch()]:
+                start_time = time.perf_counter()
+                for target in targets:
+                    algorithm.search(mapped, target)
+                per_query = (time.perf_counter() - start_time) / queries
+
+                start_time = time.perf_counter()
+                algorithm.search_many(mapped, targets)
+                batch_time = (time.perf_counter() - start_time) / queries
+
+                print(f"  {algorithm.name:<22} search: {per_query * 1e6:8.2f} µs   "
+                      f"search_many: {batch_time * 1e9:8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
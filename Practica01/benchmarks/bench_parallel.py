@@ -0,0 +1,67 @@
+"""
+Benchmark de escalamiento de la búsqueda lineal paralela
+
+Mide ParallelLinearSearch con 1 hasta N procesos (N = núcleos disponibles) sobre un
+arreglo desordenado, para un objetivo ausente (recorrido completo), un objetivo
+cerca del final, un objetivo cerca del inicio (cancelación temprana) y el modo de
+todas las apariciones. La búsqueda lineal secuencial se reporta como referencia.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_parallel [tamaño]
+"""
+
+import os
+import random
+import sys
+import time
+from array import array
+
+from search_algorithms.algorithms import LinearSearch, ParallelLinearSearch
+
+
+def best_time(function, repetitions=3):
+    best = float("inf")
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    cores = os.cpu_count() or 1
+    rng = random.Random(42)
+    data = array('q', (rng.randrange(0, 1 << 40) for _ in range(size)))
+    data[size // 100] = -2
+    data[size - size // 100] = -3
+    data[size // 2] = -4
+    data[size // 4] = -4
+
+    print("\n" + "=" * 60)
+    print(f"BÚSQUEDA LINEAL PARALELA (arreglo desordenado de {size} elementos, {cores} núcleos)")
+    print("=" * 60)
+
+    cases = [("ausente", -1), ("cerca del final", -3), ("cerca del inicio", -2)]
+    linear = LinearSearch()
+    print(f"\n{'procesos':<10}" + "".join(f"{name:>18}" for name, _ in cases) + f"{'todas':>12}")
+    print("-" * 76)
+    print(f"{'secuencial':<10}" + "".join(
+        f"{best_time(lambda: linear.search(data, target)) * 1e3:15.1f} ms" for _, target in cases))
+
+    workers = 1
+    while True:
+        with ParallelLinearSearch(workers=workers) as parallel:
+            parallel.share(data)
+            parallel.search(data, -1)  # arranca el pool antes de medir
+            row = "".join(f"{best_time(lambda: parallel.search(data, target)) * 1e3:15.1f} ms"
+                          for _, target in cases)
+            row += f"{best_time(lambda: parallel.search_all(data, -4)) * 1e3:9.1f} ms"
+        print(f"{workers:<10}{row}")
+        if workers >= cores:
+            break
+        workers = min(workers * 2, cores)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de las sondas de instrumentación
+
+Compara el tiempo por búsqueda de la ruta sin seguimiento, la ruta con una sonda
+vacía, con CountingProbe y con un logger activo (que construye los mensajes de
+texto), y muestra el histograma de posiciones accedidas por la búsqueda binaria y
+la búsqueda por interpolación sobre datos uniformes y sesgados.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_probes
+"""
+
+import logging
+import random
+import time
+
+from search_algorithms.algorithms import (
+    BinarySearch,
+    CountingProbe,
+    HistogramProbe,
+    InterpolationSearch,
+    LinearSearch,
+    Probe,
+)
+
+
+def per_search(algorithm, data, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        algorithm.search(data, target)
+    return (time.perf_counter() - start_time) / len(targets)
+
+
+def main():
+    size = 100_000
+    rng = random.Random(42)
+    data = list(range(0, size * 2, 2))
+    targets = [rng.randrange(size * 2) for _ in range(5_000)]
+
+    logger = logging.getLogger("bench_probes")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+
+    print("\n" + "=" * 60)
+    print(f"COSTO DE LA INSTRUMENTACIÓN (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for algorithm_class, sample in [(BinarySearch, targets), (LinearSearch, targets[:20])]:
+        print(f"\n{algorithm_class().name}:")
+        print("-" * 40)
+        for label, probe, log in [("sin sonda", None, None), ("sonda vacía", Probe(), None),
+                                  ("CountingProbe", CountingProbe(), None), ("logger activo", None, logger)]:
+            algorithm = algorithm_class(log)
+            algorithm.probe = probe
+            print(f"  {label:<16} {per_search(algorithm, data, sample) * 1e6:12.2f} µs/búsqueda")
+
+    skewed = sorted(int(rng.expovariate(1e-3) ** 2) for _ in range(size))
+    for name, keys in [("uniformes", data), ("sesgados", skewed)]:
+        for algorithm in [BinarySearch(), InterpolationSearch()]:
+            probe = HistogramProbe(bins=10)
+            counting = CountingProbe()
+            algorithm.probe = probe
+            for target in rng.sample(keys, 200):
+                algorithm.search(keys, target)
+            algorithm.probe = counting
+            for target in rng.sample(keys, 200):
+                algorithm.search(keys, target)
+            print(f"\nPosiciones accedidas por {algorithm.name}, datos {name} "
+                  f"({counting.stats['comparisons_per_search']:.1f} comparaciones por búsqueda):")
+            print(probe.format())
+
+
+if __name__ == "__main__":
+    main()
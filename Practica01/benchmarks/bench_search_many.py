@@ -0,0 +1,52 @@
+"""
+Benchmark de búsqueda por lotes
+
+Compara resolver un lote de objetivos con llamadas individuales a search() contra
+una sola llamada a search_many() sobre el mismo arreglo ordenado.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_search_many
+"""
+
+import random
+import time
+from array import array
+
+from search_algorithms.algorithms import SearchAlgorithmFactory as SearchFactory
+
+
+def main():
+    algorithms = ["binary", "exponential", "interpolation"]
+    size = 1_000_000
+    batch_sizes = [1_000, 10_000, 100_000]
+
+    data = array('q', range(0, size * 2, 2))
+
+    print("\n" + "=" * 60)
+    print(f"BÚSQUEDA POR LOTES (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for batch_size in batch_sizes:
+        targets = [random.randrange(0, size * 2) for _ in range(batch_size)]
+        print(f"\nLote de {batch_size} objetivos:")
+        print("-" * 40)
+
+        for algo in algorithms:
+            search_algorithm = SearchFactory.get_algorithm(algo)
+
+            start_time = time.perf_counter()
+            expected = [search_algorithm.search(data, target) for target in targets]
+            loop_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            result = search_algorithm.search_many(data, targets)
+            batch_time = time.perf_counter() - start_time
+
+            assert list(result) == expected
+            print(f"  {algo:<14} search(): {loop_time:.4f} s   "
+                  f"search_many(): {batch_time:.4f} s   "
+                  f"aceleración: {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
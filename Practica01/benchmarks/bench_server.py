@@ -0,0 +1,73 @@
+"""
+Benchmark del servidor local de búsqueda
+
+Generador de carga para SearchServer: mide el throughput y las latencias p50 y
+p99 con distinto número de consultas en curso, junto con el tamaño promedio de
+los lotes que formó el servidor. Sin --connect inicia un servidor en el mismo
+proceso (cliente y servidor comparten el núcleo); con --connect mide un servidor
+ya iniciado con python -m search_algorithms.utils.search_server.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_server [--size N] [--requests N]
+    python -m benchmarks.bench_server --connect 127.0.0.1:8765
+    python -m benchmarks.bench_server --connect /tmp/busqueda.sock
+"""
+
+import argparse
+import asyncio
+import random
+
+from search_algorithms.utils import SearchServer, run_load
+
+
+def parse_address(text):
+    if ":" in text:
+        host, port = text.rsplit(":", 1)
+        return host, int(port)
+    return text
+
+
+async def measure(args):
+    rng = random.Random(42)
+    server = None
+    key_range = args.size * 2
+    if args.connect:
+        address = parse_address(args.connect)
+    else:
+        server = SearchServer(range(0, key_range, 2), max_delay=args.max_delay)
+        address = await server.start()
+
+    print("\n" + "=" * 60)
+    print(f"SERVIDOR DE BÚSQUEDA ({address})")
+    print("=" * 60)
+    print(f"{'conexiones':>10}{'en curso':>10}{'consultas/s':>14}{'p50 µs':>10}{'p99 µs':>10}{'lote medio':>12}")
+
+    try:
+        for connections, concurrency in [(1, 1), (1, 16), (4, 16), (4, 64), (8, 128)]:
+            targets = [rng.randrange(key_range) for _ in range(args.requests)]
+            before = dict(server.stats) if server else None
+            report = await run_load(address, targets, connections=connections, concurrency=concurrency)
+            if server:
+                batches = server.stats['batches'] - before['batches']
+                mean_batch = f"{(server.stats['requests'] - before['requests']) / max(batches, 1):12.1f}"
+            else:
+                mean_batch = f"{'-':>12}"
+            print(f"{connections:>10}{connections * concurrency:>10}{report['throughput']:14.0f}"
+                  f"{report['p50'] * 1e6:10.0f}{report['p99'] * 1e6:10.0f}{mean_batch}")
+    finally:
+        if server:
+            await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_server",
+                                     description="Mide el throughput y la latencia del servidor de búsqueda")
+    parser.add_argument("--connect", metavar="DIRECCIÓN", help="host:puerto o ruta de socket Unix de un servidor iniciado")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Claves del servidor local")
+    parser.add_argument("--requests", type=int, default=20_000, help="Consultas por medición")
+    parser.add_argument("--max-delay", type=float, default=0.0, help="Espera adicional por lote del servidor local")
+    asyncio.run(measure(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark del índice ordenado preparado (SortedIndex)
+
+Compara cada algoritmo buscando sobre una List[int] con el mismo algoritmo
+buscando sobre un SortedIndex construido una sola vez con los mismos datos, en
+datos uniformes y sesgados (crecimiento exponencial). Reporta también el tiempo
+de construcción del índice, que se amortiza tras unas pocas consultas.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_sorted_index [tamaño]
+"""
+
+import random
+import sys
+import time
+
+from search_algorithms.algorithms import (
+    BinarySearch,
+    ExponentialSearch,
+    GuardedInterpolationSearch,
+    InterpolationSearch,
+    LinearSearch,
+    SortedIndex,
+)
+
+
+def per_query(search, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        search(target)
+    return (time.perf_counter() - start_time) / len(targets)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    queries = 20_000
+    rng = random.Random(42)
+
+    datasets = {
+        "uniforme": list(range(0, size * 2, 2)),
+        "sesgado": sorted(int(rng.expovariate(1e-3) ** 2) for _ in range(size)),
+    }
+
+    print("\n" + "=" * 60)
+    print(f"ÍNDICE ORDENADO PREPARADO (arreglo de {size} elementos)")
+    print("=" * 60)
+
+    for name, data in datasets.items():
+        start_time = time.perf_counter()
+        index = SortedIndex(data)
+        build = time.perf_counter() - start_time
+        targets = [data[rng.randrange(size)] for _ in range(queries)]
+
+        print(f"\nDatos {name} (construcción del índice: {build * 1e3:.1f} ms):")
+        print("-" * 40)
+        for algorithm in [BinarySearch(), ExponentialSearch(), InterpolationSearch(),
+                          GuardedInterpolationSearch(), LinearSearch()]:
+            # La búsqueda lineal sobre la lista es O(n): pocas consultas bastan
+            sample = targets[:20] if isinstance(algorithm, LinearSearch) else targets
+            on_list = per_query(lambda target: algorithm.search(data, target), sample)
+            on_index = per_query(lambda target: algorithm.search(index, target), sample)
+            print(f"  {algorithm.name:<32} lista: {on_list * 1e6:10.2f} µs   "
+                  f"índice: {on_index * 1e6:8.2f} µs   ({on_list / on_index:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark de las operaciones de conjuntos sobre arreglos ordenados
+
+Interseca una lista corta (100 elementos, la mitad presentes) con una lista
+larga, como en un índice invertido, y compara el galope de sorted_sets con una
+búsqueda binaria por elemento de la lista corta, con la mezcla elemento por
+elemento y con la intersección de conjuntos de Python. También mide la unión,
+la diferencia y la intersección de varias listas.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_sorted_sets [--size N]
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from search_algorithms.algorithms import (
+    BinarySearch,
+    difference,
+    intersection,
+    intersection_many,
+    iter_intersection,
+    union,
+)
+
+
+def per_call(function, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start_time) / repeat, result
+
+
+def merge_intersection(a, b):
+    """Mezcla elemento por elemento, O(n + m)"""
+    i = j = 0
+    result = []
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif b[j] < a[i]:
+            j += 1
+        else:
+            result.append(a[i])
+            i += 1
+            j += 1
+    return result
+
+
+def report(label, elapsed, result):
+    print(f"  {label:<36} {elapsed * 1e3:10.3f} ms   {len(result)} valores")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_sorted_sets",
+                                     description="Mide las operaciones de conjuntos con galope")
+    parser.add_argument("--size", type=int, default=1_000_000, help="Longitud de la lista larga")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    large = sorted(rng.sample(range(args.size * 10), args.size))
+    small = sorted(rng.sample(large, 50) + rng.sample(range(args.size * 10), 50))
+    other = sorted(rng.sample(range(args.size * 10), args.size // 2))
+
+    print("\n" + "=" * 60)
+    print(f"INTERSECCIÓN DE {len(small)} CON {args.size} ELEMENTOS")
+    print("=" * 60 + "\n")
+
+    binary = BinarySearch()
+    report("galope (intersection)", *per_call(lambda: intersection(small, large), 100))
+    report("galope, generador", *per_call(lambda: list(iter_intersection(small, large)), 100))
+    report("BinarySearch.search por elemento",
+           *per_call(lambda: [value for value in small if binary.search(large, value) != -1], 100))
+    report("mezcla elemento por elemento", *per_call(lambda: merge_intersection(small, large), 1))
+    report("set(corta) & set(larga)", *per_call(lambda: sorted(set(small) & set(large)), 1))
+
+    print("\n" + "=" * 60)
+    print("UNIÓN, DIFERENCIA E INTERSECCIÓN DE VARIAS LISTAS")
+    print("=" * 60 + "\n")
+
+    report("union(corta, larga)", *per_call(lambda: union(small, large), 3))
+    report("heapq.merge sin repetidos",
+           *per_call(lambda: list(dict.fromkeys(heapq.merge(small, large))), 1))
+    report("difference(larga, corta)", *per_call(lambda: difference(large, small), 3))
+    report("difference(corta, larga)", *per_call(lambda: difference(small, large), 100))
+    report("intersection_many(corta, larga, otra)",
+           *per_call(lambda: intersection_many([small, large, other]), 100))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark de búsquedas concurrentes con hilos
+
+Compara el tiempo por búsqueda al atender las consultas desde un ThreadPoolExecutor
+con una instancia compartida por todos los hilos, con una instancia nueva por
+consulta y en un solo hilo, y verifica que las iteraciones que devuelve
+search_result coinciden con las de una búsqueda secuencial. Con el GIL (y en una
+máquina de un núcleo) los hilos no aceleran la búsqueda; lo que se mide es el
+costo de cada forma de compartir el algoritmo.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_threads
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch, InterpolationSearch
+
+
+def per_search(run, targets):
+    start_time = time.perf_counter()
+    results = run(targets)
+    return (time.perf_counter() - start_time) / len(targets), results
+
+
+def in_threads(executor, search, targets, chunk=256):
+    """Reparte los objetivos en tareas de chunk búsquedas, para no medir el costo de cada tarea"""
+    chunks = [targets[i:i + chunk] for i in range(0, len(targets), chunk)]
+    tasks = executor.map(lambda batch: [search(target) for target in batch], chunks)
+    return [result for batch in tasks for result in batch]
+
+
+def main():
+    size = 100_000
+    workers = 8
+    rng = random.Random(42)
+    data = list(range(0, size * 2, 2))
+    targets = [rng.randrange(size * 2) for _ in range(20_000)]
+
+    print("\n" + "=" * 60)
+    print(f"BÚSQUEDAS CONCURRENTES ({size} elementos, {workers} hilos)")
+    print("=" * 60)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for algorithm_class in [BinarySearch, ExponentialSearch, InterpolationSearch]:
+            shared = algorithm_class()
+            expected = [tuple(shared.search_result(data, target)[:2]) for target in targets]
+
+            cases = {
+                "un hilo": lambda batch: [shared.search_result(data, target) for target in batch],
+                "hilos, instancia compartida": lambda batch: in_threads(
+                    executor, lambda target: shared.search_result(data, target), batch),
+                "hilos, instancia por consulta": lambda batch: in_threads(
+                    executor, lambda target: algorithm_class().search_result(data, target), batch),
+            }
+
+            print(f"\n{shared.name}:")
+            print("-" * 40)
+            for label, run in cases.items():
+                elapsed, results = per_search(run, targets)
+                matches = [tuple(result[:2]) for result in results] == expected
+                print(f"  {label:<32} {elapsed * 1e6:8.2f} µs/búsqueda   "
+                      f"{'iteraciones correctas' if matches else 'ITERACIONES DISTINTAS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark del registro de seguimiento síncrono y por lotes
+
+Mide el tiempo por búsqueda binaria con seguimiento activo cuando los mensajes se
+escriben de forma síncrona (consola y archivo) y cuando se
+encolan para el hilo de escritura de BatchingQueueHandler (archivo de texto o
+comprimido con gzip), y con LogProbe registrando todas las búsquedas o una
+muestra del 1%. La consola se redirige a os.devnull para no medir la terminal.
+Con un solo núcleo el hilo de escritura compite con la búsqueda por el GIL, así
+que su trabajo también aparece en los tiempos.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_trace_pipeline
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from search_algorithms.algorithms import BinarySearch, LogProbe
+from search_algorithms.utils import get_console_logger, get_file_logger
+
+
+def per_search(algorithm, data, targets):
+    start_time = time.perf_counter()
+    for target in targets:
+        algorithm.search(data, target)
+    return (time.perf_counter() - start_time) / len(targets)
+
+
+def main():
+    size = 100_000
+    rng = random.Random(42)
+    data = list(range(0, size * 2, 2))
+    targets = [rng.randrange(size * 2) for _ in range(5_000)]
+
+    print("\n" + "=" * 60)
+    print(f"REGISTRO DE SEGUIMIENTO (búsqueda binaria, {size} elementos)")
+    print("=" * 60 + "\n")
+
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        path = os.path.join(directory, "traza")
+        loggers = {
+            "consola síncrona": get_console_logger("bench_sync", stream=devnull),
+            "consola por lotes": get_console_logger("bench_async", asynchronous=True, stream=devnull),
+            "archivo síncrono": get_file_logger("bench_sync", path + ".log"),
+            "archivo por lotes": get_file_logger("bench_async", path + "_lotes.log", asynchronous=True),
+            "archivo gzip": get_file_logger("bench_gzip", path + ".log.gz"),
+        }
+        for logger in loggers.values():
+            logger.propagate = False
+
+        baseline = per_search(BinarySearch(), data, targets)
+        print(f"  {'sin seguimiento':<32} {baseline * 1e6:10.2f} µs/búsqueda")
+        for label, logger in loggers.items():
+            elapsed = per_search(BinarySearch(logger), data, targets)
+            # El tiempo de escritura pendiente no se cuenta como latencia de la búsqueda
+            logger.handlers[0].flush()
+            print(f"  {label:<32} {elapsed * 1e6:10.2f} µs/búsqueda")
+
+        for sample_rate in [1.0, 0.01]:
+            algorithm = BinarySearch()
+            algorithm.probe = LogProbe(loggers["archivo por lotes"], sample_rate=sample_rate, seed=1)
+            elapsed = per_search(algorithm, data, targets)
+            print(f"  {f'LogProbe {sample_rate:.0%} por lotes':<32} {elapsed * 1e6:10.2f} µs/búsqueda")
+
+        for label, logger in loggers.items():
+            handler = logger.handlers[0]
+            if hasattr(handler, "stats"):
+                print(f"\n  {label}: {handler.stats['mean_batch']:.0f} registros por escritura, "
+                      f"{handler.stats['dropped']} descartados")
+            logger.removeHandler(handler)
+            handler.close()
+        gzip_bytes = os.path.getsize(path + ".log.gz")
+        text_bytes = os.path.getsize(path + ".log")
+        print(f"\n  Mismos registros en texto: {text_bytes / 1024:.0f} KiB, con gzip: {gzip_bytes / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Comparación de corridas de benchmarks guardadas
+
+Compara una corrida guardada en un ResultStore con una o varias corridas de
+referencia y marca las mediciones (algoritmo, tamaño, distribución, posición) cuya mediana
+empeoró de forma estadísticamente significativa. Termina con código 1 si hay
+alguna regresión, para poder usarlo como verificación antes de integrar cambios.
+
+Uso (desde la carpeta practica01):
+    python -m benchmarks.bench_matrix --save benchmark_results   # referencia
+    python -m benchmarks.bench_matrix --save benchmark_results   # tras el cambio
+    python -m benchmarks.compare [--dir benchmark_results] [referencia ...] [actual]
+
+Sin identificadores se compara la corrida más reciente con la anterior; con uno
+solo, la más reciente con él; con varios, el último es la corrida actual y los
+demás forman la referencia. Varias corridas de referencia capturan la variación
+entre procesos y reducen las falsas alarmas.
+"""
+
+import argparse
+import math
+import sys
+
+from search_algorithms.utils.results_store import ResultStore, compare_runs, format_comparison
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare",
+                                     description="Detecta regresiones entre dos corridas de benchmarks")
+    parser.add_argument("runs", nargs="*", help="Identificadores de las corridas de referencia y de la actual")
+    parser.add_argument("--dir", default="benchmark_results", help="Directorio del almacén de resultados")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Cambio relativo mínimo de la mediana")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Nivel de significancia")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.dir)
+    available = store.runs()
+    if len(args.runs) >= 2:
+        baseline_ids, current_id = args.runs[:-1], args.runs[-1]
+    elif len(args.runs) == 1:
+        if not available:
+            parser.error(f"no hay corridas en {args.dir}")
+        baseline_ids, current_id = args.runs, available[-1]
+    else:
+        if len(available) < 2:
+            parser.error(f"se necesitan al menos dos corridas en {args.dir}")
+        baseline_ids, current_id = available[-2:-1], available[-1]
+
+    current_meta, current = store.load(current_id)
+    baseline = []
+    print("\n" + "=" * 60)
+    print(f"COMPARACIÓN: {', '.join(baseline_ids)} -> {current_id}")
+    print("=" * 60)
+    for baseline_id in baseline_ids:
+        baseline_meta, rows = store.load(baseline_id)
+        baseline.extend(rows)
+        for field in ['python_version', 'platform', 'cpu_count', 'git_commit']:
+            if baseline_meta.get(field) != current_meta.get(field):
+                print(f"Aviso: {field} cambió en {baseline_id} "
+                      f"({baseline_meta.get(field)} -> {current_meta.get(field)})")
+
+    comparisons = compare_runs(baseline, current, args.threshold, args.alpha)
+    print(format_comparison(comparisons))
+
+    ratios = [row['ratio'] for row in comparisons if 0 < row['ratio'] < math.inf]
+    if ratios:
+        # Un cambio parejo en todas las mediciones suele indicar un cambio del estado de la máquina
+        shift = math.exp(sum(map(math.log, ratios)) / len(ratios))
+        print(f"\nRazón media geométrica: {shift:.3f}")
+        if abs(math.log(shift)) > math.log(1 + args.threshold):
+            print("Aviso: todas las mediciones se desplazaron; conviene repetir la corrida en una máquina sin carga")
+
+    regressions = [row for row in comparisons if row['status'] == 'regression']
+    print(f"\n{len(regressions)} regresiones, "
+          f"{sum(row['status'] == 'improvement' for row in comparisons)} mejoras, "
+          f"{len(comparisons)} mediciones comparadas")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -60,9 +60,9 @@ def main():
                 time.sleep(0.3)  # Pausa entre tamaños
 
                 for target in test_cases:
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     index = search_algorithm.search(data, target)
-                    elapsed_time = time.time() - start_time
+                    elapsed_time = time.perf_counter() - start_time
 
                     results[algo]["times"].append(elapsed_time)
                     results[algo]["iterations"].append(index if index is not None else -1)
@@ -8,6 +8,9 @@ Paquetes:
     algorithms: Implementaciones de algoritmos de búsqueda
     utils: Funciones de utilidad
 
+Los subpaquetes y las clases exportadas se importan en su primer uso, así que
+importar el paquete no carga ningún algoritmo, ni NumPy, ni colorama.
+
 Ejemplo de uso:
     from search_algorithms.algorithms import SearchAlgorithmFactory
     from search_algorithms.utils import get_console_logger
@@ -25,33 +28,186 @@ Ejemplo de uso:
 
 __version__ = '1.0.0'
 
-from .algorithms import (
-    SearchAlgorithm,
-    LinearSearch,
-    BinarySearch,
-    ExponentialSearch,
-    InterpolationSearch,
-    SearchAlgorithmFactory
-)
-
-from .utils import (
-    get_console_logger,
-    get_file_logger,
-    get_null_logger,
-    measure_time,
-    run_performance_test
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .algorithms import (
+        SearchAlgorithm,
+        SearchResult,
+        SortedSearchAlgorithm,
+        Probe,
+        CountingProbe,
+        HistogramProbe,
+        ConsoleProbe,
+        MultiProbe,
+        LogProbe,
+        SortedIndex,
+        LinearSearch,
+        BinarySearch,
+        ExponentialSearch,
+        FingerSearchCursor,
+        InterpolationSearch,
+        GuardedInterpolationSearch,
+        EytzingerSearch,
+        StaticBTreeSearch,
+        LearnedIndexSearch,
+        HashIndexSearch,
+        FractionalCascading,
+        intersection,
+        union,
+        difference,
+        intersection_many,
+        iter_intersection,
+        iter_union,
+        iter_difference,
+        iter_intersection_many,
+        AdaptiveSearch,
+        CachedSearch,
+        BloomFilter,
+        FilteredSearch,
+        ParallelLinearSearch,
+        SearchAlgorithmFactory
+    )
+
+    from .utils import (
+        get_console_logger,
+        get_file_logger,
+        get_null_logger,
+        measure_time,
+        run_performance_test,
+        benchmark,
+        run_benchmark_matrix,
+        ResultStore,
+        MappedSortedArray,
+        write_sorted_array,
+        SearchServer,
+        SearchClient
+    )
+
+# Subpaquete que exporta cada nombre; se importa en el primer acceso al nombre
+_EXPORTS = {
+    'SearchAlgorithm': '.algorithms',
+    'SearchResult': '.algorithms',
+    'SortedSearchAlgorithm': '.algorithms',
+    'Probe': '.algorithms',
+    'CountingProbe': '.algorithms',
+    'HistogramProbe': '.algorithms',
+    'ConsoleProbe': '.algorithms',
+    'MultiProbe': '.algorithms',
+    'LogProbe': '.algorithms',
+    'SortedIndex': '.algorithms',
+    'LinearSearch': '.algorithms',
+    'BinarySearch': '.algorithms',
+    'ExponentialSearch': '.algorithms',
+    'FingerSearchCursor': '.algorithms',
+    'InterpolationSearch': '.algorithms',
+    'GuardedInterpolationSearch': '.algorithms',
+    'EytzingerSearch': '.algorithms',
+    'StaticBTreeSearch': '.algorithms',
+    'LearnedIndexSearch': '.algorithms',
+    'HashIndexSearch': '.algorithms',
+    'FractionalCascading': '.algorithms',
+    'intersection': '.algorithms',
+    'union': '.algorithms',
+    'difference': '.algorithms',
+    'intersection_many': '.algorithms',
+    'iter_intersection': '.algorithms',
+    'iter_union': '.algorithms',
+    'iter_difference': '.algorithms',
+    'iter_intersection_many': '.algorithms',
+    'AdaptiveSearch': '.algorithms',
+    'CachedSearch': '.algorithms',
+    'BloomFilter': '.algorithms',
+    'FilteredSearch': '.algorithms',
+    'ParallelLinearSearch': '.algorithms',
+    'SearchAlgorithmFactory': '.algorithms',
+    'get_console_logger': '.utils',
+    'get_file_logger': '.utils',
+    'get_null_logger': '.utils',
+    'measure_time': '.utils',
+    'run_performance_test': '.utils',
+    'benchmark': '.utils',
+    'run_benchmark_matrix': '.utils',
+    'ResultStore': '.utils',
+    'MappedSortedArray': '.utils',
+    'write_sorted_array': '.utils',
+    'SearchServer': '.utils',
+    'SearchClient': '.utils',
+}
 
 __all__ = [
     'SearchAlgorithm',
+    'SearchResult',
+    'SortedSearchAlgorithm',
+    'Probe',
+    'CountingProbe',
+    'HistogramProbe',
+    'ConsoleProbe',
+    'MultiProbe',
+    'LogProbe',
+    'SortedIndex',
     'LinearSearch',
     'BinarySearch',
     'ExponentialSearch',
+    'FingerSearchCursor',
     'InterpolationSearch',
+    'GuardedInterpolationSearch',
+    'EytzingerSearch',
+    'StaticBTreeSearch',
+    'LearnedIndexSearch',
+    'HashIndexSearch',
+    'FractionalCascading',
+    'intersection',
+    'union',
+    'difference',
+    'intersection_many',
+    'iter_intersection',
+    'iter_union',
+    'iter_difference',
+    'iter_intersection_many',
+    'AdaptiveSearch',
+    'CachedSearch',
+    'BloomFilter',
+    'FilteredSearch',
+    'ParallelLinearSearch',
     'SearchAlgorithmFactory',
     'get_console_logger',
     'get_file_logger',
     'get_null_logger',
     'measure_time',
-    'run_performance_test'
-]
\ No newline at end of file
+    'run_performance_test',
+    'benchmark',
+    'run_benchmark_matrix',
+    'ResultStore',
+    'MappedSortedArray',
+    'write_sorted_array',
+    'SearchServer',
+    'SearchClient'
+]
+
+"""
+    Importa el subpaquete (o el nombre que exporta) la primera vez que se usa.
+
+    Args:
+        name (str): Nombre del atributo
+
+    Returns:
+        Any: El subpaquete, o la clase o función exportada
+
+    Raises:
+        AttributeError: Si el paquete no exporta ese nombre
+    """
+def __getattr__(name: str) -> Any:
+    if name in ('algorithms', 'utils'):
+        return importlib.import_module(f".{name}", __name__)
+    package = _EXPORTS.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(package, __name__), name)
+    globals()[name] = value
+    return value
+
+"""Lista también los nombres exportados que aún no se importan."""
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
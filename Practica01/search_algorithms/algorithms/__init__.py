@@ -8,6 +8,22 @@ Algoritmos disponibles:
 - Búsqueda Binaria
 - Búsqueda Exponencial
 - Búsqueda por Interpolación
+- Búsqueda por Interpolación Acotada
+- Búsqueda sobre la disposición de Eytzinger
+- Búsqueda sobre un árbol B estático
+- Búsqueda con índice aprendido
+- Búsqueda con índice hash de posiciones para arreglos desordenados
+- Cascada fraccional (un objetivo en varios arreglos ordenados)
+- Intersección, unión y diferencia de arreglos ordenados con galope
+- Búsqueda adaptativa (elige el algoritmo según una muestra del arreglo)
+- Caché de resultados para cualquier algoritmo
+- Filtro de Bloom que descarta los objetivos ausentes antes de buscar
+- Búsqueda lineal paralela sobre memoria compartida
+- Sondas de instrumentación (conteo, histograma de posiciones, consola, logger
+  con muestreo) que reciben los eventos estructurados de la búsqueda
+- Índice ordenado preparado (SortedIndex) que aceptan las búsquedas lineal,
+  binaria, exponencial y por interpolación
+- Resultados por llamada (SearchResult) para compartir una instancia entre hilos
 
 Uso:
     from search_algorithms.algorithms import SearchAlgorithmFactory
@@ -22,18 +38,127 @@ Uso:
     result = linear_search.search([1, 2, 3, 4, 5], 3)
 """
 
-from .base import SearchAlgorithm
-from .linear import LinearSearch
-from .binary import BinarySearch
-from .exponential import ExponentialSearch
-from .interpolation import InterpolationSearch
-from .factory import SearchAlgorithmFactory
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base import SearchAlgorithm, SearchResult, SortedSearchAlgorithm
+    from .probes import Probe, CountingProbe, HistogramProbe, ConsoleProbe, MultiProbe, LogProbe
+    from .sorted_index import SortedIndex
+    from .linear import LinearSearch
+    from .binary import BinarySearch
+    from .exponential import ExponentialSearch, FingerSearchCursor
+    from .interpolation import InterpolationSearch, GuardedInterpolationSearch
+    from .layout import EytzingerSearch, StaticBTreeSearch
+    from .learned import LearnedIndexSearch
+    from .hashed import HashIndexSearch
+    from .cascading import FractionalCascading
+    from .sorted_sets import (intersection, union, difference, intersection_many,
+                              iter_intersection, iter_union, iter_difference, iter_intersection_many)
+    from .adaptive import AdaptiveSearch
+    from .cached import CachedSearch
+    from .filtered import BloomFilter, FilteredSearch
+    from .parallel import ParallelLinearSearch
+    from .factory import SearchAlgorithmFactory
+
+# Módulo que define cada nombre exportado. Los módulos se importan en el primer
+# acceso al nombre, así que importar el paquete no carga ningún algoritmo
+_EXPORTS = {
+    'SearchAlgorithm': '.base',
+    'SearchResult': '.base',
+    'SortedSearchAlgorithm': '.base',
+    'Probe': '.probes',
+    'CountingProbe': '.probes',
+    'HistogramProbe': '.probes',
+    'ConsoleProbe': '.probes',
+    'MultiProbe': '.probes',
+    'LogProbe': '.probes',
+    'SortedIndex': '.sorted_index',
+    'LinearSearch': '.linear',
+    'BinarySearch': '.binary',
+    'ExponentialSearch': '.exponential',
+    'FingerSearchCursor': '.exponential',
+    'InterpolationSearch': '.interpolation',
+    'GuardedInterpolationSearch': '.interpolation',
+    'EytzingerSearch': '.layout',
+    'StaticBTreeSearch': '.layout',
+    'LearnedIndexSearch': '.learned',
+    'HashIndexSearch': '.hashed',
+    'FractionalCascading': '.cascading',
+    'intersection': '.sorted_sets',
+    'union': '.sorted_sets',
+    'difference': '.sorted_sets',
+    'intersection_many': '.sorted_sets',
+    'iter_intersection': '.sorted_sets',
+    'iter_union': '.sorted_sets',
+    'iter_difference': '.sorted_sets',
+    'iter_intersection_many': '.sorted_sets',
+    'AdaptiveSearch': '.adaptive',
+    'CachedSearch': '.cached',
+    'BloomFilter': '.filtered',
+    'FilteredSearch': '.filtered',
+    'ParallelLinearSearch': '.parallel',
+    'SearchAlgorithmFactory': '.factory',
+}
 
 __all__ = [
     'SearchAlgorithm',
+    'SearchResult',
+    'SortedSearchAlgorithm',
+    'Probe',
+    'CountingProbe',
+    'HistogramProbe',
+    'ConsoleProbe',
+    'MultiProbe',
+    'LogProbe',
+    'SortedIndex',
     'LinearSearch',
     'BinarySearch',
     'ExponentialSearch',
+    'FingerSearchCursor',
     'InterpolationSearch',
+    'GuardedInterpolationSearch',
+    'EytzingerSearch',
+    'StaticBTreeSearch',
+    'LearnedIndexSearch',
+    'HashIndexSearch',
+    'FractionalCascading',
+    'intersection',
+    'union',
+    'difference',
+    'intersection_many',
+    'iter_intersection',
+    'iter_union',
+    'iter_difference',
+    'iter_intersection_many',
+    'AdaptiveSearch',
+    'CachedSearch',
+    'BloomFilter',
+    'FilteredSearch',
+    'ParallelLinearSearch',
     'SearchAlgorithmFactory',
 ]
+
+"""
+    Importa el módulo que define un nombre exportado la primera vez que se usa.
+
+    Args:
+        name (str): Nombre del atributo
+
+    Returns:
+        Any: La clase o función exportada
+
+    Raises:
+        AttributeError: Si el paquete no exporta ese nombre
+    """
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+"""Lista también los nombres exportados que aún no se importan."""
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
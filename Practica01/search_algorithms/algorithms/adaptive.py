@@ -0,0 +1,251 @@
+"""
+Algoritmo de Búsqueda Adaptativa
+
+Este módulo implementa un algoritmo que analiza una muestra del arreglo y elige
+el algoritmo de búsqueda más adecuado para él.
+
+Clases:
+    AdaptiveSearch: Selección automática entre búsqueda lineal, exponencial,
+                    por interpolación y binaria
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple, TypeVar, Optional
+from itertools import islice
+import logging
+from .base import SearchAlgorithm
+from .linear import LinearSearch
+from .binary import BinarySearch
+from .exponential import ExponentialSearch
+from .interpolation import GuardedInterpolationSearch
+
+T = TypeVar('T')
+
+# Hasta este tamaño la búsqueda lineal (list.index, en código nativo) gana a las demás
+SMALL_ARRAY_SIZE = 32
+
+# Número de posiciones del arreglo que se revisan en el análisis
+SAMPLE_SIZE = 64
+
+# Desviación máxima, relativa al rango de claves, respecto a una recta para considerar uniforme el arreglo
+UNIFORMITY_TOLERANCE = 0.05
+
+# Arreglos distintos cuya elección se recuerda; al analizar uno más se olvida el más antiguo
+MAX_ANALYZED = 16
+
+"""
+    Implementación de la Búsqueda Adaptativa.
+
+    La primera vez que recibe un arreglo toma una muestra de SAMPLE_SIZE posiciones
+    equiespaciadas y elige un algoritmo:
+
+    - lineal si el arreglo es pequeño o la muestra no está ordenada
+    - por interpolación si las claves son numéricas y crecen casi linealmente con
+      la posición (se usa la variante acotada, que no se degrada si la muestra
+      no detectó un tramo sesgado)
+    - exponencial si se espera que los objetivos estén cerca del inicio
+    - binaria en cualquier otro caso
+
+    La posición esperada de los objetivos se indica con position ('start',
+    'middle', 'end' o 'random', como en run_performance_test) o se estima con una
+    muestra de los objetivos en search_many y analyze.
+
+    La elección se guarda por arreglo (hasta MAX_ANALYZED arreglos, con una
+    referencia a cada uno para que su identidad no se reutilice) y se reutiliza
+    mientras reciba el mismo objeto con la misma longitud, así que alternar entre
+    varios arreglos no repite el análisis. Si el arreglo se modifica de otra
+    forma, hay que llamar a analyze() de nuevo.
+
+    Precondiciones:
+    - Ninguna: con arreglos desordenados se elige la búsqueda lineal. La muestra
+      no revisa todos los elementos, así que un arreglo casi ordenado puede pasar
+      por ordenado
+    """
+class AdaptiveSearch(SearchAlgorithm):
+
+    """
+        Inicializa el algoritmo de búsqueda adaptativa.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+            position (str, optional): Posición esperada de los objetivos ('start',
+                                      'middle', 'end' o 'random'). Por defecto 'random'.
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None, position: str = 'random'):
+        self._candidates: Dict[str, SearchAlgorithm] = {
+            'linear': LinearSearch(logger),
+            'binary': BinarySearch(logger),
+            'exponential': ExponentialSearch(logger),
+            'interpolation': GuardedInterpolationSearch(logger),
+        }
+        super().__init__("Adaptive Search", logger)
+        self.position = position
+        self._analyzed: Dict[int, Tuple[List[T], int, str]] = {}
+        self._choice = 'linear'
+
+    """
+        Establece el logger del algoritmo y de todos los algoritmos candidatos.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    @SearchAlgorithm.logger.setter
+    def logger(self, logger: Optional[logging.Logger]) -> None:
+        SearchAlgorithm.logger.fset(self, logger)
+        for algorithm in self._candidates.values():
+            algorithm.logger = logger
+
+    """Obtiene el nombre del algoritmo elegido para el último arreglo analizado."""
+    @property
+    def choice(self) -> str:
+        return self._choice
+
+    """Obtiene la instancia del algoritmo elegido para el último arreglo analizado."""
+    @property
+    def algorithm(self) -> SearchAlgorithm:
+        return self._candidates[self._choice]
+
+    """
+        Analiza una muestra del arreglo y elige el algoritmo de búsqueda.
+
+        Args:
+            arr (List[T]): El arreglo en el que se va a buscar
+            targets (Iterable[T], optional): Muestra de los objetivos esperados, usada
+                                             para estimar su posición en el arreglo
+
+        Returns:
+            str: El nombre del algoritmo elegido ('linear', 'binary', 'exponential'
+            o 'interpolation')
+        """
+    def analyze(self, arr: List[T], targets: Optional[Iterable[T]] = None) -> str:
+        with self._lock:
+            n = len(arr)
+            choice = self._choose(arr, n, targets)
+            self._analyzed.pop(id(arr), None)
+            if len(self._analyzed) >= MAX_ANALYZED:
+                del self._analyzed[next(iter(self._analyzed))]
+            self._analyzed[id(arr)] = (arr, n, choice)
+            self._choice = choice
+        self.log(f"Análisis de {n} elementos: se eligió {self._candidates[choice].name}")
+        return choice
+
+    """
+        Aplica las reglas de elección sobre la muestra del arreglo.
+        """
+    def _choose(self, arr: List[T], n: int, targets: Optional[Iterable[T]]) -> str:
+        if n <= SMALL_ARRAY_SIZE:
+            return 'linear'
+
+        # Posiciones equiespaciadas y sus vecinos inmediatos
+        step = max(1, (n - 1) // (SAMPLE_SIZE - 1))
+        positions = list(range(0, n - 1, step)) + [n - 1]
+        try:
+            if any(arr[j] < arr[i] for i, j in zip(positions, positions[1:])):
+                return 'linear'
+            if any(arr[i + 1] < arr[i] for i in positions[:-1]):
+                return 'linear'
+        except TypeError:
+            # Elementos que no se pueden comparar entre sí
+            return 'linear'
+
+        if self._near_start(arr, n, targets):
+            return 'exponential'
+        if self._uniform(arr, n, positions):
+            return 'interpolation'
+        return 'binary'
+
+    """
+        Indica si se espera que los objetivos estén cerca del inicio del arreglo.
+
+        La búsqueda exponencial hace unas 2 log p comparaciones para un objetivo en la
+        posición p, así que conviene sobre la binaria cuando p es menor que raíz de n.
+        """
+    def _near_start(self, arr: List[T], n: int, targets: Optional[Iterable[T]]) -> bool:
+        if targets is None:
+            return self.position == 'start'
+
+        sample = list(islice(targets, SAMPLE_SIZE))
+        if not sample:
+            return self.position == 'start'
+        try:
+            positions = sorted(bisect_left(arr, target) for target in sample)
+        except TypeError:
+            return False
+        median = positions[len(positions) // 2]
+        return median * median < n
+
+    """
+        Indica si las claves muestreadas crecen casi linealmente con la posición.
+        """
+    def _uniform(self, arr: List[T], n: int, positions: List[int]) -> bool:
+        try:
+            first, last = float(arr[0]), float(arr[n - 1])
+            span = last - first
+            if not span > 0:
+                return False
+            deviation = max(abs((float(arr[i]) - first) / span - i / (n - 1)) for i in positions)
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return deviation <= UNIFORMITY_TOLERANCE
+
+    """
+        Obtiene la elección guardada para el arreglo.
+
+        La entrada se lee bajo _lock, así que el arreglo, su longitud y la elección
+        corresponden al mismo análisis aunque otro hilo esté analizando otro arreglo.
+
+        Args:
+            arr (List[T]): El arreglo en el que se va a buscar
+            analyze (bool, optional): Si se analiza el arreglo cuando no tiene una
+                                      elección guardada. Por defecto True.
+
+        Returns:
+            str: El nombre del algoritmo elegido, o None si no hay una elección
+            guardada y analyze es False
+        """
+    def _choice_for(self, arr: List[T], analyze: bool = True) -> Optional[str]:
+        with self._lock:
+            entry = self._analyzed.get(id(arr))
+            if entry is not None and entry[0] is arr and entry[1] == len(arr):
+                return entry[2]
+        return self.analyze(arr) if analyze else None
+
+    """
+        Busca un elemento objetivo con el algoritmo elegido para el arreglo.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        algorithm = self._candidates[self._choice_for(arr)]
+        result = algorithm.search(arr, target)
+        self._iterations = algorithm.iterations
+        return result
+
+    """
+        Busca varios elementos objetivo con el algoritmo elegido para el arreglo.
+
+        Si el arreglo no se ha analizado, una muestra de los objetivos se usa para
+        estimar su posición.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        choice = self._choice_for(arr, analyze=False)
+        if choice is None:
+            targets = list(targets)
+            choice = self.analyze(arr, targets)
+
+        algorithm = self._candidates[choice]
+        result = algorithm.search_many(arr, targets)
+        self._iterations = algorithm.iterations
+        return result
@@ -5,29 +5,86 @@ Este módulo define la clase base para todos los algoritmos de búsqueda.
 Proporciona funcionalidad común y una interfaz consistente.
 
 Clases:
+    SearchResult: Resultado de una búsqueda (índice, iteraciones y tiempo)
     SearchAlgorithm: Clase base abstracta para algoritmos de búsqueda
+    SortedSearchAlgorithm: Clase base para algoritmos sobre arreglos ordenados
 """
 
 from abc import ABC, abstractmethod
 import logging
-from typing import List, TypeVar, Optional
+import threading
+import time
+from typing import Any, Iterable, List, NamedTuple, Tuple, TypeVar, Optional
+from .vectorized import index_array
+from .probes import Probe
 
 # Definimos la variable de tipo para tipado genérico
 T = TypeVar('T')
 
+"""
+    Resultado de una búsqueda, devuelto por SearchAlgorithm.search_result.
+    
+    Es inmutable y pertenece a la llamada que lo produjo, así que sigue siendo
+    válido aunque otros hilos usen la misma instancia del algoritmo.
+    
+    Atributos:
+        index (int): El índice del objetivo, -1 si no se encontró
+        iterations (int): Iteraciones realizadas por la búsqueda
+        seconds (float): Duración de la búsqueda en segundos
+    """
+class SearchResult(NamedTuple):
+    index: int
+    iterations: int
+    seconds: float
+    
+    """Indica si se encontró el objetivo."""
+    @property
+    def found(self) -> bool:
+        return self.index != -1
+
+"""
+    Contador de iteraciones con un valor por hilo.
+    
+    Los algoritmos escriben self._iterations durante la búsqueda; con este descriptor
+    cada hilo escribe y lee su propio valor, de modo que una instancia compartida por
+    varios hilos reporta en cada uno las iteraciones de su última búsqueda. Las rutas
+    sin seguimiento escriben directamente self._local.iterations, que cuesta la
+    mitad que pasar por el descriptor.
+    """
+class _PerThreadIterations:
+    
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(instance._local, 'iterations', 0)
+    
+    def __set__(self, instance: Any, value: int) -> None:
+        instance._local.iterations = value
+
 """
     Clase Base Abstracta para algoritmos de búsqueda.
     
     Todas las implementaciones de algoritmos de búsqueda deben heredar de esta clase
     e implementar el método search.
     
+    Una instancia se puede compartir entre hilos: el contador de iteraciones es
+    por hilo y search_result devuelve un resultado propio de cada llamada. Las
+    subclases que construyen estructuras para el arreglo recibido (índices,
+    filtros, cachés) lo hacen bajo _lock y las publican al final, así que es
+    seguro compartirlas entre hilos que buscan en el mismo arreglo; para buscar
+    en arreglos distintos a la vez conviene una instancia por arreglo.
+    
     Atributos:
         name (str): El nombre del algoritmo
         logger (logging.Logger): Instancia de logger para el algoritmo
-        _iterations (int): Contador de iteraciones realizadas durante la búsqueda
+        probe (Probe): Sonda que recibe los eventos estructurados de la búsqueda, o None
+        _iterations (int): Contador de iteraciones realizadas durante la búsqueda, por hilo
+        _lock (threading.RLock): Protege la construcción de las estructuras por arreglo
     """
 class SearchAlgorithm(ABC):
     
+    _iterations = _PerThreadIterations()
+    
     """
         Inicializa el algoritmo de búsqueda.
         
@@ -37,8 +94,78 @@ class SearchAlgorithm(ABC):
         """
     def __init__(self, name: str, logger: Optional[logging.Logger] = None):
         self.name = name
-        self.logger = logger
+        self._local = threading.local()
+        self._lock = threading.RLock()
         self._iterations = 0
+        self._probe: Optional[Probe] = None
+        self.logger = logger
+        
+    """Obtiene el logger del algoritmo."""
+    @property
+    def logger(self) -> Optional[logging.Logger]:
+        return self._logger
+    
+    """
+        Establece el logger y elige la ruta de búsqueda.
+        
+        Si el logger no va a emitir mensajes de nivel INFO (es None o está desactivado),
+        no hay una sonda asignada y la subclase define _search_untraced, esa versión sin
+        seguimiento reemplaza a search en la instancia, de modo que el ciclo no construye
+        ningún mensaje ni emite eventos. La elección se hace una sola vez aquí; si se
+        cambia el nivel del logger después, hay que volver a asignarlo para que se
+        reevalúe.
+        
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    @logger.setter
+    def logger(self, logger: Optional[logging.Logger]) -> None:
+        self._logger = logger
+        self._select_search()
+        
+    """Obtiene la sonda del algoritmo."""
+    @property
+    def probe(self) -> Optional[Probe]:
+        return self._probe
+    
+    """
+        Establece la sonda que recibe los eventos de la búsqueda y elige la ruta de búsqueda.
+        
+        Con una sonda, search usa la ruta con seguimiento: llama a probe.start y
+        probe.finish alrededor de cada búsqueda, y el algoritmo emite compare, narrow
+        y phase. Con None se vuelve a la ruta sin seguimiento si no hay logger activo.
+        
+        Args:
+            probe (Probe, optional): La sonda, o None para quitarla
+        """
+    @probe.setter
+    def probe(self, probe: Optional[Probe]) -> None:
+        self._probe = probe
+        self._select_search()
+        
+    """Asigna a search la ruta con sonda, con seguimiento o sin seguimiento."""
+    def _select_search(self) -> None:
+        if self._probe is not None:
+            self.search = self._search_probed
+            return
+        untraced = getattr(self, '_search_untraced', None)
+        if untraced is None or self.tracing:
+            self.__dict__.pop('search', None)
+        else:
+            self.search = untraced
+            
+    """Ejecuta la ruta con seguimiento entre los eventos start y finish de la sonda."""
+    def _search_probed(self, arr: List[T], target: T) -> int:
+        probe = self._probe
+        probe.start(self.name, len(arr), target)
+        result = type(self).search(self, arr, target)
+        probe.finish(result, self._iterations)
+        return result
+            
+    """Indica si la búsqueda genera mensajes de seguimiento con el logger actual."""
+    @property
+    def tracing(self) -> bool:
+        return self._logger is not None and self._logger.isEnabledFor(logging.INFO)
         
     """Obtiene el número de iteraciones realizadas durante la última búsqueda."""
     @property
@@ -49,6 +176,25 @@ class SearchAlgorithm(ABC):
     def reset_iterations(self) -> None:
         self._iterations = 0
         
+    """
+        Busca un elemento objetivo y devuelve el resultado completo de la llamada.
+        
+        A diferencia de leer iterations después de search, el resultado no depende
+        de ningún estado compartido de la instancia.
+        
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            SearchResult: Índice, iteraciones y duración de la búsqueda
+        """
+    def search_result(self, arr: List[T], target: T) -> SearchResult:
+        start_time = time.perf_counter()
+        index = self.search(arr, target)
+        seconds = time.perf_counter() - start_time
+        return SearchResult(index, self._iterations, seconds)
+        
     """
         Registra un mensaje si hay un logger configurado.
         
@@ -73,4 +219,112 @@ class SearchAlgorithm(ABC):
         """
     @abstractmethod
     def search(self, arr: List[T], target: T) -> int:
-        pass 
\ No newline at end of file
+        pass
+    
+    """
+        Busca varios elementos objetivo en el arreglo en una sola llamada.
+        
+        La implementación por defecto llama a search() para cada objetivo y acumula
+        las iteraciones de todas las búsquedas. Los algoritmos sobre arreglos ordenados
+        la sobrescriben con una versión vectorizada.
+        
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+            
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los objetivos no
+            encontrados (numpy.ndarray si NumPy está instalado, array('q') si no)
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        indices = []
+        total_iterations = 0
+        for target in targets:
+            indices.append(self.search(arr, target))
+            total_iterations += self._iterations
+            
+        self._iterations = total_iterations
+        return index_array(indices)
+
+
+"""
+    Clase Base Abstracta para algoritmos de búsqueda sobre arreglos ordenados.
+    
+    Además de search, estos algoritmos responden consultas de rango en O(log n):
+    primera y última aparición, punto de inserción y número de apariciones.
+    Las subclases implementan lower_bound y upper_bound; equal_range y count se
+    construyen a partir de ellos.
+    """
+class SortedSearchAlgorithm(SearchAlgorithm):
+    
+    """
+        Obtiene la primera posición cuyo valor no es menor que el objetivo.
+        
+        Es el punto de inserción del objetivo que lo deja antes de sus duplicados,
+        y la posición de su primera aparición si está en el arreglo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    @abstractmethod
+    def lower_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        pass
+    
+    """
+        Obtiene la primera posición cuyo valor es mayor que el objetivo.
+        
+        Es el punto de inserción del objetivo que lo deja después de sus duplicados.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    @abstractmethod
+    def upper_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        pass
+    
+    """
+        Obtiene el rango [primero, último) de posiciones con valor igual al objetivo.
+        
+        La búsqueda del límite superior empieza en el límite inferior, y las
+        iteraciones de ambas búsquedas se suman.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            
+        Returns:
+            Tuple[int, int]: (lower_bound, upper_bound); el rango está vacío si el
+            objetivo no está en el arreglo
+        """
+    def equal_range(self, arr: List[T], target: T) -> Tuple[int, int]:
+        first = self.lower_bound(arr, target)
+        iterations = self._iterations
+        last = self.upper_bound(arr, target, first)
+        self._iterations += iterations
+        return first, last
+    
+    """
+        Cuenta las apariciones del objetivo en el arreglo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            
+        Returns:
+            int: Número de apariciones del objetivo
+        """
+    def count(self, arr: List[T], target: T) -> int:
+        first, last = self.equal_range(arr, target)
+        return last - first
@@ -7,9 +7,12 @@ Clases:
     BinarySearch: Implementación del algoritmo de búsqueda binaria
 """
 
-from typing import List, TypeVar, Optional
+from bisect import bisect_left
+from typing import Any, Iterable, List, TypeVar, Optional
 import logging
-from .base import SearchAlgorithm
+from .base import SortedSearchAlgorithm
+from .vectorized import searchsorted_many
+from .sorted_index import SortedIndex
 
 T = TypeVar('T')
 
@@ -25,7 +28,7 @@ T = TypeVar('T')
     Precondiciones:
     - El array debe estar ordenado
     """
-class BinarySearch(SearchAlgorithm):
+class BinarySearch(SortedSearchAlgorithm):
     
     """
         Inicializa el algoritmo de búsqueda binaria.
@@ -50,23 +53,93 @@ class BinarySearch(SearchAlgorithm):
         self.reset_iterations()
         self.log(f"\nBúsqueda Binaria:")
         
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
         left, right = 0, len(arr) - 1
+        tracing, probe = self.tracing, self._probe
         
         while left <= right:
             self._iterations += 1
             mid = left + (right - left) // 2
+            value = arr[mid]
             
-            self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {arr[mid]} con {target}")
+            if tracing:
+                self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {value} con {target}")
+            if probe is not None:
+                probe.narrow(left, right)
+                probe.compare(mid, value)
             
-            if arr[mid] == target:
+            if value == target:
                 return mid
-            elif arr[mid] < target:
+            elif value < target:
                 left = mid + 1
             else:
                 right = mid - 1
                 
         return -1
     
+    
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        
+        Mantiene el mismo resultado y el mismo conteo de iteraciones que search, pero
+        no construye mensajes y lleva el contador en una variable local.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        left, right = 0, len(arr) - 1
+        iterations = 0
+        
+        while left <= right:
+            iterations += 1
+            mid = (left + right) // 2
+            value = arr[mid]
+            
+            if value == target:
+                self._local.iterations = iterations
+                return mid
+            elif value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+                
+        self._local.iterations = iterations
+        return -1
+
+    """
+        Busca en un SortedIndex.
+        
+        Los objetivos fuera de [min, max] se descartan en O(1). Si no, una búsqueda
+        binaria sobre la tabla de separadores localiza el segmento del objetivo (a lo
+        sumo fence_step posiciones) y bisect lo resuelve dentro de él sobre el búfer
+        tipado; ambas búsquedas binarias ocurren en código nativo. Las iteraciones
+        son las comparaciones de las dos búsquedas.
+        
+        Args:
+            index (SortedIndex): El índice en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+        """
+    def _search_index(self, index: SortedIndex, target: T) -> int:
+        if not index.covers(target):
+            self._iterations = 0
+            if self.tracing:
+                self.log(f"{target} está fuera del rango [{index.min}, {index.max}] del índice")
+            return -1
+        
+        lo, hi = index.segment(target)
+        data = index.data
+        pos = bisect_left(data, target, lo, hi)
+        self._iterations = index.fence_steps + (hi - lo).bit_length()
+        if self.tracing:
+            self.log(f"Segmento [{lo}, {hi}] de la tabla de separadores, punto de inserción {pos}")
+        return pos if pos < len(data) and data[pos] == target else -1
+
     """
         Busca un elemento objetivo en un rango específico del arreglo.
         
@@ -85,18 +158,107 @@ class BinarySearch(SearchAlgorithm):
     def search_range(self, arr: List[T], target: T, left: int, right: int, start_iteration: int = 0) -> int:
         self.reset_iterations()
         self._iterations = start_iteration
+        tracing, probe = self.tracing, self._probe
         
         while left <= right:
             mid = left + (right - left) // 2
+            value = arr[mid]
             
-            self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {arr[mid]} con {target}")
+            if tracing:
+                self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {value} con {target}")
+            if probe is not None:
+                probe.narrow(left, right)
+                probe.compare(mid, value)
             self._iterations += 1
             
-            if arr[mid] == target:
+            if value == target:
                 return mid
-            elif arr[mid] < target:
+            elif value < target:
                 left = mid + 1
             else:
                 right = mid - 1
                 
-        return -1 
\ No newline at end of file
+        return -1
+
+    """
+        Busca varios elementos objetivo en el arreglo ordenado en una sola llamada.
+        
+        Todas las consultas se resuelven con numpy.searchsorted (o bisect si NumPy no
+        está instalado), sin recorrer el ciclo de la búsqueda binaria en el intérprete.
+        Con elementos duplicados se devuelve la primera aparición.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+            
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        self.log(f"\nBúsqueda Binaria por lotes:")
+        indices, self._iterations = searchsorted_many(arr, targets)
+        return indices
+    
+    """
+        Obtiene la primera posición cuyo valor no es menor que el objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def lower_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        if hi is None:
+            hi = len(arr)
+        tracing = self.tracing
+        iterations = 0
+        
+        while lo < hi:
+            iterations += 1
+            mid = (lo + hi) // 2
+            if tracing:
+                self.log(f"Iteración {iterations}: izquierda={lo}, medio={mid}, derecha={hi}, Comparando {arr[mid]} con {target}")
+            
+            if arr[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+                
+        self._iterations = iterations
+        return lo
+    
+    """
+        Obtiene la primera posición cuyo valor es mayor que el objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def upper_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        if hi is None:
+            hi = len(arr)
+        tracing = self.tracing
+        iterations = 0
+        
+        while lo < hi:
+            iterations += 1
+            mid = (lo + hi) // 2
+            if tracing:
+                self.log(f"Iteración {iterations}: izquierda={lo}, medio={mid}, derecha={hi}, Comparando {arr[mid]} con {target}")
+            
+            if target < arr[mid]:
+                hi = mid
+            else:
+                lo = mid + 1
+                
+        self._iterations = iterations
+        return lo
@@ -0,0 +1,354 @@
+"""
+Búsqueda con Caché de Resultados
+
+Este módulo implementa un envoltorio que guarda los resultados de cualquier
+algoritmo de búsqueda, para tráfico en el que pocos objetivos concentran la
+mayoría de las consultas.
+
+Clases:
+    LRUCache: Caché acotada que desaloja la entrada usada hace más tiempo
+    LFUCache: Caché acotada que desaloja la entrada usada menos veces
+    CachedSearch: Envoltorio con caché de resultados para un SearchAlgorithm
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Tuple, TypeVar, Optional
+import logging
+from .base import SearchAlgorithm
+
+T = TypeVar('T')
+
+"""
+    Caché acotada con política LRU (menos usada recientemente).
+
+    Atributos:
+        capacity (int): Número máximo de entradas
+    """
+class LRUCache:
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    """
+        Obtiene el valor de una clave y la marca como usada recientemente.
+
+        Returns:
+            El valor guardado, o None si la clave no está en la caché
+        """
+    def get(self, key: Hashable) -> Any:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    """
+        Guarda un valor, desalojando la entrada usada hace más tiempo si está llena.
+
+        Returns:
+            bool: True si se desalojó una entrada
+        """
+    def put(self, key: Hashable, value: Any) -> bool:
+        if self.capacity <= 0:
+            return False
+        if key in self._entries:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            return False
+
+        evicted = len(self._entries) >= self.capacity
+        if evicted:
+            self._entries.popitem(last=False)
+        self._entries[key] = value
+        return evicted
+
+    """Elimina todas las entradas."""
+    def clear(self) -> None:
+        self._entries.clear()
+
+"""
+    Caché acotada con política LFU (menos frecuentemente usada).
+
+    Las claves se agrupan por número de usos, así que obtener, guardar y desalojar
+    cuestan O(1). Entre claves con el mismo número de usos se desaloja la más antigua.
+
+    Atributos:
+        capacity (int): Número máximo de entradas
+    """
+class LFUCache:
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._values: Dict[Hashable, Any] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    """Pasa una clave al grupo del siguiente número de usos."""
+    def _touch(self, key: Hashable) -> None:
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    """
+        Obtiene el valor de una clave y cuenta un uso.
+
+        Returns:
+            El valor guardado, o None si la clave no está en la caché
+        """
+    def get(self, key: Hashable) -> Any:
+        value = self._values.get(key)
+        if value is not None:
+            self._touch(key)
+        return value
+
+    """
+        Guarda un valor, desalojando la entrada menos usada si está llena.
+
+        Returns:
+            bool: True si se desalojó una entrada
+        """
+    def put(self, key: Hashable, value: Any) -> bool:
+        if self.capacity <= 0:
+            return False
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return False
+
+        evicted = len(self._values) >= self.capacity
+        if evicted:
+            bucket = self._buckets[self._min_count]
+            old_key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._values[old_key]
+            del self._counts[old_key]
+
+        self._values[key] = value
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+        return evicted
+
+    """Elimina todas las entradas."""
+    def clear(self) -> None:
+        self._values.clear()
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+# Políticas de desalojo disponibles
+_POLICIES = {
+    'lru': LRUCache,
+    'lfu': LFUCache,
+}
+
+# Arreglos distintos cuya versión se recuerda; al registrar uno más se olvida el
+# más antiguo y sus entradas quedan en la caché hasta que se desalojan
+MAX_SOURCES = 16
+
+"""
+    Envoltorio que guarda los resultados de un algoritmo de búsqueda.
+
+    Memoriza (versión del arreglo, target) -> índice (incluidos los -1). Cada
+    arreglo recibe una versión la primera vez que se busca en él, así que alternar
+    entre varios arreglos no vacía la caché: todos comparten la misma capacidad y
+    la política de desalojo. Se recuerdan hasta MAX_SOURCES arreglos, con una
+    referencia a cada uno para que su identidad no se reutilice. Tras modificar un
+    arreglo hay que llamar a mark_changed(), que vacía la caché.
+
+    En un acierto no se ejecuta ninguna búsqueda y iterations vale 0; en un fallo
+    iterations es el del algoritmo envuelto. Así run_performance_test sigue
+    reportando el trabajo real de cada consulta.
+
+    Atributos:
+        algorithm (SearchAlgorithm): El algoritmo envuelto
+        hits (int): Consultas resueltas por la caché
+        misses (int): Consultas que ejecutaron el algoritmo envuelto
+        evictions (int): Entradas desalojadas por falta de espacio
+        invalidations (int): Veces que la caché se vació con mark_changed()
+    """
+class CachedSearch(SearchAlgorithm):
+
+    """
+        Inicializa el envoltorio con caché.
+
+        Args:
+            algorithm (SearchAlgorithm): El algoritmo a envolver
+            capacity (int, optional): Número máximo de resultados guardados. Por defecto 1024.
+            policy (str, optional): Política de desalojo, 'lru' o 'lfu'. Por defecto 'lru'.
+            logger (logging.Logger, optional): Instancia de logger. Por defecto el del algoritmo envuelto.
+
+        Raises:
+            ValueError: Si la política no es 'lru' ni 'lfu'
+        """
+    def __init__(self, algorithm: SearchAlgorithm, capacity: int = 1024, policy: str = 'lru',
+                 logger: Optional[logging.Logger] = None):
+        if policy not in _POLICIES:
+            raise ValueError(f"Política de caché desconocida: {policy!r} (se esperaba 'lru' o 'lfu')")
+        self.algorithm = algorithm
+        self.policy = policy
+        self._cache = _POLICIES[policy](capacity)
+        self._sources: Dict[int, Tuple[List[T], int]] = {}
+        self._next_version = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        super().__init__(f"Cached {algorithm.name}", logger if logger is not None else algorithm.logger)
+
+    """
+        Establece el logger del envoltorio y del algoritmo envuelto.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    @SearchAlgorithm.logger.setter
+    def logger(self, logger: Optional[logging.Logger]) -> None:
+        SearchAlgorithm.logger.fset(self, logger)
+        self.algorithm.logger = logger
+
+    """Obtiene la capacidad de la caché."""
+    @property
+    def capacity(self) -> int:
+        return self._cache.capacity
+
+    """
+        Obtiene las estadísticas de la caché.
+
+        Returns:
+            Dict[str, Any]: Aciertos, fallos, desalojos, invalidaciones, entradas
+            actuales, capacidad y tasa de aciertos
+        """
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._cache),
+                'capacity': self._cache.capacity,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    """Reinicia los contadores de estadísticas sin vaciar la caché."""
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    """
+        Indica que el arreglo cambió y que los resultados guardados ya no son válidos.
+
+        Las búsquedas que estaban en curso no guardan su resultado.
+        """
+    def mark_changed(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    """
+        Obtiene la versión de un arreglo, registrándolo si es la primera vez que se usa.
+        Debe llamarse con _lock adquirido.
+        """
+    def _version(self, arr: List[T]) -> int:
+        entry = self._sources.get(id(arr))
+        if entry is not None and entry[0] is arr:
+            return entry[1]
+        if len(self._sources) >= MAX_SOURCES:
+            del self._sources[next(iter(self._sources))]
+        version = self._next_version
+        self._next_version += 1
+        self._sources[id(arr)] = (arr, version)
+        return version
+
+    """
+        Consulta la caché y cuenta el acierto o el fallo.
+
+        Las políticas reordenan sus entradas en cada consulta, así que todo se hace
+        bajo _lock.
+
+        Returns:
+            Tuple[Optional[int], Any, int]: El índice guardado (None si no está), la
+            clave para guardar el resultado (None si target no es hashable) y la
+            generación de la caché al consultarla
+        """
+    def _lookup(self, arr: List[T], target: T) -> Tuple[Optional[int], Any, int]:
+        with self._lock:
+            key = (self._version(arr), target)
+            try:
+                index = self._cache.get(key)
+            except TypeError:
+                key = index = None
+            if index is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return index, key, self._generation
+
+    """
+        Guarda el resultado de un fallo, salvo que la caché se haya invalidado
+        mientras se buscaba.
+        """
+    def _store(self, key: Any, index: int, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._cache.put(key, index):
+                self.evictions += 1
+
+    """
+        Busca un elemento objetivo, consultando primero la caché.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        index, key, generation = self._lookup(arr, target)
+        if index is not None:
+            self._iterations = 0
+            self.log(f"Caché: acierto para {target}, índice {index}")
+            return index
+
+        self.log(f"Caché: fallo para {target}, se busca con {self.algorithm.name}")
+        index = self.algorithm.search(arr, target)
+        self._iterations = self.algorithm.iterations
+        if key is not None:
+            self._store(key, index, generation)
+        return index
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        index, key, generation = self._lookup(arr, target)
+        if index is not None:
+            self._iterations = 0
+            return index
+
+        index = self.algorithm.search(arr, target)
+        self._iterations = self.algorithm.iterations
+        if key is not None:
+            self._store(key, index, generation)
+        return index
@@ -0,0 +1,186 @@
+"""
+Cascada Fraccional
+
+Este módulo implementa la cascada fraccional (fractional cascading) para buscar
+un mismo objetivo en varios arreglos ordenados a la vez.
+
+Clases:
+    FractionalCascading: Estructura para buscar un objetivo en k arreglos ordenados
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Sequence, TypeVar, Optional
+import logging
+
+T = TypeVar('T')
+
+"""
+    Implementación de la Cascada Fraccional.
+
+    Buscar el mismo objetivo en k arreglos ordenados con k búsquedas binarias
+    independientes cuesta O(k log n). La cascada fraccional construye, de atrás
+    hacia adelante, una lista aumentada por arreglo: M[k-1] es el último arreglo y
+    M[i] es la mezcla del arreglo i con uno de cada dos elementos de M[i+1]. Cada
+    posición de M[i] guarda su punto de inserción en el arreglo i y en M[i+1].
+
+    Una consulta hace una sola búsqueda binaria en M[0] y después baja por los
+    niveles siguiendo los punteros; en cada nivel la posición correcta está a lo
+    sumo un lugar antes de la que indica el puntero.
+
+    Complejidad Temporal: O(n) de construcción, O(log n + k) por consulta
+    Complejidad Espacial: O(n), donde n es el total de elementos de los arreglos
+
+    Precondiciones:
+    - Cada arreglo debe estar ordenado
+    - Los elementos de todos los arreglos deben ser comparables entre sí
+
+    Atributos:
+        name (str): El nombre de la estructura
+        logger (logging.Logger): Instancia de logger
+        _iterations (int): Comparaciones realizadas durante la última consulta
+    """
+class FractionalCascading:
+
+    """
+        Construye la cascada a partir de una lista de arreglos ordenados.
+
+        Args:
+            arrays (Sequence[Sequence[T]]): Los arreglos ordenados
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    def __init__(self, arrays: Sequence[Sequence[T]], logger: Optional[logging.Logger] = None):
+        self.name = "Fractional Cascading"
+        self.logger = logger
+        self._iterations = 0
+        self._arrays = list(arrays)
+        self._merged: List[List[T]] = []
+        self._own: List[array] = []
+        self._bridges: List[array] = []
+        self._build()
+
+    """
+        Construye las listas aumentadas y sus punteros, del último arreglo al primero.
+        """
+    def _build(self) -> None:
+        k = len(self._arrays)
+        merged: List[List[T]] = [[] for _ in range(k)]
+        own: List[array] = [array('q') for _ in range(k)]
+        bridges: List[array] = [array('q') for _ in range(k)]
+
+        below: List[T] = []
+        for i in range(k - 1, -1, -1):
+            values = self._arrays[i]
+            # sorted() reconoce las dos corridas ya ordenadas y las mezcla en tiempo lineal
+            level = sorted(list(values) + below[1::2])
+
+            # Punto de inserción de cada elemento en el arreglo propio y en el nivel de abajo
+            own_positions = array('q', bytes(8 * (len(level) + 1)))
+            bridge_positions = array('q', bytes(8 * (len(level) + 1)))
+            a = b = 0
+            for j, value in enumerate(level):
+                while a < len(values) and values[a] < value:
+                    a += 1
+                while b < len(below) and below[b] < value:
+                    b += 1
+                own_positions[j] = a
+                bridge_positions[j] = b
+            # Centinela para los objetivos mayores que todos los elementos del nivel
+            own_positions[len(level)] = len(values)
+            bridge_positions[len(level)] = len(below)
+
+            merged[i] = level
+            own[i] = own_positions
+            bridges[i] = bridge_positions
+            below = level
+
+        self._merged = merged
+        self._own = own
+        self._bridges = bridges
+
+    """Obtiene los arreglos con los que se construyó la cascada."""
+    @property
+    def arrays(self) -> List[Sequence[T]]:
+        return self._arrays
+
+    """Obtiene el número de comparaciones realizadas durante la última consulta."""
+    @property
+    def iterations(self) -> int:
+        return self._iterations
+
+    """Obtiene el número de arreglos de la cascada."""
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    """
+        Registra un mensaje si hay un logger configurado.
+
+        Args:
+            message (str): Mensaje a registrar
+        """
+    def log(self, message: str) -> None:
+        if self.logger:
+            self.logger.info(message)
+
+    """
+        Calcula el punto de inserción del objetivo en cada arreglo.
+
+        Args:
+            target (T): El elemento objetivo
+
+        Returns:
+            List[int]: Para cada arreglo, la primera posición cuyo valor no es menor
+            que target (equivalente a bisect_left)
+        """
+    def lower_bounds(self, target: T) -> List[int]:
+        k = len(self._arrays)
+        if k == 0:
+            self._iterations = 0
+            return []
+
+        tracing = self.logger is not None and self.logger.isEnabledFor(logging.INFO)
+        merged = self._merged
+
+        # Única búsqueda binaria, en la lista aumentada del primer nivel
+        level = merged[0]
+        pos = bisect_left(level, target)
+        iterations = len(level).bit_length()
+
+        result = [0] * k
+        for i in range(k):
+            result[i] = self._own[i][pos]
+            if tracing:
+                self.log(f"Nivel {i}: posición aumentada={pos}, posición en el arreglo={result[i]}")
+            if i + 1 == k:
+                break
+
+            # El puntero cae en el nivel de abajo a lo sumo un lugar después de la posición correcta
+            pos = self._bridges[i][pos]
+            below = merged[i + 1]
+            while pos > 0 and not (below[pos - 1] < target):
+                iterations += 1
+                pos -= 1
+            iterations += 1
+
+        self._iterations = iterations
+        return result
+
+    """
+        Busca el objetivo en cada uno de los arreglos.
+
+        Args:
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            List[int]: Para cada arreglo, el índice de la primera aparición del
+            objetivo, o -1 si no se encuentra
+        """
+    def search(self, target: T) -> List[int]:
+        self.log(f"\nBúsqueda con Cascada Fraccional en {len(self._arrays)} arreglos:")
+
+        positions = self.lower_bounds(target)
+        for i, values in enumerate(self._arrays):
+            pos = positions[i]
+            if pos >= len(values) or values[pos] != target:
+                positions[i] = -1
+        return positions
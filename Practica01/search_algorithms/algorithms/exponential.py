@@ -5,15 +5,57 @@ Este módulo implementa el algoritmo de búsqueda exponencial.
 
 Clases:
     ExponentialSearch: Implementación del algoritmo de búsqueda exponencial
+    FingerSearchCursor: Cursor de búsqueda exponencial que parte de la posición anterior
+
+Funciones:
+    gallop_left: Paso de galope (avance exponencial y bisect) desde una posición
 """
 
-from typing import List, TypeVar, Optional
+from bisect import bisect_left
+from typing import Any, Iterable, List, Sequence, Tuple, TypeVar, Optional
 import logging
-from .base import SearchAlgorithm
-from .binary import BinarySearch
+from .base import SortedSearchAlgorithm
+from .vectorized import index_array, searchsorted_many
+from .sorted_index import SortedIndex
 
 T = TypeVar('T')
 
+"""
+    Obtiene la primera posición en [lo, hi) cuyo valor no es menor que el objetivo,
+    galopando desde lo.
+    
+    Compara las posiciones lo, lo+step, lo+2·step, lo+4·step, ... hasta pasar el
+    objetivo y termina con bisect en el último intervalo, así que cuesta
+    O(log(d/step) + log step), con d la distancia de lo al resultado. Es el paso
+    que usan merge_search, la búsqueda en un SortedIndex, el avance hacia la
+    derecha de FingerSearchCursor y las operaciones de conjuntos de sorted_sets;
+    cuando se conoce la distancia esperada (por ejemplo, n/m al intersecar m
+    valores con n), usarla como step ahorra las primeras comparaciones del galope.
+    
+    Args:
+        arr (Sequence[T]): El arreglo ordenado en el que buscar
+        target (T): El elemento objetivo
+        lo (int): Inicio del rango de búsqueda (incluido)
+        hi (int): Fin del rango de búsqueda (excluido)
+        step (int, optional): Primer salto del galope. Por defecto 1.
+        
+    Returns:
+        Tuple[int, int]: La posición en [lo, hi] y el número de iteraciones, contadas
+        igual que en lower_bound (comparaciones del galope más pasos de bisect)
+    """
+def gallop_left(arr: Sequence[T], target: T, lo: int, hi: int, step: int = 1) -> Tuple[int, int]:
+    iterations = 0
+    start = probe = lo
+    while probe < hi and arr[probe] < target:
+        iterations += 1
+        start = probe + 1
+        probe = lo + step
+        step <<= 1
+    if probe < hi:
+        iterations += 1
+    end = min(probe, hi)
+    return bisect_left(arr, target, start, end), iterations + (end - start).bit_length()
+
 """
     Implementación del Algoritmo de Búsqueda Exponencial.
     
@@ -27,7 +69,7 @@ T = TypeVar('T')
     Precondiciones:
     - El arreglo debe estar ordenado
     """
-class ExponentialSearch(SearchAlgorithm):
+class ExponentialSearch(SortedSearchAlgorithm):
     
     """
         Inicializa el algoritmo de búsqueda exponencial.
@@ -37,7 +79,6 @@ class ExponentialSearch(SearchAlgorithm):
         """
     def __init__(self, logger: Optional[logging.Logger] = None):
         super().__init__("Exponential Search", logger)
-        self._binary_search = BinarySearch(logger)
         
     """
         Busca un elemento objetivo en el arreglo utilizando búsqueda exponencial.
@@ -53,34 +94,454 @@ class ExponentialSearch(SearchAlgorithm):
         self.reset_iterations()
         self.log(f"\nBúsqueda Exponencial:")
         
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
         n = len(arr)
         
         # Manejo del arreglo en caso de ser vacío
         if n == 0:
             return -1
         
+        tracing, probe = self.tracing, self._probe
+        if probe is not None:
+            probe.phase("avance exponencial")
+            probe.compare(0, arr[0])
+        
         # Comprobamos el primer elemento
         if arr[0] == target:
             self._iterations += 1
-            self.log(f"Iteración {self._iterations}: Comparando posición 0, valor {arr[0]} con {target}")
+            if tracing:
+                self.log(f"Iteración {self._iterations}: Comparando posición 0, valor {arr[0]} con {target}")
             return 0
         
         # Encontramos el rango para la búsqueda binaria
         i = 1
-        while i < n and arr[i] <= target:
+        while i < n:
+            value = arr[i]
+            if probe is not None:
+                probe.compare(i, value)
+            if not value <= target:
+                break
             self._iterations += 1
-            self.log(f"Iteración {self._iterations}: Comprobando posición {i}, valor {arr[i]}")
+            if tracing:
+                self.log(f"Iteración {self._iterations}: Comprobando posición {i}, valor {value}")
             i = i * 2
         
         # Realizamos la búsqueda binaria en el rango
         start = i // 2
         end = min(i, n - 1)
         
+        if tracing:
+            self.log(f"Realizando búsqueda binaria en el rango [{start}, {end}]")
+        if probe is not None:
+            probe.phase("búsqueda binaria")
+        
+        # La búsqueda binaria se hace aquí y no con una instancia de BinarySearch,
+        # para no compartir su contador entre búsquedas de distintos hilos
+        left, right = start, end
+        while left <= right:
+            mid = left + (right - left) // 2
+            value = arr[mid]
+            
+            if tracing:
+                self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {value} con {target}")
+            if probe is not None:
+                probe.narrow(left, right)
+                probe.compare(mid, value)
+            self._iterations += 1
+            
+            if value == target:
+                return mid
+            elif value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+                
+        return -1
+
+    
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        
+        Realiza el avance exponencial y la búsqueda binaria en el mismo ciclo y cuenta
+        las iteraciones igual que search.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        n = len(arr)
+        
+        if n == 0:
+            self._local.iterations = 0
+            return -1
+        
+        if arr[0] == target:
+            self._local.iterations = 1
+            return 0
+        
+        # Encontramos el rango para la búsqueda binaria
+        iterations = 0
+        i = 1
+        while i < n and arr[i] <= target:
+            iterations += 1
+            i = i * 2
+            
+        left, right = i // 2, min(i, n - 1)
+        
+        # Búsqueda binaria en el rango
+        while left <= right:
+            iterations += 1
+            mid = (left + right) // 2
+            value = arr[mid]
+            
+            if value == target:
+                self._local.iterations = iterations
+                return mid
+            elif value < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+                
+        self._local.iterations = iterations
+        return -1
+
+    """
+        Busca en un SortedIndex.
+        
+        Los objetivos fuera de [min, max] se descartan en O(1). Si no, gallop_left
+        avanza exponencialmente directamente sobre el búfer tipado y bisect resuelve
+        el rango final en código nativo.
+        
+        Args:
+            index (SortedIndex): El índice en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+        """
+    def _search_index(self, index: SortedIndex, target: T) -> int:
+        if not index.covers(target):
+            self._iterations = 0
+            if self.tracing:
+                self.log(f"{target} está fuera del rango [{index.min}, {index.max}] del índice")
+            return -1
+        
+        data = index.data
+        n = len(data)
+        pos, self._iterations = gallop_left(data, target, 0, n)
+        if self.tracing:
+            self.log(f"Punto de inserción {pos} tras {self._iterations} iteraciones")
+        return pos if pos < n and data[pos] == target else -1
+
+    """
+        Busca varios elementos objetivo en el arreglo ordenado en una sola llamada.
+        
+        Todas las consultas se resuelven con numpy.searchsorted (o bisect si NumPy no
+        está instalado), sin recorrer el ciclo de la búsqueda exponencial en el intérprete.
+        Con elementos duplicados se devuelve la primera aparición.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+            
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        self.log(f"\nBúsqueda Exponencial por lotes:")
+        indices, self._iterations = searchsorted_many(arr, targets)
+        return indices
+    
+    """
+        Busca un lote de objetivos recorriendo el arreglo una sola vez (merge join).
+        
+        Los objetivos se procesan en orden creciente y cada búsqueda avanza
+        exponencialmente desde la posición donde terminó la anterior, así que el
+        costo de cada una es logarítmico en la distancia recorrida y no en el tamaño
+        del arreglo: O(m log(n/m)) en total para m objetivos, en lugar de O(m log n).
+        
+        Si presorted es True los objetivos no se ordenan; si alguno es menor que el
+        anterior, su búsqueda vuelve a empezar desde el inicio del arreglo, por lo que
+        el resultado sigue siendo correcto.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+            presorted (bool, optional): Indica que targets ya está ordenado. Por defecto False.
+            
+        Returns:
+            Arreglo de índices en el orden original de targets, con -1 para los no
+            encontrados (numpy.ndarray si NumPy está instalado, array('q') si no)
+        """
+    def merge_search(self, arr: List[T], targets: Iterable[T], presorted: bool = False) -> Any:
+        self.log(f"\nBúsqueda Exponencial por lotes ordenados:")
+        
+        targets = list(targets)
+        order = range(len(targets)) if presorted else sorted(range(len(targets)), key=targets.__getitem__)
+        n = len(arr)
+        tracing = self.tracing
+        indices = [-1] * len(targets)
+        total_iterations = 0
+        pos = 0
+        previous = None
+        
+        for i in order:
+            target = targets[i]
+            if previous is not None and target < previous:
+                pos = 0
+            previous = target
+            
+            if tracing:
+                pos = self.lower_bound(arr, target, pos)
+                total_iterations += self._iterations
+            else:
+                pos, iterations = gallop_left(arr, target, pos, n)
+                total_iterations += iterations
+                
+            if pos < n and arr[pos] == target:
+                indices[i] = pos
+                
+        self._iterations = total_iterations
+        return index_array(indices)
+    
+    """
+        Crea un cursor de búsqueda por dedo (finger search) sobre el arreglo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que se va a buscar
+            position (int, optional): Posición inicial del dedo. Por defecto 0.
+            
+        Returns:
+            FingerSearchCursor: Un cursor nuevo, con su propio estado
+        """
+    def cursor(self, arr: List[T], position: int = 0) -> 'FingerSearchCursor':
+        return FingerSearchCursor(arr, position, self.logger)
+    
+    """
+        Avanza exponencialmente desde lo hasta encontrar el rango que contiene el límite buscado.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int): Fin del rango de búsqueda (excluido)
+            strict (bool): Si es True se busca el primer valor mayor que el objetivo
+                           (upper_bound); si es False, el primero no menor (lower_bound)
+            
+        Returns:
+            Tuple[int, int, int]: El rango [inicio, fin) donde está el límite y el
+            número de iteraciones realizadas
+        """
+    def _gallop(self, arr: List[T], target: T, lo: int, hi: int, strict: bool) -> Tuple[int, int, int]:
+        tracing = self.tracing
+        iterations = 0
+        step = 1
+        prev = lo
+        i = lo
+        
+        while i < hi:
+            iterations += 1
+            if tracing:
+                self.log(f"Iteración {iterations}: Comprobando posición {i}, valor {arr[i]}")
+            if (target < arr[i]) if strict else not (arr[i] < target):
+                break
+            prev = i + 1
+            i = lo + step
+            step *= 2
+            
+        return prev, min(i, hi), iterations
+    
+    """
+        Búsqueda binaria del límite dentro del rango encontrado por _gallop.
+        
+        Cuenta y registra las iteraciones igual que BinarySearch.lower_bound y
+        upper_bound, pero las devuelve en lugar de guardarlas en la instancia.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango (incluido)
+            hi (int): Fin del rango (excluido)
+            strict (bool): Igual que en _gallop
+            
+        Returns:
+            Tuple[int, int]: La posición del límite y el número de iteraciones realizadas
+        """
+    def _bisect(self, arr: List[T], target: T, lo: int, hi: int, strict: bool) -> Tuple[int, int]:
+        tracing = self.tracing
+        iterations = 0
+        
+        while lo < hi:
+            iterations += 1
+            mid = (lo + hi) // 2
+            if tracing:
+                self.log(f"Iteración {iterations}: izquierda={lo}, medio={mid}, derecha={hi}, Comparando {arr[mid]} con {target}")
+            
+            if (target < arr[mid]) if strict else not (arr[mid] < target):
+                hi = mid
+            else:
+                lo = mid + 1
+                
+        return lo, iterations
+    
+    """
+        Obtiene la primera posición cuyo valor no es menor que el objetivo.
+        
+        Avanza exponencialmente desde lo y termina con una búsqueda binaria en el rango
+        encontrado, por lo que el costo es O(log d), con d la distancia de lo al resultado.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def lower_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        if hi is None:
+            hi = len(arr)
+        start, end, iterations = self._gallop(arr, target, lo, hi, strict=False)
+        
+        self.log(f"Realizando búsqueda binaria en el rango [{start}, {end}]")
+        result, binary_iterations = self._bisect(arr, target, start, end, strict=False)
+        self._iterations = iterations + binary_iterations
+        return result
+    
+    """
+        Obtiene la primera posición cuyo valor es mayor que el objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def upper_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        if hi is None:
+            hi = len(arr)
+        start, end, iterations = self._gallop(arr, target, lo, hi, strict=True)
+        
         self.log(f"Realizando búsqueda binaria en el rango [{start}, {end}]")
+        result, binary_iterations = self._bisect(arr, target, start, end, strict=True)
+        self._iterations = iterations + binary_iterations
+        return result
+
+
+"""
+    Cursor de búsqueda por dedo (finger search) sobre un arreglo ordenado.
+    
+    Recuerda la posición del último resultado (el dedo) y cada búsqueda avanza
+    exponencialmente hacia la izquierda o hacia la derecha desde ahí, para terminar
+    con una búsqueda binaria en el rango encontrado. Cuando los objetivos
+    consecutivos están cerca, el costo es O(log d), donde d es la distancia entre
+    el resultado anterior y el nuevo.
+    
+    Todo el estado (dedo y contador de iteraciones) vive en el cursor y el arreglo
+    solo se lee, así que varios hilos pueden buscar en el mismo arreglo siempre que
+    cada uno use su propio cursor. Un mismo cursor no debe compartirse entre hilos.
+    
+    Complejidad Temporal: O(log d) por búsqueda
+    Complejidad Espacial: O(1)
+    
+    Precondiciones:
+    - El arreglo debe estar ordenado
+    """
+class FingerSearchCursor:
+    
+    """
+        Inicializa el cursor.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            position (int, optional): Posición inicial del dedo. Por defecto 0.
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    def __init__(self, arr: List[T], position: int = 0, logger: Optional[logging.Logger] = None):
+        self.arr = arr
+        self.logger = logger
+        self._finger = 0
+        self._iterations = 0
+        self.reset(position)
+        
+    """Obtiene la posición actual del dedo."""
+    @property
+    def position(self) -> int:
+        return self._finger
+    
+    """Obtiene el número de iteraciones realizadas durante la última búsqueda."""
+    @property
+    def iterations(self) -> int:
+        return self._iterations
+    
+    """
+        Mueve el dedo a una posición, limitada al rango del arreglo.
+        
+        Args:
+            position (int, optional): Nueva posición del dedo. Por defecto 0.
+        """
+    def reset(self, position: int = 0) -> None:
+        self._finger = min(max(position, 0), max(len(self.arr) - 1, 0))
+        
+    """
+        Obtiene la primera posición cuyo valor no es menor que el objetivo,
+        avanzando exponencialmente desde el dedo.
+        
+        Args:
+            target (T): El elemento objetivo
+            
+        Returns:
+            int: Posición en [0, len(arr)]
+        """
+    def lower_bound(self, target: T) -> int:
+        arr = self.arr
+        n = len(arr)
+        if n == 0:
+            self._iterations = 0
+            return 0
         
-        result = self._binary_search.search_range(arr, target, start, end, self._iterations)
+        finger = self._finger
+        # Hacia la derecha con gallop_left; su primera comparación es la del dedo
+        pos, iterations = gallop_left(arr, target, finger, n)
+        if pos == finger:
+            # Hacia la izquierda: el límite está en [0, finger]
+            hi, probe = finger, finger - 1
+            step = 1
+            while probe >= 0 and not (arr[probe] < target):
+                iterations += 1
+                hi = probe
+                step <<= 1
+                probe = finger - step
+            if probe >= 0:
+                iterations += 1
+            lo = max(probe + 1, 0)
+            pos = bisect_left(arr, target, lo, hi)
+            iterations += (hi - lo).bit_length()
+            
+        self._iterations = iterations
+        self._finger = min(pos, n - 1)
         
-        # Actualizamos las iteraciones desde la búsqueda binaria
-        self._iterations = self._binary_search.iterations
+        if self.logger and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Búsqueda por dedo: dedo {finger} -> {self._finger}, {self._iterations} iteraciones")
+        return pos
+    
+    """
+        Busca un elemento objetivo partiendo de la posición del resultado anterior.
         
-        return result 
\ No newline at end of file
+        Args:
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+        """
+    def search(self, target: T) -> int:
+        pos = self.lower_bound(target)
+        if pos < len(self.arr) and self.arr[pos] == target:
+            return pos
+        return -1
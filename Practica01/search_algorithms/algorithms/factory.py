@@ -7,30 +7,52 @@ Clases:
     SearchAlgorithmFactory: Fábrica para crear instancias de algoritmos de búsqueda
 """
 
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Union
+import importlib
 import logging
 from .base import SearchAlgorithm
-from .linear import LinearSearch
-from .binary import BinarySearch
-from .exponential import ExponentialSearch
-from .interpolation import InterpolationSearch
 
 """
     Fábrica para crear instancias de algoritmos de búsqueda.
     
     Esta fábrica mantiene un registro de los algoritmos de búsqueda disponibles
     y proporciona métodos para crear y recuperar instancias de algoritmos.
+    
+    Una entrada del registro puede ser la clase o la ruta 'modulo.Clase' (relativa
+    a este paquete si empieza con un punto); el módulo se importa la primera vez
+    que se pide el algoritmo y la entrada se reemplaza por la clase.
     """
 class SearchAlgorithmFactory:
     
     # Registro de algoritmos disponibles
-    _algorithms: Dict[str, Type[SearchAlgorithm]] = {
-        'linear': LinearSearch,
-        'binary': BinarySearch,
-        'exponential': ExponentialSearch,
-        'interpolation': InterpolationSearch
+    _algorithms: Dict[str, Union[Type[SearchAlgorithm], str]] = {
+        'linear': '.linear.LinearSearch',
+        'binary': '.binary.BinarySearch',
+        'exponential': '.exponential.ExponentialSearch',
+        'interpolation': '.interpolation.InterpolationSearch',
+        'learned': '.learned.LearnedIndexSearch',
+        'hash': '.hashed.HashIndexSearch',
+        'auto': '.adaptive.AdaptiveSearch'
     }
     
+    """
+        Obtiene la clase registrada con un nombre, importando su módulo si hace falta.
+        
+        Args:
+            name (str): Nombre del algoritmo, en minúsculas
+            
+        Returns:
+            Type[SearchAlgorithm]: La clase del algoritmo, o None si no está registrado
+        """
+    @classmethod
+    def _resolve(cls, name: str) -> Optional[Type[SearchAlgorithm]]:
+        entry = cls._algorithms.get(name)
+        if isinstance(entry, str):
+            module, _, class_name = entry.rpartition('.')
+            entry = getattr(importlib.import_module(module, __package__), class_name)
+            cls._algorithms[name] = entry
+        return entry
+    
     """
         Obtiene una instancia del algoritmo de búsqueda especificado.
         
@@ -43,7 +65,7 @@ class SearchAlgorithmFactory:
         """
     @classmethod
     def get_algorithm(cls, name: str, logger: Optional[logging.Logger] = None) -> Optional[SearchAlgorithm]:
-        algorithm_class = cls._algorithms.get(name.lower())
+        algorithm_class = cls._resolve(name.lower())
         
         if algorithm_class:
             return algorithm_class(logger)
@@ -60,17 +82,18 @@ class SearchAlgorithmFactory:
         """
     @classmethod
     def get_all_algorithms(cls, logger: Optional[logging.Logger] = None) -> Dict[str, SearchAlgorithm]:
-        return {name: algo_class(logger) for name, algo_class in cls._algorithms.items()}
+        return {name: cls._resolve(name)(logger) for name in list(cls._algorithms)}
     
     """
         Registra un nuevo algoritmo de búsqueda.
         
         Args:
             name (str): Nombre del algoritmo (no distingue mayúsculas/minúsculas)
-            algorithm_class (Type[SearchAlgorithm]): La clase del algoritmo a registrar
+            algorithm_class (Type[SearchAlgorithm] | str): La clase del algoritmo a registrar,
+                o su ruta 'paquete.modulo.Clase' para importarla en el primer uso
         """
     @classmethod
-    def register_algorithm(cls, name: str, algorithm_class: Type[SearchAlgorithm]) -> None:
+    def register_algorithm(cls, name: str, algorithm_class: Union[Type[SearchAlgorithm], str]) -> None:
         cls._algorithms[name.lower()] = algorithm_class
     
     """
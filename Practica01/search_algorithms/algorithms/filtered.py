@@ -0,0 +1,357 @@
+"""
+Búsqueda con Filtro de Pertenencia
+
+Este módulo implementa un filtro de Bloom y un envoltorio que lo consulta antes
+de ejecutar cualquier algoritmo de búsqueda, para tráfico en el que muchas
+consultas buscan valores que no están en el arreglo.
+
+Clases:
+    BloomFilter: Filtro de Bloom con tasa de falsos positivos configurable
+    FilteredSearch: Envoltorio que descarta con un filtro de Bloom los objetivos ausentes
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, TypeVar, Optional
+import logging
+from .base import SearchAlgorithm
+from .vectorized import load_numpy
+
+T = TypeVar('T')
+
+np = load_numpy()
+
+_MASK = (1 << 64) - 1
+
+"""
+    Mezcla los bits de un hash de 64 bits (finalizador de splitmix64).
+
+    Los hash de Python para enteros son el propio valor, así que sin mezclar
+    claves consecutivas caerían en bits consecutivos del filtro.
+    """
+def _mix(value: int) -> int:
+    z = (value + 0x9E3779B97F4A7C15) & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
+
+"""
+    Filtro de Bloom: responde si un valor "puede estar" o "no está" en un conjunto.
+
+    Cada valor marca num_hashes bits de un arreglo de num_bits bits, elegidos con
+    doble hashing (h1 + i * h2) a partir de hash(valor) mezclado con splitmix64.
+    Como parte de hash(), valores iguales (1, 1.0, True) marcan los mismos bits,
+    igual que los compara la búsqueda con ==. Nunca hay falsos negativos; la tasa
+    de falsos positivos se acerca a false_positive_rate mientras no se agreguen
+    más de capacity valores.
+
+    No admite eliminar valores: tras borrar elementos del arreglo hay que
+    reconstruirlo.
+
+    Atributos:
+        capacity (int): Número de valores para el que se dimensionó el filtro
+        false_positive_rate (float): Tasa de falsos positivos objetivo
+        num_bits (int): Tamaño del arreglo de bits
+        num_hashes (int): Bits marcados por cada valor
+        count (int): Valores agregados
+    """
+class BloomFilter:
+
+    """
+        Dimensiona un filtro vacío.
+
+        Args:
+            capacity (int): Número de valores esperado
+            false_positive_rate (float, optional): Tasa de falsos positivos objetivo. Por defecto 0.01.
+
+        Raises:
+            ValueError: Si false_positive_rate no está en (0, 1)
+        """
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"false_positive_rate debe estar en (0, 1): {false_positive_rate}")
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    """
+        Construye un filtro con todos los valores de un arreglo.
+
+        Con NumPy, los hash se calculan con map(hash, ...) y los bits se marcan de
+        forma vectorizada; sin NumPy, valor por valor.
+
+        Args:
+            values (Iterable[T]): Los valores (deben ser hashables)
+            false_positive_rate (float, optional): Tasa de falsos positivos objetivo. Por defecto 0.01.
+
+        Returns:
+            BloomFilter: El filtro con los valores agregados
+
+        Raises:
+            TypeError: Si algún valor no es hashable
+        """
+    @classmethod
+    def from_values(cls, values: Iterable[T], false_positive_rate: float = 0.01) -> 'BloomFilter':
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        bloom = cls(len(values), false_positive_rate)
+        if np is None or len(values) < 1024:
+            for value in values:
+                bloom.add(value)
+            return bloom
+
+        hashes = np.fromiter(map(hash, values), dtype=np.int64, count=len(values)).view(np.uint64)
+        with np.errstate(over='ignore'):
+            z = hashes + np.uint64(0x9E3779B97F4A7C15)
+            z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            z ^= z >> np.uint64(31)
+            h1 = z & np.uint64(0xFFFFFFFF)
+            h2 = (z >> np.uint64(32)) | np.uint64(1)
+            marked = np.zeros(len(bloom._bits) * 8, dtype=bool)
+            num_bits = np.uint64(bloom.num_bits)
+            for i in range(bloom.num_hashes):
+                marked[(h1 + np.uint64(i) * h2) % num_bits] = True
+        bloom._bits = bytearray(np.packbits(marked, bitorder='little').tobytes())
+        bloom.count = len(values)
+        return bloom
+
+    """Calcula las posiciones de los bits de un valor."""
+    def _positions(self, value: T) -> List[int]:
+        z = _mix(hash(value) & _MASK)
+        h1, h2 = z & 0xFFFFFFFF, (z >> 32) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    """
+        Agrega un valor al filtro.
+
+        Raises:
+            TypeError: Si el valor no es hashable
+        """
+    def add(self, value: T) -> None:
+        bits = self._bits
+        for position in self._positions(value):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    """
+        Indica si el valor puede estar en el filtro; False significa que seguro no está.
+
+        Raises:
+            TypeError: Si el valor no es hashable
+        """
+    def __contains__(self, value: T) -> bool:
+        z = (hash(value) + 0x9E3779B97F4A7C15) & _MASK
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+        z ^= z >> 31
+        position, step = z & 0xFFFFFFFF, (z >> 32) | 1
+        bits, num_bits = self._bits, self.num_bits
+        # Se sale en el primer bit apagado: un objetivo ausente casi nunca revisa todos
+        for _ in range(self.num_hashes):
+            position %= num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+        return True
+
+    """Obtiene la memoria ocupada por el arreglo de bits, en bytes."""
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    """Estima la tasa de falsos positivos con los valores agregados hasta ahora."""
+    @property
+    def expected_false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def __repr__(self) -> str:
+        return (f"BloomFilter(count={self.count}, num_bits={self.num_bits}, "
+                f"num_hashes={self.num_hashes}, memory_bytes={self.memory_bytes})")
+
+"""
+    Envoltorio que descarta los objetivos ausentes antes de buscar.
+
+    Al recibir un arreglo construye un filtro de Bloom con sus valores. Si el
+    filtro indica que el objetivo no está, search devuelve -1 sin ejecutar el
+    algoritmo envuelto (iterations vale 0); si no, busca con el algoritmo
+    envuelto. El filtro pertenece a un solo arreglo: si search recibe otro
+    objeto, o si se llama a mark_changed() tras modificarlo, se reconstruye.
+    Tras agregar valores al arreglo basta con llamar a add().
+
+    Si los valores del arreglo no son hashables no se usa filtro y todas las
+    consultas pasan al algoritmo envuelto.
+
+    Atributos:
+        algorithm (SearchAlgorithm): El algoritmo envuelto
+        false_positive_rate (float): Tasa de falsos positivos objetivo del filtro
+        filter (BloomFilter): El filtro del arreglo actual, o None
+        rejected (int): Consultas descartadas por el filtro
+        passed (int): Consultas que ejecutaron el algoritmo envuelto
+        false_positives (int): Consultas que pasaron el filtro y no se encontraron
+        rebuilds (int): Veces que se construyó el filtro
+    """
+class FilteredSearch(SearchAlgorithm):
+
+    """
+        Inicializa el envoltorio con filtro.
+
+        Args:
+            algorithm (SearchAlgorithm): El algoritmo a envolver
+            false_positive_rate (float, optional): Tasa de falsos positivos objetivo. Por defecto 0.01.
+            logger (logging.Logger, optional): Instancia de logger. Por defecto el del algoritmo envuelto.
+
+        Raises:
+            ValueError: Si false_positive_rate no está en (0, 1)
+        """
+    def __init__(self, algorithm: SearchAlgorithm, false_positive_rate: float = 0.01,
+                 logger: Optional[logging.Logger] = None):
+        if not 0 < false_positive_rate < 1:
+            raise ValueError(f"false_positive_rate debe estar en (0, 1): {false_positive_rate}")
+        self.algorithm = algorithm
+        self.false_positive_rate = false_positive_rate
+        self.filter: Optional[BloomFilter] = None
+        self._source = None
+        self._stale = False
+        self.rejected = 0
+        self.passed = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+        super().__init__(f"Filtered {algorithm.name}", logger if logger is not None else algorithm.logger)
+
+    """
+        Establece el logger del envoltorio y del algoritmo envuelto.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    @SearchAlgorithm.logger.setter
+    def logger(self, logger: Optional[logging.Logger]) -> None:
+        SearchAlgorithm.logger.fset(self, logger)
+        self.algorithm.logger = logger
+
+    """
+        Obtiene las estadísticas del filtro.
+
+        Returns:
+            Dict[str, Any]: Consultas descartadas, consultas que pasaron, falsos positivos,
+            tasa de aciertos del filtro (fracción de consultas resueltas sin buscar),
+            memoria del filtro en bytes, bits, funciones hash y reconstrucciones
+        """
+    @property
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.rejected + self.passed
+        bloom = self.filter
+        return {
+            'lookups': lookups,
+            'rejected': self.rejected,
+            'passed': self.passed,
+            'false_positives': self.false_positives,
+            'hit_rate': self.rejected / lookups if lookups else 0.0,
+            'memory_bytes': bloom.memory_bytes if bloom is not None else 0,
+            'num_bits': bloom.num_bits if bloom is not None else 0,
+            'num_hashes': bloom.num_hashes if bloom is not None else 0,
+            'rebuilds': self.rebuilds,
+        }
+
+    """Reinicia los contadores de estadísticas sin reconstruir el filtro."""
+    def reset_stats(self) -> None:
+        self.rejected = self.passed = self.false_positives = 0
+
+    """
+        Indica que el arreglo cambió; el filtro se reconstruye en la siguiente búsqueda.
+        """
+    def mark_changed(self) -> None:
+        self._stale = True
+
+    """
+        Agrega al filtro un valor añadido al arreglo, sin reconstruirlo.
+
+        Args:
+            value (T): El valor agregado
+        """
+    def add(self, value: T) -> None:
+        if self.filter is not None and not self._stale:
+            try:
+                self.filter.add(value)
+            except TypeError:
+                # Valor no hashable: el filtro ya no puede describir el arreglo
+                self.filter = None
+
+    """Construye el filtro para un arreglo, si otro hilo no lo construyó ya."""
+    def _build(self, arr: List[T]) -> None:
+        with self._lock:
+            if arr is self._source and not self._stale:
+                return
+            self.rebuilds += 1
+            try:
+                bloom = BloomFilter.from_values(arr, self.false_positive_rate)
+            except TypeError:
+                bloom = None
+            # El arreglo se publica al final, cuando el filtro ya está completo
+            self.filter = bloom
+            self._stale = False
+            self._source = arr
+
+    """
+        Busca un elemento objetivo, consultando primero el filtro.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        if arr is not self._source or self._stale:
+            self._build(arr)
+            self.log(f"Filtro: construido para {len(arr)} elementos ({self.stats['memory_bytes']} bytes)")
+
+        try:
+            maybe = self.filter is None or target in self.filter
+        except TypeError:
+            maybe = True
+
+        if not maybe:
+            self.rejected += 1
+            self._iterations = 0
+            self.log(f"Filtro: {target} no está en el arreglo")
+            return -1
+
+        self.passed += 1
+        self.log(f"Filtro: {target} puede estar, se busca con {self.algorithm.name}")
+        index = self.algorithm.search(arr, target)
+        self._iterations = self.algorithm.iterations
+        if index == -1:
+            self.false_positives += 1
+        return index
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if arr is not self._source or self._stale:
+            self._build(arr)
+
+        bloom = self.filter
+        if bloom is not None:
+            try:
+                maybe = target in bloom
+            except TypeError:
+                maybe = True
+            if not maybe:
+                self.rejected += 1
+                self._iterations = 0
+                return -1
+
+        self.passed += 1
+        index = self.algorithm.search(arr, target)
+        self._iterations = self.algorithm.iterations
+        if index == -1:
+            self.false_positives += 1
+        return index
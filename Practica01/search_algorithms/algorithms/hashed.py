@@ -0,0 +1,247 @@
+"""
+Búsqueda con Índice Hash
+
+Este módulo implementa una búsqueda para arreglos desordenados que construye una
+sola vez un diccionario valor -> posición y responde cada consulta en O(1).
+
+Clases:
+    HashIndexSearch: Búsqueda con índice hash de posiciones, con las mismas respuestas que LinearSearch
+"""
+
+import sys
+from typing import Any, Dict, List, TypeVar, Optional
+import logging
+from .base import SearchAlgorithm
+from .linear import LinearSearch
+from .vectorized import index_array
+
+T = TypeVar('T')
+
+"""
+    Búsqueda con índice hash de posiciones.
+
+    Al recibir un arreglo construye un diccionario que asocia cada valor con su
+    primera posición y, si all_positions es True, guarda también las posiciones
+    de los duplicados. search devuelve la primera aparición, igual que
+    LinearSearch.search, así que puede reemplazarla cuando se hacen muchas
+    consultas sobre el mismo arreglo.
+
+    El índice pertenece a un solo arreglo. Si search recibe otro objeto, el índice
+    se reconstruye; si el arreglo creció, solo se indexan los valores agregados al
+    final; si se modificaron o eliminaron valores hay que llamar a mark_changed().
+
+    Si algún valor (o el objetivo) no es hashable, la consulta se resuelve con
+    LinearSearch.
+
+    Complejidad Temporal: O(n) para construir el índice, O(1) por consulta
+    Complejidad Espacial: O(n)
+
+    Atributos:
+        all_positions (bool): Si se guardan las posiciones de todos los duplicados
+        builds (int): Veces que se construyó el índice completo
+    """
+class HashIndexSearch(SearchAlgorithm):
+
+    """
+        Inicializa la búsqueda con índice hash.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+            all_positions (bool, optional): Si se guardan todas las posiciones de cada
+                                            valor para search_all y count. Por defecto False.
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None, all_positions: bool = False):
+        self.all_positions = all_positions
+        self._linear = LinearSearch()
+        self._first: Optional[Dict[T, int]] = None
+        self._rest: Dict[T, List[int]] = {}
+        self._source = None
+        self._indexed = 0
+        self._stale = False
+        self.builds = 0
+        super().__init__("Hash Index Search", logger)
+
+    """
+        Indica que el arreglo se modificó; el índice se reconstruye en la siguiente búsqueda.
+
+        No hace falta llamarlo después de agregar valores al final del arreglo.
+        """
+    def mark_changed(self) -> None:
+        self._stale = True
+
+    """Construye el índice completo de un arreglo."""
+    def _build(self, arr: List[T]) -> None:
+        self.builds += 1
+        values = arr.tolist() if hasattr(arr, 'tolist') else list(arr)
+        n = len(values)
+        rest: Dict[T, List[int]] = {}
+        try:
+            # En el recorrido inverso la última asignación de cada valor es su primera posición
+            first = dict(zip(reversed(values), range(n - 1, -1, -1)))
+        except TypeError:
+            # Valores no hashables: se busca con LinearSearch
+            first = None
+        else:
+            if self.all_positions and len(first) < n:
+                for i, value in enumerate(values):
+                    if first[value] != i:
+                        rest.setdefault(value, []).append(i)
+
+        # El arreglo se publica al final, cuando el índice ya está completo
+        self._first, self._rest, self._indexed = first, rest, n
+        self._stale = False
+        self._source = arr
+
+    """Indexa los valores agregados al final del arreglo desde la última búsqueda."""
+    def _extend(self, arr: List[T]) -> None:
+        first, rest = self._first, self._rest
+        try:
+            for i in range(self._indexed, len(arr)):
+                value = arr[i]
+                if value not in first:
+                    first[value] = i
+                elif self.all_positions:
+                    rest.setdefault(value, []).append(i)
+        except TypeError:
+            self._first = None
+        self._indexed = len(arr)
+
+    """Actualiza el índice si el arreglo cambió y lo devuelve (None si no se puede usar)."""
+    def _index_for(self, arr: List[T]) -> Optional[Dict[T, int]]:
+        with self._lock:
+            if arr is not self._source or self._stale or len(arr) < self._indexed:
+                self._build(arr)
+            elif len(arr) > self._indexed and self._first is not None:
+                self._extend(arr)
+            return self._first
+
+    """
+        Busca la primera aparición de un elemento objetivo.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        self.reset_iterations()
+        self.log(f"\nBúsqueda con Índice Hash:")
+        builds = self.builds
+        first = self._index_for(arr)
+        if self.builds != builds:
+            self.log(f"Índice construido para {len(arr)} elementos ({len(first or ())} valores distintos)")
+
+        try:
+            index = first.get(target, -1) if first is not None else None
+        except TypeError:
+            index = None
+        if index is None:
+            self.log(f"Índice no disponible, se busca con {self._linear.name}")
+            index = self._linear.search(arr, target)
+            self._iterations = self._linear.iterations
+            return index
+
+        self._iterations = 1
+        self.log(f"Iteración 1: consulta de {target} en el índice: {index}")
+        return index
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if arr is self._source and not self._stale and len(arr) == self._indexed:
+            first = self._first
+        else:
+            first = self._index_for(arr)
+
+        if first is not None:
+            try:
+                index = first.get(target, -1)
+            except TypeError:
+                pass
+            else:
+                self._iterations = 1
+                return index
+
+        index = self._linear.search(arr, target)
+        self._iterations = self._linear.iterations
+        return index
+
+    """
+        Busca todas las apariciones de un elemento objetivo.
+
+        Requiere all_positions=True; si no, se recorre el arreglo con LinearSearch.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            Arreglo con los índices de todas las apariciones en orden creciente
+            (numpy.ndarray si NumPy está instalado, array('q') si no)
+        """
+    def search_all(self, arr: List[T], target: T) -> Any:
+        first = self._index_for(arr)
+        if first is not None and self.all_positions:
+            try:
+                index = first.get(target)
+            except TypeError:
+                pass
+            else:
+                self._iterations = 1
+                if index is None:
+                    return index_array([])
+                return index_array([index] + self._rest.get(target, []))
+
+        positions = self._linear.search_all(arr, target)
+        self._iterations = self._linear.iterations
+        return positions
+
+    """
+        Cuenta las apariciones de un elemento objetivo.
+
+        Requiere all_positions=True; si no, se recorre el arreglo con LinearSearch.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a contar
+
+        Returns:
+            int: Número de apariciones del objetivo
+        """
+    def count(self, arr: List[T], target: T) -> int:
+        first = self._index_for(arr)
+        if first is not None and self.all_positions:
+            try:
+                found = target in first
+            except TypeError:
+                pass
+            else:
+                self._iterations = 1
+                return 1 + len(self._rest.get(target, ())) if found else 0
+
+        count = self._linear.count(arr, target)
+        self._iterations = self._linear.iterations
+        return count
+
+    """
+        Estima la memoria que ocupa el índice, sin contar los valores del arreglo.
+
+        Cuenta las tablas de los diccionarios, las listas de duplicados y los enteros
+        de las posiciones (CPython comparte los enteros menores que 257).
+
+        Returns:
+            int: Bytes ocupados por el índice, 0 si no hay índice
+        """
+    @property
+    def memory_bytes(self) -> int:
+        if self._first is None:
+            return 0
+        int_size = sys.getsizeof(1 << 20)
+        total = sys.getsizeof(self._first) + sys.getsizeof(self._rest)
+        total += max(0, len(self._first) - 257) * int_size
+        for positions in self._rest.values():
+            total += sys.getsizeof(positions) + len(positions) * int_size
+        return total
@@ -5,11 +5,15 @@ Este módulo implementa el algoritmo de búsqueda por interpolación.
 
 Clases:
     InterpolationSearch: Implementación del algoritmo de búsqueda por interpolación
+    GuardedInterpolationSearch: Búsqueda por interpolación con peor caso O(log n)
 """
 
-from typing import List, TypeVar, Optional
+from bisect import bisect_left
+from typing import Any, Iterable, List, TypeVar, Optional
 import logging
-from .base import SearchAlgorithm
+from .base import SortedSearchAlgorithm
+from .vectorized import interpolate_many
+from .sorted_index import SortedIndex
 
 T = TypeVar('T')
 
@@ -27,7 +31,7 @@ T = TypeVar('T')
     - El array debe estar ordenado
     - Los elementos deben estar uniformemente distribuidos para un rendimiento óptimo
     """
-class InterpolationSearch(SearchAlgorithm):
+class InterpolationSearch(SortedSearchAlgorithm):
     
     """
         Inicializa el algoritmo de búsqueda por interpolación.
@@ -52,10 +56,16 @@ class InterpolationSearch(SearchAlgorithm):
         self.reset_iterations()
         self.log(f"\nBúsqueda por Interpolación:")
         
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
         low, high = 0, len(arr) - 1
+        tracing, probe = self.tracing, self._probe
         
         while low <= high and target >= arr[low] and target <= arr[high]:
             self._iterations += 1
+            if probe is not None:
+                probe.narrow(low, high)
             
             # Calculamos la posición usando la fórmula de interpolación
             if high == low:
@@ -70,16 +80,360 @@ class InterpolationSearch(SearchAlgorithm):
                     # Por lo que usamos el punto medio si la fórmula falla
                     pos = low + (high - low) // 2
             
-            self.log(f"Iteración {self._iterations}: bajo={low}, pos={pos}, alto={high}, Comparando {arr[pos]} con {target}")
+            value = arr[pos]
+            if tracing:
+                self.log(f"Iteración {self._iterations}: bajo={low}, pos={pos}, alto={high}, Comparando {value} con {target}")
+            if probe is not None:
+                probe.compare(pos, value)
             
             # Comprobamos si se encontró el elemento
-            if arr[pos] == target:
+            if value == target:
                 return pos
             
             # Determinamos en qué sub-arreglo buscar
-            if arr[pos] < target:
+            if value < target:
+                low = pos + 1
+            else:
+                high = pos - 1
+                
+        return -1
+
+    
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        
+        Mantiene el mismo resultado y el mismo conteo de iteraciones que search, pero
+        no construye mensajes y lleva el contador en una variable local.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        low, high = 0, len(arr) - 1
+        iterations = 0
+        
+        while low <= high and target >= arr[low] and target <= arr[high]:
+            iterations += 1
+            
+            if high == low:
+                pos = low
+            else:
+                try:
+                    pos = low + int(((float(high - low) /
+                                    (arr[high] - arr[low])) *
+                                    (target - arr[low])))
+                except (TypeError, ZeroDivisionError):
+                    pos = low + (high - low) // 2
+                    
+            value = arr[pos]
+            if value == target:
+                self._local.iterations = iterations
+                return pos
+            
+            if value < target:
+                low = pos + 1
+            else:
+                high = pos - 1
+                
+        self._local.iterations = iterations
+        return -1
+
+    """
+        Busca en un SortedIndex.
+        
+        Los objetivos fuera de [min, max] se descartan en O(1). Con claves numéricas
+        se prueba primero la estimación global (min, max y scale), que en datos
+        uniformes acierta en un solo acceso. Si no acierta, la tabla de
+        separadores localiza el segmento del objetivo (a lo sumo fence_step
+        posiciones), la pendiente precalculada del segmento da una estimación y, si
+        la estimación no acierta, bisect termina la búsqueda en la parte del segmento
+        que queda, en código nativo. Como el segmento es pequeño, datos sesgados no
+        degradan la búsqueda.
+        
+        Args:
+            index (SortedIndex): El índice en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def _search_index(self, index: SortedIndex, target: T) -> int:
+        if not index.covers(target):
+            self._iterations = 0
+            if self.tracing:
+                self.log(f"{target} está fuera del rango [{index.min}, {index.max}] del índice")
+            return -1
+        
+        data = index.data
+        scale = index.scale
+        if scale is not None:
+            # Estimación global: en datos uniformes suele acertar sin consultar la tabla
+            pos = int((target - index.min) * scale)
+            if data[pos] == target:
+                self._iterations = 1
+                if self.tracing:
+                    self.log(f"La estimación global {pos} acierta")
+                return pos
+        
+        lo, hi = index.segment(target)
+        last = min(hi, len(data) - 1)
+        if scale is not None:
+            # Estimación con la pendiente del segmento que contiene al objetivo
+            segment = max(lo - 1, 0) // index.fence_step
+            pos = segment * index.fence_step + int((target - index.fences[segment]) * index.slopes[segment])
+            pos = min(max(pos, lo), last)
+        else:
+            pos = lo + (last - lo) // 2
+            
+        value = data[pos]
+        iterations = index.fence_steps + (2 if scale is not None else 1)
+        if value == target:
+            self._iterations = iterations
+            if self.tracing:
+                self.log(f"Segmento [{lo}, {hi}]: la estimación {pos} acierta")
+            return pos
+        
+        if value < target:
+            lo = pos + 1
+        else:
+            hi = pos
+        pos = bisect_left(data, target, lo, hi)
+        self._iterations = iterations + (hi - lo).bit_length()
+        if self.tracing:
+            self.log(f"Estimación fallida; bisección en [{lo}, {hi}], punto de inserción {pos}")
+        return pos if pos < len(data) and data[pos] == target else -1
+
+    """
+        Busca varios elementos objetivo en el arreglo ordenado en una sola llamada.
+        
+        Se estima la posición de todos los objetivos a la vez con la fórmula de
+        interpolación y solo los que no quedan resueltos por la estimación pasan a
+        numpy.searchsorted (o bisect si NumPy no está instalado).
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+            
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        self.log(f"\nBúsqueda por Interpolación por lotes:")
+        indices, self._iterations = interpolate_many(arr, targets)
+        return indices
+    
+    """
+        Busca un límite (lower_bound o upper_bound) con pasos de interpolación protegidos por bisección.
+        
+        Cuando un paso de interpolación no reduce el intervalo al menos a la mitad, el
+        siguiente paso toma el punto medio, así que cada dos pasos el intervalo se reduce
+        al menos a la mitad: O(log n) en el peor caso aunque la distribución no sea uniforme.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int): Fin del rango de búsqueda (excluido)
+            strict (bool): Si es True se busca el primer valor mayor que el objetivo
+                           (upper_bound); si es False, el primero no menor (lower_bound)
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def _bound(self, arr: List[T], target: T, lo: int, hi: int, strict: bool) -> int:
+        tracing = self.tracing
+        iterations = 0
+        bisect_next = False
+        
+        while lo < hi:
+            iterations += 1
+            last = hi - 1
+            size = hi - lo
+            
+            if bisect_next or last == lo:
+                pos = lo + (last - lo) // 2
+            else:
+                try:
+                    pos = lo + int(((float(last - lo) /
+                                    (arr[last] - arr[lo])) *
+                                    (target - arr[lo])))
+                except (TypeError, ZeroDivisionError):
+                    pos = lo + (last - lo) // 2
+                pos = min(max(pos, lo), last)
+                
+            if tracing:
+                self.log(f"Iteración {iterations}: bajo={lo}, pos={pos}, alto={last}, Comparando {arr[pos]} con {target}")
+                
+            if (target < arr[pos]) if strict else not (arr[pos] < target):
+                hi = pos
+            else:
+                lo = pos + 1
+                
+            bisect_next = not bisect_next and (hi - lo) * 2 > size
+                
+        self._iterations = iterations
+        return lo
+    
+    """
+        Obtiene la primera posición cuyo valor no es menor que el objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def lower_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        return self._bound(arr, target, lo, len(arr) if hi is None else hi, strict=False)
+    
+    """
+        Obtiene la primera posición cuyo valor es mayor que el objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo
+            lo (int): Inicio del rango de búsqueda (incluido)
+            hi (int, optional): Fin del rango de búsqueda (excluido). Por defecto len(arr).
+            
+        Returns:
+            int: Posición en [lo, hi]
+        """
+    def upper_bound(self, arr: List[T], target: T, lo: int = 0, hi: Optional[int] = None) -> int:
+        return self._bound(arr, target, lo, len(arr) if hi is None else hi, strict=True)
+
+
+"""
+    Implementación de la Búsqueda por Interpolación Acotada.
+    
+    Variante de la búsqueda por interpolación que vigila cuánto se reduce el intervalo.
+    Si un paso de interpolación no lo reduce al menos a la mitad, el siguiente paso es
+    de bisección (punto medio). Con datos uniformes casi todos los pasos son de
+    interpolación; con datos sesgados, donde la búsqueda por interpolación se vuelve
+    lineal, cada dos pasos el intervalo se reduce al menos a la mitad.
+    
+    Complejidad Temporal: O(log log n) caso promedio con datos uniformes, O(log n) peor caso
+    Complejidad Espacial: O(1)
+    
+    Precondiciones:
+    - El array debe estar ordenado
+    """
+class GuardedInterpolationSearch(InterpolationSearch):
+    
+    """
+        Inicializa el algoritmo de búsqueda por interpolación acotada.
+        
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        super().__init__(logger)
+        self.name = "Guarded Interpolation Search"
+        
+    """
+        Busca un elemento objetivo en el arreglo utilizando búsqueda por interpolación acotada.
+        
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        self.reset_iterations()
+        self.log(f"\nBúsqueda por Interpolación Acotada:")
+        
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        low, high = 0, len(arr) - 1
+        bisect_next = False
+        tracing, probe = self.tracing, self._probe
+        previous_step = None
+        
+        while low <= high and target >= arr[low] and target <= arr[high]:
+            self._iterations += 1
+            size = high - low + 1
+            if probe is not None:
+                probe.narrow(low, high)
+            
+            if bisect_next or high == low:
+                pos = low + (high - low) // 2
+                step = "bisección"
+            else:
+                try:
+                    pos = low + int(((float(high - low) / 
+                                    (arr[high] - arr[low])) * 
+                                    (target - arr[low])))
+                    step = "interpolación"
+                except (TypeError, ZeroDivisionError):
+                    pos = low + (high - low) // 2
+                    step = "bisección"
+            
+            value = arr[pos]
+            if tracing:
+                self.log(f"Iteración {self._iterations} ({step}): bajo={low}, pos={pos}, alto={high}, Comparando {value} con {target}")
+            if probe is not None:
+                if step != previous_step:
+                    probe.phase(step)
+                    previous_step = step
+                probe.compare(pos, value)
+            
+            if value == target:
+                return pos
+            
+            if value < target:
                 low = pos + 1
             else:
                 high = pos - 1
                 
-        return -1 
\ No newline at end of file
+            # Si el intervalo no se redujo al menos a la mitad, el siguiente paso es de bisección
+            bisect_next = not bisect_next and (high - low + 1) * 2 > size
+                
+        return -1
+    
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        
+        Mantiene el mismo resultado y el mismo conteo de iteraciones que search, pero
+        no construye mensajes y lleva el contador en una variable local.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        low, high = 0, len(arr) - 1
+        iterations = 0
+        bisect_next = False
+        
+        while low <= high and target >= arr[low] and target <= arr[high]:
+            iterations += 1
+            size = high - low + 1
+            
+            if bisect_next or high == low:
+                pos = low + (high - low) // 2
+            else:
+                try:
+                    pos = low + int(((float(high - low) /
+                                    (arr[high] - arr[low])) *
+                                    (target - arr[low])))
+                except (TypeError, ZeroDivisionError):
+                    pos = low + (high - low) // 2
+                    
+            value = arr[pos]
+            if value == target:
+                self._local.iterations = iterations
+                return pos
+            
+            if value < target:
+                low = pos + 1
+            else:
+                high = pos - 1
+                
+            bisect_next = not bisect_next and (high - low + 1) * 2 > size
+                
+        self._local.iterations = iterations
+        return -1
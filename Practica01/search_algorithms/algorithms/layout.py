@@ -0,0 +1,387 @@
+"""
+Índices con Disposición Amigable con la Caché
+
+Este módulo implementa dos índices prearmados que reacomodan un arreglo ordenado
+para que la búsqueda toque menos líneas de caché que la búsqueda binaria.
+
+El índice se construye una sola vez por arreglo y se reutiliza mientras search()
+reciba el mismo objeto. Si el arreglo se modifica, hay que llamar a build() de nuevo.
+
+Clases:
+    EytzingerSearch: Búsqueda sobre el arreglo en orden de Eytzinger (por niveles)
+    StaticBTreeSearch: Búsqueda sobre un árbol B estático con nodos del tamaño de una línea de caché
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, List, TypeVar, Optional
+import logging
+from .base import SearchAlgorithm
+from .vectorized import load_numpy, typed_buffer
+
+T = TypeVar('T')
+
+np = load_numpy()
+
+# Tamaño de una línea de caché en bytes
+CACHE_LINE_SIZE = 64
+
+"""
+    Implementación de la Búsqueda sobre la Disposición de Eytzinger.
+
+    Los elementos se guardan en el orden en que aparecerían al recorrer por niveles
+    el árbol binario de búsqueda implícito: la raíz en la posición 1 y los hijos del
+    nodo k en 2k y 2k+1. Los primeros niveles del árbol, que visitan todas las
+    búsquedas, quedan juntos al inicio del arreglo y permanecen en caché.
+
+    Complejidad Temporal: O(log n) por búsqueda, O(n) para construir el índice
+    Complejidad Espacial: O(n)
+
+    Precondiciones:
+    - El arreglo debe estar ordenado
+    """
+class EytzingerSearch(SearchAlgorithm):
+
+    """
+        Inicializa el algoritmo de búsqueda sobre la disposición de Eytzinger.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        super().__init__("Eytzinger Search", logger)
+        self._source = None
+        self._keys = [None]
+        self._positions = array('q', [-1])
+
+    """
+        Construye el índice para el arreglo ordenado dado.
+
+        Args:
+            arr (List[T]): El arreglo ordenado a indexar
+        """
+    def build(self, arr: List[T]) -> None:
+        with self._lock:
+            n = len(arr)
+            buffer = typed_buffer(arr)
+
+            if buffer is not None and np is not None:
+                # Posición en orden (in-order) de cada nodo k = 1..n del árbol completo
+                nodes = np.arange(1, n + 1, dtype=np.int64)
+                depth = np.floor(np.log2(nodes)).astype(np.int64)
+                # Corregimos posibles errores de redondeo de log2
+                depth -= np.left_shift(1, depth) > nodes
+                depth += np.left_shift(1, depth + 1) <= nodes
+                height = n.bit_length()
+                offset = nodes - np.left_shift(1, depth)
+                order = np.argsort((2 * offset + 1) << (height - 1 - depth), kind='stable')
+
+                keys = np.empty(n + 1, dtype=buffer.typecode)
+                keys[order + 1] = np.frombuffer(buffer, dtype=buffer.typecode)
+                positions = np.full(n + 1, -1, dtype=np.int64)
+                positions[order + 1] = np.arange(n, dtype=np.int64)
+
+                self._keys = array(buffer.typecode, keys.tobytes())
+                self._positions = array('q', positions.tobytes())
+            else:
+                keys = [arr[0] if n else 0] * (n + 1)
+                positions = array('q', [-1]) * (n + 1)
+
+                # Recorrido en orden del árbol implícito, asignando los elementos ordenados
+                stack = []
+                k = 1
+                i = 0
+                while stack or k <= n:
+                    while k <= n:
+                        stack.append(k)
+                        k = 2 * k
+                    k = stack.pop()
+                    keys[k] = arr[i]
+                    positions[k] = i
+                    i += 1
+                    k = 2 * k + 1
+
+                self._keys = array(buffer.typecode, keys) if buffer is not None else keys
+                self._positions = positions
+
+            self._source = arr
+
+    """
+        Busca un elemento objetivo en el arreglo utilizando la disposición de Eytzinger.
+
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo en arr si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+        self.reset_iterations()
+        self.log(f"\nBúsqueda Eytzinger:")
+
+        keys = self._keys
+        n = len(keys) - 1
+        k = 1
+        tracing = self.tracing
+
+        while k <= n:
+            self._iterations += 1
+            if tracing:
+                self.log(f"Iteración {self._iterations}: nodo={k}, Comparando {keys[k]} con {target}")
+            k = 2 * k + (keys[k] < target)
+
+        # Quitamos los giros a la derecha finales para llegar al primer valor >= target
+        k >>= (~k & (k + 1)).bit_length()
+
+        if k and keys[k] == target:
+            return self._positions[k]
+        return -1
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+
+        keys = self._keys
+        n = len(keys) - 1
+        k = 1
+        iterations = 0
+
+        while k <= n:
+            iterations += 1
+            k = 2 * k + (keys[k] < target)
+
+        self._iterations = iterations
+        k >>= (~k & (k + 1)).bit_length()
+
+        if k and keys[k] == target:
+            return self._positions[k]
+        return -1
+
+    """
+        Busca varios elementos objetivo en una sola llamada.
+
+        Con NumPy, todas las consultas descienden juntas por el árbol, un nivel por paso.
+
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        if arr is not self._source:
+            self.build(arr)
+        if np is None or not isinstance(self._keys, array):
+            return super().search_many(arr, targets)
+
+        self.log(f"\nBúsqueda Eytzinger por lotes:")
+        keys = np.frombuffer(self._keys, dtype=self._keys.typecode)
+        positions = np.frombuffer(self._positions, dtype=np.int64)
+        n = len(keys) - 1
+
+        if not hasattr(targets, '__len__'):
+            targets = list(targets)
+        queries = np.asarray(targets)
+        k = np.ones(queries.shape, dtype=np.int64)
+
+        levels = n.bit_length()
+        for _ in range(levels):
+            inside = k <= n
+            k[inside] = 2 * k[inside] + (keys[k[inside]] < queries[inside])
+
+        # Quitamos los giros a la derecha finales (ver search)
+        k >>= np.log2((~k & (k + 1)).astype(np.float64)).astype(np.int64) + 1
+        found = (k > 0) & (keys[k] == queries)
+
+        self._iterations = int(queries.size) * levels
+        return np.where(found, positions[k], -1).astype(np.int64, copy=False)
+
+
+"""
+    Implementación de la Búsqueda sobre un Árbol B Estático.
+
+    El arreglo ordenado forma las hojas, agrupadas en bloques de B elementos, y sobre
+    ellas se construyen niveles de nodos internos de B claves que dirigen la búsqueda
+    a uno de sus B+1 hijos. B se elige para que un nodo ocupe una línea de caché,
+    de modo que cada nivel cuesta un solo acceso a memoria.
+
+    Complejidad Temporal: O(log_B n) nodos visitados, O(log n) comparaciones
+    Complejidad Espacial: O(n / B) adicional
+
+    Precondiciones:
+    - El arreglo debe estar ordenado
+    """
+class StaticBTreeSearch(SearchAlgorithm):
+
+    """
+        Inicializa el algoritmo de búsqueda sobre un árbol B estático.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+            node_size (int, optional): Claves por nodo. Por defecto, las que caben en
+                                       una línea de caché (8 para claves de 64 bits).
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None, node_size: Optional[int] = None):
+        super().__init__("Static B-Tree Search", logger)
+        self._node_size = node_size
+        self._block = node_size or CACHE_LINE_SIZE // 8
+        self._source = None
+        self._leaves = []
+        self._levels = []
+
+    """Obtiene el número de claves por nodo del índice construido."""
+    @property
+    def node_size(self) -> int:
+        return self._block
+
+    """
+        Construye el índice para el arreglo ordenado dado.
+
+        Args:
+            arr (List[T]): El arreglo ordenado a indexar
+        """
+    def build(self, arr: List[T]) -> None:
+        with self._lock:
+            buffer = typed_buffer(arr)
+            leaves = buffer if buffer is not None else arr
+            block = self._node_size or (CACHE_LINE_SIZE // buffer.itemsize if buffer is not None else 8)
+            n = len(leaves)
+
+            # Cada nivel guarda, por nodo, la primera clave de cada hijo salvo el primero
+            levels = []
+            span = block
+            while span < n:
+                child_span = span
+                span *= block + 1
+                keys = array(buffer.typecode) if buffer is not None else []
+                for start in range(0, n, span):
+                    for child in range(start + child_span, min(start + span, n), child_span):
+                        keys.append(leaves[child])
+                levels.append(keys)
+
+            self._block = block
+            self._leaves = leaves
+            self._levels = levels[::-1]
+            self._source = arr
+
+    """
+        Busca un elemento objetivo en el arreglo utilizando el árbol B estático.
+
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+        self.reset_iterations()
+        self.log(f"\nBúsqueda en Árbol B Estático:")
+
+        block = self._block
+        node = 0
+        tracing = self.tracing
+        for depth, keys in enumerate(self._levels):
+            start = node * block
+            end = min(start + block, len(keys))
+            child = bisect_left(keys, target, start, end) - start
+            self._iterations += (end - start).bit_length()
+            if tracing:
+                self.log(f"Iteración {depth + 1}: nodo={node}, Comparando {list(keys[start:end])} con {target}")
+            node = node * (block + 1) + child
+
+        leaves = self._leaves
+        start = node * block
+        end = min(start + block, len(leaves))
+        pos = bisect_left(leaves, target, start, end)
+        self._iterations += (end - start).bit_length()
+        if tracing:
+            self.log(f"Iteración {len(self._levels) + 1}: hoja={node}, Comparando {list(leaves[start:end])} con {target}")
+
+        if pos < len(leaves) and leaves[pos] == target:
+            return pos
+        return -1
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+
+        block = self._block
+        node = 0
+        iterations = 0
+        for keys in self._levels:
+            start = node * block
+            end = min(start + block, len(keys))
+            iterations += (end - start).bit_length()
+            node = node * (block + 1) + bisect_left(keys, target, start, end) - start
+
+        leaves = self._leaves
+        start = node * block
+        end = min(start + block, len(leaves))
+        pos = bisect_left(leaves, target, start, end)
+        self._iterations = iterations + (end - start).bit_length()
+
+        if pos < len(leaves) and leaves[pos] == target:
+            return pos
+        return -1
+
+    """
+        Busca varios elementos objetivo en una sola llamada.
+
+        Con NumPy, todas las consultas descienden juntas por el árbol: en cada nivel se
+        leen las B claves del nodo de cada consulta y se cuentan las menores que el objetivo.
+
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            targets (Iterable[T]): Los elementos objetivo a encontrar
+
+        Returns:
+            Arreglo de índices en el orden de targets, con -1 para los no encontrados
+        """
+    def search_many(self, arr: List[T], targets: Iterable[T]) -> Any:
+        if arr is not self._source:
+            self.build(arr)
+        if np is None or not isinstance(self._leaves, array):
+            return super().search_many(arr, targets)
+
+        self.log(f"\nBúsqueda en Árbol B Estático por lotes:")
+        if not hasattr(targets, '__len__'):
+            targets = list(targets)
+        queries = np.asarray(targets)[:, None]
+        if not len(self._leaves):
+            self._iterations = 0
+            return np.full(len(queries), -1, dtype=np.int64)
+
+        block = self._block
+        lanes = np.arange(block, dtype=np.int64)
+        node = np.zeros(len(queries), dtype=np.int64)
+
+        for keys in self._levels + [self._leaves]:
+            values = np.frombuffer(keys, dtype=keys.typecode)
+            slots = node[:, None] * block + lanes
+            valid = slots < len(values)
+            smaller = (values[np.minimum(slots, len(values) - 1)] < queries) & valid
+            node = node * (block + 1) + smaller.sum(axis=1)
+
+        # En las hojas, el último paso dejó node * (B + 1) + cuenta; recuperamos la posición
+        child = node % (block + 1)
+        pos = node // (block + 1) * block + child
+        leaves = np.frombuffer(self._leaves, dtype=self._leaves.typecode)
+        n = len(leaves)
+        found = (pos < n) & (leaves[np.minimum(pos, n - 1)] == queries[:, 0])
+
+        self._iterations = len(queries) * (len(self._levels) + 1) * block.bit_length()
+        return np.where(found, pos, -1).astype(np.int64, copy=False)
+
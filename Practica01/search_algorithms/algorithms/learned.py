@@ -0,0 +1,300 @@
+"""
+Algoritmo de Búsqueda con Índice Aprendido
+
+Este módulo implementa un índice aprendido de dos etapas (recursive model index).
+
+Clases:
+    LearnedIndexSearch: Implementación de la búsqueda con índice aprendido
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple, TypeVar, Optional
+import logging
+from .base import SearchAlgorithm
+from .vectorized import load_numpy, typed_buffer
+
+T = TypeVar('T')
+
+np = load_numpy()
+
+"""
+    Implementación de la Búsqueda con Índice Aprendido.
+
+    Generaliza la idea de la búsqueda por interpolación: en lugar de una sola recta
+    para todo el arreglo, un modelo raíz lineal por tramos elige uno de varios modelos
+    lineales y ese modelo predice la posición del objetivo. Al construir el índice se guarda el
+    error máximo de cada modelo, así que la búsqueda termina con una búsqueda binaria
+    acotada a la ventana [predicción - error, predicción + error].
+
+    El índice se construye la primera vez que search() recibe un arreglo y se
+    reutiliza mientras reciba el mismo objeto. Si el arreglo se modifica, hay que
+    llamar a build() de nuevo.
+
+    Complejidad Temporal: O(1) para predecir más O(log e) para la búsqueda final,
+    donde e es el error del modelo; O(log n) en el peor caso
+    Complejidad Espacial: O(n / leaf_size)
+
+    Precondiciones:
+    - El arreglo debe estar ordenado
+    - Los elementos deben ser numéricos para aprovechar los modelos; con otros tipos
+      la búsqueda equivale a una búsqueda binaria
+    """
+class LearnedIndexSearch(SearchAlgorithm):
+
+    """
+        Inicializa el algoritmo de búsqueda con índice aprendido.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+            leaf_size (int, optional): Elementos promedio por modelo hoja. Por defecto 64.
+            root_size (int, optional): Tramos del modelo raíz. Por defecto 128.
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None, leaf_size: int = 64, root_size: int = 128):
+        super().__init__("Learned Index Search", logger)
+        self._leaf_size = leaf_size
+        self._root_size = root_size
+        self._source = None
+        self._fitted = False
+        self._knots = array('d')
+        self._knot_leaves = array('d')
+        self._knot_scales = array('d')
+        self._slopes = array('d', [0.0])
+        self._intercepts = array('d', [0.0])
+        self._errors = array('q', [0])
+
+    """Obtiene el mayor error de predicción entre todos los modelos hoja."""
+    @property
+    def max_error(self) -> int:
+        return max(self._errors)
+
+    """
+        Construye el índice para el arreglo ordenado dado.
+
+        El modelo raíz es una función lineal por tramos que une claves tomadas en
+        cuantiles del arreglo, así que sigue la distribución de las claves aunque no
+        sea uniforme. Cada modelo hoja es la recta que une su primera y su última clave.
+
+        Args:
+            arr (List[T]): El arreglo ordenado a indexar
+        """
+    def build(self, arr: List[T]) -> None:
+        with self._lock:
+            n = len(arr)
+            buffer = typed_buffer(arr)
+            self._fitted = not (buffer is None or n < 2 or arr[0] == arr[n - 1])
+
+            if not self._fitted:
+                # Sin modelos útiles: un único modelo que abarca todo el arreglo
+                self._slopes = array('d', [0.0])
+                self._intercepts = array('d', [0.0])
+                self._errors = array('q', [n])
+                self._source = arr
+                return
+
+            leaves = max(1, n // self._leaf_size)
+            segments = max(1, min(self._root_size, leaves))
+
+            # Nodos del modelo raíz: clave en el cuantil j y hoja que le corresponde
+            positions = [j * (n - 1) // segments for j in range(segments + 1)]
+            knots = array('d', [float(buffer[p]) for p in positions])
+            knot_leaves = array('d', [p * leaves / n for p in positions])
+            knot_scales = array('d', [0.0]) * segments
+            for j in range(segments):
+                span = knots[j + 1] - knots[j]
+                if span > 0:
+                    knot_scales[j] = (knot_leaves[j + 1] - knot_leaves[j]) / span
+            self._knots = knots
+            self._knot_leaves = knot_leaves
+            self._knot_scales = knot_scales
+
+            if np is not None:
+                self._fit_numpy(np.frombuffer(buffer, dtype=buffer.typecode), leaves)
+            else:
+                self._fit_python(buffer, leaves)
+            # El arreglo se publica al final, cuando los modelos ya están ajustados
+            self._source = arr
+
+    """
+        Ajusta los modelos hoja usando NumPy.
+
+        Args:
+            keys: Vista NumPy del arreglo ordenado
+            leaves (int): Número de modelos hoja
+        """
+    def _fit_numpy(self, keys, leaves: int) -> None:
+        n = len(keys)
+        x = keys.astype(np.float64)
+
+        # Hoja de cada clave según el modelo raíz (mismas operaciones que _leaf_of)
+        knots = np.frombuffer(self._knots, dtype=np.float64)
+        segment = np.clip(np.searchsorted(knots, x, side='right') - 1, 0, len(knots) - 2)
+        leaf = np.frombuffer(self._knot_leaves, dtype=np.float64)[segment] + \
+            (x - knots[segment]) * np.frombuffer(self._knot_scales, dtype=np.float64)[segment]
+        leaf = np.clip(leaf.astype(np.int64), 0, leaves - 1)
+
+        # Como la raíz es monótona, cada hoja recibe un rango contiguo de posiciones
+        starts = np.searchsorted(leaf, np.arange(leaves), side='left')
+        ends = np.searchsorted(leaf, np.arange(leaves), side='right')
+        first = np.minimum(starts, n - 1)
+        last = np.maximum(ends - 1, 0)
+
+        span = x[last] - x[first]
+        slopes = np.where((ends > starts) & (span > 0), (last - first) / np.where(span > 0, span, 1), 0.0)
+        # Una hoja vacía predice su punto de inserción
+        intercepts = np.where(ends > starts, first - slopes * x[first], starts.astype(np.float64))
+
+        # El error solo se mide en la primera aparición de cada clave, que es la que
+        # debe quedar dentro de la ventana para que la búsqueda acotada la encuentre
+        first_seen = np.ones(n, dtype=bool)
+        first_seen[1:] = keys[1:] != keys[:-1]
+        predicted = (x * slopes[leaf] + intercepts[leaf]).astype(np.int64)
+        errors = np.zeros(leaves, dtype=np.int64)
+        np.maximum.at(errors, leaf[first_seen], np.abs(predicted - np.arange(n))[first_seen])
+
+        self._slopes = array('d', slopes.tobytes())
+        self._intercepts = array('d', intercepts.tobytes())
+        self._errors = array('q', (errors + 1).tobytes())
+
+    """
+        Ajusta los modelos hoja sin NumPy.
+
+        Args:
+            keys (array): El arreglo ordenado como búfer tipado
+            leaves (int): Número de modelos hoja
+        """
+    def _fit_python(self, keys: array, leaves: int) -> None:
+        n = len(keys)
+        leaf_of = [self._leaf_of(float(key), leaves) for key in keys]
+
+        starts = [n] * leaves
+        ends = [0] * leaves
+        for i, leaf in enumerate(leaf_of):
+            starts[leaf] = min(starts[leaf], i)
+            ends[leaf] = i + 1
+
+        slopes = array('d', [0.0]) * leaves
+        intercepts = array('d', [0.0]) * leaves
+        errors = array('q', [1]) * leaves
+        boundary = 0
+        for leaf in range(leaves):
+            if ends[leaf] == 0:
+                # Una hoja vacía predice su punto de inserción
+                intercepts[leaf] = boundary
+                continue
+            first, last = starts[leaf], ends[leaf] - 1
+            span = float(keys[last]) - float(keys[first])
+            if span > 0:
+                slopes[leaf] = (last - first) / span
+            intercepts[leaf] = first - slopes[leaf] * float(keys[first])
+            boundary = ends[leaf]
+
+        # El error solo se mide en la primera aparición de cada clave (ver _fit_numpy)
+        for i, leaf in enumerate(leaf_of):
+            if i and keys[i] == keys[i - 1]:
+                continue
+            error = abs(int(float(keys[i]) * slopes[leaf] + intercepts[leaf]) - i) + 1
+            if error > errors[leaf]:
+                errors[leaf] = error
+
+        self._slopes = slopes
+        self._intercepts = intercepts
+        self._errors = errors
+
+    """
+        Evalúa el modelo raíz para obtener la hoja que corresponde a una clave.
+
+        Args:
+            key (float): La clave convertida a flotante
+            leaves (int): Número de modelos hoja
+
+        Returns:
+            int: Número de hoja en [0, leaves)
+        """
+    def _leaf_of(self, key: float, leaves: int) -> int:
+        knots = self._knots
+        segment = min(max(bisect_right(knots, key) - 1, 0), len(knots) - 2)
+        leaf = int(self._knot_leaves[segment] + (key - knots[segment]) * self._knot_scales[segment])
+        return min(max(leaf, 0), leaves - 1)
+
+    """
+        Calcula la ventana donde debe estar el objetivo según los modelos.
+
+        Args:
+            target (T): El elemento objetivo
+            n (int): Tamaño del arreglo
+
+        Returns:
+            Tuple[int, int, int]: La posición predicha y la ventana [inicio, fin)
+        """
+    def _window(self, target: T, n: int) -> Tuple[int, int, int]:
+        if not self._fitted:
+            return 0, 0, n
+        key = float(target)
+        leaf = self._leaf_of(key, len(self._slopes))
+        predicted = int(key * self._slopes[leaf] + self._intercepts[leaf])
+        error = self._errors[leaf]
+        return predicted, min(max(predicted - error, 0), n), min(max(predicted + error + 1, 0), n)
+
+    """
+        Busca un elemento objetivo en el arreglo utilizando el índice aprendido.
+
+        Args:
+            arr (List[T]): El arreglo ordenado en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice del elemento objetivo si se encuentra, -1 en caso contrario
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+        self.reset_iterations()
+        self.log(f"\nBúsqueda con Índice Aprendido:")
+
+        n = len(arr)
+        try:
+            predicted, low, high = self._window(target, n)
+        except (TypeError, ValueError, OverflowError):
+            predicted, low, high = 0, 0, n
+
+        self._iterations += 1
+        tracing = self.tracing
+        if tracing:
+            self.log(f"Iteración {self._iterations}: bajo={low}, pos={predicted}, alto={high}")
+
+        # Búsqueda binaria acotada a la ventana del modelo
+        left, right = low, high
+        while left < right:
+            self._iterations += 1
+            mid = (left + right) // 2
+            if tracing:
+                self.log(f"Iteración {self._iterations}: izquierda={left}, medio={mid}, derecha={right}, Comparando {arr[mid]} con {target}")
+            if arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid
+
+        if left < n and arr[left] == target:
+            return left
+        return -1
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if arr is not self._source:
+            self.build(arr)
+
+        n = len(arr)
+        try:
+            _, low, high = self._window(target, n)
+        except (TypeError, ValueError, OverflowError):
+            low, high = 0, n
+
+        pos = bisect_left(arr, target, low, high)
+        self._iterations = 1 + (high - low).bit_length()
+
+        if pos < n and arr[pos] == target:
+            return pos
+        return -1
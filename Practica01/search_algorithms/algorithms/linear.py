@@ -7,9 +7,11 @@ Clases:
     LinearSearch: Implementación del algoritmo de búsqueda lineal
 """
 
-from typing import List, TypeVar, Optional
+from typing import Any, List, TypeVar, Optional
 import logging
 from .base import SearchAlgorithm
+from .vectorized import index_array, is_typed_buffer, scan_all, scan_count, scan_first
+from .sorted_index import SortedIndex
 
 T = TypeVar('T')
 
@@ -19,6 +21,11 @@ T = TypeVar('T')
     La búsqueda lineal comprueba secuencialmente cada elemento del aarreglo
     hasta encontrar el elemento que estamos buscando o hasta llegar al final del arreglo.
     
+    Un elemento coincide con el objetivo si es el mismo objeto o si es igual (==),
+    la misma regla que usan list.index y el operador in de Python. Así el resultado
+    es el mismo con y sin logging aunque haya valores que no son iguales a sí mismos
+    (por ejemplo float('nan')), y coincide con el de HashIndexSearch.
+    
     Complejidad Temporal: O(n)
     Complejidad Espacial: O(1)
     
@@ -50,11 +57,137 @@ class LinearSearch(SearchAlgorithm):
         self.reset_iterations()
         self.log(f"\nBúsqueda Lineal:")
         
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        tracing, probe = self.tracing, self._probe
         for i in range(len(arr)):
             self._iterations += 1
-            self.log(f"Iteración {self._iterations}: Comparando {arr[i]} con {target}")
+            value = arr[i]
+            if tracing:
+                self.log(f"Iteración {self._iterations}: Comparando {value} con {target}")
+            if probe is not None:
+                probe.compare(i, value)
             
-            if arr[i] == target:
+            if value is target or value == target:
+                return i
+                
+        return -1
+    
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        
+        Los búferes tipados (numpy.ndarray, array.array, memoryview) se recorren con
+        comparaciones vectorizadas por bloques y las listas y tuplas con el método
+        index; en ambos casos el recorrido ocurre en código nativo. El conteo de
+        iteraciones es el mismo que en search (posición encontrada + 1, o len(arr)
+        si no se encuentra).
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        if type(arr) is SortedIndex:
+            return self._search_index(arr, target)
+        
+        if is_typed_buffer(arr):
+            index = scan_first(arr, target)
+            self._local.iterations = index + 1 if index >= 0 else len(arr)
+            return index
+        
+        if isinstance(arr, (list, tuple)):
+            try:
+                index = arr.index(target)
+            except ValueError:
+                self._local.iterations = len(arr)
+                return -1
+            self._local.iterations = index + 1
+            return index
+        
+        for i, value in enumerate(arr):
+            if value is target or value == target:
+                self._local.iterations = i + 1
                 return i
                 
-        return -1 
\ No newline at end of file
+        self._local.iterations = len(arr)
+        return -1
+    
+    """
+        Busca en un SortedIndex.
+        
+        Los objetivos fuera de [min, max] se descartan sin recorrer el arreglo. Como
+        los datos están ordenados, la tabla de separadores indica hasta dónde puede
+        estar la primera aparición, y el recorrido sobre el búfer tipado termina ahí.
+        
+        Args:
+            index (SortedIndex): El índice en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+        """
+    def _search_index(self, index: SortedIndex, target: T) -> int:
+        if not index.covers(target):
+            self._iterations = 0
+            if self.tracing:
+                self.log(f"{target} está fuera del rango [{index.min}, {index.max}] del índice")
+            return -1
+        
+        end = min(index.segment(target)[1] + 1, len(index))
+        data = index.data
+        if index.slopes is not None:
+            position = scan_first(data, target, 0, end)
+        else:
+            try:
+                position = data.index(target, 0, end)
+            except ValueError:
+                position = -1
+                
+        self._iterations = position + 1 if position >= 0 else end
+        if self.tracing:
+            self.log(f"Recorrido de las posiciones [0, {end}) del índice: resultado {position}")
+        return position
+    
+    """
+        Busca todas las apariciones de un elemento objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+            
+        Returns:
+            Arreglo con los índices de todas las apariciones en orden creciente
+            (numpy.ndarray si NumPy está instalado, array('q') si no)
+        """
+    def search_all(self, arr: List[T], target: T) -> Any:
+        self._iterations = len(arr)
+        if is_typed_buffer(arr):
+            return scan_all(arr, target)
+        
+        if isinstance(arr, (list, tuple)):
+            # Saltos sucesivos con index, que recorre la lista en código nativo
+            positions = []
+            index = -1
+            while True:
+                try:
+                    index = arr.index(target, index + 1)
+                except ValueError:
+                    return index_array(positions)
+                positions.append(index)
+        
+        return index_array(i for i, value in enumerate(arr) if value is target or value == target)
+    
+    """
+        Cuenta las apariciones de un elemento objetivo.
+        
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a contar
+            
+        Returns:
+            int: Número de apariciones del objetivo
+        """
+    def count(self, arr: List[T], target: T) -> int:
+        self._iterations = len(arr)
+        if is_typed_buffer(arr):
+            return scan_count(arr, target)
+        if isinstance(arr, (list, tuple)):
+            return arr.count(target)
+        return sum(1 for value in arr if value is target or value == target)
@@ -0,0 +1,357 @@
+"""
+Algoritmo de Búsqueda Lineal Paralela
+
+Este módulo implementa una búsqueda lineal que reparte el arreglo entre varios
+procesos. El arreglo se copia una sola vez a memoria compartida
+(multiprocessing.shared_memory) y cada proceso del pool recorre un bloque.
+
+Clases:
+    ParallelLinearSearch: Búsqueda lineal por bloques sobre un pool de procesos
+"""
+
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, TypeVar, Optional
+import logging
+from .linear import LinearSearch
+from .vectorized import index_array, scan_all, scan_first, typed_buffer
+
+T = TypeVar('T')
+
+# Elementos que un proceso recorre entre dos revisiones de la cancelación
+SCAN_BLOCK = 1 << 16
+
+# Segmentos de memoria compartida abiertos en cada proceso del pool, por nombre
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+"""
+    Abre un segmento de memoria compartida creado por el proceso principal.
+
+    Los procesos del pool comparten el resource_tracker del proceso principal, que
+    es el dueño del segmento y el único que lo elimina (unlink).
+    """
+def _attach(name: str) -> shared_memory.SharedMemory:
+    segment = _attached.get(name)
+    if segment is None:
+        segment = shared_memory.SharedMemory(name=name)
+        _attached[name] = segment
+    return segment
+
+"""
+    Recorre un bloque del arreglo compartido dentro de un proceso del pool.
+
+    Args:
+        data_name (str): Nombre del segmento con los datos
+        typecode (str): Código de tipo de los elementos
+        flags_name (str): Nombre del segmento con una bandera por bloque
+        chunk (int): Número de este bloque
+        start (int): Primera posición del bloque
+        end (int): Posición siguiente a la última del bloque
+        target: El elemento objetivo
+        find_all (bool): Si es True devuelve todas las apariciones del bloque
+
+    Returns:
+        List[int]: Las posiciones encontradas (a lo sumo una si find_all es False),
+        o None si el bloque se canceló porque un bloque anterior ya encontró el objetivo
+    """
+def _scan_chunk(data_name: str, typecode: str, flags_name: str, chunk: int,
+                start: int, end: int, target: Any, find_all: bool) -> Optional[List[int]]:
+    data = _attach(data_name).buf
+    flags = _attach(flags_name).buf
+    # Los segmentos de arreglos anteriores ya no se usan
+    for name in list(_attached):
+        if name not in (data_name, flags_name):
+            _attached.pop(name).close()
+
+    values = data.cast(typecode)
+    found: List[int] = []
+    try:
+        for block_start in range(start, end, SCAN_BLOCK):
+            block_end = min(block_start + SCAN_BLOCK, end)
+            if find_all:
+                found.extend(scan_all(values, target, block_start, block_end).tolist())
+                continue
+
+            # Cancelación temprana: algún bloque anterior ya tiene una coincidencia
+            if any(flags[:chunk]):
+                return None
+            index = scan_first(values, target, block_start, block_end)
+            if index >= 0:
+                flags[chunk] = 1
+                return [index]
+    finally:
+        values.release()
+
+    return found
+
+"""
+    Implementación de la Búsqueda Lineal Paralela.
+
+    El arreglo se convierte a un búfer tipado y se copia a memoria compartida la
+    primera vez que se busca en él; mientras se reciba el mismo objeto se reutiliza
+    la copia, así que si el arreglo se modifica hay que llamar a share() de nuevo.
+    Después se divide en bloques contiguos que se reparten entre los procesos.
+
+    Para encontrar la primera aparición, cada bloque marca una bandera compartida
+    en cuanto encuentra el objetivo y los bloques posteriores dejan de recorrer su
+    parte; el resultado es la coincidencia del bloque más a la izquierda. search_all
+    devuelve todas las apariciones.
+
+    Los arreglos pequeños (menos de min_parallel_size elementos) y los que no son
+    numéricos se buscan de forma secuencial, como en LinearSearch.
+
+    El conteo de iteraciones es el de la búsqueda lineal secuencial (posición
+    encontrada + 1, o len(arr)) para que sea comparable con LinearSearch.
+
+    Complejidad Temporal: O(n / p) con p procesos, más el costo de repartir los bloques
+    Complejidad Espacial: O(n) en memoria compartida
+
+    Precondiciones:
+    - El arreglo puede estar ordenado o desordenado
+    """
+class ParallelLinearSearch(LinearSearch):
+
+    """
+        Inicializa el algoritmo de búsqueda lineal paralela.
+
+        Args:
+            logger (logging.Logger, optional): Instancia de logger
+            workers (int, optional): Número de procesos. Por defecto os.cpu_count().
+            chunks_per_worker (int, optional): Bloques por proceso; más bloques
+                                               permiten cancelar antes. Por defecto 4.
+            min_parallel_size (int, optional): Tamaño mínimo para usar el pool.
+                                               Por defecto 100000.
+        """
+    def __init__(self, logger: Optional[logging.Logger] = None, workers: Optional[int] = None,
+                 chunks_per_worker: int = 4, min_parallel_size: int = 100_000):
+        super().__init__(logger)
+        self.name = "Parallel Linear Search"
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.min_parallel_size = min_parallel_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._source = None
+        self._data: Optional[shared_memory.SharedMemory] = None
+        self._typecode = 'q'
+        self._length = 0
+        self._closed = False
+        chunks = self.workers * chunks_per_worker
+        self._flags = shared_memory.SharedMemory(create=True, size=chunks)
+        self._finalizer = weakref.finalize(self, ParallelLinearSearch._release, [self._flags], None)
+
+    """
+        Libera los segmentos de memoria compartida y el pool de procesos.
+        """
+    @staticmethod
+    def _release(segments: List[Optional[shared_memory.SharedMemory]],
+                 executor: Optional[ProcessPoolExecutor]) -> None:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for segment in segments:
+            if segment is not None:
+                segment.close()
+                try:
+                    segment.unlink()
+                except FileNotFoundError:
+                    # El segmento ya se eliminó
+                    pass
+
+    """Reprograma la liberación de recursos con los segmentos y el pool actuales."""
+    def _track_resources(self) -> None:
+        self._finalizer.detach()
+        self._finalizer = weakref.finalize(self, ParallelLinearSearch._release,
+                                           [self._flags, self._data], self._executor)
+
+    """
+        Copia el arreglo a memoria compartida.
+
+        Args:
+            arr (List[T]): El arreglo a compartir
+
+        Returns:
+            bool: True si el arreglo es numérico y se compartió, False si debe
+            buscarse de forma secuencial
+
+        Raises:
+            ValueError: Si la instancia ya se cerró
+        """
+    def share(self, arr: List[T]) -> bool:
+        with self._lock:
+            self._check_open()
+            if self._data is not None:
+                self._data.close()
+                self._data.unlink()
+                self._data = None
+
+            buffer = typed_buffer(arr)
+            if buffer is None or len(buffer) == 0:
+                self._track_resources()
+                self._source = arr
+                return False
+
+            raw = memoryview(buffer).cast('B')
+            self._data = shared_memory.SharedMemory(create=True, size=len(raw))
+            self._data.buf[:len(raw)] = raw
+            self._typecode = buffer.typecode
+            self._length = len(buffer)
+            self._track_resources()
+            # El arreglo se publica al final, cuando ya está copiado
+            self._source = arr
+            return True
+
+    """
+        Cierra el pool de procesos y libera la memoria compartida. Después de
+        cerrarla, la instancia ya no se puede usar para buscar.
+        """
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._finalizer()
+            self._executor = None
+            self._data = None
+            self._flags = None
+            self._source = None
+
+    """Lanza ValueError si la instancia ya se cerró."""
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("La búsqueda lineal paralela ya se cerró")
+
+    def __enter__(self) -> 'ParallelLinearSearch':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    """
+        Indica si el arreglo se busca con el pool de procesos, compartiéndolo si hace falta.
+        """
+    def _parallel(self, arr: List[T]) -> bool:
+        if len(arr) < self.min_parallel_size:
+            return False
+        if arr is not self._source:
+            with self._lock:
+                if arr is not self._source:
+                    self.share(arr)
+        return self._data is not None
+
+    """
+        Reparte los bloques del arreglo compartido entre los procesos.
+
+        Args:
+            target (T): El elemento objetivo
+            find_all (bool): Si es True se buscan todas las apariciones
+
+        Returns:
+            List[int]: Las posiciones encontradas en orden creciente
+        """
+    def _run(self, target: T, find_all: bool) -> List[int]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._track_resources()
+
+            n = self._length
+            chunks = min(self.workers * self.chunks_per_worker, n)
+            bounds = [(i * n // chunks, (i + 1) * n // chunks) for i in range(chunks)]
+            self._flags.buf[:chunks] = bytes(chunks)
+
+            futures = {
+                self._executor.submit(_scan_chunk, self._data.name, self._typecode, self._flags.name,
+                                      chunk, start, end, target, find_all): chunk
+                for chunk, (start, end) in enumerate(bounds)
+            }
+            self.log(f"{chunks} bloques de ~{n // chunks} elementos repartidos en {self.workers} procesos")
+
+            results: List[Optional[List[int]]] = [None] * chunks
+            done = [False] * chunks
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if not future.cancelled():
+                        chunk = futures[future]
+                        results[chunk] = future.result()
+                        done[chunk] = True
+                if find_all:
+                    continue
+
+                # La respuesta está lista cuando todos los bloques anteriores al primer acierto terminaron sin él
+                for chunk in range(chunks):
+                    if not done[chunk]:
+                        break
+                    if results[chunk]:
+                        for future in pending:
+                            future.cancel()
+                        # Los bloques que ya empezaron ven la bandera y terminan en un SCAN_BLOCK
+                        wait(pending)
+                        return results[chunk]
+
+            found: List[int] = []
+            for chunk_result in results:
+                if chunk_result:
+                    found.extend(chunk_result)
+            return found
+
+    """
+        Busca un elemento objetivo en el arreglo repartiéndolo entre varios procesos.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            int: El índice de la primera aparición del objetivo, -1 si no se encuentra
+
+        Raises:
+            ValueError: Si la instancia ya se cerró
+        """
+    def search(self, arr: List[T], target: T) -> int:
+        self._check_open()
+        self.reset_iterations()
+        self.log(f"\nBúsqueda Lineal Paralela:")
+
+        if not self._parallel(arr):
+            self.log("Arreglo pequeño o no numérico: búsqueda secuencial")
+            return LinearSearch.search(self, arr, target)
+
+        found = self._run(target, False)
+        index = found[0] if found else -1
+        self._iterations = index + 1 if found else len(arr)
+        self.log(f"Resultado: {index}")
+        return index
+
+    """
+        Versión de search sin seguimiento, usada cuando el logging está desactivado.
+        """
+    def _search_untraced(self, arr: List[T], target: T) -> int:
+        self._check_open()
+        if not self._parallel(arr):
+            return LinearSearch._search_untraced(self, arr, target)
+
+        found = self._run(target, False)
+        self._iterations = found[0] + 1 if found else len(arr)
+        return found[0] if found else -1
+
+    """
+        Busca todas las apariciones de un elemento objetivo.
+
+        Args:
+            arr (List[T]): El arreglo en el que buscar
+            target (T): El elemento objetivo a encontrar
+
+        Returns:
+            Arreglo con los índices de todas las apariciones en orden creciente
+            (numpy.ndarray si NumPy está instalado, array('q') si no)
+
+        Raises:
+            ValueError: Si la instancia ya se cerró
+        """
+    def search_all(self, arr: List[T], target: T) -> Any:
+        self._check_open()
+        self._iterations = len(arr)
+        if self._parallel(arr):
+            return index_array(self._run(target, True))
+        return LinearSearch.search_all(self, arr, target)
@@ -0,0 +1,373 @@
+"""
+Sondas de Instrumentación
+
+Este módulo define la interfaz de sondas (probes) que reciben los eventos
+estructurados de una búsqueda, en lugar de mensajes de texto: cada comparación
+con su posición y valor, cada reducción del intervalo y cada cambio de fase.
+Las sondas se asignan con algorithm.probe = sonda; sin sonda (y sin logger) la
+búsqueda usa la ruta sin seguimiento, que no emite ningún evento.
+
+Clases:
+    Probe: Sonda base; todos sus métodos son no-ops
+    CountingProbe: Cuenta búsquedas, comparaciones, reducciones y fases
+    HistogramProbe: Histograma de las posiciones accedidas, relativas al tamaño del arreglo
+    ConsoleProbe: Muestra la búsqueda paso a paso en la consola, con colores
+    MultiProbe: Reenvía los eventos a varias sondas
+    LogProbe: Envía una muestra de las búsquedas a un logger, un registro estructurado por búsqueda
+"""
+
+import logging
+import random
+import sys
+from collections import Counter
+from typing import Any, Dict, List, Optional, TextIO, TypeVar
+
+T = TypeVar('T')
+
+"""
+    Sonda base: define los eventos de una búsqueda. Los métodos no hacen nada; las
+    subclases sobrescriben los que les interesan.
+
+    Los eventos llegan en este orden: start, luego cualquier número de compare,
+    narrow y phase, y por último finish.
+    """
+class Probe:
+
+    """
+        Empieza una búsqueda.
+
+        Args:
+            algorithm (str): Nombre del algoritmo
+            size (int): Tamaño del arreglo
+            target (T): El elemento objetivo
+        """
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        pass
+
+    """
+        Se leyó el valor de una posición y se comparó con el objetivo.
+
+        Args:
+            index (int): Posición accedida
+            value (T): Valor en esa posición
+        """
+    def compare(self, index: int, value: T) -> None:
+        pass
+
+    """
+        El intervalo donde puede estar el objetivo se redujo a [lo, hi] (ambos incluidos).
+
+        Args:
+            lo (int): Límite inferior
+            hi (int): Límite superior
+        """
+    def narrow(self, lo: int, hi: int) -> None:
+        pass
+
+    """
+        La búsqueda pasa a otra fase (por ejemplo, 'avance exponencial' o 'bisección').
+
+        Args:
+            name (str): Nombre de la fase
+        """
+    def phase(self, name: str) -> None:
+        pass
+
+    """
+        Termina una búsqueda.
+
+        Args:
+            result (int): Índice devuelto por la búsqueda
+            iterations (int): Iteraciones reportadas por el algoritmo
+        """
+    def finish(self, result: int, iterations: int) -> None:
+        pass
+
+"""
+    Sonda que cuenta los eventos.
+
+    Atributos:
+        searches (int): Búsquedas terminadas
+        comparisons (int): Comparaciones en total
+        narrows (int): Reducciones del intervalo en total
+        phases (Counter): Veces que se entró en cada fase
+        last_comparisons (int): Comparaciones de la búsqueda en curso o de la última
+    """
+class CountingProbe(Probe):
+
+    def __init__(self):
+        self.reset()
+
+    """Pone todos los contadores en cero."""
+    def reset(self) -> None:
+        self.searches = 0
+        self.comparisons = 0
+        self.narrows = 0
+        self.phases: Counter = Counter()
+        self.last_comparisons = 0
+
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        self.last_comparisons = 0
+
+    def compare(self, index: int, value: T) -> None:
+        self.comparisons += 1
+        self.last_comparisons += 1
+
+    def narrow(self, lo: int, hi: int) -> None:
+        self.narrows += 1
+
+    def phase(self, name: str) -> None:
+        self.phases[name] += 1
+
+    def finish(self, result: int, iterations: int) -> None:
+        self.searches += 1
+
+    """
+        Obtiene los contadores.
+
+        Returns:
+            Dict[str, Any]: Búsquedas, comparaciones, reducciones, comparaciones por
+            búsqueda y fases
+        """
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'searches': self.searches,
+            'comparisons': self.comparisons,
+            'narrows': self.narrows,
+            'comparisons_per_search': self.comparisons / self.searches if self.searches else 0.0,
+            'phases': dict(self.phases),
+        }
+
+"""
+    Sonda que construye un histograma de las posiciones accedidas.
+
+    Cada posición se divide entre el tamaño del arreglo, así que búsquedas sobre
+    arreglos de distinto tamaño se acumulan en el mismo histograma: la cubeta k
+    cuenta los accesos a posiciones en [k / bins, (k + 1) / bins) del arreglo.
+
+    Atributos:
+        bins (int): Número de cubetas
+        counts (List[int]): Accesos por cubeta
+    """
+class HistogramProbe(Probe):
+
+    """
+        Inicializa el histograma.
+
+        Args:
+            bins (int, optional): Número de cubetas. Por defecto 10.
+
+        Raises:
+            ValueError: Si bins no es positivo
+        """
+    def __init__(self, bins: int = 10):
+        if bins < 1:
+            raise ValueError(f"bins debe ser positivo: {bins}")
+        self.bins = bins
+        self.counts: List[int] = [0] * bins
+        self._size = 1
+
+    """Pone el histograma en cero."""
+    def reset(self) -> None:
+        self.counts = [0] * self.bins
+
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        self._size = max(size, 1)
+
+    def compare(self, index: int, value: T) -> None:
+        self.counts[min(index * self.bins // self._size, self.bins - 1)] += 1
+
+    """
+        Da formato de barras al histograma.
+
+        Args:
+            width (int, optional): Ancho de la barra más larga. Por defecto 40.
+
+        Returns:
+            str: Una línea por cubeta con su rango, su conteo y una barra
+        """
+    def format(self, width: int = 40) -> str:
+        peak = max(self.counts) or 1
+        lines = []
+        for k, count in enumerate(self.counts):
+            label = f"[{k / self.bins:.2f}, {(k + 1) / self.bins:.2f})"
+            lines.append(f"{label:<14}{count:>10} {'#' * round(count * width / peak)}")
+        return "\n".join(lines)
+
+"""
+    Sonda que muestra la búsqueda paso a paso en la consola.
+
+    Produce la misma salida con colores y emojis que el logger de consola, pero a
+    partir de los eventos, sin construir ni volver a analizar mensajes de texto.
+
+    Atributos:
+        stream (TextIO): Flujo donde se escribe la salida
+    """
+class ConsoleProbe(Probe):
+
+    # Emoji de cada algoritmo, por nombre
+    ALGORITHM_EMOJIS = {
+        'Binary Search': '🔍',
+        'Linear Search': '➡️',
+        'Exponential Search': '📈',
+        'Interpolation Search': '📊',
+        'Guarded Interpolation Search': '📊',
+    }
+
+    """
+        Inicializa la sonda de consola.
+
+        Args:
+            stream (TextIO, optional): Flujo de salida. Por defecto sys.stdout.
+            color (bool, optional): Si se usan colores ANSI (requiere colorama). Por defecto True.
+        """
+    def __init__(self, stream: Optional[TextIO] = None, color: bool = True):
+        self.stream = stream if stream is not None else sys.stdout
+        if color:
+            from colorama import Fore, Style
+            self._cyan, self._yellow, self._green = Fore.CYAN, Fore.YELLOW, Fore.GREEN
+            self._magenta, self._reset = Fore.MAGENTA, Style.RESET_ALL
+        else:
+            self._cyan = self._yellow = self._green = self._magenta = self._reset = ''
+        self._iteration = 0
+        self._target = None
+
+    def _write(self, line: str) -> None:
+        self.stream.write(line + "\n")
+
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        self._iteration = 0
+        self._target = target
+        emoji = self.ALGORITHM_EMOJIS.get(algorithm, '🔎')
+        self._write(f"\n{self._green}{emoji} {algorithm}: buscando {target} en {size} elementos{self._reset}")
+
+    def compare(self, index: int, value: T) -> None:
+        self._iteration += 1
+        y, r = self._yellow, self._reset
+        self._write(f"{self._cyan}🔄 Iteración {self._iteration}{r}: 📍 posición {y}{index}{r} "
+                    f"⚖️ Comparando {y}{value}{r} con {y}{self._target}{r}")
+
+    def narrow(self, lo: int, hi: int) -> None:
+        y, r = self._yellow, self._reset
+        self._write(f"   ⬅️ izquierda={y}{lo}{r}, ➡️ derecha={y}{hi}{r}")
+
+    def phase(self, name: str) -> None:
+        self._write(f"{self._magenta}🎯 {name}{self._reset}")
+
+    def finish(self, result: int, iterations: int) -> None:
+        outcome = f"encontrado en la posición {result}" if result != -1 else "no encontrado"
+        self._write(f"{self._green}✔ {outcome} ({iterations} iteraciones){self._reset}")
+
+"""
+    Sonda que reenvía cada evento a varias sondas.
+
+    Atributos:
+        probes (List[Probe]): Las sondas que reciben los eventos
+    """
+class MultiProbe(Probe):
+
+    def __init__(self, *probes: Probe):
+        self.probes = list(probes)
+
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        for probe in self.probes:
+            probe.start(algorithm, size, target)
+
+    def compare(self, index: int, value: T) -> None:
+        for probe in self.probes:
+            probe.compare(index, value)
+
+    def narrow(self, lo: int, hi: int) -> None:
+        for probe in self.probes:
+            probe.narrow(lo, hi)
+
+    def phase(self, name: str) -> None:
+        for probe in self.probes:
+            probe.phase(name)
+
+    def finish(self, result: int, iterations: int) -> None:
+        for probe in self.probes:
+            probe.finish(result, iterations)
+
+"""
+    Sonda que envía las búsquedas a un logger como registros estructurados.
+
+    Los eventos de una búsqueda se guardan como tuplas (evento, campos) y en finish
+    se emite un solo registro con todos ellos en record.events (y record.event igual
+    a 'search'): crear un LogRecord cuesta varios microsegundos, así que la búsqueda
+    solo paga uno, y StructuredFormatter lo convierte en una línea por evento sin
+    analizar texto, en el hilo de escritura si el handler es un BatchingQueueHandler.
+    Un handler común muestra un resumen de una línea.
+
+    Con sample_rate < 1 solo se registra una fracción de las búsquedas, elegidas al
+    azar en start; en las demás cada evento termina en una comparación.
+
+    Atributos:
+        logger (logging.Logger): Logger que recibe los registros
+        sample_rate (float): Fracción de las búsquedas que se registran
+        level (int): Nivel de los registros
+        searches (int): Búsquedas iniciadas
+        sampled (int): Búsquedas registradas
+    """
+class LogProbe(Probe):
+
+    """
+        Inicializa la sonda.
+
+        Args:
+            logger (logging.Logger): Logger que recibe los registros
+            sample_rate (float, optional): Fracción de las búsquedas que se registran. Por defecto 1.0.
+            level (int, optional): Nivel de los registros. Por defecto logging.INFO.
+            seed (int, optional): Semilla del muestreo
+
+        Raises:
+            ValueError: Si sample_rate no está en [0, 1]
+        """
+    def __init__(self, logger: logging.Logger, sample_rate: float = 1.0, level: int = logging.INFO,
+                 seed: Optional[int] = None):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate debe estar en [0, 1]: {sample_rate}")
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.level = level
+        self.searches = 0
+        self.sampled = 0
+        self._random = random.Random(seed).random
+        self._events: Optional[List[tuple]] = None
+        self._iteration = 0
+        self._search = None
+
+    def start(self, algorithm: str, size: int, target: T) -> None:
+        self.searches += 1
+        if ((self.sample_rate >= 1.0 or self._random() < self.sample_rate)
+                and self.logger.isEnabledFor(self.level)):
+            self.sampled += 1
+            self._iteration = 0
+            self._search = (algorithm, target, size)
+            self._events = [('start', self._search)]
+        else:
+            self._events = None
+
+    def compare(self, index: int, value: T) -> None:
+        if self._events is not None:
+            self._iteration += 1
+            self._events.append(('compare', (self._iteration, index, value, self._search[1])))
+
+    def narrow(self, lo: int, hi: int) -> None:
+        if self._events is not None:
+            self._events.append(('narrow', (lo, hi)))
+
+    def phase(self, name: str) -> None:
+        if self._events is not None:
+            self._events.append(('phase', (name,)))
+
+    def finish(self, result: int, iterations: int) -> None:
+        events = self._events
+        if events is not None:
+            self._events = None
+            events.append(('finish', (result, iterations)))
+            algorithm, target, size = self._search
+            self.logger.log(self.level, "%s: buscando %s en %d elementos, resultado %d (%d iteraciones)",
+                            algorithm, target, size, result, iterations,
+                            extra={'event': 'search', 'events': events})
@@ -0,0 +1,156 @@
+"""
+Índice Ordenado Preparado
+
+Este módulo implementa un contenedor que valida una sola vez que los datos están
+ordenados, los guarda en un búfer tipado compacto y precalcula los datos auxiliares
+que usan los algoritmos de búsqueda, para que las consultas no repitan ese trabajo.
+
+Clases:
+    SortedIndex: Arreglo ordenado validado con tabla de separadores y pendientes
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import islice
+from operator import le
+from typing import Any, Iterable, List, Optional, Tuple, TypeVar, Union
+from .vectorized import typed_buffer
+
+T = TypeVar('T')
+
+# Elementos entre dos separadores consecutivos de la tabla
+FENCE_STEP = 64
+
+"""
+    Arreglo ordenado preparado para búsquedas repetidas.
+
+    Al construirlo se comprueba en O(n) que los valores están en orden no
+    decreciente y se precalculan:
+
+    - min y max, para descartar en O(1) los objetivos fuera de rango
+    - fences, la tabla de separadores: un valor de cada fence_step, en una lista
+      pequeña sobre la que bisect localiza el segmento del objetivo
+    - scale y slopes, para claves numéricas: posiciones por unidad de clave en
+      todo el arreglo y en cada segmento, que dan las estimaciones de la
+      búsqueda por interpolación
+
+    Los valores numéricos se guardan en un array.array ('q' o 'd'); los demás en
+    una tupla. El objeto es una secuencia de solo lectura, así que cualquier
+    algoritmo lo acepta; LinearSearch, BinarySearch, ExponentialSearch e
+    InterpolationSearch lo reconocen y usan directamente el búfer y las tablas.
+
+    Atributos:
+        data: Los valores (array.array o tupla)
+        fence_step (int): Elementos por segmento de la tabla de separadores
+        fences (List[T]): Valores en las posiciones 0, fence_step, 2 * fence_step, ...
+        scale (float): Posiciones por unidad de clave en todo el arreglo, o None
+                       si las claves no son numéricas
+        slopes (List[float]): Posiciones por unidad de clave en cada segmento, o
+                              None si las claves no son numéricas
+        fence_steps (int): Comparaciones de una búsqueda binaria en la tabla
+    """
+class SortedIndex(Sequence):
+
+    """
+        Valida y prepara los valores.
+
+        Args:
+            values (Iterable[T]): Los valores en orden no decreciente
+            fence_step (int, optional): Elementos por segmento. Por defecto 64.
+
+        Raises:
+            ValueError: Si los valores no están ordenados o fence_step no es positivo
+        """
+    def __init__(self, values: Iterable[T], fence_step: int = FENCE_STEP):
+        if fence_step < 1:
+            raise ValueError(f"fence_step debe ser positivo: {fence_step}")
+        if not isinstance(values, Sequence) and not hasattr(values, '__len__'):
+            values = list(values)
+
+        buffer = typed_buffer(values)
+        self.data = buffer if buffer is not None else tuple(values)
+        data = self.data
+
+        if not all(map(le, data, islice(data, 1, None))):
+            position = next(i for i in range(1, len(data)) if not data[i - 1] <= data[i])
+            raise ValueError(f"Los valores no están ordenados (posición {position})")
+
+        n = len(data)
+        self.fence_step = fence_step
+        self.fences: List[T] = list(data[::fence_step])
+        self.fence_steps = len(self.fences).bit_length()
+        self._min = data[0] if n else None
+        self._max = data[n - 1] if n else None
+        self.slopes: Optional[List[float]] = self._slopes() if buffer is not None else None
+        self.scale: Optional[float] = None
+        if buffer is not None and n:
+            span = self._max - self._min
+            self.scale = (n - 1) / span if span > 0 else 0.0
+
+    """Calcula las posiciones por unidad de clave de cada segmento."""
+    def _slopes(self) -> List[float]:
+        fences, step, n = self.fences, self.fence_step, len(self.data)
+        slopes = []
+        for k, start in enumerate(fences):
+            if k + 1 < len(fences):
+                width, span = step, fences[k + 1] - start
+            else:
+                width, span = n - 1 - k * step, self._max - start
+            slopes.append(width / span if span > 0 else 0.0)
+        return slopes
+
+    """Obtiene el valor mínimo, o None si el índice está vacío."""
+    @property
+    def min(self) -> Optional[T]:
+        return self._min
+
+    """Obtiene el valor máximo, o None si el índice está vacío."""
+    @property
+    def max(self) -> Optional[T]:
+        return self._max
+
+    """
+        Indica si el objetivo está entre el mínimo y el máximo.
+
+        Un objetivo fuera de ese rango no está en el índice.
+        """
+    def covers(self, target: T) -> bool:
+        return self._min is not None and self._min <= target <= self._max
+
+    """
+        Localiza con la tabla de separadores el rango donde está el primer valor no menor que el objetivo.
+
+        Args:
+            target (T): El elemento objetivo
+
+        Returns:
+            Tuple[int, int]: (lo, hi) tal que lower_bound(target) está en [lo, hi]; el
+            rango abarca a lo sumo fence_step posiciones
+        """
+    def segment(self, target: T) -> Tuple[int, int]:
+        i = bisect_left(self.fences, target)
+        step = self.fence_step
+        return (i - 1) * step + 1 if i else 0, min(i * step, len(self.data))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return self.data[index]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    """
+        Expone los datos a NumPy sin copiarlos cuando son numéricos (numpy.asarray usa este método).
+        """
+    def __array__(self, dtype=None, copy=None) -> Any:
+        import numpy as np
+        if self.slopes is not None:
+            values = np.frombuffer(self.data, dtype=self.data.typecode)
+        else:
+            values = np.asarray(self.data)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"SortedIndex(len={len(self)}, min={self._min!r}, max={self._max!r}, fence_step={self.fence_step})"
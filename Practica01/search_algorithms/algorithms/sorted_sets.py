@@ -0,0 +1,306 @@
+"""
+Operaciones de Conjuntos sobre Arreglos Ordenados
+
+Este módulo implementa la intersección, la unión y la diferencia de arreglos
+ordenados (por ejemplo, listas de apariciones de un índice invertido) con el paso
+de galope de la búsqueda exponencial. En lugar de recorrer los dos arreglos
+elemento por elemento, cada operación salta con gallop_left sobre los tramos que
+no aportan al resultado, así que intersecar m elementos con n >> m cuesta
+O(m log(n/m)) comparaciones en lugar de O(n + m).
+
+Los arreglos pueden tener elementos repetidos; se tratan como multiconjuntos: un
+valor que aparece p veces en a y q veces en b aparece min(p, q) veces en la
+intersección, max(p, q) en la unión y max(p - q, 0) en la diferencia.
+
+Cada operación tiene una versión generadora (iter_*), que produce los valores en
+orden sin construir el resultado, y una versión que devuelve un búfer: un
+array.array si todos los arreglos son array.array del mismo tipo, o una lista si no.
+Las versiones generadoras leen los arreglos a medida que avanzan, así que no deben
+modificarse mientras se recorre el resultado.
+
+Funciones:
+    iter_intersection: Valores presentes en los dos arreglos, como generador
+    iter_union: Valores presentes en alguno de los dos arreglos, como generador
+    iter_difference: Valores del primer arreglo que no están en el segundo, como generador
+    iter_intersection_many: Valores presentes en todos los arreglos, como generador
+    intersection: Intersección de dos arreglos, como búfer
+    union: Unión de dos arreglos, como búfer
+    difference: Diferencia de dos arreglos, como búfer
+    intersection_many: Intersección de varios arreglos, como búfer
+"""
+
+from array import array
+from typing import Any, Iterator, Sequence, Tuple, TypeVar
+from .exponential import gallop_left
+
+T = TypeVar('T')
+
+# Tamaño de los bloques en los que las versiones generadoras copian los tramos
+# largos, para no crear una copia del tramo completo
+_CHUNK = 4096
+
+"""
+    Crea el búfer vacío para el resultado de una operación.
+
+    Returns:
+        Un array.array si todos los arreglos son array.array del mismo tipo,
+        una lista si no
+    """
+def _new_buffer(*arrays: Sequence[T]) -> Any:
+    typecodes = {arr.typecode if isinstance(arr, array) else None for arr in arrays}
+    if len(typecodes) == 1 and None not in typecodes:
+        return array(typecodes.pop())
+    return []
+
+"""
+    Obtiene el primer salto del galope en un arreglo al que le quedan remaining
+    elementos, cuando al otro le quedan other: la distancia esperada entre dos
+    valores consecutivos del otro arreglo.
+    """
+def _step(remaining: int, other: int) -> int:
+    return remaining // other if remaining > other else 1
+
+"""
+    Produce los valores de los tramos arr[lo:hi] en bloques de _CHUNK elementos.
+    """
+def _iter_runs(runs: Iterator[Tuple[Sequence[T], int, int]]) -> Iterator[T]:
+    for arr, lo, hi in runs:
+        if hi - lo == 1:
+            yield arr[lo]
+            continue
+        for start in range(lo, hi, _CHUNK):
+            yield from arr[start:min(start + _CHUNK, hi)]
+
+"""
+    Copia los tramos arr[lo:hi] al búfer del resultado.
+    """
+def _collect_runs(buffer: Any, runs: Iterator[Tuple[Sequence[T], int, int]]) -> Any:
+    for arr, lo, hi in runs:
+        buffer.extend(arr[lo:hi])
+    return buffer
+
+"""
+    Obtiene los valores presentes en los dos arreglos ordenados.
+
+    Galopa alternadamente en los dos arreglos: cada valor de uno se busca en el
+    otro desde la última posición, y el valor encontrado (el primero no menor)
+    se usa para saltar en el primero. Si un arreglo tiene m elementos y el otro
+    n >= m, el costo es O(m log(n/m)).
+
+    Args:
+        a (Sequence[T]): Un arreglo ordenado
+        b (Sequence[T]): Otro arreglo ordenado
+
+    Yields:
+        T: Los valores comunes, en orden creciente
+    """
+def iter_intersection(a: Sequence[T], b: Sequence[T]) -> Iterator[T]:
+    if len(b) < len(a):
+        a, b = b, a
+    na, nb = len(a), len(b)
+    i = j = 0
+
+    while i < na and j < nb:
+        value = a[i]
+        j, _ = gallop_left(b, value, j, nb, _step(nb - j, na - i))
+        if j == nb:
+            return
+        other = b[j]
+        if value < other:
+            # Ningún valor de a en [value, other) está en b
+            i, _ = gallop_left(a, other, i + 1, na, _step(na - i, nb - j))
+        else:
+            yield value
+            i += 1
+            j += 1
+
+"""
+    Obtiene los tramos de la unión de dos arreglos ordenados como (arreglo, inicio, fin).
+    """
+def _union_runs(a: Sequence[T], b: Sequence[T]) -> Iterator[Tuple[Sequence[T], int, int]]:
+    na, nb = len(a), len(b)
+    i = j = 0
+
+    while i < na and j < nb:
+        value, other = a[i], b[j]
+        if value < other:
+            end, _ = gallop_left(a, other, i + 1, na, _step(na - i, nb - j))
+            yield a, i, end
+            i = end
+        elif other < value:
+            end, _ = gallop_left(b, value, j + 1, nb, _step(nb - j, na - i))
+            yield b, j, end
+            j = end
+        else:
+            yield a, i, i + 1
+            i += 1
+            j += 1
+
+    if i < na:
+        yield a, i, na
+    if j < nb:
+        yield b, j, nb
+
+"""
+    Obtiene los valores presentes en alguno de los dos arreglos ordenados.
+
+    Los tramos de un arreglo que quedan entre dos valores consecutivos del otro se
+    encuentran galopando y se copian completos, así que las comparaciones son
+    O(m log(n/m)) aunque el resultado tenga n + m elementos.
+
+    Args:
+        a (Sequence[T]): Un arreglo ordenado
+        b (Sequence[T]): Otro arreglo ordenado
+
+    Yields:
+        T: Los valores de la unión, en orden creciente
+    """
+def iter_union(a: Sequence[T], b: Sequence[T]) -> Iterator[T]:
+    return _iter_runs(_union_runs(a, b))
+
+"""
+    Obtiene los tramos de la diferencia a - b como (arreglo, inicio, fin).
+    """
+def _difference_runs(a: Sequence[T], b: Sequence[T]) -> Iterator[Tuple[Sequence[T], int, int]]:
+    na, nb = len(a), len(b)
+    i = j = 0
+
+    while i < na and j < nb:
+        value = a[i]
+        j, _ = gallop_left(b, value, j, nb, _step(nb - j, na - i))
+        if j == nb:
+            break
+        other = b[j]
+        if value < other:
+            # Los valores de a en [value, other) no están en b
+            end, _ = gallop_left(a, other, i + 1, na, _step(na - i, nb - j))
+            yield a, i, end
+            i = end
+        else:
+            i += 1
+            j += 1
+
+    if i < na:
+        yield a, i, na
+
+"""
+    Obtiene los valores del primer arreglo ordenado que no están en el segundo.
+
+    Args:
+        a (Sequence[T]): El arreglo ordenado del que se quitan valores
+        b (Sequence[T]): El arreglo ordenado con los valores a quitar
+
+    Yields:
+        T: Los valores de a - b, en orden creciente
+    """
+def iter_difference(a: Sequence[T], b: Sequence[T]) -> Iterator[T]:
+    return _iter_runs(_difference_runs(a, b))
+
+"""
+    Obtiene los valores presentes en todos los arreglos ordenados.
+
+    Los arreglos se recorren del más corto al más largo: cada candidato del más
+    corto se busca galopando en los demás, y en cuanto uno tiene un valor mayor,
+    ese valor pasa a ser el siguiente candidato. El costo es O(k m log(n/m)), con
+    m la longitud del arreglo más corto y k el número de arreglos.
+
+    Args:
+        arrays (Sequence[Sequence[T]]): Los arreglos ordenados
+
+    Yields:
+        T: Los valores comunes a todos los arreglos, en orden creciente
+    """
+def iter_intersection_many(arrays: Sequence[Sequence[T]]) -> Iterator[T]:
+    arrays = sorted(arrays, key=len)
+    if not arrays or len(arrays[0]) == 0:
+        return
+    first, rest = arrays[0], arrays[1:]
+    lengths = [len(arr) for arr in rest]
+    positions = [0] * len(rest)
+    n = len(first)
+    i = 0
+
+    while i < n:
+        value = first[i]
+        t = 0
+        while t < len(rest):
+            arr = rest[t]
+            pos, _ = gallop_left(arr, value, positions[t], lengths[t],
+                                 _step(lengths[t] - positions[t], n - i))
+            positions[t] = pos
+            if pos == lengths[t]:
+                return
+            if value < arr[pos]:
+                # Nuevo candidato: el primer valor del arreglo corto no menor que arr[pos]
+                i, _ = gallop_left(first, arr[pos], i + 1, n)
+                if i == n:
+                    return
+                value = first[i]
+                t = 0
+            else:
+                t += 1
+
+        yield value
+        i += 1
+        for t in range(len(rest)):
+            positions[t] += 1
+
+"""
+    Obtiene la intersección de dos arreglos ordenados.
+
+    Args:
+        a (Sequence[T]): Un arreglo ordenado
+        b (Sequence[T]): Otro arreglo ordenado
+
+    Returns:
+        Los valores comunes en orden creciente (array.array si a y b son
+        array.array del mismo tipo, lista si no)
+    """
+def intersection(a: Sequence[T], b: Sequence[T]) -> Any:
+    buffer = _new_buffer(a, b)
+    buffer.extend(iter_intersection(a, b))
+    return buffer
+
+"""
+    Obtiene la unión de dos arreglos ordenados.
+
+    Args:
+        a (Sequence[T]): Un arreglo ordenado
+        b (Sequence[T]): Otro arreglo ordenado
+
+    Returns:
+        Los valores de la unión en orden creciente (array.array si a y b son
+        array.array del mismo tipo, lista si no)
+    """
+def union(a: Sequence[T], b: Sequence[T]) -> Any:
+    return _collect_runs(_new_buffer(a, b), _union_runs(a, b))
+
+"""
+    Obtiene la diferencia a - b de dos arreglos ordenados.
+
+    Args:
+        a (Sequence[T]): El arreglo ordenado del que se quitan valores
+        b (Sequence[T]): El arreglo ordenado con los valores a quitar
+
+    Returns:
+        Los valores de a - b en orden creciente (array.array si a y b son
+        array.array del mismo tipo, lista si no)
+    """
+def difference(a: Sequence[T], b: Sequence[T]) -> Any:
+    return _collect_runs(_new_buffer(a, b), _difference_runs(a, b))
+
+"""
+    Obtiene la intersección de varios arreglos ordenados.
+
+    Args:
+        arrays (Sequence[Sequence[T]]): Los arreglos ordenados
+
+    Returns:
+        Los valores comunes en orden creciente (array.array si todos los arreglos
+        son array.array del mismo tipo, lista si no)
+    """
+def intersection_many(arrays: Sequence[Sequence[T]]) -> Any:
+    arrays = list(arrays)
+    buffer = _new_buffer(*arrays) if arrays else []
+    buffer.extend(iter_intersection_many(arrays))
+    return buffer
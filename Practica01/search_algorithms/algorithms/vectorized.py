@@ -0,0 +1,347 @@
+"""
+Búsqueda Vectorizada por Lotes
+
+Este módulo proporciona las rutinas compartidas para resolver muchas búsquedas
+sobre un arreglo ordenado en una sola llamada, y para recorrer búferes tipados
+(numpy.ndarray, array.array, memoryview) en la búsqueda lineal.
+
+Si NumPy está instalado se usa numpy.searchsorted, que resuelve todas las consultas
+en código nativo. Si no, se usa bisect, que sigue evitando el ciclo del intérprete
+por cada comparación.
+
+Funciones:
+    load_numpy: Importa NumPy en el primer uso (None si no está instalado)
+    searchsorted_many: Resuelve un lote de objetivos sobre un arreglo ordenado
+    interpolate_many: Resuelve un lote con una estimación por interpolación vectorizada
+    index_array: Convierte una lista de índices al tipo de arreglo devuelto por search_many
+    typed_buffer: Convierte un arreglo numérico a un array.array compacto
+    is_typed_buffer: Indica si un arreglo es un búfer tipado
+    scan_first: Primera posición de un objetivo en un búfer tipado, por bloques
+    scan_all: Todas las posiciones de un objetivo en un búfer tipado
+    scan_count: Número de apariciones de un objetivo en un búfer tipado
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Sequence, Tuple, TypeVar, Any, Optional
+
+T = TypeVar('T')
+
+# NumPy se importa en el primer uso: importarlo tarda más que todo el resto del
+# paquete, y un proceso que solo hace búsquedas individuales no lo necesita.
+# Mientras no se importe, np vale _UNLOADED; después, el módulo o None.
+_UNLOADED = object()
+np: Any = _UNLOADED
+
+"""
+    Importa NumPy la primera vez que se necesita.
+
+    Returns:
+        El módulo numpy, o None si no está instalado
+    """
+def load_numpy() -> Any:
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:  # NumPy es opcional
+            numpy = None
+        np = numpy
+    return np
+
+"""
+    Devuelve NumPy solo si ya fue importado.
+
+    Sirve para las comprobaciones isinstance: si NumPy no se ha importado, ningún
+    valor puede ser un numpy.ndarray, así que no hace falta importarlo para saberlo.
+    """
+def _imported_numpy() -> Any:
+    return sys.modules.get('numpy') if np is _UNLOADED else np
+
+"""
+    Convierte una lista de índices al tipo de arreglo que devuelve search_many.
+
+    Args:
+        indices (Iterable[int]): Índices resultantes de la búsqueda
+
+    Returns:
+        numpy.ndarray si NumPy está disponible, array('q') en caso contrario
+    """
+def index_array(indices: Iterable[int]) -> Any:
+    np = load_numpy()
+    if np is not None:
+        return np.fromiter(indices, dtype=np.int64)
+    return array('q', indices)
+
+"""
+    Convierte un arreglo numérico a un búfer tipado compacto (array.array).
+
+    Los enteros se guardan como 'q' (64 bits) y los flotantes como 'd'. Un array.array
+    se devuelve sin copiar.
+
+    Args:
+        values (Sequence[T]): Los valores a convertir
+
+    Returns:
+        array.array con los valores, o None si no son todos enteros de 64 bits o
+        todos flotantes
+    """
+def typed_buffer(values: Sequence[T]) -> Any:
+    np = _imported_numpy()
+    if isinstance(values, array):
+        return values
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind == 'i' or (values.dtype.kind == 'u' and values.dtype.itemsize < 8):
+            values = values.astype(np.int64, copy=False)
+        elif values.dtype.kind == 'f':
+            values = values.astype(np.float64, copy=False)
+        else:
+            return None
+        buffer = array('q' if values.dtype.kind == 'i' else 'd')
+        buffer.frombytes(np.ascontiguousarray(values).tobytes())
+        return buffer
+    
+    try:
+        return array('q', values)
+    except (TypeError, OverflowError):
+        pass
+    if all(isinstance(value, float) for value in values):
+        return array('d', values)
+    return None
+
+"""
+    Obtiene una vista NumPy del arreglo sin copiarlo cuando es posible.
+
+    Los arreglos numpy.ndarray, array.array y memoryview se reutilizan sin copia;
+    las listas se convierten en cada llamada.
+
+    Args:
+        arr (Sequence[T]): El arreglo ordenado
+
+    Returns:
+        numpy.ndarray: Vista del arreglo
+    """
+def _as_numpy(arr: Sequence[T]) -> Any:
+    np = load_numpy()
+    if isinstance(arr, np.ndarray):
+        return arr
+    if isinstance(arr, (array, memoryview)):
+        return np.frombuffer(arr, dtype=memoryview(arr).format)
+    return np.asarray(arr)
+
+"""
+    Busca un lote de objetivos en un arreglo ordenado.
+
+    Para cada objetivo se obtiene el punto de inserción izquierdo, por lo que
+    con elementos duplicados se devuelve la primera aparición.
+
+    Args:
+        arr (Sequence[T]): El arreglo ordenado en el que buscar
+        targets (Iterable[T]): Los elementos objetivo a encontrar
+
+    Returns:
+        Tuple[Any, int]: El arreglo de índices (-1 para los no encontrados) y el
+        número de comparaciones lógicas, acotado como las de una búsqueda binaria
+        por objetivo
+    """
+def searchsorted_many(arr: Sequence[T], targets: Iterable[T]) -> Tuple[Any, int]:
+    np = load_numpy()
+    n = len(arr)
+    steps = n.bit_length()
+
+    if np is None:
+        targets = list(targets)
+        indices = array('q', [-1]) * len(targets)
+        for i, target in enumerate(targets):
+            pos = bisect_left(arr, target)
+            if pos < n and arr[pos] == target:
+                indices[i] = pos
+        return indices, len(targets) * steps
+
+    if not hasattr(targets, '__len__'):
+        targets = list(targets)
+    queries = np.asarray(targets)
+    if n == 0:
+        return np.full(queries.shape, -1, dtype=np.int64), 0
+
+    keys = _as_numpy(arr)
+    positions = np.searchsorted(keys, queries, side='left')
+    found = keys[np.minimum(positions, n - 1)] == queries
+    found &= positions < n
+    indices = np.where(found, positions, -1).astype(np.int64, copy=False)
+    return indices, int(queries.size) * steps
+
+"""
+    Busca un lote de objetivos en un arreglo ordenado estimando su posición por interpolación.
+
+    Se calcula una única estimación vectorizada para todo el lote. Los objetivos que
+    coinciden con el valor estimado, o que caen estrictamente entre la estimación y
+    uno de sus vecinos, quedan resueltos; el resto se resuelve con searchsorted_many.
+    Requiere NumPy y claves numéricas; en otro caso equivale a searchsorted_many.
+
+    Args:
+        arr (Sequence[T]): El arreglo ordenado en el que buscar
+        targets (Iterable[T]): Los elementos objetivo a encontrar
+
+    Returns:
+        Tuple[Any, int]: El arreglo de índices (-1 para los no encontrados) y el
+        número de comparaciones lógicas
+    """
+def interpolate_many(arr: Sequence[T], targets: Iterable[T]) -> Tuple[Any, int]:
+    np = load_numpy()
+    n = len(arr)
+    if np is None or n < 2:
+        return searchsorted_many(arr, targets)
+
+    keys = _as_numpy(arr)
+    if not hasattr(targets, '__len__'):
+        targets = list(targets)
+    queries = np.asarray(targets)
+    if keys.dtype.kind not in 'iuf' or queries.dtype.kind not in 'iuf' or queries.ndim != 1:
+        return searchsorted_many(arr, queries)
+
+    low, high = keys[0], keys[n - 1]
+    if high == low:
+        return searchsorted_many(arr, queries)
+
+    # Estimación de la posición de cada objetivo con la fórmula de interpolación
+    estimate = (queries.astype(np.float64) - float(low)) * ((n - 1) / (float(high) - float(low)))
+    pos = np.clip(estimate, 0, n - 1).astype(np.int64)
+    value = keys[pos]
+    below = keys[np.maximum(pos - 1, 0)]
+    above = keys[np.minimum(pos + 1, n - 1)]
+
+    hit = value == queries
+    miss = (queries < low) | (queries > high)
+    miss |= (value < queries) & (queries < above) & (pos < n - 1)
+    miss |= (below < queries) & (queries < value) & (pos > 0)
+
+    indices = np.where(hit, pos, -1)
+    pending = ~(hit | miss)
+    if pending.any():
+        rest, _ = searchsorted_many(keys, queries[pending])
+        indices[pending] = rest
+
+    comparisons = int(queries.size) + int(np.count_nonzero(pending)) * n.bit_length()
+    return indices, comparisons
+
+# Elementos comparados por bloque en el recorrido lineal; el bloque cabe en L2 y
+# permite terminar en cuanto aparece la primera coincidencia
+LINEAR_BLOCK = 1 << 14
+
+"""
+    Indica si un arreglo es un búfer tipado que el recorrido vectorizado puede usar.
+
+    Args:
+        arr (Sequence[T]): El arreglo
+
+    Returns:
+        bool: True para numpy.ndarray, array.array y memoryview
+    """
+def is_typed_buffer(arr: Sequence[T]) -> bool:
+    np = _imported_numpy()
+    return isinstance(arr, (array, memoryview)) or (np is not None and isinstance(arr, np.ndarray))
+
+"""
+    Indica si un objetivo se puede comparar de forma vectorizada con un búfer numérico.
+    """
+def _numeric(target: Any) -> bool:
+    np = _imported_numpy()
+    return isinstance(target, (int, float)) or (np is not None and isinstance(target, np.number))
+
+"""
+    Busca la primera aparición de un objetivo en un búfer tipado.
+
+    Con NumPy el rango se compara por bloques de LINEAR_BLOCK elementos, así que la
+    búsqueda termina en el primer bloque que contiene el objetivo. Sin NumPy se usa
+    array.index, que también recorre el búfer en código nativo.
+
+    Args:
+        arr (Sequence[T]): El búfer tipado
+        target (T): El elemento objetivo
+        start (int, optional): Primera posición del rango. Por defecto 0.
+        end (int, optional): Posición siguiente a la última del rango. Por defecto len(arr).
+
+    Returns:
+        int: La primera posición del objetivo en [start, end), o -1
+    """
+def scan_first(arr: Sequence[T], target: T, start: int = 0, end: Optional[int] = None) -> int:
+    end = len(arr) if end is None else end
+    if not _numeric(target):
+        for i in range(start, end):
+            if arr[i] == target:
+                return i
+        return -1
+
+    np = load_numpy()
+    if np is not None:
+        view = _as_numpy(arr)
+        for block_start in range(start, end, LINEAR_BLOCK):
+            hits = np.flatnonzero(view[block_start:min(block_start + LINEAR_BLOCK, end)] == target)
+            if hits.size:
+                return block_start + int(hits[0])
+        return -1
+
+    for block_start in range(start, end, LINEAR_BLOCK):
+        block = arr[block_start:min(block_start + LINEAR_BLOCK, end)]
+        try:
+            return block_start + block.index(target)
+        except ValueError:
+            pass
+        except AttributeError:  # memoryview no tiene index
+            try:
+                return block_start + block.tolist().index(target)
+            except ValueError:
+                pass
+    return -1
+
+"""
+    Busca todas las apariciones de un objetivo en un búfer tipado.
+
+    Args:
+        arr (Sequence[T]): El búfer tipado
+        target (T): El elemento objetivo
+        start (int, optional): Primera posición del rango. Por defecto 0.
+        end (int, optional): Posición siguiente a la última del rango. Por defecto len(arr).
+
+    Returns:
+        Las posiciones del objetivo en orden creciente (numpy.ndarray si NumPy
+        está instalado, array('q') si no)
+    """
+def scan_all(arr: Sequence[T], target: T, start: int = 0, end: Optional[int] = None) -> Any:
+    np = load_numpy()
+    end = len(arr) if end is None else end
+    if np is None or not _numeric(target):
+        return index_array(i for i in range(start, end) if arr[i] == target)
+
+    view = _as_numpy(arr)
+    blocks = [np.flatnonzero(view[block_start:min(block_start + LINEAR_BLOCK, end)] == target) + block_start
+              for block_start in range(start, end, LINEAR_BLOCK)]
+    if not blocks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(blocks).astype(np.int64, copy=False)
+
+"""
+    Cuenta las apariciones de un objetivo en un búfer tipado.
+
+    Args:
+        arr (Sequence[T]): El búfer tipado
+        target (T): El elemento objetivo
+        start (int, optional): Primera posición del rango. Por defecto 0.
+        end (int, optional): Posición siguiente a la última del rango. Por defecto len(arr).
+
+    Returns:
+        int: Número de apariciones del objetivo en [start, end)
+    """
+def scan_count(arr: Sequence[T], target: T, start: int = 0, end: Optional[int] = None) -> int:
+    np = load_numpy()
+    end = len(arr) if end is None else end
+    if np is None or not _numeric(target):
+        if isinstance(arr, array) and start == 0 and end == len(arr):
+            return arr.count(target)
+        return sum(1 for i in range(start, end) if arr[i] == target)
+
+    view = _as_numpy(arr)
+    return sum(int(np.count_nonzero(view[block_start:min(block_start + LINEAR_BLOCK, end)] == target))
+               for block_start in range(start, end, LINEAR_BLOCK))
@@ -0,0 +1,77 @@
+import unittest
+import random
+from search_algorithms.algorithms import AdaptiveSearch, SearchAlgorithmFactory
+
+class TestAdaptiveSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.search = SearchAlgorithmFactory.get_algorithm("auto")
+
+    """Test para la busqueda en arreglos vacios"""
+    def test_empty_array(self):
+        self.assertEqual(self.search.search([], 5), -1)
+
+    """Test para arreglos pequeños y desordenados: se elige la búsqueda lineal"""
+    def test_linear_choice(self):
+        self.assertEqual(self.search.search([4, 2, 9], 9), 2)
+        self.assertEqual(self.search.choice, "linear")
+
+        arr = list(range(10000))
+        arr[5000], arr[5001] = arr[5001], arr[5000]
+        random.Random(1).shuffle(arr)
+        self.assertEqual(self.search.search(arr, 77), arr.index(77))
+        self.assertEqual(self.search.choice, "linear")
+
+    """Test para claves uniformes: se elige la búsqueda por interpolación"""
+    def test_interpolation_choice(self):
+        arr = list(range(0, 300000, 3))
+        self.assertEqual(self.search.search(arr, 2997), 999)
+        self.assertEqual(self.search.choice, "interpolation")
+
+    """Test para claves agrupadas: se elige la búsqueda binaria"""
+    def test_binary_choice(self):
+        arr = sorted(c * 10**9 + i for c in range(10) for i in range(1000))
+        self.assertEqual(self.search.search(arr, 3 * 10**9 + 5), 3005)
+        self.assertEqual(self.search.choice, "binary")
+
+    """Test para objetivos cerca del inicio: se elige la búsqueda exponencial"""
+    def test_exponential_choice(self):
+        arr = sorted(c * 10**9 + i for c in range(10) for i in range(1000))
+        self.assertEqual(list(self.search.search_many(arr, arr[:20])), list(range(20)))
+        self.assertEqual(self.search.choice, "exponential")
+
+        search = AdaptiveSearch(position="start")
+        self.assertEqual(search.search(list(range(100000)), 3), 3)
+        self.assertEqual(search.choice, "exponential")
+
+    """Test para verificar que la elección se guarda por arreglo"""
+    def test_choice_cached(self):
+        arr = list(range(100000))
+        self.search.search(arr, 5)
+        arr[0] = 10**9  # el análisis no se repite con el mismo objeto y la misma longitud
+        self.assertEqual(self.search.choice, "interpolation")
+        self.search.search(arr, 5)
+        self.assertEqual(self.search.choice, "interpolation")
+        self.assertEqual(self.search.analyze(arr), "linear")
+
+    """Test para varios arreglos usados de forma alternada, analizados una sola vez cada uno"""
+    def test_alternating_arrays(self):
+        analyses = []
+        choose = self.search._choose
+        self.search._choose = lambda *args: analyses.append(args[1]) or choose(*args)
+        ordered, unordered = list(range(100000)), list(range(1000, 0, -1))
+        for _ in range(10):
+            self.assertEqual(self.search.search(ordered, 7), 7)
+            self.assertEqual(self.search.search(unordered, 1), 999)
+        self.assertEqual(analyses, [100000, 1000])
+        self.assertEqual(self.search.choice, "linear")
+
+    """Test para el contador de iteraciones, tomado del algoritmo elegido"""
+    def test_iterations(self):
+        arr = list(range(1000))
+        self.search.search(arr, 500)
+        self.assertEqual(self.search.iterations, self.search.algorithm.iterations)
+        self.assertGreater(self.search.iterations, 0)
+
+if __name__ == '__main__':
+    unittest.main()
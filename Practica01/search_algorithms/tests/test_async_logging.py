@@ -0,0 +1,158 @@
+import unittest
+import gzip
+import io
+import logging
+import os
+import tempfile
+import threading
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch, LogProbe
+from search_algorithms.utils import BatchingQueueHandler, StructuredFormatter, get_console_logger, get_file_logger
+
+
+class BlockingStream(io.StringIO):
+    """Flujo cuya escritura espera hasta que se libera el evento"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+class TestAsyncLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.loggers = []
+
+    def tearDown(self):
+        for logger in self.loggers:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+        self.directory.cleanup()
+
+    def make_logger(self, name, handler):
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        self.loggers.append(logger)
+        return logger
+
+    """Prueba que el handler escribe todos los registros, en orden y por lotes"""
+    def test_batching_handler(self):
+        stream = io.StringIO()
+        handler = BatchingQueueHandler(stream, max_batch=64, flush_interval=0.01)
+        logger = self.make_logger("test_async_batching", handler)
+        for i in range(500):
+            logger.info("registro %d", i)
+        handler.flush()
+        self.assertEqual(stream.getvalue().splitlines(), [f"registro {i}" for i in range(500)])
+        stats = handler.stats
+        self.assertEqual(stats['written'], 500)
+        self.assertLess(stats['batches'], 500)
+        self.assertEqual(stats['dropped'], 0)
+        with self.assertRaises(ValueError):
+            BatchingQueueHandler(stream, max_batch=0)
+
+    """Prueba que con la cola llena los registros se descartan en lugar de bloquear"""
+    def test_full_queue_drops(self):
+        stream = BlockingStream()
+        handler = BatchingQueueHandler(stream, flush_interval=0, max_queue=2)
+        logger = self.make_logger("test_async_drops", handler)
+        for i in range(10):
+            logger.info("registro %d", i)
+        self.assertGreaterEqual(handler.dropped, 7)
+        stream.release.set()
+        handler.flush()
+        self.assertEqual(handler.written + handler.dropped, 10)
+
+    """Prueba que flush termina aunque close se ejecute entre su revisión y su encolado"""
+    def test_flush_during_close(self):
+        handler = BatchingQueueHandler(io.StringIO(), flush_interval=0)
+        closer = threading.Thread(target=handler.close)
+        writer_alive = handler._writer.is_alive
+
+        def is_alive():
+            # La primera revisión de flush pasa y enseguida se ejecuta close
+            if closer.ident is None:
+                alive = writer_alive()
+                closer.start()
+                closer.join(0.2)
+                return alive
+            return writer_alive()
+
+        handler._writer.is_alive = is_alive
+        flusher = threading.Thread(target=handler.flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=5)
+        self.assertFalse(flusher.is_alive())
+        closer.join(timeout=5)
+        self.assertFalse(handler._writer.is_alive())
+
+    """Prueba el logger de archivo asíncrono y el comprimido con gzip"""
+    def test_file_loggers(self):
+        plain = os.path.join(self.directory.name, 'busqueda.log')
+        compressed = os.path.join(self.directory.name, 'busqueda.log.gz')
+        for filename, options, opener in [(plain, {'asynchronous': True}, open),
+                                          (compressed, {}, gzip.open)]:
+            logger = get_file_logger(f"test_async_{os.path.basename(filename)}", filename, **options)
+            self.loggers.append(logger)
+            self.assertIsInstance(logger.handlers[0], BatchingQueueHandler)
+            algorithm = BinarySearch(logger)
+            self.assertEqual(algorithm.search(list(range(100)), 42), 42)
+            logger.handlers[0].close()
+            with opener(filename, 'rt', encoding='utf-8') as log_file:
+                lines = [line for line in log_file.read().splitlines() if " - INFO - " in line]
+            # El encabezado y una línea por iteración
+            self.assertEqual(len(lines), algorithm.iterations + 1)
+            self.assertIn(" - INFO - Iteración 1: izquierda=0, medio=49, derecha=99", lines[1])
+
+    """Prueba que el formateador arma los mensajes a partir de los campos de LogProbe"""
+    def test_structured_formatter(self):
+        stream = io.StringIO()
+        logger = get_console_logger("test_async_structured", asynchronous=True, stream=stream)
+        self.loggers.append(logger)
+        logger.handlers[0].setFormatter(StructuredFormatter(color=False))
+        algorithm = ExponentialSearch()
+        algorithm.probe = LogProbe(logger)
+        self.assertEqual(algorithm.search(list(range(0, 64, 2)), 10), 5)
+        logger.handlers[0].flush()
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0], "Exponential Search: buscando 10 en 32 elementos")
+        self.assertIn("avance exponencial", lines)
+        self.assertIn("Iteración 1: posición 0, Comparando 0 con 10", lines)
+        self.assertEqual(lines[-1], f"resultado 5 ({algorithm.iterations} iteraciones)")
+
+        # Los registros sin campos se muestran con su mensaje
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "Comparando %s con %s", (1, 2), None)
+        self.assertEqual(StructuredFormatter(color=False).format(record), "Comparando 1 con 2")
+
+    """Prueba el muestreo de búsquedas de LogProbe"""
+    def test_log_probe_sampling(self):
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        logger = self.make_logger("test_async_sampling", handler)
+        algorithm = BinarySearch()
+        arr = list(range(100))
+
+        algorithm.probe = LogProbe(logger, sample_rate=0.0)
+        algorithm.search(arr, 7)
+        self.assertEqual(stream.getvalue(), "")
+
+        probe = LogProbe(logger, sample_rate=0.25, seed=1)
+        algorithm.probe = probe
+        for target in range(200):
+            algorithm.search(arr, target)
+        self.assertEqual(probe.searches, 200)
+        self.assertGreater(probe.sampled, 20)
+        self.assertLess(probe.sampled, 80)
+        self.assertEqual(stream.getvalue().count("buscando"), probe.sampled)
+        with self.assertRaises(ValueError):
+            LogProbe(logger, sample_rate=1.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import gc
+import random
+from search_algorithms.algorithms import BinarySearch, LinearSearch
+from search_algorithms.utils.benchmark import (
+    DISTRIBUTIONS, benchmark, calibrate, format_results, generate_data, pick_target,
+    run_benchmark_matrix, summarize
+)
+
+class TestBenchmark(unittest.TestCase):
+
+    """Test para las estadísticas de una lista de tiempos conocida"""
+    def test_summarize(self):
+        stats = summarize([float(i) for i in range(1, 101)])
+        self.assertEqual(stats['median'], 50.5)
+        self.assertEqual(stats['mean'], 50.5)
+        self.assertEqual(stats['min'], 1.0)
+        self.assertEqual(stats['max'], 100.0)
+        self.assertAlmostEqual(stats['p5'], 5.95)
+        self.assertAlmostEqual(stats['p95'], 95.05)
+        self.assertEqual(stats['samples'], 100)
+        # El intervalo de la mediana contiene a la mediana y es más angosto que el rango
+        self.assertLessEqual(stats['ci_low'], stats['median'])
+        self.assertGreaterEqual(stats['ci_high'], stats['median'])
+        self.assertGreater(stats['ci_low'], stats['p25'])
+        self.assertLess(stats['ci_high'], stats['p75'])
+
+        single = summarize([3.0])
+        self.assertEqual((single['median'], single['ci_low'], single['ci_high'], single['stdev']), (3.0, 3.0, 3.0, 0.0))
+        with self.assertRaises(ValueError):
+            summarize([])
+
+    """Test para la calibración del número de llamadas por muestra"""
+    def test_calibrate(self):
+        calls = []
+        loops = calibrate(lambda: calls.append(None), min_time=1e-3)
+        self.assertGreater(loops, 1)
+        self.assertGreaterEqual(len(calls), loops)
+
+    """Test para la medición de una función y el manejo del recolector de basura"""
+    def test_benchmark(self):
+        calls = []
+        stats = benchmark(lambda: calls.append(None), repeat=7, warmup=2, loops=10)
+        self.assertEqual(stats['loops'], 10)
+        self.assertEqual(stats['samples'], 7)
+        # Calentamiento y muestras (sin calibración porque loops es fijo)
+        self.assertEqual(len(calls), 10 * (2 + 7))
+        self.assertGreater(stats['median'], 0)
+        self.assertLessEqual(stats['min'], stats['median'])
+        self.assertLessEqual(stats['median'], stats['max'])
+        self.assertTrue(gc.isenabled())
+
+        gc_states = []
+        benchmark(lambda: gc_states.append(gc.isenabled()), repeat=2, warmup=0, loops=1)
+        self.assertEqual(gc_states, [False, False])
+        self.assertTrue(gc.isenabled())
+
+    """Test para las distribuciones de datos y las posiciones del objetivo"""
+    def test_generate_data_and_pick_target(self):
+        rng = random.Random(3)
+        for distribution in DISTRIBUTIONS:
+            arr = generate_data(500, distribution, rng)
+            self.assertEqual(len(arr), 500)
+            self.assertEqual(arr, sorted(arr))
+            self.assertEqual(pick_target(arr, 'start', rng), arr[0])
+            self.assertEqual(pick_target(arr, 'middle', rng), arr[250])
+            self.assertEqual(pick_target(arr, 'end', rng), arr[-1])
+            self.assertIn(pick_target(arr, 'random', rng), arr)
+            self.assertNotIn(pick_target(arr, 'missing', rng), arr)
+
+        self.assertEqual(generate_data(5, 'sequential'), [0, 1, 2, 3, 4])
+        self.assertEqual(generate_data(300, 'uniform', random.Random(1)), generate_data(300, 'uniform', random.Random(1)))
+        with self.assertRaises(ValueError):
+            generate_data(10, 'normal')
+        with self.assertRaises(ValueError):
+            pick_target([1, 2, 3], 'last')
+
+    """Test para la matriz de algoritmos x tamaños x posiciones x distribuciones"""
+    def test_run_benchmark_matrix(self):
+        binary = BinarySearch()
+        algorithms = {'linear': LinearSearch(), 'binary': binary}
+        rows = run_benchmark_matrix(algorithms, sizes=[50, 500], positions=['start', 'missing'],
+                                    distributions=['uniform', 'zipf'], repeat=3, min_time=1e-5, warmup=1)
+        self.assertEqual(len(rows), 2 * 2 * 2 * 2)
+        self.assertEqual({(r['algorithm'], r['size'], r['position'], r['distribution']) for r in rows},
+                         {(a, s, p, d) for a in algorithms for s in [50, 500]
+                          for p in ['start', 'missing'] for d in ['uniform', 'zipf']})
+        for row in rows:
+            self.assertGreater(row['median'], 0)
+            self.assertEqual(row['samples'], 3)
+            if row['algorithm'] == 'linear' and row['position'] == 'missing':
+                self.assertEqual(row['iterations'], row['size'])
+        self.assertIsNone(binary.logger)
+
+        # Mismo resultado lógico con la misma semilla
+        again = run_benchmark_matrix(algorithms, sizes=[50, 500], positions=['start', 'missing'],
+                                     distributions=['uniform', 'zipf'], repeat=3, min_time=1e-5, warmup=1)
+        self.assertEqual([(r['target'], r['iterations']) for r in rows], [(r['target'], r['iterations']) for r in again])
+
+        table = format_results(rows)
+        self.assertEqual(len(table.splitlines()), len(rows) + 2)
+        self.assertIn('zipf', table)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -74,5 +74,69 @@ class TestBinarySearch(unittest.TestCase):
         result = self.search.search_range(arr, 9, 0, 5, 0)
         self.assertEqual(result, -1)
 
+    """Test para la búsqueda por lotes con search_many"""
+    def test_search_many(self):
+        arr = [1, 3, 5, 7, 9, 11]
+        result = self.search.search_many(arr, [7, 1, 4, 11, 12, 0])
+        self.assertEqual(list(result), [3, 0, -1, 5, -1, -1])
+        
+        # Arreglo vacío y lote vacío
+        self.assertEqual(list(self.search.search_many([], [1, 2])), [-1, -1])
+        self.assertEqual(list(self.search.search_many(arr, [])), [])
+        
+    """Test para search_many sobre un búfer tipado"""
+    def test_search_many_typed_buffer(self):
+        from array import array
+        arr = array('q', range(0, 200, 2))
+        targets = [0, 1, 100, 198, 199]
+        expected = [self.search.search(arr, t) for t in targets]
+        self.assertEqual(list(self.search.search_many(arr, targets)), expected)
+
+    """Test para search_many cuando NumPy no está disponible (se usa bisect)"""
+    def test_search_many_without_numpy(self):
+        from unittest import mock
+        from search_algorithms.algorithms import vectorized
+        
+        arr = [1, 3, 5, 7, 9, 11]
+        with mock.patch.object(vectorized, 'np', None):
+            result = self.search.search_many(arr, iter([7, 1, 4, 12]))
+        self.assertEqual(list(result), [3, 0, -1, -1])
+
+    """Test para lower_bound, upper_bound, equal_range y count con duplicados"""
+    def test_bounds_with_duplicates(self):
+        arr = [1, 2, 2, 2, 3, 5, 5, 8]
+        self.assertEqual(self.search.lower_bound(arr, 2), 1)
+        self.assertEqual(self.search.upper_bound(arr, 2), 4)
+        self.assertEqual(self.search.equal_range(arr, 5), (5, 7))
+        self.assertEqual(self.search.count(arr, 2), 3)
+        
+        # Valores ausentes: rango vacío en su punto de inserción
+        self.assertEqual(self.search.equal_range(arr, 4), (5, 5))
+        self.assertEqual(self.search.count(arr, 0), 0)
+        self.assertEqual(self.search.equal_range(arr, 9), (8, 8))
+        self.assertEqual(self.search.equal_range([], 1), (0, 0))
+        
+    """Test que compara los límites con el módulo bisect en arreglos aleatorios"""
+    def test_bounds_match_bisect(self):
+        import bisect
+        import random
+        rng = random.Random(3)
+        for size in [1, 2, 10, 100, 500]:
+            arr = sorted(rng.randint(0, size // 3 + 1) ** 2 for _ in range(size))
+            for target in [-1] + [v + d for v in set(arr) for d in (-1, 0, 1)]:
+                self.assertEqual(self.search.lower_bound(arr, target), bisect.bisect_left(arr, target))
+                self.assertEqual(self.search.upper_bound(arr, target), bisect.bisect_right(arr, target))
+                
+        # Límites restringidos a un subrango
+        arr = [1, 2, 2, 2, 3, 4]
+        self.assertEqual(self.search.lower_bound(arr, 2, 2, 5), 2)
+        self.assertEqual(self.search.upper_bound(arr, 2, 0, 3), 3)
+        
+    """Test para verificar que los límites cuestan O(log n) iteraciones"""
+    def test_bounds_iterations(self):
+        arr = [7] * 1000 + list(range(8, 1008))
+        self.search.count(arr, 7)
+        self.assertLessEqual(self.search.iterations, 60)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
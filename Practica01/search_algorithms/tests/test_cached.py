@@ -0,0 +1,116 @@
+import unittest
+import logging
+from search_algorithms.algorithms import BinarySearch, CachedSearch, LinearSearch
+from search_algorithms.algorithms.cached import LFUCache, LRUCache
+from search_algorithms.utils import run_performance_test
+
+class TestCachedSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = list(range(0, 2000, 2))
+        self.search = CachedSearch(BinarySearch(), capacity=4)
+
+    """Test para los resultados, que coinciden con los del algoritmo envuelto"""
+    def test_results(self):
+        for target in [0, 1, 998, 1998, 5000, 0, 1]:
+            self.assertEqual(self.search.search(self.arr, target), BinarySearch().search(self.arr, target))
+
+    """Test para aciertos y fallos, con cero iteraciones en un acierto"""
+    def test_hits_and_iterations(self):
+        self.search.search(self.arr, 500)
+        self.assertGreater(self.search.iterations, 0)
+        self.assertEqual(self.search.search(self.arr, 500), 250)
+        self.assertEqual(self.search.iterations, 0)
+        self.search.search(self.arr, 501)
+        self.search.search(self.arr, 501)
+        stats = self.search.stats
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (2, 2, 2))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    """Test para la invalidación al modificar el arreglo"""
+    def test_invalidation(self):
+        arr = [1, 2, 3]
+        self.assertEqual(self.search.search(arr, 3), 2)
+        arr.insert(0, 0)
+        self.search.mark_changed()
+        self.assertEqual(self.search.search(arr, 3), 3)
+        self.assertEqual(self.search.search([3, 4], 3), 0)
+        self.assertEqual(self.search.invalidations, 1)
+        self.assertEqual(self.search.hits, 0)
+
+    """Test para varios arreglos usados de forma alternada, con entradas separadas"""
+    def test_alternating_arrays(self):
+        first, second = [1, 2, 3], [3, 4, 5]
+        for _ in range(10):
+            self.assertEqual(self.search.search(first, 3), 2)
+            self.assertEqual(self.search.search(second, 3), 0)
+        stats = self.search.stats
+        self.assertEqual((stats['hits'], stats['misses'], stats['invalidations']), (18, 2, 0))
+
+    """Test para un fallo cuya búsqueda termina después de mark_changed, que no se guarda"""
+    def test_change_during_search(self):
+        search = CachedSearch(BinarySearch())
+        wrapped = search.algorithm.search
+        search.algorithm.search = lambda arr, target: (search.mark_changed(), wrapped(arr, target))[1]
+        arr = [1, 2, 3]
+        self.assertEqual(search.search(arr, 3), 2)
+        self.assertEqual(search.stats['size'], 0)
+
+    """Test para el desalojo con política LRU"""
+    def test_lru_eviction(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        self.assertTrue(cache.put('c', 3))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+
+    """Test para el desalojo con política LFU"""
+    def test_lfu_eviction(self):
+        cache = LFUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        for _ in range(3):
+            cache.get('b')
+        cache.get('a')
+        self.assertTrue(cache.put('c', 3))
+        self.assertIsNone(cache.get('a'))
+        self.assertTrue(cache.put('d', 4))
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('b'), 2)
+
+    """Test para las estadísticas de desalojo y la política inválida"""
+    def test_evictions(self):
+        search = CachedSearch(BinarySearch(), capacity=2, policy='lfu')
+        for target in [0, 2, 4, 6, 0]:
+            search.search(self.arr, target)
+        self.assertEqual(search.evictions, 3)
+        with self.assertRaises(ValueError):
+            CachedSearch(BinarySearch(), policy='fifo')
+
+    """Test para objetivos no hashables, que se buscan sin guardarse"""
+    def test_unhashable_target(self):
+        search = CachedSearch(LinearSearch())
+        self.assertEqual(search.search([[1], [2]], [2]), 1)
+        self.assertEqual(search.stats['size'], 0)
+
+    """Test para el camino con seguimiento y el logger compartido con el algoritmo envuelto"""
+    def test_tracing(self):
+        logger = logging.getLogger("test_cached_search")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        search = CachedSearch(BinarySearch(), logger=logger)
+        self.assertTrue(search.tracing)
+        self.assertIs(search.algorithm.logger, logger)
+        self.assertEqual(search.search(self.arr, 10), 5)
+        self.assertEqual(search.search(self.arr, 10), 5)
+        self.assertEqual((search.hits, search.iterations), (1, 0))
+
+    """Test para run_performance_test, que reporta cero iteraciones en un acierto"""
+    def test_performance_report(self):
+        results = run_performance_test({"cached": self.search}, sizes=[100, 1000], repetitions=3)
+        self.assertEqual(results["cached"]["iterations"], [0, 0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import random
+from bisect import bisect_left
+from search_algorithms import FractionalCascading
+
+class TestFractionalCascading(unittest.TestCase):
+
+    def setUp(self):
+        self.arrays = [[1, 5, 9, 13], [2, 4, 6, 8, 10], [], [5, 5, 5, 7], [0, 20]]
+        self.cascade = FractionalCascading(self.arrays)
+
+    """Test para una cascada sin arreglos"""
+    def test_no_arrays(self):
+        cascade = FractionalCascading([])
+        self.assertEqual(len(cascade), 0)
+        self.assertEqual(cascade.search(3), [])
+
+    """Test para un objetivo presente en algunos de los arreglos"""
+    def test_search(self):
+        self.assertEqual(self.cascade.search(5), [1, -1, -1, 0, -1])
+        self.assertEqual(self.cascade.search(20), [-1, -1, -1, -1, 1])
+        self.assertEqual(self.cascade.search(3), [-1] * 5)
+
+    """Test para objetivos menores y mayores que todos los elementos"""
+    def test_out_of_range(self):
+        self.assertEqual(self.cascade.lower_bounds(-1), [0, 0, 0, 0, 0])
+        self.assertEqual(self.cascade.lower_bounds(99), [4, 5, 0, 4, 2])
+
+    """Test que compara los puntos de inserción con bisect en arreglos aleatorios"""
+    def test_matches_bisect(self):
+        rng = random.Random(7)
+        arrays = [sorted(rng.randint(0, 300) for _ in range(rng.randint(0, 60))) for _ in range(12)]
+        cascade = FractionalCascading(arrays)
+        for target in range(-2, 303):
+            self.assertEqual(cascade.lower_bounds(target), [bisect_left(arr, target) for arr in arrays])
+            expected = [bisect_left(arr, target) if target in arr else -1 for arr in arrays]
+            self.assertEqual(cascade.search(target), expected)
+
+    """Test para el contador de iteraciones: O(log n + k) en lugar de O(k log n)"""
+    def test_iteration_count(self):
+        arrays = [list(range(i, 100000, 7)) for i in range(20)]
+        cascade = FractionalCascading(arrays)
+        cascade.search(54321)
+        self.assertLessEqual(cascade.iterations, 2 * 20 + 20)
+
+if __name__ == '__main__':
+    unittest.main()
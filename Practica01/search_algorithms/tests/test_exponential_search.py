@@ -1,5 +1,8 @@
 import unittest
-from search_algorithms.algorithms import ExponentialSearch
+import random
+import threading
+from bisect import bisect_left
+from search_algorithms.algorithms import ExponentialSearch, FingerSearchCursor
 
 class TestExponentialSearch(unittest.TestCase):
     
@@ -74,5 +77,137 @@ class TestExponentialSearch(unittest.TestCase):
         # significativamente menos de lo que requeriría la búsqueda lineal (1000)
         self.assertLess(self.search.iterations, 50)
 
+    """Test para la búsqueda por lotes con search_many"""
+    def test_search_many(self):
+        arr = [1, 3, 5, 7, 9, 11]
+        result = self.search.search_many(arr, [7, 1, 4, 11, 12, 0])
+        self.assertEqual(list(result), [3, 0, -1, 5, -1, -1])
+        
+        # Arreglo vacío y lote vacío
+        self.assertEqual(list(self.search.search_many([], [1, 2])), [-1, -1])
+        self.assertEqual(list(self.search.search_many(arr, [])), [])
+        
+    """Test para search_many sobre un búfer tipado"""
+    def test_search_many_typed_buffer(self):
+        from array import array
+        arr = array('q', range(0, 200, 2))
+        targets = [0, 1, 100, 198, 199]
+        expected = [self.search.search(arr, t) for t in targets]
+        self.assertEqual(list(self.search.search_many(arr, targets)), expected)
+
+    """Test para lower_bound, upper_bound, equal_range y count con duplicados"""
+    def test_bounds_with_duplicates(self):
+        arr = [1, 2, 2, 2, 3, 5, 5, 8]
+        self.assertEqual(self.search.lower_bound(arr, 2), 1)
+        self.assertEqual(self.search.upper_bound(arr, 2), 4)
+        self.assertEqual(self.search.equal_range(arr, 5), (5, 7))
+        self.assertEqual(self.search.count(arr, 2), 3)
+        
+        # Valores ausentes: rango vacío en su punto de inserción
+        self.assertEqual(self.search.equal_range(arr, 4), (5, 5))
+        self.assertEqual(self.search.count(arr, 0), 0)
+        self.assertEqual(self.search.equal_range(arr, 9), (8, 8))
+        self.assertEqual(self.search.equal_range([], 1), (0, 0))
+        
+    """Test que compara los límites con el módulo bisect en arreglos aleatorios"""
+    def test_bounds_match_bisect(self):
+        import bisect
+        import random
+        rng = random.Random(3)
+        for size in [1, 2, 10, 100, 500]:
+            arr = sorted(rng.randint(0, size // 3 + 1) ** 2 for _ in range(size))
+            for target in [-1] + [v + d for v in set(arr) for d in (-1, 0, 1)]:
+                self.assertEqual(self.search.lower_bound(arr, target), bisect.bisect_left(arr, target))
+                self.assertEqual(self.search.upper_bound(arr, target), bisect.bisect_right(arr, target))
+                
+        # Límites restringidos a un subrango
+        arr = [1, 2, 2, 2, 3, 4]
+        self.assertEqual(self.search.lower_bound(arr, 2, 2, 5), 2)
+        self.assertEqual(self.search.upper_bound(arr, 2, 0, 3), 3)
+        
+    """Test para verificar que los límites cuestan O(log n) iteraciones"""
+    def test_bounds_iterations(self):
+        arr = [7] * 1000 + list(range(8, 1008))
+        self.search.count(arr, 7)
+        self.assertLessEqual(self.search.iterations, 60)
+
+    """Test para merge_search: resultados en el orden original de los objetivos"""
+    def test_merge_search(self):
+        arr = [1, 3, 3, 5, 7, 9, 11]
+        targets = [7, 1, 4, 11, 3, 12, 0, 3]
+        self.assertEqual(list(self.search.merge_search(arr, targets)), [4, 0, -1, 6, 1, -1, -1, 1])
+        self.assertEqual(list(self.search.merge_search([], [1, 2])), [-1, -1])
+        self.assertEqual(list(self.search.merge_search(arr, [])), [])
+
+    """Test para merge_search con objetivos que se declaran ordenados pero no lo están"""
+    def test_merge_search_presorted(self):
+        arr = list(range(0, 100, 2))
+        self.assertEqual(list(self.search.merge_search(arr, [10, 20, 30], presorted=True)), [5, 10, 15])
+        self.assertEqual(list(self.search.merge_search(arr, [30, 10, 31], presorted=True)), [15, 5, -1])
+
+    """Test para las iteraciones de merge_search, O(m log(n/m)) en lugar de O(m log n)"""
+    def test_merge_search_iterations(self):
+        import random
+        rng = random.Random(9)
+        arr = sorted(rng.sample(range(10**6), 100000))
+        targets = rng.sample(arr, 10000)
+        result = self.search.merge_search(arr, targets)
+        self.assertEqual([arr[i] for i in result], targets)
+        self.assertLess(self.search.iterations, 10000 * 2 * ((100000 // 10000).bit_length() + 2))
+        self.assertLess(self.search.iterations, 10000 * (100000).bit_length())
+
+class TestFingerSearchCursor(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = list(range(0, 200000, 2))
+        self.cursor = ExponentialSearch().cursor(self.arr)
+
+    """Test para la busqueda en arreglos vacios"""
+    def test_empty_array(self):
+        cursor = FingerSearchCursor([])
+        self.assertEqual(cursor.search(5), -1)
+        self.assertEqual(cursor.position, 0)
+
+    """Test que compara lower_bound con bisect moviendo el dedo en ambas direcciones"""
+    def test_matches_bisect(self):
+        rng = random.Random(2)
+        arr = sorted(rng.randint(0, 300) for _ in range(200))
+        cursor = FingerSearchCursor(arr, position=100)
+        for _ in range(2000):
+            target = rng.randint(-2, 302)
+            self.assertEqual(cursor.lower_bound(target), bisect_left(arr, target))
+        self.assertEqual(cursor.search(arr[57]), arr.index(arr[57]))
+
+    """Test para el costo O(log d): objetivos cercanos al resultado anterior"""
+    def test_iterations_depend_on_distance(self):
+        self.assertEqual(self.cursor.search(100000), 50000)
+        self.assertEqual(self.cursor.position, 50000)
+        self.assertEqual(self.cursor.search(100016), 50008)
+        self.assertLessEqual(self.cursor.iterations, 2 * 4 + 2)
+        self.assertEqual(self.cursor.search(99990), 49995)
+        self.assertLessEqual(self.cursor.iterations, 2 * 4 + 2)
+        self.assertEqual(self.cursor.search(99991), -1)
+
+    """Test para un cursor por hilo sobre el mismo arreglo"""
+    def test_cursor_per_thread(self):
+        errors = []
+
+        def consume(seed):
+            rng = random.Random(seed)
+            cursor = FingerSearchCursor(self.arr)
+            target = rng.randrange(0, 200000)
+            for _ in range(3000):
+                target = max(0, target + rng.randint(-20, 20))
+                expected = target // 2 if target % 2 == 0 and target < 200000 else -1
+                if cursor.search(target) != expected:
+                    errors.append((seed, target))
+
+        threads = [threading.Thread(target=consume, args=(seed,)) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -6,6 +6,9 @@ from search_algorithms.algorithms import (
     BinarySearch,
     ExponentialSearch,
     InterpolationSearch,
+    LearnedIndexSearch,
+    HashIndexSearch,
+    AdaptiveSearch,
     SearchAlgorithm
 )
 
@@ -36,6 +39,15 @@ class TestSearchAlgorithmFactory(unittest.TestCase):
         interpolation = SearchAlgorithmFactory.get_algorithm("interpolation")
         self.assertIsInstance(interpolation, InterpolationSearch)
         
+        learned = SearchAlgorithmFactory.get_algorithm("learned")
+        self.assertIsInstance(learned, LearnedIndexSearch)
+        
+        hashed = SearchAlgorithmFactory.get_algorithm("hash")
+        self.assertIsInstance(hashed, HashIndexSearch)
+        
+        auto = SearchAlgorithmFactory.get_algorithm("auto")
+        self.assertIsInstance(auto, AdaptiveSearch)
+        
         # Prueba con mayúsculas y minúsculas mezcladas
         binary_mixed = SearchAlgorithmFactory.get_algorithm("BiNaRy")
         self.assertIsInstance(binary_mixed, BinarySearch)
@@ -49,13 +61,16 @@ class TestSearchAlgorithmFactory(unittest.TestCase):
         algorithms = SearchAlgorithmFactory.get_all_algorithms()
         
         # Verificamos que obtenemos el número correcto de algoritmos
-        self.assertEqual(len(algorithms), 4)
+        self.assertEqual(len(algorithms), 7)
         
         # Verificamos que cada algoritmo es del tipo correcto
         self.assertIsInstance(algorithms["linear"], LinearSearch)
         self.assertIsInstance(algorithms["binary"], BinarySearch)
         self.assertIsInstance(algorithms["exponential"], ExponentialSearch)
         self.assertIsInstance(algorithms["interpolation"], InterpolationSearch)
+        self.assertIsInstance(algorithms["learned"], LearnedIndexSearch)
+        self.assertIsInstance(algorithms["hash"], HashIndexSearch)
+        self.assertIsInstance(algorithms["auto"], AdaptiveSearch)
         
     """Prueba para registrar un nuevo algoritmo"""
     def test_register_algorithm(self):
@@ -89,9 +104,12 @@ class TestSearchAlgorithmFactory(unittest.TestCase):
         self.assertIn("binary", algorithms)
         self.assertIn("exponential", algorithms)
         self.assertIn("interpolation", algorithms)
+        self.assertIn("learned", algorithms)
+        self.assertIn("hash", algorithms)
+        self.assertIn("auto", algorithms)
         
         # Verificamos la longitud
-        self.assertEqual(len(algorithms), 4)
+        self.assertEqual(len(algorithms), 7)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,79 @@
+import unittest
+import random
+from search_algorithms.algorithms import BinarySearch, BloomFilter, FilteredSearch, LinearSearch
+from search_algorithms.utils import run_performance_test
+
+class TestFilteredSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = list(range(0, 2000, 2))
+        self.search = FilteredSearch(BinarySearch())
+
+    """Test para el filtro de Bloom: sin falsos negativos y con la tasa de falsos positivos pedida"""
+    def test_bloom_filter(self):
+        rng = random.Random(0)
+        values = [rng.randrange(10 ** 9) for _ in range(5000)]
+        present = set(values)
+        for bloom in [BloomFilter.from_values(values, 0.01), BloomFilter.from_values(values[:500], 0.01)]:
+            self.assertTrue(all(value in bloom for value in values[:bloom.count]))
+        bloom = BloomFilter.from_values(values, 0.01)
+        absent = [value for value in (rng.randrange(10 ** 9) for _ in range(20000)) if value not in present]
+        false_positives = sum(value in bloom for value in absent) / len(absent)
+        self.assertLess(false_positives, 0.02)
+        self.assertIn(float(values[0]), bloom)
+        with self.assertRaises(ValueError):
+            BloomFilter(10, 1.5)
+
+    """Test para la construcción vectorizada, que marca los mismos bits que add"""
+    def test_from_values_matches_add(self):
+        values = [str(i) for i in range(3000)]
+        bloom = BloomFilter(len(values))
+        for value in values:
+            bloom.add(value)
+        self.assertEqual(BloomFilter.from_values(values)._bits, bloom._bits)
+
+    """Test para los resultados, que coinciden con los del algoritmo envuelto"""
+    def test_results(self):
+        for target in [0, 1, 998, 1998, 5000, -3]:
+            self.assertEqual(self.search.search(self.arr, target), BinarySearch().search(self.arr, target))
+        linear = FilteredSearch(LinearSearch())
+        self.assertEqual(linear.search(['b', 'a', 'c'], 'c'), 2)
+        self.assertEqual(linear.search([[1], [2]], [2]), 1)
+
+    """Test para los descartes, con cero iteraciones, y las estadísticas"""
+    def test_rejections_and_stats(self):
+        self.search.search(self.arr, 500)
+        self.assertGreater(self.search.iterations, 0)
+        rejected = sum(self.search.search(self.arr, target) == -1 and self.search.iterations == 0
+                       for target in range(1, 2000, 2))
+        self.assertGreater(rejected, 950)
+        stats = self.search.stats
+        self.assertEqual(stats['lookups'], 1001)
+        self.assertEqual(stats['rejected'], rejected)
+        self.assertEqual(stats['false_positives'], 1000 - rejected)
+        self.assertGreater(stats['memory_bytes'], 0)
+        self.assertAlmostEqual(stats['hit_rate'], rejected / 1001)
+
+    """Test para la reconstrucción al cambiar el arreglo y para add"""
+    def test_changes(self):
+        arr = [1, 2, 3]
+        self.assertEqual(self.search.search(arr, 3), 2)
+        arr.append(7)
+        self.search.add(7)
+        self.assertEqual(self.search.search(arr, 7), 3)
+        arr.insert(0, 0)
+        self.search.mark_changed()
+        self.assertEqual(self.search.search(arr, 0), 0)
+        self.assertEqual(self.search.search([3, 4], 4), 1)
+        self.assertEqual(self.search.rebuilds, 3)
+
+    """Test para el reporte de rendimiento, que incluye la tasa de aciertos y la memoria del filtro"""
+    def test_performance_report(self):
+        results = run_performance_test({'filtered': FilteredSearch(BinarySearch()), 'binary': BinarySearch()},
+                                       sizes=[100, 1000], repetitions=3, position='missing')
+        self.assertEqual(len(results['filtered']['filter']), 2)
+        self.assertGreater(results['filtered']['filter'][1]['memory_bytes'], 0)
+        self.assertNotIn('filter', results['binary'])
+
+if __name__ == '__main__':
+    unittest.main()
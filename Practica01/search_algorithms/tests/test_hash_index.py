@@ -0,0 +1,73 @@
+import unittest
+import logging
+import random
+from array import array
+from search_algorithms.algorithms import HashIndexSearch, LinearSearch, SearchAlgorithmFactory
+
+class TestHashIndexSearch(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.arr = [rng.randint(0, 50) for _ in range(300)]
+        self.search = HashIndexSearch(all_positions=True)
+        self.linear = LinearSearch()
+
+    """Test para la primera aparición, que coincide con la de LinearSearch"""
+    def test_matches_linear_search(self):
+        nan = float('nan')
+        for arr in [self.arr, array('q', self.arr), [3.0, 1, True, 'a', 1.0, None], [], [7], [1, nan, 2]]:
+            for target in list(arr)[:20] + [-1, 1, 'a', 'b', None, 2.5, nan, float('nan')]:
+                self.assertEqual(self.search.search(arr, target), self.linear.search(arr, target))
+                if self.search.search(arr, target) != -1:
+                    self.assertEqual(self.search.iterations, 1)
+
+    """Test para la ruta con seguimiento, que da los mismos resultados"""
+    def test_traced(self):
+        logger = logging.getLogger("test_hash_index_traced")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(logging.NullHandler())
+        traced = HashIndexSearch(logger)
+        for target in [0, 25, 50, 99]:
+            self.assertEqual(traced.search(self.arr, target), self.linear.search(self.arr, target))
+
+    """Test para todas las posiciones y el conteo"""
+    def test_search_all_and_count(self):
+        for target in [0, 25, 50, 99]:
+            self.assertEqual(list(self.search.search_all(self.arr, target)),
+                             list(self.linear.search_all(self.arr, target)))
+            self.assertEqual(self.search.count(self.arr, target), self.arr.count(target))
+        first_only = HashIndexSearch()
+        self.assertEqual(first_only.count(self.arr, 25), self.arr.count(25))
+
+    """Test para el mantenimiento incremental al agregar valores y la reconstrucción"""
+    def test_incremental_updates(self):
+        arr = [5, 3, 5]
+        self.assertEqual(self.search.search(arr, 5), 0)
+        arr.extend([9, 3, 9])
+        self.assertEqual(self.search.search(arr, 9), 3)
+        self.assertEqual(self.search.count(arr, 3), 2)
+        self.assertEqual(self.search.builds, 1)
+        arr[0] = 1
+        self.search.mark_changed()
+        self.assertEqual(self.search.search(arr, 5), 2)
+        arr.pop()
+        self.assertEqual(self.search.count(arr, 9), 1)
+        self.assertEqual(self.search.builds, 3)
+
+    """Test para los valores no hashables, que se buscan con LinearSearch"""
+    def test_unhashable(self):
+        arr = [[1], [2], [1]]
+        self.assertEqual(self.search.search(arr, [1]), 0)
+        self.assertEqual(self.search.search(arr, [2]), 1)
+        self.assertEqual(self.search.memory_bytes, 0)
+        self.assertEqual(self.search.search([1, 2], [2]), -1)
+
+    """Test para el registro en la fábrica y la memoria estimada"""
+    def test_factory_and_memory(self):
+        algorithm = SearchAlgorithmFactory.get_algorithm("hash")
+        self.assertEqual(algorithm.search(list(range(1000)), 999), 999)
+        self.assertGreater(algorithm.memory_bytes, 1000 * 8)
+
+if __name__ == '__main__':
+    unittest.main()
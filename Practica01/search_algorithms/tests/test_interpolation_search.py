@@ -1,5 +1,7 @@
 import unittest
-from search_algorithms.algorithms import InterpolationSearch
+import logging
+import random
+from search_algorithms.algorithms import InterpolationSearch, GuardedInterpolationSearch
 
 class TestInterpolationSearch(unittest.TestCase):
     
@@ -73,5 +75,126 @@ class TestInterpolationSearch(unittest.TestCase):
         result = self.search.search(arr, 2)
         self.assertIn(result, [1, 2, 3])  # Podría ser cualquiera de estas posiciones
 
+    """Test para la búsqueda por lotes con search_many"""
+    def test_search_many(self):
+        arr = [1, 3, 5, 7, 9, 11]
+        result = self.search.search_many(arr, [7, 1, 4, 11, 12, 0])
+        self.assertEqual(list(result), [3, 0, -1, 5, -1, -1])
+        
+        # Arreglo vacío y lote vacío
+        self.assertEqual(list(self.search.search_many([], [1, 2])), [-1, -1])
+        self.assertEqual(list(self.search.search_many(arr, [])), [])
+        
+    """Test para search_many sobre un búfer tipado"""
+    def test_search_many_typed_buffer(self):
+        from array import array
+        arr = array('q', range(0, 200, 2))
+        targets = [0, 1, 100, 198, 199]
+        expected = [self.search.search(arr, t) for t in targets]
+        self.assertEqual(list(self.search.search_many(arr, targets)), expected)
+
+    """Test para search_many con distribución no uniforme y duplicados"""
+    def test_search_many_non_uniform(self):
+        arr = sorted([2**i for i in range(20)] + [5, 5, 5, 1000, 1000])
+        targets = list(range(-2, 1100)) + [2**19, 2**19 + 1]
+        result = self.search.search_many(arr, targets)
+        for target, index in zip(targets, result):
+            if target in arr:
+                self.assertEqual(arr[index], target)
+            else:
+                self.assertEqual(index, -1)
+
+    """Test para lower_bound, upper_bound, equal_range y count con duplicados"""
+    def test_bounds_with_duplicates(self):
+        arr = [1, 2, 2, 2, 3, 5, 5, 8]
+        self.assertEqual(self.search.lower_bound(arr, 2), 1)
+        self.assertEqual(self.search.upper_bound(arr, 2), 4)
+        self.assertEqual(self.search.equal_range(arr, 5), (5, 7))
+        self.assertEqual(self.search.count(arr, 2), 3)
+        
+        # Valores ausentes: rango vacío en su punto de inserción
+        self.assertEqual(self.search.equal_range(arr, 4), (5, 5))
+        self.assertEqual(self.search.count(arr, 0), 0)
+        self.assertEqual(self.search.equal_range(arr, 9), (8, 8))
+        self.assertEqual(self.search.equal_range([], 1), (0, 0))
+        
+    """Test que compara los límites con el módulo bisect en arreglos aleatorios"""
+    def test_bounds_match_bisect(self):
+        import bisect
+        import random
+        rng = random.Random(3)
+        for size in [1, 2, 10, 100, 500]:
+            arr = sorted(rng.randint(0, size // 3 + 1) ** 2 for _ in range(size))
+            for target in [-1] + [v + d for v in set(arr) for d in (-1, 0, 1)]:
+                self.assertEqual(self.search.lower_bound(arr, target), bisect.bisect_left(arr, target))
+                self.assertEqual(self.search.upper_bound(arr, target), bisect.bisect_right(arr, target))
+                
+        # Límites restringidos a un subrango
+        arr = [1, 2, 2, 2, 3, 4]
+        self.assertEqual(self.search.lower_bound(arr, 2, 2, 5), 2)
+        self.assertEqual(self.search.upper_bound(arr, 2, 0, 3), 3)
+        
+    """Test para verificar que los límites cuestan O(log n) iteraciones"""
+    def test_bounds_iterations(self):
+        arr = [7] * 1000 + list(range(8, 1008))
+        self.search.count(arr, 7)
+        self.assertLessEqual(self.search.iterations, 60)
+
+class TestGuardedInterpolationSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.search = GuardedInterpolationSearch()
+        rng = random.Random(3)
+        self.adversarial = {
+            "exponencial": sorted(int(rng.expovariate(1e-3)) for _ in range(20000)),
+            "agrupada": sorted(c * 10**9 + rng.randint(0, 100) for c in range(10) for _ in range(2000)),
+            "potencias": [2 ** (i // 500) + i for i in range(20000)],
+        }
+
+    """Test para la busqueda en arreglos vacios y con un elemento"""
+    def test_small_arrays(self):
+        self.assertEqual(self.search.search([], 5), -1)
+        self.assertEqual(self.search.search([5], 5), 0)
+        self.assertEqual(self.search.search([5], 1), -1)
+
+    """Test para elementos presentes y ausentes en el arreglo"""
+    def test_elements_found(self):
+        arr = [1, 3, 5, 7, 9]
+        for i, value in enumerate(arr):
+            self.assertEqual(self.search.search(arr, value), i)
+        for target in [0, 2, 6, 10]:
+            self.assertEqual(self.search.search(arr, target), -1)
+
+    """Test con distribuciones adversas: el número de iteraciones queda acotado por O(log n)"""
+    def test_worst_case_bound(self):
+        for name, arr in self.adversarial.items():
+            bound = 2 * len(arr).bit_length() + 2
+            for target in arr[::37] + [arr[0] - 1, arr[-1] + 1, arr[len(arr) // 2] + 1]:
+                index = self.search.search(arr, target)
+                if index != -1:
+                    self.assertEqual(arr[index], target, name)
+                self.assertLessEqual(self.search.iterations, bound, name)
+
+    """Test con datos uniformes: se conservan las pocas iteraciones de la interpolación"""
+    def test_uniform_iterations(self):
+        arr = list(range(0, 300000, 3))
+        total = 0
+        for target in arr[::997]:
+            self.assertEqual(arr[self.search.search(arr, target)], target)
+            total += self.search.iterations
+        self.assertLess(total / len(arr[::997]), 5)
+
+    """Test para verificar que el camino con logging produce los mismos resultados"""
+    def test_traced_matches_untraced(self):
+        logger = logging.getLogger("test_guarded_interpolation")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        traced = GuardedInterpolationSearch(logger)
+        self.assertTrue(traced.tracing)
+        arr = self.adversarial["agrupada"]
+        for target in arr[::211] + [arr[0] - 1, arr[100] + 1]:
+            self.assertEqual(traced.search(arr, target), self.search.search(arr, target))
+            self.assertEqual(traced.iterations, self.search.iterations)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,84 @@
+import unittest
+import random
+from array import array
+from search_algorithms.algorithms import BinarySearch, EytzingerSearch, StaticBTreeSearch
+
+class LayoutSearchTests:
+    """Pruebas comunes para los índices con disposición amigable con la caché"""
+
+    """Test para la busqueda en arreglos vacios"""
+    def test_empty_array(self):
+        result = self.search.search([], 5)
+        self.assertEqual(result, -1)
+
+    """Test para elementos al principio, a la mitad y al final del arreglo"""
+    def test_elements_found(self):
+        arr = [1, 2, 3, 4, 5]
+        self.assertEqual(self.search.search(arr, 1), 0)
+        self.assertEqual(self.search.search(arr, 3), 2)
+        self.assertEqual(self.search.search(arr, 5), 4)
+
+    """Test para cuando el elemento no se encuentra en el arreglo"""
+    def test_element_not_in_array(self):
+        arr = [1, 3, 5, 7, 9]
+        for target in [0, 2, 4, 6, 8, 10]:
+            self.assertEqual(self.search.search(arr, target), -1)
+
+    """Test que compara los resultados con la búsqueda binaria en arreglos aleatorios"""
+    def test_matches_binary_search(self):
+        rng = random.Random(11)
+        for size in [1, 2, 3, 15, 16, 17, 100, 1000]:
+            arr = sorted(rng.sample(range(size * 3), size))
+            for target in range(-1, size * 3 + 1):
+                self.assertEqual(self.search.search(arr, target), self.binary.search(arr, target))
+
+    """Test para claves no numéricas, que no caben en un búfer tipado"""
+    def test_string_keys(self):
+        arr = ["ana", "beto", "carla", "diego", "elena", "fer"]
+        self.assertEqual(self.search.search(arr, "diego"), 3)
+        self.assertEqual(self.search.search(arr, "zoe"), -1)
+
+    """Test para verificar que el índice se reconstruye al cambiar de arreglo"""
+    def test_rebuild_on_new_array(self):
+        self.assertEqual(self.search.search([1, 2, 3], 3), 2)
+        self.assertEqual(self.search.search([3, 4], 3), 0)
+
+    """Test para search_many sobre un búfer tipado"""
+    def test_search_many(self):
+        arr = array('q', range(0, 400, 4))
+        targets = [0, 3, 8, 396, 400, -4]
+        self.assertEqual(list(self.search.search_many(arr, targets)), [0, -1, 2, 99, -1, -1])
+        self.assertEqual(list(self.search.search_many(array('q'), [1, 2])), [-1, -1])
+
+class TestEytzingerSearch(LayoutSearchTests, unittest.TestCase):
+
+    def setUp(self):
+        self.search = EytzingerSearch()
+        self.binary = BinarySearch()
+
+    """Test para el contador de iteraciones, igual a la altura del árbol"""
+    def test_iteration_count(self):
+        arr = list(range(1023))
+        self.search.search(arr, 500)
+        self.assertEqual(self.search.iterations, 10)
+
+class TestStaticBTreeSearch(LayoutSearchTests, unittest.TestCase):
+
+    def setUp(self):
+        self.search = StaticBTreeSearch(node_size=4)
+        self.binary = BinarySearch()
+
+    """Test para el tamaño de nodo por defecto (una línea de caché de claves de 64 bits)"""
+    def test_default_node_size(self):
+        search = StaticBTreeSearch()
+        search.search(list(range(100)), 10)
+        self.assertEqual(search.node_size, 8)
+
+    """Test para el contador de iteraciones, proporcional a log n"""
+    def test_iteration_count(self):
+        arr = list(range(10000))
+        self.search.search(arr, 9999)
+        self.assertLessEqual(self.search.iterations, 3 * 7)
+
+if __name__ == '__main__':
+    unittest.main()
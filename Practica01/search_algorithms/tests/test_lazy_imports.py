@@ -0,0 +1,84 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+# Carpeta practica01, para que el intérprete nuevo encuentre el paquete
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY_MODULES = ['numpy', 'colorama', 'asyncio', 'concurrent.futures.process',
+                 'search_algorithms.algorithms.learned', 'search_algorithms.algorithms.parallel',
+                 'search_algorithms.utils.logger', 'search_algorithms.utils.search_server']
+
+
+def loaded_modules(code):
+    """Ejecuta código en un intérprete nuevo y devuelve cuáles de HEAVY_MODULES quedaron importados"""
+    script = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_DIR, check=True,
+                            capture_output=True, text=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+class TestLazyImports(unittest.TestCase):
+
+    """Prueba que importar el paquete no importa ningún módulo pesado"""
+    def test_package_import(self):
+        self.assertEqual(loaded_modules("import search_algorithms"), set())
+
+    """Prueba que usar un algoritmo solo importa lo que necesita"""
+    def test_single_algorithm(self):
+        code = ("from search_algorithms import BinarySearch\n"
+                "from search_algorithms.algorithms import SearchAlgorithmFactory\n"
+                "assert BinarySearch().search([1, 2, 3], 2) == 1\n"
+                "assert SearchAlgorithmFactory.get_algorithm('linear').search([1, 2, 3], 3) == 2")
+        self.assertEqual(loaded_modules(code), set())
+
+    """Prueba que medir un algoritmo sin filtro no importa NumPy"""
+    def test_performance_test(self):
+        code = ("from search_algorithms import BinarySearch, run_performance_test\n"
+                "run_performance_test({'binary': BinarySearch()}, sizes=[100], repetitions=3)")
+        self.assertEqual(loaded_modules(code), set())
+
+    """Prueba que colorama solo se importa al formatear con colores"""
+    def test_logger_colorama(self):
+        code = ("from search_algorithms import get_null_logger, get_console_logger\n"
+                "get_null_logger('x')\n"
+                "import sys; assert 'colorama' not in sys.modules\n"
+                "get_console_logger('x', stream=sys.stdout).info('hola')")
+        self.assertIn('colorama', loaded_modules(code))
+
+    """Prueba que search_many importa NumPy en su primer uso, si está instalado"""
+    def test_numpy_on_first_use(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy no está instalado")
+        code = ("from search_algorithms import BinarySearch\n"
+                "assert list(BinarySearch().search_many([1, 2, 3], [3, 4])) == [2, -1]")
+        self.assertIn('numpy', loaded_modules(code))
+
+    """Prueba los atributos perezosos del paquete y las entradas perezosas de la fábrica"""
+    def test_lazy_attributes_and_factory(self):
+        import search_algorithms
+        from search_algorithms import algorithms
+        from search_algorithms.algorithms import SearchAlgorithmFactory, LearnedIndexSearch
+
+        self.assertIn('BinarySearch', dir(search_algorithms))
+        self.assertIs(search_algorithms.LearnedIndexSearch, LearnedIndexSearch)
+        self.assertIs(search_algorithms.algorithms, algorithms)
+        with self.assertRaises(AttributeError):
+            search_algorithms.NoSuchSearch
+        with self.assertRaises(ImportError):
+            from search_algorithms.algorithms import NoSuchSearch  # noqa: F401
+
+        SearchAlgorithmFactory.register_algorithm('test_lazy', 'search_algorithms.algorithms.layout.EytzingerSearch')
+        try:
+            algorithm = SearchAlgorithmFactory.get_algorithm('TEST_LAZY')
+            self.assertEqual(type(algorithm).__name__, 'EytzingerSearch')
+            self.assertEqual(algorithm.search([1, 2, 3], 3), 2)
+        finally:
+            del SearchAlgorithmFactory._algorithms['test_lazy']
+
+if __name__ == '__main__':
+    unittest.main()
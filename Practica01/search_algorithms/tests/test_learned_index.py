@@ -0,0 +1,77 @@
+import unittest
+import random
+from search_algorithms.algorithms import LearnedIndexSearch
+
+class TestLearnedIndexSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.search = LearnedIndexSearch()
+
+    """Test para la busqueda en arreglos vacios"""
+    def test_empty_array(self):
+        result = self.search.search([], 5)
+        self.assertEqual(result, -1)
+
+    """Test para elementos al principio, a la mitad y al final del arreglo"""
+    def test_elements_found(self):
+        arr = [1, 2, 3, 4, 5]
+        self.assertEqual(self.search.search(arr, 1), 0)
+        self.assertEqual(self.search.search(arr, 3), 2)
+        self.assertEqual(self.search.search(arr, 5), 4)
+
+    """Test para cuando el elemento no se encuentra en el arreglo"""
+    def test_element_not_in_array(self):
+        arr = [1, 3, 5, 7, 9]
+        for target in [0, 2, 6, 10, 2.5]:
+            self.assertEqual(self.search.search(arr, target), -1)
+
+    """Test para un arreglo con un elemento"""
+    def test_array_with_one_element(self):
+        self.assertEqual(self.search.search([5], 5), 0)
+        self.assertEqual(self.search.search([5], 1), -1)
+
+    """Test para cuando hay duplicados: se devuelve la primera aparición"""
+    def test_duplicates(self):
+        arr = [1] * 50 + [2] * 50 + list(range(3, 500))
+        self.assertEqual(self.search.search(arr, 2), 50)
+        self.assertEqual(self.search.search(arr, 1), 0)
+
+    """Test para claves no numéricas, que no permiten ajustar modelos"""
+    def test_string_keys(self):
+        arr = ["ana", "beto", "carla", "diego"]
+        self.assertEqual(self.search.search(arr, "carla"), 2)
+        self.assertEqual(self.search.search(arr, "zoe"), -1)
+
+    """Test con distribuciones no uniformes: el error de los modelos se mantiene acotado"""
+    def test_skewed_distributions(self):
+        rng = random.Random(5)
+        distributions = {
+            "exponencial": [int(rng.expovariate(1e-3)) for _ in range(20000)],
+            "lognormal": [rng.lognormvariate(0, 3) for _ in range(20000)],
+            "agrupada": [c * 10**6 + rng.randint(0, 100) for c in range(10) for _ in range(2000)],
+        }
+        for name, values in distributions.items():
+            arr = sorted(values)
+            self.search.build(arr)
+            self.assertLess(self.search.max_error, 1000, name)
+            for target in arr[::97]:
+                index = self.search.search(arr, target)
+                self.assertEqual(arr[index], target)
+                self.assertTrue(index == 0 or arr[index - 1] != target)
+            for target in [arr[0] - 1, arr[-1] + 1]:
+                self.assertEqual(self.search.search(arr, target), -1)
+
+    """Test para el contador de iteraciones: la búsqueda final está acotada por el error"""
+    def test_iteration_count(self):
+        arr = list(range(0, 200000, 2))
+        self.search.search(arr, 123456)
+        self.assertLessEqual(self.search.iterations, 1 + (2 * self.search.max_error + 1).bit_length())
+        self.assertLess(self.search.iterations, 10)
+
+    """Test para verificar que el índice se reconstruye al cambiar de arreglo"""
+    def test_rebuild_on_new_array(self):
+        self.assertEqual(self.search.search(list(range(100)), 99), 99)
+        self.assertEqual(self.search.search(list(range(50, 60)), 55), 5)
+
+if __name__ == '__main__':
+    unittest.main()
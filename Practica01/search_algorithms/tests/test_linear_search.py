@@ -57,5 +57,75 @@ class TestLinearSearch(unittest.TestCase):
         self.search.search(arr, 6)
         self.assertEqual(self.search.iterations, 5)
 
+    """Test para search_many, que usa la implementación por defecto de la clase base"""
+    def test_search_many(self):
+        arr = [4, 2, 7, 2, 9]
+        result = self.search.search_many(arr, [2, 9, 5])
+        self.assertEqual(list(result), [1, 4, -1])
+        
+        # Las iteraciones se acumulan para todo el lote: 2 + 5 + 5
+        self.assertEqual(self.search.iterations, 12)
+
+    """Test para búferes tipados: numpy.ndarray, array.array y memoryview"""
+    def test_typed_buffers(self):
+        import numpy as np
+        from array import array
+        values = array('q', [5, -3, 8, 8, 1] * 10000)
+        values[40000] = 99
+        for arr in [values, memoryview(values), np.frombuffer(values, dtype=np.int64)]:
+            self.assertEqual(self.search.search(arr, 99), 40000)
+            self.assertEqual(self.search.iterations, 40001)
+            self.assertEqual(self.search.search(arr, 7), -1)
+            self.assertEqual(self.search.iterations, 50000)
+            self.assertEqual(self.search.search(arr, 8.0), 2)
+            self.assertEqual(self.search.search(arr, "8"), -1)
+
+    """Test para search_all y count sobre listas y búferes tipados"""
+    def test_search_all_and_count(self):
+        from array import array
+        arr = [4, 2, 7, 2, 9] * 7000
+        expected = [i for i, value in enumerate(arr) if value == 2]
+        for values in [arr, array('q', arr)]:
+            self.assertEqual(list(self.search.search_all(values, 2)), expected)
+            self.assertEqual(self.search.count(values, 2), len(expected))
+            self.assertEqual(self.search.iterations, len(arr))
+            self.assertEqual(list(self.search.search_all(values, 5)), [])
+            self.assertEqual(self.search.count(values, 5), 0)
+
+    """Test para el recorrido de búferes tipados sin NumPy"""
+    def test_typed_buffers_without_numpy(self):
+        from unittest import mock
+        from array import array
+        from search_algorithms.algorithms import vectorized
+
+        values = array('d', [0.5 * i for i in range(40000)])
+        with mock.patch.object(vectorized, 'np', None):
+            for arr in [values, memoryview(values)]:
+                self.assertEqual(self.search.search(arr, 19999.5), 39999)
+                self.assertEqual(self.search.search(arr, 0.25), -1)
+                self.assertEqual(list(self.search.search_all(arr, 1.0)), [2])
+                self.assertEqual(self.search.count(arr, 1.0), 1)
+
+    """Test para valores que no son iguales a sí mismos, con y sin seguimiento"""
+    def test_identity_then_equality(self):
+        import logging
+        from collections import deque
+        logger = logging.getLogger("test_linear_identity")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(logging.NullHandler())
+        traced = LinearSearch(logger)
+        self.assertTrue(traced.tracing)
+
+        nan = float('nan')
+        arr = [1, nan, 2, nan]
+        for algorithm in [self.search, traced]:
+            self.assertEqual(algorithm.search(arr, nan), 1)
+            self.assertEqual(algorithm.iterations, 2)
+            self.assertEqual(algorithm.search(arr, float('nan')), -1)
+            self.assertEqual(algorithm.search(deque(arr), nan), 1)
+        self.assertEqual(list(self.search.search_all(arr, nan)), [1, 3])
+        self.assertEqual(self.search.count(deque(arr), nan), 2)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,60 @@
+import unittest
+import os
+import random
+import tempfile
+from search_algorithms import MappedSortedArray, write_sorted_array
+from search_algorithms.algorithms import BinarySearch, ExponentialSearch, InterpolationSearch
+
+class TestMappedSortedArray(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "keys.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """Test para escribir y leer de vuelta enteros y flotantes"""
+    def test_round_trip(self):
+        for typecode, values in [('q', list(range(-50, 1000, 3))), ('d', [0.5 * i for i in range(300)])]:
+            self.assertEqual(write_sorted_array(self.path, iter(values), typecode, chunk_size=64), len(values))
+            with MappedSortedArray(self.path) as mapped:
+                self.assertEqual(mapped.typecode, typecode)
+                self.assertEqual(len(mapped), len(values))
+                self.assertEqual(list(mapped), values)
+                self.assertEqual(mapped[-1], values[-1])
+
+    """Test para los algoritmos de búsqueda sobre el archivo mapeado"""
+    def test_search_algorithms(self):
+        rng = random.Random(8)
+        values = sorted(rng.sample(range(100000), 5000))
+        write_sorted_array(self.path, values)
+        with MappedSortedArray(self.path) as mapped:
+            for algorithm in [BinarySearch(), ExponentialSearch(), InterpolationSearch()]:
+                for target in values[::97] + [-1, 100001, values[10] + 1]:
+                    expected = values.index(target) if target in values else -1
+                    self.assertEqual(algorithm.search(mapped, target), expected)
+                    self.assertEqual(algorithm.search(mapped.view, target), expected)
+                self.assertEqual(algorithm.lower_bound(mapped, values[7]), 7)
+                self.assertEqual(list(algorithm.search_many(mapped, values[:5] + [-1])), [0, 1, 2, 3, 4, -1])
+
+    """Test para un archivo sin elementos"""
+    def test_empty_file(self):
+        write_sorted_array(self.path, [])
+        with MappedSortedArray(self.path) as mapped:
+            self.assertEqual(len(mapped), 0)
+            self.assertEqual(BinarySearch().search(mapped, 3), -1)
+
+    """Test para los errores de escritura y de formato"""
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            write_sorted_array(self.path, [3, 2, 1])
+        with self.assertRaises(ValueError):
+            write_sorted_array(self.path, [1, 2], typecode='x')
+        with open(self.path, 'wb') as file:
+            file.write(b'NOPE' + bytes(40))
+        with self.assertRaises(ValueError):
+            MappedSortedArray(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
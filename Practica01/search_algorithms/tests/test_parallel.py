@@ -0,0 +1,81 @@
+import unittest
+import random
+from array import array
+from search_algorithms.algorithms import CountingProbe, LinearSearch, ParallelLinearSearch
+
+class TestParallelLinearSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.search = ParallelLinearSearch(workers=2, chunks_per_worker=3, min_parallel_size=0)
+        rng = random.Random(4)
+        cls.arr = [rng.randint(0, 5000) for _ in range(20000)]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.search.close()
+
+    """Test para la busqueda en arreglos vacios"""
+    def test_empty_array(self):
+        self.assertEqual(self.search.search([], 5), -1)
+
+    """Test para la primera aparición, que coincide con la búsqueda lineal"""
+    def test_first_match(self):
+        linear = LinearSearch()
+        for target in [self.arr[0], self.arr[-1], self.arr[12345], -1, 5001]:
+            self.assertEqual(self.search.search(self.arr, target), linear.search(self.arr, target))
+            self.assertEqual(self.search.iterations, linear.iterations)
+
+    """Test para la primera aparición cuando varios bloques contienen el objetivo"""
+    def test_first_match_across_chunks(self):
+        arr = array('q', [0] * 30000)
+        for i in [29999, 25000, 17000, 9000]:
+            arr[i] = 7
+        self.assertEqual(self.search.search(arr, 7), 9000)
+
+    """Test para el modo de todas las apariciones"""
+    def test_search_all(self):
+        target = self.arr[100]
+        expected = [i for i, value in enumerate(self.arr) if value == target]
+        self.assertEqual(list(self.search.search_all(self.arr, target)), expected)
+        self.assertEqual(list(self.search.search_all(self.arr, -1)), [])
+
+    """Test para arreglos no numéricos y pequeños, que se buscan de forma secuencial"""
+    def test_sequential_fallback(self):
+        self.assertEqual(self.search.search(["a", "b", "c"], "c"), 2)
+        self.assertEqual(list(self.search.search_all(["a", "b", "a"], "a")), [0, 2])
+        small = ParallelLinearSearch(workers=2)
+        self.assertEqual(small.search([3, 1, 2], 2), 2)
+        small.close()
+
+    """Test para la búsqueda secuencial con una sonda, que registra cada comparación"""
+    def test_sequential_fallback_probe(self):
+        small = ParallelLinearSearch(workers=2)
+        probe = CountingProbe()
+        small.probe = probe
+        self.assertEqual(small.search([3, 1, 2], 2), 2)
+        self.assertEqual(small.iterations, 3)
+        self.assertEqual(probe.comparisons, 3)
+        small.close()
+
+    """Test para flotantes y objetivos de otro tipo"""
+    def test_float_values(self):
+        arr = [0.5 * i for i in range(1000)]
+        self.assertEqual(self.search.search(arr, 250.0), 500)
+        self.assertEqual(self.search.search(arr, 250), 500)
+        self.assertEqual(self.search.search(arr, "250"), -1)
+
+    """Test para una instancia cerrada, que ya no se puede usar"""
+    def test_closed(self):
+        search = ParallelLinearSearch(workers=2, min_parallel_size=10)
+        arr = list(range(1000))
+        self.assertEqual(search.search(arr, 5), 5)
+        search.close()
+        search.close()
+        for call in [lambda: search.search(arr, 5), lambda: search.search_all(arr, 5),
+                     lambda: search.search([1, 2], 2), lambda: search.share(arr)]:
+            with self.assertRaises(ValueError):
+                call()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,12 +77,32 @@ class TestPerformance(unittest.TestCase):
             self.assertEqual(len(results[algo_name]['times']), len(sizes))
             self.assertEqual(len(results[algo_name]['iterations']), len(sizes))
             
+            # Verificamos que las estadísticas acompañen a cada tiempo
+            self.assertEqual(len(results[algo_name]['stats']), len(sizes))
+            for time_taken, stats in zip(results[algo_name]['times'], results[algo_name]['stats']):
+                self.assertEqual(time_taken, stats['median'])
+                self.assertLessEqual(stats['ci_low'], stats['median'])
+                self.assertLessEqual(stats['median'], stats['ci_high'])
+            
         # La búsqueda binaria debería tener menos iteraciones que la búsqueda lineal de arreglos grandes
         self.assertLess(
             results['binary']['iterations'][1],  # Iterations de la busqueda binaria para arreglos de tamaño 100
             results['linear']['iterations'][1]   # Iterations de la busqueda lineal para arreglos de tamaño 100
         )
         
+        """Test para run_performance_test con otra distribución de datos"""
+    def test_run_performance_test_distribution(self):
+        results = run_performance_test(
+            {'linear': self.algorithms['linear']},
+            sizes=[100],
+            repetitions=3,
+            position='missing',
+            distribution='zipf'
+        )
+        
+        # Un objetivo que no está obliga a la búsqueda lineal a recorrer todo el arreglo
+        self.assertEqual(results['linear']['iterations'], [100])
+        
         """Test para la búsqueda lineal en un arreglo desordenado"""
     def test_linear_search_with_unsorted_array(self):
         linear = self.algorithms["linear"]
@@ -0,0 +1,122 @@
+import unittest
+import io
+from search_algorithms.algorithms import (
+    BinarySearch,
+    ConsoleProbe,
+    CountingProbe,
+    ExponentialSearch,
+    GuardedInterpolationSearch,
+    HistogramProbe,
+    InterpolationSearch,
+    LinearSearch,
+    MultiProbe,
+    Probe,
+)
+
+
+class RecordingProbe(Probe):
+    """Sonda que guarda los eventos recibidos en una lista"""
+
+    def __init__(self):
+        self.events = []
+
+    def start(self, algorithm, size, target):
+        self.events.append(('start', algorithm, size, target))
+
+    def compare(self, index, value):
+        self.events.append(('compare', index, value))
+
+    def narrow(self, lo, hi):
+        self.events.append(('narrow', lo, hi))
+
+    def phase(self, name):
+        self.events.append(('phase', name))
+
+    def finish(self, result, iterations):
+        self.events.append(('finish', result, iterations))
+
+
+class TestProbes(unittest.TestCase):
+
+    def setUp(self):
+        self.arr = list(range(0, 200, 2))
+
+    """Prueba que asignar una sonda cambia la ruta de búsqueda y quitarla la restaura"""
+    def test_probe_switches_path(self):
+        algorithm = BinarySearch()
+        self.assertEqual(algorithm.search.__name__, '_search_untraced')
+        algorithm.probe = CountingProbe()
+        self.assertEqual(algorithm.search.__name__, '_search_probed')
+        algorithm.probe = None
+        self.assertEqual(algorithm.search.__name__, '_search_untraced')
+
+    """Prueba los eventos de la búsqueda binaria"""
+    def test_binary_events(self):
+        probe = RecordingProbe()
+        algorithm = BinarySearch()
+        algorithm.probe = probe
+        self.assertEqual(algorithm.search(self.arr, 30), 15)
+        events = probe.events
+        self.assertEqual(events[0], ('start', 'Binary Search', 100, 30))
+        self.assertEqual(events[-1], ('finish', 15, algorithm.iterations))
+        compares = [event for event in events if event[0] == 'compare']
+        self.assertEqual(len(compares), algorithm.iterations)
+        self.assertEqual(compares[-1], ('compare', 15, 30))
+        self.assertEqual(events[1], ('narrow', 0, 99))
+
+    """Prueba que los resultados e iteraciones con sonda coinciden con los de la ruta sin seguimiento"""
+    def test_results_match_untraced(self):
+        for algorithm_class in [LinearSearch, BinarySearch, ExponentialSearch,
+                                InterpolationSearch, GuardedInterpolationSearch]:
+            plain, probed = algorithm_class(), algorithm_class()
+            probe = CountingProbe()
+            probed.probe = probe
+            for target in [0, 1, 30, 198, 500, -1]:
+                self.assertEqual(probed.search(self.arr, target), plain.search(self.arr, target))
+                self.assertEqual(probed.iterations, plain.iterations)
+            self.assertEqual(probe.searches, 6)
+            self.assertGreater(probe.comparisons, 0)
+
+    """Prueba las fases de la búsqueda exponencial"""
+    def test_exponential_phases(self):
+        probe = CountingProbe()
+        algorithm = ExponentialSearch()
+        algorithm.probe = probe
+        algorithm.search(self.arr, 100)
+        self.assertEqual(probe.stats['phases'], {'avance exponencial': 1, 'búsqueda binaria': 1})
+
+    """Prueba que con una sonda y un logger desactivado no se construyen mensajes de iteración"""
+    def test_no_log_strings(self):
+        algorithm = LinearSearch()
+        algorithm.probe = CountingProbe()
+        messages = []
+        algorithm.log = messages.append
+        algorithm.search(self.arr, 50)
+        self.assertEqual(messages, ["\nBúsqueda Lineal:"])
+
+    """Prueba el histograma de posiciones"""
+    def test_histogram(self):
+        probe = HistogramProbe(bins=4)
+        algorithm = LinearSearch()
+        algorithm.probe = probe
+        algorithm.search(self.arr, 198)
+        self.assertEqual(probe.counts, [25, 25, 25, 25])
+        self.assertEqual(len(probe.format().splitlines()), 4)
+        with self.assertRaises(ValueError):
+            HistogramProbe(0)
+
+    """Prueba la salida de consola y el reenvío a varias sondas"""
+    def test_console_and_multi(self):
+        stream = io.StringIO()
+        counting = CountingProbe()
+        algorithm = BinarySearch()
+        algorithm.probe = MultiProbe(ConsoleProbe(stream, color=False), counting)
+        algorithm.search(self.arr, 31)
+        output = stream.getvalue()
+        self.assertIn("Binary Search: buscando 31", output)
+        self.assertIn("Comparando", output)
+        self.assertIn("no encontrado", output)
+        self.assertEqual(counting.searches, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import random
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from search_algorithms.algorithms import (
+    AdaptiveSearch,
+    BinarySearch,
+    CachedSearch,
+    EytzingerSearch,
+    ExponentialSearch,
+    FilteredSearch,
+    HashIndexSearch,
+    InterpolationSearch,
+    LearnedIndexSearch,
+    LinearSearch,
+    SearchResult,
+    StaticBTreeSearch,
+)
+
+
+class TestReentrant(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.arr = sorted(rng.sample(range(100_000), 5_000))
+        self.targets = [rng.randrange(100_000) for _ in range(2_000)] + self.arr[:500]
+        # Cambios de hilo frecuentes para que las búsquedas se intercalen
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def run_shared(self, algorithm, call, workers=8):
+        """Ejecuta call(algorithm, target) para todos los objetivos con una instancia compartida"""
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda target: call(algorithm, target), self.targets))
+
+    """Prueba los campos del resultado por llamada"""
+    def test_search_result(self):
+        algorithm = BinarySearch()
+        result = algorithm.search_result(self.arr, self.arr[10])
+        self.assertIsInstance(result, SearchResult)
+        self.assertEqual(result.index, 10)
+        self.assertTrue(result.found)
+        self.assertEqual(result.iterations, algorithm.iterations)
+        self.assertGreaterEqual(result.seconds, 0.0)
+        index, iterations, _ = algorithm.search_result(self.arr, -1)
+        self.assertEqual(index, -1)
+        self.assertFalse(algorithm.search_result(self.arr, -1).found)
+        self.assertGreater(iterations, 0)
+
+    """Prueba que una instancia compartida da en cada hilo el índice y las iteraciones de su búsqueda"""
+    def test_shared_instances(self):
+        factories = [LinearSearch, BinarySearch, ExponentialSearch, InterpolationSearch, EytzingerSearch,
+                     StaticBTreeSearch, LearnedIndexSearch, HashIndexSearch, AdaptiveSearch,
+                     lambda: FilteredSearch(BinarySearch())]
+        for factory in factories:
+            expected_algorithm = factory()
+            expected = [tuple(expected_algorithm.search_result(self.arr, target)[:2]) for target in self.targets]
+            results = self.run_shared(factory(), lambda algorithm, target: algorithm.search_result(self.arr, target))
+            with self.subTest(algorithm=expected_algorithm.name):
+                self.assertEqual([tuple(result[:2]) for result in results], expected)
+
+    """Prueba que los límites de la búsqueda exponencial no comparten estado entre hilos"""
+    def test_exponential_bounds(self):
+        expected = [(bisect_left(self.arr, target), bisect_right(self.arr, target)) for target in self.targets]
+        fresh = ExponentialSearch()
+        iterations = [(fresh.lower_bound(self.arr, target), fresh.iterations) for target in self.targets]
+
+        def bounds(algorithm, target):
+            lower = algorithm.lower_bound(self.arr, target)
+            lower_iterations = algorithm.iterations
+            return (lower, algorithm.upper_bound(self.arr, target)), (lower, lower_iterations)
+
+        results = self.run_shared(ExponentialSearch(), bounds)
+        self.assertEqual([result[0] for result in results], expected)
+        self.assertEqual([result[1] for result in results], iterations)
+
+    """Prueba que el contador de iteraciones es propio de cada hilo"""
+    def test_iterations_per_thread(self):
+        algorithm = LinearSearch()
+        algorithm.search(self.arr, self.arr[3])
+        thread = threading.Thread(target=algorithm.search, args=(self.arr, -1))
+        thread.start()
+        thread.join()
+        self.assertEqual(algorithm.iterations, 4)
+
+    """Prueba que las estructuras por arreglo se construyen una sola vez aunque varios hilos las pidan"""
+    def test_single_build(self):
+        hashed = HashIndexSearch()
+        filtered = FilteredSearch(BinarySearch())
+        cached = CachedSearch(BinarySearch(), capacity=64, policy='lfu')
+        for algorithm in [hashed, filtered, cached]:
+            indices = self.run_shared(algorithm, lambda algorithm, target: algorithm.search(self.arr, target))
+            with self.subTest(algorithm=algorithm.name):
+                self.assertEqual(indices, [BinarySearch().search(self.arr, target) for target in self.targets])
+        self.assertEqual(hashed.builds, 1)
+        self.assertEqual(filtered.rebuilds, 1)
+        self.assertEqual(cached.invalidations, 0)
+
+if __name__ == '__main__':
+    unittest.main()
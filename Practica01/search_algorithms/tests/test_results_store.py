@@ -0,0 +1,118 @@
+import unittest
+import json
+import os
+import random
+import tempfile
+from search_algorithms.algorithms import BinarySearch, LinearSearch
+from search_algorithms.utils import ResultStore, compare_runs, format_comparison, run_performance_test
+from search_algorithms.utils.results_store import environment_metadata, mann_whitney_greater
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.directory.name, "results"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def row(self, algorithm, median, timings=None, size=1000):
+        timings = timings or [median] * 5
+        return {'algorithm': algorithm, 'size': size, 'distribution': 'uniform', 'position': 'end',
+                'median': median, 'ci_low': min(timings), 'ci_high': max(timings), 'timings': timings}
+
+    """Test para guardar, listar y cargar corridas con sus metadatos"""
+    def test_save_and_load(self):
+        self.assertEqual(self.store.runs(), [])
+        first = self.store.save([self.row('binary', 1e-6)], {'source': 'test'})
+        second = self.store.save([self.row('binary', 2e-6), self.row('linear', 5e-6)], run_id='manual')
+        self.assertEqual(self.store.runs(), [first, 'manual'])
+        self.assertEqual(second, 'manual')
+
+        metadata, rows = self.store.load(first)
+        self.assertEqual(metadata['source'], 'test')
+        self.assertEqual(metadata['python_version'], environment_metadata()['python_version'])
+        self.assertIn('cpu_count', metadata)
+        self.assertIn('git_commit', metadata)
+        self.assertEqual(rows, [self.row('binary', 1e-6)])
+
+        # Una línea JSON por registro
+        with open(os.path.join(self.store.directory, "manual.jsonl"), encoding='utf-8') as file:
+            records = [json.loads(line)['record'] for line in file]
+        self.assertEqual(records, ['run', 'result', 'result'])
+
+        with self.assertRaises(ValueError):
+            self.store.load('desconocida')
+
+    """Test para run_performance_test con un almacén"""
+    def test_run_performance_test_store(self):
+        algorithms = {'linear': LinearSearch(), 'binary': BinarySearch()}
+        results = run_performance_test(algorithms, sizes=[10, 100], repetitions=3, position='end', store=self.store)
+        metadata, rows = self.store.load(results['run_id'])
+        self.assertEqual(metadata['source'], 'run_performance_test')
+        self.assertEqual(len(rows), 4)
+        for row in rows:
+            index = [10, 100].index(row['size'])
+            self.assertEqual(row['median'], results[row['algorithm']]['times'][index])
+            self.assertEqual(row['iterations'], results[row['algorithm']]['iterations'][index])
+            self.assertEqual(len(row['timings']), 3)
+
+    """Test para la prueba de Mann-Whitney"""
+    def test_mann_whitney(self):
+        rng = random.Random(5)
+        base = [rng.gauss(1.0, 0.05) for _ in range(30)]
+        slower = [rng.gauss(1.2, 0.05) for _ in range(30)]
+        same = [rng.gauss(1.0, 0.05) for _ in range(30)]
+        self.assertLess(mann_whitney_greater(slower, base), 0.001)
+        self.assertGreater(mann_whitney_greater(base, slower), 0.999)
+        self.assertGreater(mann_whitney_greater(same, base), 0.01)
+        # Todos los valores empatados: no hay diferencia
+        self.assertEqual(mann_whitney_greater([1.0] * 5, [1.0] * 5), 1.0)
+        self.assertEqual(mann_whitney_greater([], base), 1.0)
+
+    """Test para la detección de regresiones y mejoras"""
+    def test_compare_runs(self):
+        rng = random.Random(9)
+        samples = lambda center: [rng.gauss(center, center * 0.02) for _ in range(30)]
+        baseline = [self.row('binary', 1e-6, samples(1e-6)), self.row('linear', 5e-6, samples(5e-6)),
+                    self.row('exponential', 2e-6, samples(2e-6)), self.row('removed', 1e-6)]
+        current = [self.row('binary', 1.3e-6, samples(1.3e-6)), self.row('linear', 3e-6, samples(3e-6)),
+                   self.row('exponential', 2.02e-6, samples(2.02e-6)), self.row('added', 1e-6)]
+        for row in baseline + current:
+            row['median'] = sorted(row['timings'])[len(row['timings']) // 2]
+
+        comparisons = {row['algorithm']: row for row in compare_runs(baseline, current)}
+        self.assertEqual(set(comparisons), {'binary', 'linear', 'exponential'})
+        self.assertEqual(comparisons['binary']['status'], 'regression')
+        self.assertGreater(comparisons['binary']['ratio'], 1.2)
+        self.assertEqual(comparisons['linear']['status'], 'improvement')
+        self.assertEqual(comparisons['exponential']['status'], 'unchanged')
+
+        # Un cambio pequeño aunque significativo no supera el umbral
+        self.assertEqual(compare_runs(baseline, current, threshold=0.5)[0]['status'], 'unchanged')
+
+        # Sin muestras se usan los intervalos de confianza
+        bare = [{k: v for k, v in row.items() if k != 'timings'} for row in current]
+        by_name = {row['algorithm']: row for row in compare_runs(baseline, bare)}
+        self.assertEqual(by_name['binary']['status'], 'regression')
+        self.assertIsNone(by_name['binary']['p_value'])
+
+        # Una corrida de referencia más lenta dentro del conjunto evita la falsa alarma
+        slow_baseline = self.row('binary', 1.35e-6, samples(1.35e-6))
+        by_name = {row['algorithm']: row for row in compare_runs(baseline + [slow_baseline], current)}
+        self.assertEqual(by_name['binary']['status'], 'unchanged')
+
+        # Las mediciones omitidas (sin mediana) no se comparan
+        skipped = {'algorithm': 'linear', 'size': 1000, 'distribution': 'uniform', 'position': 'end',
+                   'skipped': 'RecursionError'}
+        by_name = {row['algorithm']: row for row in compare_runs(baseline + [skipped], current + [skipped])}
+        self.assertEqual(set(by_name), {'binary', 'linear', 'exponential'})
+        self.assertEqual(by_name['linear']['status'], 'improvement')
+        self.assertEqual([row['algorithm'] for row in compare_runs([skipped], current)], [])
+
+        table = format_comparison(comparisons.values())
+        self.assertIn('regression', table)
+        self.assertIn('binary/1000/uniform/end', table)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import os
+import socket
+import tempfile
+from search_algorithms.algorithms import BinarySearch
+from search_algorithms.utils import MappedSortedArray, SearchClient, SearchServer, run_load, write_sorted_array
+
+class TestSearchServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.keys = list(range(0, 2000, 2))
+        self.server = SearchServer(self.keys)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    """Test para las consultas por TCP local, que coinciden con BinarySearch"""
+    async def test_lookup(self):
+        async with await SearchClient.connect(self.server.address) as client:
+            self.assertEqual(await client.lookup(500), 250)
+            self.assertEqual(await client.lookup(501), -1)
+            targets = [0, 1, 1998, 2000, -4, 3.0, 4.0]
+            self.assertEqual(await client.lookup_many(targets),
+                             [(target, BinarySearch().search(self.keys, target)) for target in targets])
+
+    """Test para el agrupamiento de consultas concurrentes de varias conexiones en lotes"""
+    async def test_batching(self):
+        clients = [await SearchClient.connect(self.server.address) for _ in range(3)]
+        try:
+            for client in clients:
+                results = await client.lookup_many(range(0, 400, 2))
+                self.assertEqual([index for _, index in results], list(range(200)))
+        finally:
+            for client in clients:
+                await client.close()
+        stats = self.server.stats
+        self.assertEqual(stats['requests'], 600)
+        self.assertGreater(stats['mean_batch'], 1)
+
+    """Test para los errores: objetivos no comparables y consultas inválidas"""
+    async def test_errors(self):
+        async with await SearchClient.connect(self.server.address) as client:
+            with self.assertRaises(ValueError):
+                await client.lookup(None)
+            with self.assertRaises(ValueError):
+                await client.lookup([1, 2])
+            # La conexión sigue disponible después de un error
+            self.assertEqual(await client.lookup(2), 1)
+
+    """Test para el generador de carga"""
+    async def test_run_load(self):
+        report = await run_load(self.server.address, list(range(0, 4000, 3)), connections=2, concurrency=8)
+        self.assertEqual(report['requests'], len(range(0, 4000, 3)))
+        self.assertGreater(report['throughput'], 0)
+        self.assertLessEqual(report['p50'], report['p99'])
+        self.assertLessEqual(report['p99'], report['max'])
+
+    """Test para un socket Unix y claves en un archivo mapeado en memoria"""
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "sockets Unix no disponibles")
+    async def test_unix_socket_with_mapped_keys(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'claves.bin')
+            write_sorted_array(path, range(0, 300, 3))
+            keys = MappedSortedArray(path)
+            server = SearchServer(keys)
+            address = await server.start(path=os.path.join(directory, 'busqueda.sock'))
+            try:
+                async with await SearchClient.connect(address) as client:
+                    self.assertEqual(await client.lookup_many([3, 4, 297]), [(3, 1), (4, -1), (297, 99)])
+            finally:
+                await server.close()
+                del server
+
+if __name__ == '__main__':
+    unittest.main()
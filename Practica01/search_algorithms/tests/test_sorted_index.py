@@ -0,0 +1,109 @@
+import unittest
+import random
+from array import array
+from search_algorithms import SortedIndex
+from search_algorithms.algorithms import (
+    AdaptiveSearch, BinarySearch, ExponentialSearch, GuardedInterpolationSearch, InterpolationSearch, LinearSearch
+)
+from search_algorithms.utils import get_console_logger, get_null_logger
+
+class TestSortedIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(17)
+        self.uniform = sorted(rng.sample(range(100000), 5000))
+        self.skewed = sorted(int(rng.expovariate(0.01) ** 3) for _ in range(3000))
+        self.duplicates = sorted(rng.randrange(20) for _ in range(1000))
+        self.algorithms = [LinearSearch(), BinarySearch(), ExponentialSearch(),
+                           InterpolationSearch(), GuardedInterpolationSearch()]
+
+    """Test para la validación y el almacenamiento compacto"""
+    def test_build(self):
+        index = SortedIndex(self.uniform)
+        self.assertIsInstance(index.data, array)
+        self.assertEqual(index.data.typecode, 'q')
+        self.assertEqual(list(index), self.uniform)
+        self.assertEqual(len(index), len(self.uniform))
+        self.assertEqual(index[10], self.uniform[10])
+        self.assertEqual((index.min, index.max), (self.uniform[0], self.uniform[-1]))
+        self.assertEqual(index.fences, self.uniform[::64])
+        self.assertEqual(len(index.slopes), len(index.fences))
+
+        self.assertEqual(SortedIndex([0.5, 1.5, 2.5]).data.typecode, 'd')
+        words = SortedIndex(iter(["ana", "beto", "carla"]))
+        self.assertIsInstance(words.data, tuple)
+        self.assertIsNone(words.slopes)
+
+        empty = SortedIndex([])
+        self.assertEqual(len(empty), 0)
+        self.assertIsNone(empty.min)
+        self.assertFalse(empty.covers(1))
+
+        with self.assertRaises(ValueError) as context:
+            SortedIndex([1, 2, 5, 4, 6])
+        self.assertIn("posición 3", str(context.exception))
+        with self.assertRaises(ValueError):
+            SortedIndex([1, 2], fence_step=0)
+
+    """Test para el segmento que localiza la tabla de separadores"""
+    def test_segment(self):
+        for step in [1, 2, 7, 64]:
+            index = SortedIndex(self.duplicates, fence_step=step)
+            for target in range(-1, 22):
+                lo, hi = index.segment(target)
+                expected = sum(1 for value in self.duplicates if value < target)
+                self.assertTrue(lo <= expected <= hi, (step, target, lo, hi, expected))
+                self.assertLessEqual(hi - lo, step)
+
+    """Test para los cuatro algoritmos sobre el índice, con y sin seguimiento"""
+    def test_algorithms_accept_index(self):
+        for values in [self.uniform, self.skewed, self.duplicates]:
+            index = SortedIndex(values, fence_step=16)
+            targets = values[::37] + [values[0] - 1, values[-1] + 1] + [value + 1 for value in values[::53]]
+            for logger in [None, get_null_logger("sorted_index_null")]:
+                for algorithm in self.algorithms:
+                    algorithm.logger = logger
+                    for target in targets:
+                        result = algorithm.search(index, target)
+                        if target not in values:
+                            self.assertEqual(result, -1)
+                        elif isinstance(algorithm, InterpolationSearch):
+                            self.assertEqual(values[result], target)
+                        else:
+                            self.assertEqual(result, values.index(target))
+
+        # Los objetivos fuera de rango se descartan sin comparaciones
+        index = SortedIndex(self.uniform)
+        for algorithm in self.algorithms:
+            self.assertEqual(algorithm.search(index, -5), -1)
+            self.assertEqual(algorithm.iterations, 0)
+
+    """Test para las iteraciones acotadas por la tabla de separadores"""
+    def test_iterations(self):
+        index = SortedIndex(self.skewed)
+        binary = BinarySearch()
+        interpolation = InterpolationSearch()
+        for target in self.skewed[::101]:
+            binary.search(index, target)
+            self.assertLessEqual(binary.iterations, index.fence_steps + 7)
+            interpolation.search(index, target)
+            self.assertLessEqual(interpolation.iterations, index.fence_steps + 1 + 7)
+
+        linear = LinearSearch()
+        linear.search(index, self.skewed[0] + 0.5)
+        self.assertLess(linear.iterations, len(self.skewed))
+
+    """Test para el índice con seguimiento, search_many y la búsqueda adaptativa"""
+    def test_integration(self):
+        index = SortedIndex(self.uniform)
+        with self.assertLogs("sorted_index_test_console", level="INFO") as logs:
+            self.assertEqual(BinarySearch(get_console_logger("sorted_index_test")).search(index, self.uniform[99]), 99)
+        self.assertTrue(any("Segmento" in line for line in logs.output))
+
+        targets = self.uniform[:5] + [-1]
+        self.assertEqual(list(BinarySearch().search_many(index, targets)), [0, 1, 2, 3, 4, -1])
+        self.assertEqual(BinarySearch().lower_bound(index, self.uniform[7]), 7)
+        self.assertEqual(AdaptiveSearch().search(index, self.uniform[300]), 300)
+
+if __name__ == '__main__':
+    unittest.main()
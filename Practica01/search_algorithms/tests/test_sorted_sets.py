@@ -0,0 +1,89 @@
+import unittest
+import random
+from array import array
+from collections import Counter
+from itertools import islice
+from search_algorithms.algorithms import (
+    difference,
+    intersection,
+    intersection_many,
+    iter_difference,
+    iter_intersection,
+    iter_intersection_many,
+    iter_union,
+    union,
+)
+from search_algorithms.algorithms.exponential import gallop_left
+
+
+def reference(a, b, operation):
+    """Resultado esperado de la operación tratando los arreglos como multiconjuntos"""
+    counts = operation(Counter(a), Counter(b))
+    return sorted(counts.elements())
+
+
+class TestSortedSets(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(11)
+
+    def random_sorted(self, size, universe):
+        return sorted(self.rng.choices(range(universe), k=size))
+
+    """Prueba el paso de galope desde una posición y con un primer salto mayor que 1"""
+    def test_gallop_left(self):
+        arr = list(range(0, 200, 2))
+        for lo in [0, 10, 99]:
+            for step in [1, 7, 64]:
+                for target in [-1, 0, 21, 22, 150, 198, 500]:
+                    pos, iterations = gallop_left(arr, target, lo, len(arr), step)
+                    self.assertEqual(pos, max(lo, min(len(arr), (target + 1) // 2)))
+                    self.assertGreater(iterations, 0)
+        self.assertEqual(gallop_left(arr, 5, 10, 10), (10, 0))
+
+    """Prueba las operaciones con dos arreglos contra los conteos de Counter, con repetidos"""
+    def test_pairwise(self):
+        cases = [
+            (iter_intersection, intersection, lambda x, y: x & y),
+            (iter_union, union, lambda x, y: x | y),
+            (iter_difference, difference, lambda x, y: x - y),
+        ]
+        for _ in range(300):
+            a = self.random_sorted(self.rng.randint(0, 30), self.rng.randint(1, 200))
+            b = self.random_sorted(self.rng.randint(0, 300), self.rng.randint(1, 200))
+            for generator, materialized, operation in cases:
+                for x, y in [(a, b), (b, a)]:
+                    expected = reference(x, y, operation)
+                    self.assertEqual(list(generator(x, y)), expected)
+                    self.assertEqual(materialized(x, y), expected)
+
+    """Prueba la intersección de varios arreglos"""
+    def test_intersection_many(self):
+        for _ in range(200):
+            arrays = [self.random_sorted(self.rng.randint(0, 200), 100) for _ in range(self.rng.randint(1, 5))]
+            counts = Counter(arrays[0])
+            for arr in arrays[1:]:
+                counts &= Counter(arr)
+            self.assertEqual(list(iter_intersection_many(arrays)), sorted(counts.elements()))
+        self.assertEqual(intersection_many([]), [])
+        self.assertEqual(intersection_many([[1, 2, 3], [], [2]]), [])
+
+    """Prueba el tipo del búfer devuelto"""
+    def test_buffers(self):
+        a, b = array('q', [1, 3, 5, 7]), array('q', [3, 4, 5])
+        self.assertEqual(union(a, b), array('q', [1, 3, 4, 5, 7]))
+        self.assertEqual(intersection_many([a, b, array('q', [5])]), array('q', [5]))
+        self.assertEqual(difference(a, [3]), [1, 5, 7])
+        self.assertEqual(intersection(['b', 'c'], ['a', 'c']), ['c'])
+
+    """Prueba que los generadores galopan sin recorrer el arreglo largo"""
+    def test_streaming(self):
+        huge = range(0, 10 ** 15, 5)
+        self.assertEqual(list(iter_intersection([5, 12, 10 ** 14], huge)), [5, 10 ** 14])
+        self.assertEqual(list(iter_intersection_many([huge, [10, 11, 10 ** 13], range(0, 10 ** 15, 2)])),
+                         [10, 10 ** 13])
+        self.assertEqual(list(islice(iter_union(huge, [3, 7]), 5)), [0, 3, 5, 7, 10])
+        self.assertEqual(list(islice(iter_difference(huge, [0, 10]), 3)), [5, 15, 20])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import logging
+import random
+from search_algorithms.algorithms import SearchAlgorithmFactory
+
+
+class ListHandler(logging.Handler):
+    """Handler que guarda los mensajes registrados en una lista"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestTracingPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ListHandler()
+        self.logger = logging.getLogger("test_tracing_paths")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+
+    """Prueba que la fábrica elige la ruta sin seguimiento cuando no hay logger"""
+    def test_factory_selects_untraced_path(self):
+        for name in ["linear", "binary", "exponential", "interpolation"]:
+            algorithm = SearchAlgorithmFactory.get_algorithm(name)
+            self.assertFalse(algorithm.tracing)
+            self.assertEqual(algorithm.search.__func__, type(algorithm)._search_untraced)
+
+            traced = SearchAlgorithmFactory.get_algorithm(name, self.logger)
+            self.assertTrue(traced.tracing)
+            self.assertEqual(traced.search.__func__, type(traced).search)
+
+    """Prueba que un logger que no emite mensajes INFO también usa la ruta sin seguimiento"""
+    def test_disabled_logger_uses_untraced_path(self):
+        quiet = logging.getLogger("test_tracing_quiet")
+        quiet.setLevel(logging.CRITICAL + 1)
+        algorithm = SearchAlgorithmFactory.get_algorithm("binary", quiet)
+        self.assertFalse(algorithm.tracing)
+        self.assertEqual(algorithm.search.__func__, type(algorithm)._search_untraced)
+
+    """Prueba que reasignar el logger cambia la ruta de búsqueda"""
+    def test_reassigning_logger_switches_path(self):
+        algorithm = SearchAlgorithmFactory.get_algorithm("linear", self.logger)
+        algorithm.logger = None
+        algorithm.search([1, 2, 3], 2)
+        self.assertEqual(self.handler.messages, [])
+
+        algorithm.logger = self.logger
+        algorithm.search([1, 2, 3], 2)
+        self.assertEqual(self.handler.messages[1:], [
+            "Iteración 1: Comparando 1 con 2",
+            "Iteración 2: Comparando 2 con 2",
+        ])
+
+    """Prueba que ambas rutas dan el mismo resultado y el mismo número de iteraciones"""
+    def test_paths_are_equivalent(self):
+        rng = random.Random(7)
+        for name in ["linear", "binary", "exponential", "interpolation"]:
+            fast = SearchAlgorithmFactory.get_algorithm(name)
+            traced = SearchAlgorithmFactory.get_algorithm(name, self.logger)
+            for size in [0, 1, 2, 7, 40, 100]:
+                arr = sorted(rng.randint(0, size * 3) for _ in range(size))
+                for target in range(-1, size * 3 + 2):
+                    self.assertEqual(fast.search(arr, target), traced.search(arr, target))
+                    self.assertEqual(fast.iterations, traced.iterations)
+
+if __name__ == '__main__':
+    unittest.main()
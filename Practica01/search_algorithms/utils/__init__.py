@@ -1,16 +1,91 @@
 """
 Módulo de utilidades.
 
-Este módulo contiene utilidades para logging y medición de rendimiento.
+Este módulo contiene utilidades para logging (síncrono o por lotes desde un
+hilo de fondo), medición de rendimiento, benchmarks estadísticos, almacenamiento
+de resultados, arreglos ordenados mapeados en memoria y un servidor local de
+búsqueda.
 """
 
-from .logger import get_console_logger, get_file_logger, get_null_logger
-from .performance import measure_time, run_performance_test
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .logger import get_console_logger, get_file_logger, get_null_logger, StructuredFormatter, BatchingQueueHandler
+    from .performance import measure_time, run_performance_test
+    from .benchmark import benchmark, summarize, generate_data, run_benchmark_matrix, format_results
+    from .results_store import ResultStore, compare_runs, format_comparison
+    from .mmap_array import MappedSortedArray, write_sorted_array
+    from .search_server import SearchServer, SearchClient, run_load
+
+# Módulo que define cada nombre exportado; se importa en el primer acceso al
+# nombre (el servidor, por ejemplo, importa asyncio)
+_EXPORTS = {
+    'get_console_logger': '.logger',
+    'get_file_logger': '.logger',
+    'get_null_logger': '.logger',
+    'StructuredFormatter': '.logger',
+    'BatchingQueueHandler': '.logger',
+    'measure_time': '.performance',
+    'run_performance_test': '.performance',
+    'benchmark': '.benchmark',
+    'summarize': '.benchmark',
+    'generate_data': '.benchmark',
+    'run_benchmark_matrix': '.benchmark',
+    'format_results': '.benchmark',
+    'ResultStore': '.results_store',
+    'compare_runs': '.results_store',
+    'format_comparison': '.results_store',
+    'MappedSortedArray': '.mmap_array',
+    'write_sorted_array': '.mmap_array',
+    'SearchServer': '.search_server',
+    'SearchClient': '.search_server',
+    'run_load': '.search_server',
+}
 
 __all__ = [
     'get_console_logger',
     'get_file_logger',
     'get_null_logger',
+    'StructuredFormatter',
+    'BatchingQueueHandler',
     'measure_time',
-    'run_performance_test'
+    'run_performance_test',
+    'benchmark',
+    'summarize',
+    'generate_data',
+    'run_benchmark_matrix',
+    'format_results',
+    'ResultStore',
+    'compare_runs',
+    'format_comparison',
+    'MappedSortedArray',
+    'write_sorted_array',
+    'SearchServer',
+    'SearchClient',
+    'run_load'
 ]
+
+"""
+    Importa el módulo que define un nombre exportado la primera vez que se usa.
+
+    Args:
+        name (str): Nombre del atributo
+
+    Returns:
+        Any: La clase o función exportada
+
+    Raises:
+        AttributeError: Si el paquete no exporta ese nombre
+    """
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+"""Lista también los nombres exportados que aún no se importan."""
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,299 @@
+"""
+Motor de Benchmarks
+
+Este módulo proporciona mediciones de tiempo estadísticamente confiables para
+los algoritmos de búsqueda. A diferencia de un promedio simple con time.time(),
+cada medición:
+
+- usa time.perf_counter_ns, el reloj de mayor resolución disponible
+- calibra cuántas llamadas agrupar por muestra para que cada muestra dure al menos
+  min_time y la resolución del reloj no domine
+- ejecuta muestras de calentamiento que se descartan
+- desactiva el recolector de basura mientras se toman las muestras
+- reporta la mediana, percentiles y un intervalo de confianza de la mediana
+
+Funciones:
+    calibrate: Calcula cuántas llamadas agrupar por muestra
+    benchmark: Mide una función y resume sus tiempos
+    summarize: Calcula las estadísticas de una lista de tiempos
+    generate_data: Genera un arreglo ordenado con una distribución dada
+    pick_target: Elige el objetivo según su posición en el arreglo
+    run_benchmark_matrix: Mide algoritmos x tamaños x posiciones x distribuciones
+    format_results: Da formato de tabla a los resultados de run_benchmark_matrix
+"""
+
+import gc
+import math
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Distribuciones de datos disponibles en generate_data
+DISTRIBUTIONS = ('uniform', 'sequential', 'exponential', 'clustered', 'zipf', 'duplicates')
+
+# Posiciones del objetivo disponibles en pick_target
+POSITIONS = ('start', 'middle', 'end', 'random', 'missing')
+
+"""
+    Calcula cuántas llamadas agrupar en cada muestra.
+
+    Aumenta el número de llamadas hasta que una muestra tarda al menos min_time.
+
+    Args:
+        func (Callable[[], Any]): La función a medir, sin argumentos
+        min_time (float, optional): Duración mínima de una muestra en segundos. Por defecto 0.0002.
+
+    Returns:
+        int: Número de llamadas por muestra
+    """
+def calibrate(func: Callable[[], Any], min_time: float = 2e-4) -> int:
+    target_ns = min_time * 1e9
+    # La primera llamada puede incluir costos únicos (construir índices, cachés)
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= target_ns or loops >= 1 << 30:
+            return loops
+        # Se estima cuántas llamadas faltan, sin crecer más de 10 veces por paso
+        loops = min(loops * 10, max(loops * 2, int(loops * target_ns / max(elapsed, 1)) + 1))
+
+"""
+    Calcula las estadísticas de una lista de tiempos.
+
+    El intervalo de confianza de la mediana se obtiene con estadísticos de orden
+    (no supone una distribución normal de los tiempos, que suelen tener colas
+    largas por interrupciones del sistema).
+
+    Args:
+        samples (Sequence[float]): Tiempos en segundos
+        confidence (float, optional): Nivel de confianza del intervalo. Por defecto 0.95.
+
+    Returns:
+        Dict[str, float]: median, mean, stdev, min, max, p5, p25, p75, p95,
+        ci_low, ci_high (en segundos) y samples (número de muestras)
+    """
+def summarize(samples: Sequence[float], confidence: float = 0.95) -> Dict[str, float]:
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        raise ValueError("Se necesita al menos una muestra")
+
+    def percentile(p: float) -> float:
+        position = (n - 1) * p
+        low = math.floor(position)
+        high = min(low + 1, n - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    # Posiciones del intervalo de la mediana: n/2 ± z * sqrt(n) / 2
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * math.sqrt(n) / 2
+    low_rank = max(0, math.floor(n / 2 - half_width))
+    high_rank = min(n - 1, math.ceil(n / 2 + half_width) - 1)
+
+    return {
+        'median': statistics.median(ordered),
+        'mean': statistics.fmean(ordered),
+        'stdev': statistics.stdev(ordered) if n > 1 else 0.0,
+        'min': ordered[0],
+        'max': ordered[-1],
+        'p5': percentile(0.05),
+        'p25': percentile(0.25),
+        'p75': percentile(0.75),
+        'p95': percentile(0.95),
+        'ci_low': ordered[low_rank],
+        'ci_high': ordered[high_rank],
+        'samples': n,
+    }
+
+"""
+    Mide el tiempo por llamada de una función.
+
+    Args:
+        func (Callable[[], Any]): La función a medir, sin argumentos
+        repeat (int, optional): Número de muestras. Por defecto 30.
+        min_time (float, optional): Duración mínima de cada muestra en segundos. Por defecto 0.0002.
+        warmup (int, optional): Muestras de calentamiento descartadas. Por defecto 3.
+        disable_gc (bool, optional): Desactivar el recolector de basura al medir. Por defecto True.
+        loops (int, optional): Llamadas por muestra; si es None se calibran.
+
+    Returns:
+        Dict[str, float]: Las estadísticas de summarize, con tiempos por llamada en
+        segundos, más loops (llamadas por muestra) y timings (la lista de muestras,
+        que usan las pruebas de significancia de results_store.compare_runs)
+    """
+def benchmark(func: Callable[[], Any], repeat: int = 30, min_time: float = 2e-4, warmup: int = 3,
+              disable_gc: bool = True, loops: Optional[int] = None) -> Dict[str, float]:
+    if loops is None:
+        loops = calibrate(func, min_time)
+    iterations = range(loops)
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        for _ in range(warmup):
+            for _ in iterations:
+                func()
+
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in iterations:
+                func()
+            samples.append((time.perf_counter_ns() - start) / loops / 1e9)
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+    stats = summarize(samples)
+    stats['loops'] = loops
+    stats['timings'] = samples
+    return stats
+
+"""
+    Genera un arreglo ordenado de enteros con la distribución dada.
+
+    Args:
+        size (int): Número de elementos
+        distribution (str, optional): 'uniform' (enteros aleatorios en [0, size * factor]),
+            'sequential' (0, 1, 2, ...), 'exponential', 'clustered' (grupos de claves
+            muy separados), 'zipf' (cola pesada) o 'duplicates' (pocos valores
+            distintos). Por defecto 'uniform'.
+        rng (random.Random, optional): Generador de números aleatorios. Por defecto el
+                                       generador global del módulo random.
+        value_range_factor (int, optional): Factor para el rango de valores. Por defecto 10.
+
+    Returns:
+        List[int]: El arreglo ordenado
+    """
+def generate_data(size: int, distribution: str = 'uniform', rng: Optional[random.Random] = None,
+                  value_range_factor: int = 10) -> List[int]:
+    rng = rng or random
+    if distribution == 'uniform':
+        values = [rng.randint(0, size * value_range_factor) for _ in range(size)]
+    elif distribution == 'sequential':
+        values = list(range(size))
+    elif distribution == 'exponential':
+        values = [int(rng.expovariate(1 / value_range_factor) * size) for _ in range(size)]
+    elif distribution == 'clustered':
+        clusters = max(1, int(math.sqrt(size)) // 4)
+        values = [rng.randrange(clusters) * size * value_range_factor * 100 + rng.randint(0, size)
+                  for _ in range(size)]
+    elif distribution == 'zipf':
+        values = [int(rng.paretovariate(1.0) * value_range_factor) for _ in range(size)]
+    elif distribution == 'duplicates':
+        values = [rng.randint(0, max(1, int(math.sqrt(size)))) for _ in range(size)]
+    else:
+        raise ValueError(f"Distribución desconocida: {distribution!r} (se esperaba una de {DISTRIBUTIONS})")
+    values.sort()
+    return values
+
+"""
+    Elige el objetivo de la búsqueda según su posición en el arreglo.
+
+    Args:
+        arr (List[int]): El arreglo ordenado
+        position (str): 'start', 'middle', 'end', 'random' o 'missing' (un valor
+                        que no está en el arreglo)
+        rng (random.Random, optional): Generador de números aleatorios. Por defecto el
+                                       generador global del módulo random.
+
+    Returns:
+        int: El objetivo
+    """
+def pick_target(arr: List[int], position: str, rng: Optional[random.Random] = None) -> int:
+    rng = rng or random
+    size = len(arr)
+    if position == 'start':
+        return arr[0]
+    if position == 'middle':
+        return arr[size // 2]
+    if position == 'end':
+        return arr[size - 1]
+    if position == 'random':
+        return arr[rng.randint(0, size - 1)]
+    if position == 'missing':
+        return arr[size - 1] + 1
+    raise ValueError(f"Posición desconocida: {position!r} (se esperaba una de {POSITIONS})")
+
+"""
+    Mide cada algoritmo sobre cada combinación de tamaño, distribución y posición.
+
+    El logging de los algoritmos se desactiva durante la medición y se restaura
+    después; las iteraciones se toman de una búsqueda adicional con el logger original.
+
+    Args:
+        algorithms (Dict[str, SearchAlgorithm]): Diccionario de algoritmos a medir
+        sizes (Iterable[int], optional): Tamaños de arreglo. Por defecto [100, 1000, 10000, 100000].
+        positions (Iterable[str], optional): Posiciones del objetivo. Por defecto ['random'].
+        distributions (Iterable[str], optional): Distribuciones de datos. Por defecto ['uniform'].
+        repeat (int, optional): Muestras por medición. Por defecto 30.
+        min_time (float, optional): Duración mínima de cada muestra en segundos. Por defecto 0.0002.
+        warmup (int, optional): Muestras de calentamiento. Por defecto 3.
+        seed (int, optional): Semilla para los datos y los objetivos. Por defecto 0.
+
+    Returns:
+        List[Dict[str, Any]]: Una fila por medición con algorithm, size,
+        distribution, position, target, iterations y las estadísticas de benchmark
+    """
+def run_benchmark_matrix(algorithms: Dict[str, Any], sizes: Optional[Iterable[int]] = None,
+                         positions: Iterable[str] = ('random',), distributions: Iterable[str] = ('uniform',),
+                         repeat: int = 30, min_time: float = 2e-4, warmup: int = 3,
+                         seed: int = 0) -> List[Dict[str, Any]]:
+    if sizes is None:
+        sizes = [100, 1000, 10000, 100000]
+    rng = random.Random(seed)
+    rows = []
+
+    for distribution in distributions:
+        for size in sizes:
+            arr = generate_data(size, distribution, rng)
+            for position in positions:
+                target = pick_target(arr, position, rng)
+                for name, algorithm in algorithms.items():
+                    orig_logger = algorithm.logger
+                    algorithm.logger = None
+                    try:
+                        stats = benchmark(lambda: algorithm.search(arr, target), repeat=repeat,
+                                          min_time=min_time, warmup=warmup)
+                    finally:
+                        algorithm.logger = orig_logger
+                    algorithm.search(arr, target)
+
+                    row = {
+                        'algorithm': name,
+                        'size': size,
+                        'distribution': distribution,
+                        'position': position,
+                        'target': target,
+                        'iterations': algorithm.iterations,
+                    }
+                    row.update(stats)
+                    rows.append(row)
+
+    return rows
+
+"""
+    Da formato de tabla a las filas de run_benchmark_matrix.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Las filas de resultados
+
+    Returns:
+        str: Tabla con la mediana, el intervalo de confianza y el p95 en microsegundos
+    """
+def format_results(rows: Iterable[Dict[str, Any]]) -> str:
+    header = (f"{'algoritmo':<16}{'distribución':<14}{'posición':<10}{'tamaño':>10}"
+              f"{'mediana µs':>12}{'IC 95% µs':>22}{'p95 µs':>10}{'iter.':>8}")
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        interval = f"[{row['ci_low'] * 1e6:.3f}, {row['ci_high'] * 1e6:.3f}]"
+        lines.append(f"{row['algorithm']:<16}{row['distribution']:<14}{row['position']:<10}{row['size']:>10}"
+                     f"{row['median'] * 1e6:12.3f}{interval:>22}{row['p95'] * 1e6:10.3f}{row['iterations']:8}")
+    return "\n".join(lines)
@@ -7,15 +7,39 @@ Funciones:
     get_console_logger: Configura y devuelve un logger para la salida por consola
     get_file_logger: Configura y devuelve un logger para la salida a un archivo
     get_null_logger: Devuelve un logger que no produce ninguna salida
+
+Clases:
+    ColoredFormatter: Formateador con colores y emojis a partir del texto del mensaje
+    StructuredFormatter: Formateador a partir de los campos de los eventos de búsqueda
+    BatchingQueueHandler: Handler que encola los registros y los escribe por lotes en un hilo
 """
 
+import gzip
 import logging
 import os
-from typing import Optional
-from colorama import init, Fore, Style
+import queue
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+# colorama se importa e inicializa la primera vez que se formatea con colores:
+# init() envuelve sys.stdout, y un proceso que nunca registra no debe pagarlo
+_colorama = None
+
+"""
+    Importa e inicializa colorama en el primer uso.
 
-# Initialize colorama
-init()
+    Returns:
+        Tuple: Las constantes Fore y Style de colorama
+    """
+def _colors() -> Tuple[Any, Any]:
+    global _colorama
+    if _colorama is None:
+        import colorama
+        colorama.init()
+        _colorama = colorama
+    return _colorama.Fore, _colorama.Style
 
 class ColoredFormatter(logging.Formatter):
     """Formateador personalizado que añade colores y emojis a los mensajes de registro."""
@@ -25,7 +49,10 @@ class ColoredFormatter(logging.Formatter):
         'Búsqueda Binaria': '🔍',
         'Búsqueda Lineal': '➡️',
         'Búsqueda Exponencial': '📈',
-        'Búsqueda por Interpolación': '📊'
+        'Búsqueda por Interpolación': '📊',
+        'Búsqueda Eytzinger': '🌳',
+        'Búsqueda en Árbol B Estático': '🌲',
+        'Búsqueda con Índice Aprendido': '🧠'
     }
 
     # Diccionario de emojis para diferentes tipos de mensajes
@@ -43,6 +70,8 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
+        Fore, Style = _colors()
+        
         # Get the original message
         message = record.getMessage()
         
@@ -113,30 +142,255 @@ class ColoredFormatter(logging.Formatter):
             
         return colored_message
 
+"""
+    Formateador para los registros de búsqueda estructurados.
+
+    Los registros que emite LogProbe llevan record.event igual a 'search' y en
+    record.events la lista de eventos de la búsqueda como tuplas (evento, campos),
+    así que el mensaje se arma con una plantilla por evento, sin partir ni buscar
+    texto: una línea por evento, cada una con el formato fmt. Los demás registros
+    (los mensajes de texto de la ruta con seguimiento) se muestran como
+    ColoredFormatter, o tal cual si no se usan colores.
+
+    Campos de cada evento:
+        start: algoritmo, objetivo, tamaño
+        compare: iteración, posición, valor, objetivo
+        narrow: límite inferior, límite superior
+        phase: nombre de la fase
+        finish: resultado, iteraciones
+    """
+class StructuredFormatter(ColoredFormatter):
+
+    """
+        Inicializa el formateador.
+
+        Args:
+            fmt (str, optional): Formato del registro, como en logging.Formatter. Por defecto solo el mensaje.
+            datefmt (str, optional): Formato de %(asctime)s
+            color (bool, optional): Si se usan colores ANSI y emojis. Por defecto True.
+        """
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, color: bool = True):
+        super().__init__(fmt, datefmt)
+        self.color = color
+        if color:
+            Fore, Style = _colors()
+            c, y, g, m, r = Fore.CYAN, Fore.YELLOW, Fore.GREEN, Fore.MAGENTA, Style.RESET_ALL
+            self._templates = {
+                'start': f"\n{g}🔎 {{0}}: buscando {{1}} en {{2}} elementos{r}",
+                'compare': f"{c}🔄 Iteración {{0}}{r}: 📍 posición {y}{{1}}{r} ⚖️ Comparando {y}{{2}}{r} con {y}{{3}}{r}",
+                'narrow': f"   ⬅️ izquierda={y}{{0}}{r}, ➡️ derecha={y}{{1}}{r}",
+                'phase': f"{m}🎯 {{0}}{r}",
+                'finish': f"{g}✔ resultado {{0}} ({{1}} iteraciones){r}",
+            }
+        else:
+            self._templates = {
+                'start': "{0}: buscando {1} en {2} elementos",
+                'compare': "Iteración {0}: posición {1}, Comparando {2} con {3}",
+                'narrow': "izquierda={0}, derecha={1}",
+                'phase': "{0}",
+                'finish': "resultado {0} ({1} iteraciones)",
+            }
+
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, 'event', None) == 'search':
+            templates = self._templates
+            messages = [templates[event].format(*fields) for event, fields in record.events]
+        elif self.color:
+            messages = [super().format(record)]
+        else:
+            messages = [record.getMessage()]
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        lines = []
+        for message in messages:
+            record.message = message
+            lines.append(self.formatMessage(record))
+        if record.exc_info:
+            lines.append(self.formatException(record.exc_info))
+        return "\n".join(lines)
+
+"""
+    Handler que desacopla la búsqueda de la escritura del registro.
+
+    emit solo encola el registro, sin formatearlo ni tomar un lock: un hilo de fondo
+    saca los registros de la cola por lotes (hasta max_batch, esperando a lo más
+    flush_interval segundos para juntar más), los formatea y los escribe con una
+    sola llamada a write y un solo flush por lote. Si la cola está llena el registro
+    se descarta y se cuenta en dropped, de modo que el hilo que busca nunca espera
+    al disco ni a la consola.
+
+    Los argumentos del registro se formatean en el hilo de fondo, así que no deben
+    modificarse después de registrarlos.
+
+    Atributos:
+        stream (TextIO): Flujo donde se escriben los registros
+        max_batch (int): Máximo de registros por escritura
+        flush_interval (float): Espera máxima, en segundos, para juntar un lote
+        written (int): Registros escritos
+        batches (int): Escrituras realizadas
+        dropped (int): Registros descartados porque la cola estaba llena
+    """
+class BatchingQueueHandler(logging.Handler):
+
+    """
+        Inicializa el handler e inicia el hilo de escritura.
+
+        Args:
+            stream (TextIO): Flujo de salida
+            level (int, optional): Nivel mínimo de los registros. Por defecto logging.NOTSET.
+            max_batch (int, optional): Máximo de registros por escritura. Por defecto 1024.
+            flush_interval (float, optional): Espera máxima para juntar un lote. Por defecto 0.05.
+            max_queue (int, optional): Capacidad de la cola (0 para ilimitada). Por defecto 100000.
+            close_stream (bool, optional): Si close también cierra el flujo. Por defecto False.
+
+        Raises:
+            ValueError: Si max_batch no es positivo o flush_interval es negativo
+        """
+    def __init__(self, stream: TextIO, level: int = logging.NOTSET, max_batch: int = 1024,
+                 flush_interval: float = 0.05, max_queue: int = 100_000, close_stream: bool = False):
+        if max_batch < 1:
+            raise ValueError(f"max_batch debe ser positivo: {max_batch}")
+        if flush_interval < 0:
+            raise ValueError(f"flush_interval no puede ser negativo: {flush_interval}")
+        super().__init__(level)
+        self.stream = stream
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self._close_stream = close_stream
+        self._queue: queue.Queue = queue.Queue(max_queue)
+        self._closed = False
+        # Hace atómicas la revisión de _closed y la entrada a la cola en flush y close
+        self._state_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name="BatchingQueueHandler", daemon=True)
+        self._writer.start()
+
+    """
+        Obtiene los contadores del handler.
+
+        Returns:
+            Dict[str, Any]: Registros escritos, escrituras, registros por escritura,
+            descartados y pendientes en la cola
+        """
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'written': self.written,
+            'batches': self.batches,
+            'mean_batch': self.written / self.batches if self.batches else 0.0,
+            'dropped': self.dropped,
+            'pending': self._queue.qsize(),
+        }
+
+    # handle sin el lock del handler: la cola ya es segura entre hilos
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self.filter(record):
+            self.emit(record)
+            return True
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    """Escribe los registros encolados hasta ahora y espera a que terminen de escribirse."""
+    def flush(self) -> None:
+        done = threading.Event()
+        with self._state_lock:
+            if self._closed or not self._writer.is_alive():
+                return
+            # Queda antes que el None de close, así que el hilo lo atiende antes de terminar
+            self._queue.put(done)
+        done.wait()
+
+    """Escribe los registros pendientes, detiene el hilo y cierra el flujo si es propio."""
+    def close(self) -> None:
+        with self._state_lock:
+            closing = not self._closed
+            self._closed = True
+            if closing and self._writer.is_alive():
+                self._queue.put(None)
+        if closing:
+            self._writer.join()
+            if self._close_stream:
+                self.stream.close()
+        super().close()
+
+    # Ciclo del hilo de escritura: arma lotes hasta recibir None
+    def _run(self) -> None:
+        get, get_nowait = self._queue.get, self._queue.get_nowait
+        running = True
+        while running:
+            batch = [get()]
+            if self.flush_interval and isinstance(batch[0], logging.LogRecord) and self._queue.qsize() < self.max_batch:
+                time.sleep(self.flush_interval)
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(get_nowait())
+                except queue.Empty:
+                    break
+            lines, markers = [], []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    try:
+                        lines.append(self.format(item))
+                    except Exception:
+                        self.handleError(item)
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                    self.written += len(lines)
+                    self.batches += 1
+                except Exception:
+                    self.handleError(batch[0])
+            for marker in markers:
+                marker.set()
+
 """
     Configura y devuelve un logger para la salida por consola.
     
+    Los mensajes se formatean con StructuredFormatter. Con asynchronous=True la
+    salida pasa por un BatchingQueueHandler: la búsqueda solo encola los registros
+    y un hilo de fondo los formatea y escribe por lotes.
+    
     Args:
         name (str): Nombre del logger
         level (int): Nivel de registro (por defecto: logging.INFO)
+        asynchronous (bool): Si se escribe desde un hilo de fondo, por lotes (por defecto: False)
+        stream (TextIO, optional): Flujo de salida (por defecto: sys.stderr)
         
     Returns:
         logging.Logger: Instancia de logger configurada
     """
-def get_console_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+def get_console_logger(name: str, level: int = logging.INFO, asynchronous: bool = False,
+                       stream: Optional[TextIO] = None) -> logging.Logger:
     # Creamos un logger
     logger = logging.getLogger(f"{name}_console")
     logger.setLevel(level)
     
     # Evitamos la duplicación de handlers
     if not logger.handlers:
-        # Creamos el handler de consola
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level)
-        
-        # Establecemos el formato con colores
-        formatter = ColoredFormatter()
-        console_handler.setFormatter(formatter)
+        if asynchronous:
+            # Escribimos desde un hilo de fondo, por lotes
+            console_handler = BatchingQueueHandler(stream if stream is not None else sys.stderr, level)
+            console_handler.setFormatter(StructuredFormatter())
+        else:
+            # Creamos el handler de consola
+            console_handler = logging.StreamHandler(stream)
+            console_handler.setLevel(level)
+            
+            # Establecemos el formato con colores
+            formatter = StructuredFormatter()
+            console_handler.setFormatter(formatter)
         
         # Añadimos el handler al logger
         logger.addHandler(console_handler)
@@ -146,15 +400,24 @@ def get_console_logger(name: str, level: int = logging.INFO) -> logging.Logger:
 """
     Configura y devuelve un logger para la salida a unn archivo.
     
+    Los mensajes se formatean con StructuredFormatter, sin colores. Con
+    asynchronous=True los registros se escriben desde un hilo de fondo, por lotes.
+    Con compress=True (o si filename termina en .gz) el archivo se escribe
+    comprimido con gzip; la salida comprimida siempre es asíncrona, para comprimir
+    lotes completos en lugar de registros sueltos.
+    
     Args:
         name (str): Nombre del logger
         filename (str): Ruta al archivo de log
         level (int): Nivel de registro (por defecto: logging.INFO)
+        asynchronous (bool): Si se escribe desde un hilo de fondo, por lotes (por defecto: False)
+        compress (bool): Si el archivo se comprime con gzip (por defecto: False)
         
     Returns:
         logging.Logger: Instancia de logger configurada
     """
-def get_file_logger(name: str, filename: str, level: int = logging.INFO) -> logging.Logger:
+def get_file_logger(name: str, filename: str, level: int = logging.INFO, asynchronous: bool = False,
+                    compress: bool = False) -> logging.Logger:
     # Creamos el logger
     logger = logging.getLogger(f"{name}_file")
     logger.setLevel(level)
@@ -164,13 +427,22 @@ def get_file_logger(name: str, filename: str, level: int = logging.INFO) -> logg
     
     # Evitamos la duplicación de handlers
     if not logger.handlers:
-        # Creamos el handler de archivo
-        file_handler = logging.FileHandler(filename)
-        file_handler.setLevel(level)
-        
-        # Establecemos el formato
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        compress = compress or filename.endswith('.gz')
+        if asynchronous or compress:
+            # Con gzip se hace un flush por lote; el archivo queda completo al cerrar el handler
+            stream = (gzip.open(filename, 'at', encoding='utf-8') if compress
+                      else open(filename, 'a', encoding='utf-8'))
+            file_handler = BatchingQueueHandler(stream, level, close_stream=True)
+            file_handler.setFormatter(StructuredFormatter(log_format, color=False))
+        else:
+            # Creamos el handler de archivo
+            file_handler = logging.FileHandler(filename)
+            file_handler.setLevel(level)
+            
+            # Establecemos el formato
+            formatter = StructuredFormatter(log_format, color=False)
+            file_handler.setFormatter(formatter)
         
         # Añadimos el handler al logger
         logger.addHandler(file_handler)
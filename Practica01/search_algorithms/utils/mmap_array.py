@@ -0,0 +1,194 @@
+"""
+Arreglos Ordenados Mapeados en Memoria
+
+Este módulo permite buscar directamente sobre un archivo binario de enteros o
+flotantes de ancho fijo, sin cargarlo en una lista de Python. El archivo se mapea
+con mmap y el sistema operativo solo lee del disco las páginas que toca la búsqueda.
+
+Formato del archivo (16 bytes de encabezado seguidos de los datos):
+    - 4 bytes: firma b'SRCH'
+    - 2 bytes: versión del formato (entero sin signo, little-endian)
+    - 1 byte: código de tipo de array.array ('q', 'd', 'i', ...)
+    - 1 byte: orden de bytes de los datos (b'<' little-endian, b'>' big-endian)
+    - 8 bytes: número de elementos (entero sin signo, little-endian)
+
+Funciones:
+    write_sorted_array: Escribe un arreglo ordenado en el formato anterior
+
+Clases:
+    MappedSortedArray: Secuencia de solo lectura respaldada por el archivo mapeado
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+from operator import le
+from collections.abc import Sequence
+from typing import Any, Iterable, Union
+
+MAGIC = b'SRCH'
+VERSION = 1
+HEADER = struct.Struct('<4sHccQ')
+
+# Códigos de tipo con tamaño fijo en todas las plataformas
+TYPECODES = 'bBhHiIqQfd'
+
+_BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+"""
+    Escribe un arreglo ordenado en un archivo binario con encabezado.
+
+    Los valores se escriben por bloques, así que pueden venir de un generador sin
+    tener todo el arreglo en memoria.
+
+    Args:
+        path (str): Ruta del archivo a crear
+        values (Iterable[Union[int, float]]): Los valores en orden no decreciente
+        typecode (str, optional): Código de tipo de array.array. Por defecto 'q'.
+        chunk_size (int, optional): Elementos por bloque escrito. Por defecto 65536.
+
+    Returns:
+        int: Número de elementos escritos
+
+    Raises:
+        ValueError: Si el código de tipo no es válido o los valores no están ordenados
+    """
+def write_sorted_array(path: str, values: Iterable[Union[int, float]], typecode: str = 'q',
+                       chunk_size: int = 1 << 16) -> int:
+    if typecode not in TYPECODES:
+        raise ValueError(f"Código de tipo no soportado: {typecode!r} (se esperaba uno de {TYPECODES!r})")
+
+    count = 0
+    previous = None
+    iterator = iter(values)
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), _BYTEORDER, 0))
+
+        while True:
+            chunk = array(typecode, islice(iterator, chunk_size))
+            if not chunk:
+                break
+            # Comparaciones por pares dentro del bloque y con el último valor del bloque anterior
+            if (previous is not None and chunk[0] < previous) or \
+                    not all(map(le, chunk, islice(chunk, 1, None))):
+                raise ValueError(f"Los valores no están ordenados (bloque que inicia en la posición {count})")
+            chunk.tofile(file)
+            previous = chunk[-1]
+            count += len(chunk)
+
+        # El número de elementos se conoce hasta el final
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), _BYTEORDER, count))
+
+    return count
+
+"""
+    Secuencia ordenada de solo lectura respaldada por un archivo mapeado en memoria.
+
+    Se puede pasar directamente a BinarySearch, ExponentialSearch e
+    InterpolationSearch: solo implementa len() y el acceso por índice, que se
+    resuelven sobre un memoryview del archivo mapeado. Para evitar el costo de la
+    indirección, la propiedad view expone ese memoryview, que también es un
+    arreglo válido para los algoritmos y para search_many.
+
+    Atributos:
+        path (str): Ruta del archivo
+        typecode (str): Código de tipo de los elementos
+    """
+class MappedSortedArray(Sequence):
+
+    """
+        Abre y mapea un archivo escrito con write_sorted_array.
+
+        Args:
+            path (str): Ruta del archivo
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            header = self._file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path} es demasiado pequeño para contener un encabezado")
+            magic, version, typecode, byteorder, count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} no es un arreglo ordenado (firma {magic!r})")
+            if version != VERSION:
+                raise ValueError(f"Versión de formato no soportada: {version}")
+            self.typecode = typecode.decode()
+            if self.typecode not in TYPECODES:
+                raise ValueError(f"Código de tipo no soportado: {self.typecode!r}")
+            if byteorder != _BYTEORDER:
+                raise ValueError(f"{path} usa un orden de bytes distinto al de esta máquina")
+
+            itemsize = array(self.typecode).itemsize
+            end = HEADER.size + count * itemsize
+            self._file.seek(0, 2)
+            if self._file.tell() < end:
+                raise ValueError(f"{path} está truncado: se esperaban {count} elementos")
+
+            if count == 0:
+                # mmap no puede mapear un archivo sin datos
+                self._mmap = None
+                self._view = memoryview(array(self.typecode))
+            else:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(self._mmap, 'madvise'):
+                    # Acceso aleatorio: sin lectura anticipada de páginas contiguas
+                    self._mmap.madvise(mmap.MADV_RANDOM)
+                self._view = memoryview(self._mmap)[HEADER.size:end].cast(self.typecode)
+        except Exception:
+            self._file.close()
+            raise
+
+    """Obtiene el memoryview tipado sobre los datos del archivo."""
+    @property
+    def view(self) -> memoryview:
+        return self._view
+
+    """Obtiene el número de elementos."""
+    def __len__(self) -> int:
+        return len(self._view)
+
+    """
+        Obtiene un elemento o un rango de elementos.
+
+        Args:
+            index (Union[int, slice]): Índice o rango
+
+        Returns:
+            El elemento, o un memoryview con el rango sin copiar los datos
+        """
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return self._view[index]
+
+    """
+        Expone los datos a NumPy sin copiarlos (numpy.asarray usa este método).
+        """
+    def __array__(self, dtype=None, copy=None) -> Any:
+        import numpy as np
+        values = np.frombuffer(self._view, dtype=self.typecode)
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    """Libera el memoryview, el mapeo y el archivo."""
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedSortedArray':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedSortedArray({self.path!r}, typecode={self.typecode!r}, len={len(self)})"
@@ -4,40 +4,37 @@ Utilidades de Medición de Rendimiento
 Este módulo proporciona utilidades para medir el rendimiento de los algoritmos de búsqueda.
 
 Funciones:
-    measure_time: Mide el tiempo de ejecución de una función de búsqueda
+    measure_time: Mide el tiempo de ejecución (mediana) de una función de búsqueda
     run_performance_test: Ejecuta pruebas de rendimiento en algoritmos de búsqueda
 """
 
-import time
 import random
-from typing import Dict, List, Callable, TypeVar, Any
+from typing import Dict, List, Callable, TypeVar, Any, Optional
 
 from search_algorithms.algorithms.base import SearchAlgorithm
+from .benchmark import benchmark, generate_data, pick_target
+from .results_store import ResultStore
 
 T = TypeVar('T')
 
 """
-    Mide el tiempo de ejecución promedio de un algoritmo de búsqueda.
+    Mide el tiempo de ejecución de un algoritmo de búsqueda.
+    
+    Usa el motor de benchmark.py: calibra cuántas búsquedas agrupar por muestra,
+    descarta un calentamiento, desactiva el recolector de basura y devuelve la
+    mediana, que no se ve afectada por las muestras interrumpidas por el sistema.
     
     Args:
         algorithm (SearchAlgorithm): El algoritmo de búsqueda a medir
         arr (List[T]): El array en el que buscar
         target (T): El elemento objetivo a encontrar
-        repetitions (int): Número de repeticiones para promediar
+        repetitions (int): Número de muestras tomadas
         
     Returns:
-        float: Tiempo de ejecución promedio en segundos
+        float: Mediana del tiempo por búsqueda en segundos
     """
 def measure_time(algorithm: SearchAlgorithm, arr: List[T], target: T, repetitions: int = 100) -> float:
-    total_time = 0.0
-    
-    for _ in range(repetitions):
-        start_time = time.time()
-        algorithm.search(arr, target)
-        end_time = time.time()
-        total_time += (end_time - start_time)
-    
-    return total_time / repetitions
+    return benchmark(lambda: algorithm.search(arr, target), repeat=repetitions)['median']
 
 """
     Ejecuta pruebas de rendimiento en múltiples algoritmos de búsqueda.
@@ -45,59 +42,81 @@ def measure_time(algorithm: SearchAlgorithm, arr: List[T], target: T, repetition
     Args:
         algorithms (Dict[str, SearchAlgorithm]): Diccionario de algoritmos a probar
         sizes (List[int], optional): Tamaños de array a probar. Por defecto [100, 1000, 10000, 100000].
-        repetitions (int, optional): Número de repeticiones para cada prueba. Por defecto 100.
+        repetitions (int, optional): Número de muestras para cada prueba. Por defecto 100.
         value_range_factor (int, optional): Factor para el rango de valores. Por defecto 10.
-        position (str, optional): Posición del elemento objetivo ('random', 'start', 'middle', 'end'). 
-                                 Por defecto 'random'.
+        position (str, optional): Posición del elemento objetivo ('random', 'start', 'middle', 'end',
+                                 'missing'). Por defecto 'random'.
+        distribution (str, optional): Distribución de los datos ('uniform', 'sequential',
+                                      'exponential', 'clustered', 'zipf', 'duplicates').
+                                      Por defecto 'uniform'.
+        store (ResultStore, optional): Almacén donde guardar la corrida para compararla después
         
     Returns:
-        Dict[str, Dict[str, Any]]: Diccionario con los resultados de las pruebas
+        Dict[str, Dict[str, Any]]: Diccionario con los resultados de las pruebas. Para cada
+        algoritmo, 'times' tiene la mediana por tamaño, 'iterations' las iteraciones y
+        'stats' las estadísticas completas de benchmark (percentiles e intervalo de confianza).
+        Para los algoritmos con filtro (cuyo stats tiene 'hit_rate' y 'memory_bytes',
+        como FilteredSearch), 'filter' tiene por tamaño las estadísticas del filtro
+        (tasa de aciertos y memoria, entre otras) durante la medición.
+        Si se indicó store, 'run_id' es el identificador de la corrida guardada.
     """
 def run_performance_test(
     algorithms: Dict[str, SearchAlgorithm], 
     sizes: List[int] = None, 
     repetitions: int = 100,
     value_range_factor: int = 10,
-    position: str = 'random'
+    position: str = 'random',
+    distribution: str = 'uniform',
+    store: Optional[ResultStore] = None
 ) -> Dict[str, Dict[str, Any]]:
     if sizes is None:
         sizes = [100, 1000, 10000, 100000]
     
-    results = {name: {'times': [], 'iterations': []} for name in algorithms.keys()}
+    results = {name: {'times': [], 'iterations': [], 'stats': []} for name in algorithms.keys()}
+    rows = []
     
     for size in sizes:
         # Creamos un array ordenado del tamaño dado
-        arr = sorted([random.randint(0, size * value_range_factor) for _ in range(size)])
+        arr = generate_data(size, distribution, random, value_range_factor)
         
-        # Determinamos la posición del elemento objetivo
-        if position == 'start':
-            index = 0
-        elif position == 'middle':
-            index = size // 2
-        elif position == 'end':
-            index = size - 1
-        else:  # random
-            index = random.randint(0, size - 1)
-        
-        target = arr[index]
+        # Determinamos el elemento objetivo según su posición
+        target = pick_target(arr, position, random)
         
         # Medimos el rendimiento para cada algoritmo
         for name, algorithm in algorithms.items():
+            # Los contadores se reinician para que las estadísticas sean las de esta medición
+            reset_stats = getattr(algorithm, 'reset_stats', None)
+            if callable(reset_stats):
+                reset_stats()
+            
             # Medimos el tiempo sin logging
             orig_logger = algorithm.logger
             algorithm.logger = None
-            time_taken = measure_time(algorithm, arr, target, repetitions)
+            try:
+                stats = benchmark(lambda: algorithm.search(arr, target), repeat=repetitions)
+            finally:
+                algorithm.logger = orig_logger
             
             # Medimos las iteraciones con una sola ejecución
-            algorithm.logger = orig_logger
             algorithm.search(arr, target)
             iterations = algorithm.iterations
             
             # Almacenamos los resultados
-            results[name]['times'].append(time_taken)
+            results[name]['times'].append(stats['median'])
             results[name]['iterations'].append(iterations)
+            results[name]['stats'].append(stats)
+            row = dict(stats, algorithm=name, size=size, distribution=distribution,
+                       position=position, iterations=iterations)
+            filter_stats = getattr(algorithm, 'stats', None)
+            if isinstance(filter_stats, dict) and {'hit_rate', 'memory_bytes'} <= filter_stats.keys():
+                results[name].setdefault('filter', []).append(filter_stats)
+                row.update(filter_hit_rate=filter_stats['hit_rate'], filter_memory_bytes=filter_stats['memory_bytes'])
+            rows.append(row)
     
     # Añadimos la información de tamaño a los resultados
     results['sizes'] = sizes
     
-    return results 
\ No newline at end of file
+    if store is not None:
+        results['run_id'] = store.save(rows, {'source': 'run_performance_test', 'repetitions': repetitions})
+    
+    return results 
@@ -0,0 +1,307 @@
+"""
+Almacén de Resultados de Benchmarks
+
+Este módulo guarda los resultados de run_performance_test y run_benchmark_matrix
+en un directorio local para comparar corridas entre sí y detectar regresiones.
+
+Cada corrida es un archivo JSON Lines (<run_id>.jsonl):
+    - La primera línea es {"record": "run", "run_id": ..., "created": ..., "metadata": {...}}
+      con los metadatos del entorno (versión de Python, plataforma, CPU, commit de git...)
+    - Cada línea siguiente es {"record": "result", ...} con una medición: los campos
+      de KEY_FIELDS que la identifican y las estadísticas de benchmark (median,
+      ci_low, ci_high, p95, timings...)
+
+El formato no depende de este paquete, así que los benchmarks de practica02 escriben
+corridas que se pueden comparar con las mismas herramientas.
+
+Funciones:
+    environment_metadata: Describe el entorno en el que se ejecuta la corrida
+    mann_whitney_greater: Prueba de Mann-Whitney de una cola sobre dos listas de tiempos
+    compare_runs: Compara las mediciones de una corrida con las de referencia
+    format_comparison: Da formato de tabla a los resultados de compare_runs
+
+Clases:
+    ResultStore: Directorio de corridas en formato JSON Lines
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Campos que identifican una medición; se comparan las mediciones con los mismos valores
+KEY_FIELDS = ('algorithm', 'structure', 'size', 'distribution', 'position')
+
+"""
+    Describe el entorno en el que se ejecuta la corrida.
+
+    Returns:
+        Dict[str, Any]: Versión e implementación de Python, plataforma, arquitectura,
+        procesador, número de núcleos, nombre del equipo, versión de NumPy (None si
+        no está instalado) y commit de git (None si no se está en un repositorio)
+    """
+def environment_metadata() -> Dict[str, Any]:
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+
+    try:
+        git_commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                    timeout=5, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        git_commit = None
+
+    return {
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'hostname': platform.node(),
+        'numpy_version': numpy_version,
+        'git_commit': git_commit,
+    }
+
+"""
+    Directorio de corridas de benchmarks en formato JSON Lines.
+
+    Atributos:
+        directory (str): Ruta del directorio donde se guardan las corridas
+    """
+class ResultStore:
+
+    """
+        Inicializa el almacén.
+
+        Args:
+            directory (str, optional): Directorio de las corridas; se crea al guardar
+                                       la primera. Por defecto 'benchmark_results'.
+        """
+    def __init__(self, directory: str = 'benchmark_results'):
+        self.directory = directory
+
+    def _path(self, run_id: str) -> str:
+        return os.path.join(self.directory, f"{run_id}.jsonl")
+
+    """
+        Guarda una corrida.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Las mediciones (filas de run_benchmark_matrix)
+            metadata (Dict[str, Any], optional): Metadatos adicionales, que se agregan a
+                                                 los de environment_metadata
+            run_id (str, optional): Identificador de la corrida. Por defecto se genera
+                                    uno a partir de la fecha y hora.
+
+        Returns:
+            str: El identificador de la corrida
+        """
+    def save(self, rows: Iterable[Dict[str, Any]], metadata: Optional[Dict[str, Any]] = None,
+             run_id: Optional[str] = None) -> str:
+        created = time.time()
+        if run_id is None:
+            run_id = time.strftime('%Y%m%dT%H%M%S', time.localtime(created)) + '-' + uuid.uuid4().hex[:6]
+        info = environment_metadata()
+        info.update(metadata or {})
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(run_id), 'w', encoding='utf-8') as file:
+            file.write(json.dumps({'record': 'run', 'run_id': run_id, 'created': created, 'metadata': info}) + '\n')
+            for row in rows:
+                file.write(json.dumps(dict(row, record='result')) + '\n')
+        return run_id
+
+    """
+        Lista las corridas guardadas.
+
+        Returns:
+            List[str]: Los identificadores, de la más antigua a la más reciente
+        """
+    def runs(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        found = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.jsonl'):
+                continue
+            with open(os.path.join(self.directory, name), encoding='utf-8') as file:
+                header = json.loads(file.readline() or '{}')
+            if header.get('record') == 'run':
+                found.append((header.get('created', 0), header['run_id']))
+        return [run_id for _, run_id in sorted(found)]
+
+    """
+        Carga una corrida.
+
+        Args:
+            run_id (str): Identificador de la corrida
+
+        Returns:
+            Tuple[Dict[str, Any], List[Dict[str, Any]]]: Los metadatos y las mediciones
+
+        Raises:
+            ValueError: Si la corrida no existe
+        """
+    def load(self, run_id: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        path = self._path(run_id)
+        if not os.path.exists(path):
+            raise ValueError(f"Corrida desconocida: {run_id!r} (no existe {path})")
+
+        metadata: Dict[str, Any] = {}
+        rows = []
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.pop('record', None) == 'run':
+                    metadata = record['metadata']
+                else:
+                    rows.append(record)
+        return metadata, rows
+
+"""
+    Prueba de Mann-Whitney de una cola: ¿los tiempos de current tienden a ser mayores?
+
+    No supone una distribución normal de los tiempos. Usa la aproximación normal del
+    estadístico U con corrección por empates y por continuidad.
+
+    Args:
+        current (List[float]): Tiempos de la corrida actual
+        baseline (List[float]): Tiempos de la corrida de referencia
+
+    Returns:
+        float: El valor p; valores pequeños indican que current es más lento
+    """
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    # Rangos promedio de la muestra combinada
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+"""
+    Compara las mediciones de una corrida con las de referencia.
+
+    Una medición es una regresión si su mediana es más de threshold veces mayor
+    que la de referencia y la diferencia es significativa: con las muestras
+    (timings) se usa la prueba de Mann-Whitney con nivel alpha; si no hay muestras,
+    se exige que los intervalos de confianza de la mediana no se traslapen. Las
+    mejoras se detectan de la misma forma en sentido contrario. Las mediciones
+    omitidas (sin median, como las que practica02 registra cuando un algoritmo
+    falla) no se comparan.
+
+    Las muestras de una corrida se toman en pocos milisegundos y no capturan la
+    variación entre procesos (frecuencia del CPU, disposición de la memoria), que
+    suele ser de un 10-20%. Por eso baseline puede reunir las mediciones de varias
+    corridas: sus muestras se combinan y, además, la mediana actual tiene que
+    superar (o quedar por debajo de) la de todas las corridas de referencia.
+
+    Args:
+        baseline (Iterable[Dict[str, Any]]): Mediciones de referencia, de una o varias corridas
+        current (Iterable[Dict[str, Any]]): Mediciones a evaluar
+        threshold (float, optional): Cambio relativo mínimo de la mediana. Por defecto 0.05.
+        alpha (float, optional): Nivel de significancia. Por defecto 0.01.
+
+    Returns:
+        List[Dict[str, Any]]: Una fila por medición presente en ambas corridas, con los
+        campos de KEY_FIELDS, baseline y current (medianas en segundos), ratio,
+        p_value (None sin muestras) y status ('regression', 'improvement' o 'unchanged')
+    """
+def compare_runs(baseline: Iterable[Dict[str, Any]], current: Iterable[Dict[str, Any]],
+                 threshold: float = 0.05, alpha: float = 0.01) -> List[Dict[str, Any]]:
+    reference: Dict[Tuple, List[Dict[str, Any]]] = {}
+    for row in baseline:
+        if 'median' not in row:
+            continue
+        reference.setdefault(tuple(row.get(field) for field in KEY_FIELDS), []).append(row)
+    comparisons = []
+
+    for row in current:
+        key = tuple(row.get(field) for field in KEY_FIELDS)
+        bases = reference.get(key)
+        if not bases or 'median' not in row:
+            continue
+
+        medians = [base['median'] for base in bases]
+        timings = [value for base in bases for value in base.get('timings') or []]
+        base_median = statistics.median(timings) if timings else statistics.median(medians)
+        ratio = row['median'] / base_median if base_median > 0 else math.inf
+
+        if row.get('timings') and all(base.get('timings') for base in bases):
+            p_slower = mann_whitney_greater(row['timings'], timings)
+            p_faster = mann_whitney_greater(timings, row['timings'])
+            slower, faster = p_slower < alpha, p_faster < alpha
+            p_value = min(p_slower, p_faster)
+        else:
+            slower = row['ci_low'] > max(base['ci_high'] for base in bases)
+            faster = row['ci_high'] < min(base['ci_low'] for base in bases)
+            p_value = None
+
+        if slower and ratio > 1 + threshold and row['median'] > max(medians):
+            status = 'regression'
+        elif faster and ratio < 1 / (1 + threshold) and row['median'] < min(medians):
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+
+        comparison = {field: row.get(field) for field in KEY_FIELDS}
+        comparison.update({
+            'baseline': base_median,
+            'current': row['median'],
+            'ratio': ratio,
+            'p_value': p_value,
+            'status': status,
+        })
+        comparisons.append(comparison)
+
+    return comparisons
+
+"""
+    Da formato de tabla a los resultados de compare_runs.
+
+    Args:
+        comparisons (Iterable[Dict[str, Any]]): Las filas de compare_runs
+
+    Returns:
+        str: Tabla con las medianas en microsegundos, la razón y el estado
+    """
+def format_comparison(comparisons: Iterable[Dict[str, Any]]) -> str:
+    header = (f"{'medición':<44}{'base µs':>12}{'actual µs':>12}{'razón':>8}{'p':>10}  estado")
+    lines = [header, "-" * len(header)]
+    for row in comparisons:
+        label = "/".join(str(row[field]) for field in KEY_FIELDS if row.get(field) is not None)
+        p_value = '-' if row['p_value'] is None else f"{row['p_value']:.4f}"
+        lines.append(f"{label:<44}{row['baseline'] * 1e6:12.3f}{row['current'] * 1e6:12.3f}"
+                     f"{row['ratio']:8.2f}{p_value:>10}  {row['status']}")
+    return "\n".join(lines)
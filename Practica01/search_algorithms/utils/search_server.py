@@ -0,0 +1,452 @@
+"""
+Servidor Local de Búsqueda
+
+Este módulo permite que varios procesos consulten un mismo arreglo ordenado sin
+cargarlo cada uno: un servidor asyncio carga las claves una sola vez y atiende
+consultas por un socket Unix o TCP en la interfaz local.
+
+Protocolo (JSON Lines, una línea por mensaje en cada sentido):
+    - consulta:  {"id": 7, "target": 42}
+    - respuesta: {"id": 7, "target": 42, "index": 21}
+    - error:     {"id": 7, "target": "x", "error": "..."}
+
+Las consultas que llegan mientras se resuelve un lote, de cualquier conexión, se
+agrupan en el siguiente lote (micro-batching) y se resuelven juntas con
+search_many, que usa numpy.searchsorted cuando NumPy está instalado.
+
+Uso como programa, con claves escritas por write_sorted_array:
+    python -m search_algorithms.utils.search_server claves.bin --port 8765
+    python -m search_algorithms.utils.search_server claves.bin --unix /tmp/busqueda.sock
+
+Funciones:
+    run_load: Generador de carga que mide el throughput y la latencia de un servidor
+
+Clases:
+    SearchServer: Servidor asyncio que resuelve las consultas por lotes
+    SearchClient: Cliente asyncio que envía consultas concurrentes por una conexión
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from search_algorithms.algorithms.base import SearchAlgorithm
+from search_algorithms.algorithms.binary import BinarySearch
+from search_algorithms.algorithms.sorted_index import SortedIndex
+from search_algorithms.algorithms.vectorized import load_numpy
+from .mmap_array import MappedSortedArray
+
+T = TypeVar('T')
+
+np = load_numpy()
+
+# Tamaño máximo de una línea del protocolo
+_LINE_LIMIT = 1 << 20
+
+"""
+    Servidor asyncio que resuelve consultas de búsqueda por lotes.
+
+    Las claves se validan y preparan una sola vez: un SortedIndex (o el
+    MappedSortedArray recibido, sin copiarlo) y, con NumPy, el arreglo que usa
+    search_many. Cada conexión lee sus consultas y las pone en una cola común; una
+    única tarea toma de la cola todas las consultas pendientes (hasta max_batch),
+    las resuelve con una llamada a search_many y escribe las respuestas.
+
+    Atributos:
+        keys: Las claves preparadas (SortedIndex o MappedSortedArray)
+        algorithm (SearchAlgorithm): Algoritmo cuyo search_many resuelve los lotes
+        max_batch (int): Número máximo de consultas por lote
+        max_delay (float): Segundos que se espera a más consultas si el lote no se llenó
+        requests (int): Consultas respondidas
+        batches (int): Lotes resueltos
+    """
+class SearchServer:
+
+    """
+        Inicializa el servidor y prepara las claves.
+
+        Args:
+            keys (Sequence[T]): Las claves en orden no decreciente
+            algorithm (SearchAlgorithm, optional): Algoritmo para los lotes. Por defecto BinarySearch.
+            max_batch (int, optional): Número máximo de consultas por lote. Por defecto 1024.
+            max_delay (float, optional): Espera adicional por lote en segundos. Por defecto 0:
+                                         solo se agrupan las consultas que ya llegaron.
+
+        Raises:
+            ValueError: Si las claves no están ordenadas
+        """
+    def __init__(self, keys: Sequence[T], algorithm: Optional[SearchAlgorithm] = None,
+                 max_batch: int = 1024, max_delay: float = 0.0):
+        self.keys = keys if isinstance(keys, (SortedIndex, MappedSortedArray)) else SortedIndex(keys)
+        self._arr = np.asarray(self.keys) if np is not None else self.keys
+        self.algorithm = algorithm if algorithm is not None else BinarySearch()
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.requests = 0
+        self.batches = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._address: Union[Tuple[str, int], str, None] = None
+        self._writers = set()
+
+    """
+        Obtiene la dirección en la que escucha el servidor.
+
+        Returns:
+            (host, puerto) para TCP, la ruta para un socket Unix, o None si no se inició
+        """
+    @property
+    def address(self) -> Union[Tuple[str, int], str, None]:
+        return self._address
+
+    """
+        Obtiene las estadísticas del servidor.
+
+        Returns:
+            Dict[str, Any]: Consultas respondidas, lotes y tamaño promedio de lote
+        """
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch': self.requests / self.batches if self.batches else 0.0,
+        }
+
+    """
+        Empieza a escuchar conexiones.
+
+        Args:
+            host (str, optional): Interfaz TCP. Por defecto '127.0.0.1'.
+            port (int, optional): Puerto TCP; 0 elige uno libre. Por defecto 0.
+            path (str, optional): Ruta de un socket Unix; si se indica, se usa en lugar de TCP
+
+        Returns:
+            La dirección en la que escucha el servidor
+        """
+    async def start(self, host: str = '127.0.0.1', port: int = 0,
+                    path: Optional[str] = None) -> Union[Tuple[str, int], str]:
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batches())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path, limit=_LINE_LIMIT)
+            self._address = path
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=_LINE_LIMIT)
+            self._address = self._server.sockets[0].getsockname()[:2]
+        return self._address
+
+    """Atiende conexiones hasta que se cancele."""
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    """Deja de aceptar conexiones, cierra las abiertas y detiene la tarea de lotes."""
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    async def __aenter__(self) -> 'SearchServer':
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    """Lee las consultas de una conexión y las pone en la cola de lotes."""
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        queue = self._queue
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                request_id = None
+                try:
+                    request = json.loads(line)
+                    request_id, target = request.get('id'), request['target']
+                    if isinstance(target, (list, dict)):
+                        raise TypeError("el objetivo debe ser un número, una cadena o null")
+                    queue.put_nowait((writer, request_id, target))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    reply = {'id': request_id, 'error': f"Consulta inválida: {error}"}
+                    writer.write(json.dumps(reply).encode() + b'\n')
+        except (ConnectionError, ValueError):
+            # Conexión cerrada o línea más larga que el límite
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    """Toma las consultas pendientes de la cola, hasta max_batch."""
+    def _drain(self, batch: List[Tuple[Any, Any, Any]]) -> None:
+        queue = self._queue
+        while len(batch) < self.max_batch and not queue.empty():
+            batch.append(queue.get_nowait())
+
+    """Resuelve lotes de consultas mientras el servidor está activo."""
+    async def _run_batches(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Cede el control una vez para que las conexiones encolen lo que ya recibieron
+            await asyncio.sleep(self.max_delay)
+            self._drain(batch)
+
+            targets = [target for _, _, target in batch]
+            replies: Dict[asyncio.StreamWriter, List[bytes]] = {}
+            for (writer, request_id, target), result in zip(batch, self._resolve(targets)):
+                reply = {'id': request_id, 'target': target}
+                if isinstance(result, str):
+                    reply['error'] = result
+                else:
+                    reply['index'] = result
+                replies.setdefault(writer, []).append(json.dumps(reply).encode())
+
+            self.requests += len(batch)
+            self.batches += 1
+            for writer, lines in replies.items():
+                if not writer.is_closing():
+                    writer.write(b'\n'.join(lines) + b'\n')
+            for writer in replies:
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    pass
+
+    """
+        Resuelve un lote de objetivos.
+
+        Los objetivos se agrupan por tipo antes de llamar a search_many: NumPy
+        convertiría un lote mezclado a un solo tipo (por ejemplo, 1 y 'a' a
+        cadenas) y cambiaría las comparaciones.
+
+        Returns:
+            List[Union[int, str]]: El índice de cada objetivo, o un mensaje de error
+            para los objetivos que no se pueden comparar con las claves
+        """
+    def _resolve(self, targets: List[Any]) -> List[Union[int, str]]:
+        groups: Dict[type, List[int]] = {}
+        for position, target in enumerate(targets):
+            groups.setdefault(type(target), []).append(position)
+
+        results: List[Union[int, str]] = [-1] * len(targets)
+        for positions in groups.values():
+            group = [targets[position] for position in positions]
+            try:
+                indices = [int(index) for index in self.algorithm.search_many(self._arr, group)]
+            except (TypeError, ValueError) as error:
+                indices = [f"Objetivo no comparable con las claves: {error}"] * len(group)
+            for position, index in zip(positions, indices):
+                results[position] = index
+        return results
+
+"""
+    Cliente asyncio del servidor de búsqueda.
+
+    Varias tareas pueden consultar a la vez por la misma conexión: cada consulta
+    lleva un identificador y una tarea lectora entrega cada respuesta a quien la
+    pidió, así que las consultas concurrentes viajan juntas y el servidor las
+    resuelve en el mismo lote.
+    """
+class SearchClient:
+
+    def __init__(self):
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    """
+        Se conecta a un servidor.
+
+        Args:
+            address: (host, puerto) para TCP o la ruta de un socket Unix, como SearchServer.address
+
+        Returns:
+            SearchClient: El cliente conectado
+        """
+    @classmethod
+    async def connect(cls, address: Union[Tuple[str, int], str]) -> 'SearchClient':
+        client = cls()
+        if isinstance(address, str):
+            client._reader, client._writer = await asyncio.open_unix_connection(address, limit=_LINE_LIMIT)
+        else:
+            host, port = address
+            client._reader, client._writer = await asyncio.open_connection(host, port, limit=_LINE_LIMIT)
+        client._listener = asyncio.create_task(client._listen())
+        return client
+
+    """Entrega cada respuesta a la consulta que la espera."""
+    async def _listen(self) -> None:
+        error: Exception = ConnectionError("El servidor cerró la conexión")
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                reply = json.loads(line)
+                future = self._pending.pop(reply.get('id'), None)
+                if future is None or future.done():
+                    continue
+                if 'error' in reply:
+                    future.set_exception(ValueError(reply['error']))
+                else:
+                    future.set_result(reply['index'])
+        except (ConnectionError, ValueError) as exc:
+            error = exc
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    """
+        Busca un objetivo.
+
+        Args:
+            target (T): El objetivo (un valor que se pueda representar en JSON)
+
+        Returns:
+            int: El índice del objetivo, -1 si no se encuentra
+
+        Raises:
+            ValueError: Si el servidor no pudo comparar el objetivo con las claves
+        """
+    async def lookup(self, target: T) -> int:
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({'id': request_id, 'target': target}).encode() + b'\n')
+        return await future
+
+    """
+        Busca varios objetivos de forma concurrente.
+
+        Args:
+            targets (Iterable[T]): Los objetivos
+
+        Returns:
+            List[Tuple[T, int]]: Pares (objetivo, índice) en el orden de targets
+        """
+    async def lookup_many(self, targets: Iterable[T]) -> List[Tuple[T, int]]:
+        targets = list(targets)
+        indices = await asyncio.gather(*(self.lookup(target) for target in targets))
+        return list(zip(targets, indices))
+
+    """Cierra la conexión."""
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._listener is not None:
+            await self._listener
+
+    async def __aenter__(self) -> 'SearchClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+"""
+    Generador de carga: mide el throughput y la latencia de un servidor de búsqueda.
+
+    Abre connections conexiones y en cada una mantiene concurrency consultas en
+    curso; cada consulta se mide desde que se envía hasta que llega su respuesta.
+
+    Args:
+        address: Dirección del servidor (SearchServer.address)
+        targets (Sequence[T]): Objetivos a consultar; se reparten entre las tareas
+        connections (int, optional): Número de conexiones. Por defecto 4.
+        concurrency (int, optional): Consultas en curso por conexión. Por defecto 64.
+
+    Returns:
+        Dict[str, Any]: requests, seconds, throughput (consultas por segundo) y las
+        latencias en segundos p50, p90, p99, max y mean
+    """
+async def run_load(address: Union[Tuple[str, int], str], targets: Sequence[T],
+                   connections: int = 4, concurrency: int = 64) -> Dict[str, Any]:
+    clients = [await SearchClient.connect(address) for _ in range(connections)]
+    workers = connections * concurrency
+    latencies: List[float] = []
+
+    async def worker(client: SearchClient, share: Sequence[T]) -> None:
+        for target in share:
+            start = time.perf_counter()
+            await client.lookup(target)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker(clients[i % connections], targets[i::workers]) for i in range(workers)))
+    finally:
+        elapsed = time.perf_counter() - start
+        for client in clients:
+            await client.close()
+
+    ordered = sorted(latencies)
+    n = len(ordered)
+
+    def percentile(q: float) -> float:
+        return ordered[min(n - 1, math.ceil(q * n) - 1)] if n else 0.0
+
+    return {
+        'requests': n,
+        'seconds': elapsed,
+        'throughput': n / elapsed if elapsed > 0 else 0.0,
+        'p50': percentile(0.50),
+        'p90': percentile(0.90),
+        'p99': percentile(0.99),
+        'max': ordered[-1] if n else 0.0,
+        'mean': sum(ordered) / n if n else 0.0,
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m search_algorithms.utils.search_server",
+                                     description="Sirve búsquedas sobre un archivo de claves ordenadas")
+    parser.add_argument("keys", help="Archivo de claves escrito con write_sorted_array")
+    parser.add_argument("--host", default="127.0.0.1", help="Interfaz TCP (por defecto 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Puerto TCP (por defecto 8765)")
+    parser.add_argument("--unix", metavar="RUTA", help="Escucha en un socket Unix en lugar de TCP")
+    parser.add_argument("--max-batch", type=int, default=1024, help="Consultas máximas por lote")
+    parser.add_argument("--max-delay", type=float, default=0.0, help="Espera adicional por lote en segundos")
+    args = parser.parse_args(argv)
+
+    async def serve() -> None:
+        # El mapeo queda abierto mientras viva el proceso: NumPy usa sus páginas sin copiarlas
+        keys = MappedSortedArray(args.keys)
+        server = SearchServer(keys, max_batch=args.max_batch, max_delay=args.max_delay)
+        address = await server.start(args.host, args.port, path=args.unix)
+        print(f"Sirviendo {len(keys)} claves en {address}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
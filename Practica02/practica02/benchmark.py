@@ -0,0 +1,299 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from practica02.registry import get_algorithm, list_algorithms
+from practica02.structs.dllist import DoublyLinkedList
+
+# Distribuciones de entrada disponibles
+DISTRIBUTIONS = ("random", "sorted", "reversed", "duplicates")
+
+
+def generate_input(size: int, distribution: str, rng: random.Random) -> List[int]:
+    """
+    Genera la lista de entrada para un benchmark.
+
+    Args:
+        size: Número de elementos
+        distribution: 'random', 'sorted', 'reversed' o 'duplicates'
+        rng: Generador de números aleatorios
+
+    Returns:
+        La lista de enteros
+
+    Raises:
+        ValueError: Si la distribución no es reconocida
+    """
+    if distribution == "random":
+        return [rng.randint(0, size * 10) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "duplicates":
+        return [rng.randint(0, 9) for _ in range(size)]
+    raise ValueError(
+        f"Distribución desconocida: {distribution}. "
+        f"Las opciones válidas son: {list(DISTRIBUTIONS)}"
+    )
+
+
+def summarize(timings: List[float]) -> Dict[str, Any]:
+    """
+    Calcula las estadísticas de una lista de tiempos.
+
+    Usa los mismos campos que search_algorithms.utils.benchmark (mediana,
+    intervalo de confianza del 95% de la mediana por estadísticos de orden,
+    percentiles), para que las corridas se puedan comparar con
+    python -m benchmarks.compare.
+
+    Args:
+        timings: Tiempos en segundos
+
+    Returns:
+        Un diccionario con median, mean, min, max, p95, ci_low, ci_high,
+        samples y timings
+    """
+    ordered = sorted(timings)
+    n = len(ordered)
+    half_width = 1.96 * math.sqrt(n) / 2
+    return {
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p95": ordered[min(n - 1, math.ceil(0.95 * n) - 1)],
+        "ci_low": ordered[max(0, math.floor(n / 2 - half_width))],
+        "ci_high": ordered[min(n - 1, math.ceil(n / 2 + half_width) - 1)],
+        "samples": n,
+        "timings": timings,
+    }
+
+
+def measure(
+    algorithm: Callable, data: List[int], repetitions: int, use_linked_list: bool
+) -> List[float]:
+    """
+    Toma las muestras de tiempo de un algoritmo sobre una entrada.
+
+    Args:
+        algorithm: La función de ordenamiento
+        data: La entrada
+        repetitions: Número de muestras
+        use_linked_list: Si es True, cada muestra ordena una lista enlazada nueva
+
+    Returns:
+        Los tiempos en segundos
+    """
+    # Calentamiento
+    algorithm(DoublyLinkedList(data) if use_linked_list else data)
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repetitions):
+            input_data = DoublyLinkedList(data) if use_linked_list else data
+            start = time.perf_counter_ns()
+            algorithm(input_data)
+            timings.append((time.perf_counter_ns() - start) / 1e9)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+
+def run_benchmarks(
+    algorithms: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = (100, 1000),
+    distributions: Iterable[str] = ("random",),
+    repetitions: int = 15,
+    use_linked_list: bool = False,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Mide los algoritmos de ordenamiento sobre cada tamaño y distribución.
+
+    Cada muestra ordena la misma entrada una vez con time.perf_counter_ns y el
+    recolector de basura desactivado; la entrada se prepara fuera de la medición.
+
+    Si un algoritmo falla con una entrada (por ejemplo, quick sort supera el
+    límite de recursión con una entrada ordenada grande), la medición se
+    registra como omitida, con el error en el campo skipped y sin estadísticas,
+    y el benchmark continúa con las demás.
+
+    Args:
+        algorithms: Nombres de los algoritmos a medir (por defecto todos)
+        sizes: Tamaños de la entrada
+        distributions: Distribuciones de la entrada
+        repetitions: Número de muestras por medición
+        use_linked_list: Si es True, se mide la versión de lista enlazada
+        seed: Semilla aleatoria para reproducibilidad
+
+    Returns:
+        Una fila por medición con algorithm, structure, size, distribution y
+        las estadísticas (o skipped si la medición se omitió)
+    """
+    rng = random.Random(seed)
+    structure = "linked_list" if use_linked_list else "array"
+    names = list(algorithms) if algorithms is not None else list_algorithms()
+    rows = []
+
+    for distribution in distributions:
+        for size in sizes:
+            data = generate_input(size, distribution, rng)
+            for name in names:
+                algorithm = get_algorithm(name, use_linked_list=use_linked_list)
+                row = {
+                    "algorithm": name,
+                    "structure": structure,
+                    "size": size,
+                    "distribution": distribution,
+                }
+
+                try:
+                    timings = measure(algorithm, data, repetitions, use_linked_list)
+                except Exception as error:
+                    row["skipped"] = f"{type(error).__name__}: {error}"
+                else:
+                    row.update(summarize(timings))
+                rows.append(row)
+
+    return rows
+
+
+def environment_metadata() -> Dict[str, Any]:
+    """
+    Describe el entorno en el que se ejecuta la corrida.
+
+    Returns:
+        Un diccionario con la versión de Python, la plataforma, el número de
+        núcleos y el commit de git (None si no se está en un repositorio)
+    """
+    try:
+        git_commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        git_commit = None
+
+    return {
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "hostname": platform.node(),
+        "git_commit": git_commit,
+    }
+
+
+def save_results(
+    rows: Iterable[Dict[str, Any]],
+    directory: str,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Guarda una corrida en formato JSON Lines, compatible con el ResultStore de
+    practica01.
+
+    La primera línea describe la corrida y su entorno; cada línea siguiente es
+    una medición.
+
+    Args:
+        rows: Las mediciones de run_benchmarks
+        directory: Directorio donde se guarda la corrida
+        metadata: Metadatos adicionales
+
+    Returns:
+        El identificador de la corrida
+    """
+    created = time.time()
+    timestamp = time.strftime("%Y%m%dT%H%M%S", time.localtime(created))
+    run_id = f"{timestamp}-{uuid.uuid4().hex[:6]}"
+    info = environment_metadata()
+    info.update(metadata or {})
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{run_id}.jsonl")
+    header = {"record": "run", "run_id": run_id, "created": created, "metadata": info}
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(json.dumps(header) + "\n")
+        for row in rows:
+            file.write(json.dumps(dict(row, record="result")) + "\n")
+    return run_id
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m practica02.benchmark",
+        description="Mide los algoritmos de ordenamiento",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="Tamaños de la entrada",
+    )
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        default=["random"],
+        choices=DISTRIBUTIONS,
+        help="Distribuciones de la entrada",
+    )
+    parser.add_argument(
+        "--repetitions", type=int, default=15, help="Muestras por medición"
+    )
+    parser.add_argument(
+        "--linked-list", action="store_true", help="Mide la versión de lista enlazada"
+    )
+    parser.add_argument(
+        "--save", metavar="DIRECTORIO", help="Guarda la corrida en este directorio"
+    )
+    args = parser.parse_args(argv)
+
+    rows = run_benchmarks(
+        sizes=args.sizes,
+        distributions=args.distributions,
+        repetitions=args.repetitions,
+        use_linked_list=args.linked_list,
+    )
+
+    print(
+        f"{'algoritmo':<12}{'estructura':<13}{'distribución':<14}{'tamaño':>8}"
+        f"{'mediana ms':>12}{'p95 ms':>10}"
+    )
+    for row in rows:
+        label = (
+            f"{row['algorithm']:<12}{row['structure']:<13}"
+            f"{row['distribution']:<14}{row['size']:>8}"
+        )
+        if "skipped" in row:
+            print(f"{label}  omitida ({row['skipped']})")
+        else:
+            print(f"{label}{row['median'] * 1e3:12.3f}{row['p95'] * 1e3:10.3f}")
+
+    if args.save:
+        run_id = save_results(rows, args.save, {"source": "practica02.benchmark"})
+        print(f"\nCorrida guardada en {args.save}: {run_id}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from practica02.benchmark import (
+    DISTRIBUTIONS,
+    generate_input,
+    run_benchmarks,
+    save_results,
+    summarize,
+)
+
+
+class TestBenchmark:
+    """Pruebas para los benchmarks de ordenamiento y su almacenamiento."""
+
+    def test_generate_input(self):
+        """Prueba las distribuciones de entrada."""
+        import random
+
+        rng = random.Random(1)
+        for distribution in DISTRIBUTIONS:
+            assert len(generate_input(50, distribution, rng)) == 50
+        assert generate_input(5, "sorted", rng) == [0, 1, 2, 3, 4]
+        assert generate_input(3, "reversed", rng) == [3, 2, 1]
+        with pytest.raises(ValueError):
+            generate_input(5, "normal", rng)
+
+    def test_summarize(self):
+        """Prueba las estadísticas de una lista de tiempos."""
+        stats = summarize([float(i) for i in range(1, 21)])
+        assert stats["median"] == 10.5
+        assert stats["samples"] == 20
+        assert stats["ci_low"] <= stats["median"] <= stats["ci_high"]
+        assert stats["p95"] == 19.0
+
+    def test_run_benchmarks(self):
+        """Prueba la matriz de algoritmos, tamaños y distribuciones."""
+        rows = run_benchmarks(
+            algorithms=["quick", "merge"],
+            sizes=[10, 50],
+            distributions=["random", "sorted"],
+            repetitions=3,
+        )
+        assert len(rows) == 2 * 2 * 2
+        for row in rows:
+            assert row["structure"] == "array"
+            assert row["median"] > 0
+            assert len(row["timings"]) == 3
+
+        linked = run_benchmarks(
+            algorithms=["insertion"], sizes=[10], repetitions=2, use_linked_list=True
+        )
+        assert linked[0]["structure"] == "linked_list"
+
+    def test_skipped_measurement(self):
+        """Prueba que una medición que falla se omite sin detener la corrida."""
+        rows = run_benchmarks(
+            algorithms=["quick", "merge"],
+            sizes=[5000],
+            distributions=["sorted"],
+            repetitions=2,
+        )
+        assert [row["algorithm"] for row in rows] == ["quick", "merge"]
+        assert rows[0]["skipped"].startswith("RecursionError")
+        assert "median" not in rows[0]
+        assert "skipped" not in rows[1]
+        assert rows[1]["median"] > 0
+
+    def test_save_results(self, tmp_path):
+        """Prueba el formato JSON Lines de una corrida guardada."""
+        rows = run_benchmarks(algorithms=["heap"], sizes=[10], repetitions=2)
+        run_id = save_results(rows, str(tmp_path), {"source": "test"})
+
+        with open(os.path.join(tmp_path, f"{run_id}.jsonl"), encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert records[0]["record"] == "run"
+        assert records[0]["run_id"] == run_id
+        assert records[0]["metadata"]["source"] == "test"
+        assert "python_version" in records[0]["metadata"]
+        assert [record["record"] for record in records[1:]] == ["result"]
+        assert records[1]["algorithm"] == "heap"